@@ -1,53 +1,417 @@
-import PyPDF2
+"""
+Extração incremental dos PDFs de requisitos + índice de busca
+=============================================================
+
+Extrai o texto de todos os PDFs de um ou mais diretórios (padrão:
+``documentos/requisitos``) para ``<arquivo>_content.txt`` ao lado de cada PDF,
+no mesmo formato de antes (cabeçalho + "PÁGINA N").
+
+- Incremental: PDFs sem alteração (tamanho/mtime e, se mudaram, SHA-256 do
+  arquivo) são pulados; o texto de cada página fica em cache pelo hash do
+  conteúdo da página, então uma nova versão da especificação só extrai as
+  páginas que mudaram (v4 → v5 reaproveita as páginas iguais).
+- Paralelo: as páginas que faltam no cache são extraídas num pool de
+  processos, em lotes por arquivo.
+- Streaming: o ``_content.txt`` é escrito página a página num arquivo
+  temporário (trocado no fim), sem montar o documento inteiro em memória.
+- Índice: os trechos de cada requisito (RF01, RNF02, RN03.1...) vão para uma
+  tabela FTS5 do SQLite, consultável por ID ou por texto.
+
+Uso:
+    python read_pdf_requirements.py                         # documentos/requisitos
+    python read_pdf_requirements.py documentos --workers 8  # todos os PDFs (recursivo)
+    python read_pdf_requirements.py --forcar                # ignora o cache
+    python read_pdf_requirements.py --requisito RF04        # onde o RF04 aparece
+    python read_pdf_requirements.py --buscar "pauta tramitar"
+
+O cache e o índice ficam em ``.cache/pdf_requisitos.sqlite`` (``--cache``).
+
+Requer PyPDF2 (ou o sucessor ``pypdf``).
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
 import os
+import re
 import sys
+import time
+import sqlite3
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import PyPDF2 as pdf_lib
+except ImportError:  # pypdf é o sucessor do PyPDF2, mesma API de leitura
+    import pypdf as pdf_lib
+
+
+RAIZ = Path(__file__).resolve().parent
+DIRETORIO_PADRAO = RAIZ / 'documentos' / 'requisitos'
+CACHE_PADRAO = RAIZ / '.cache' / 'pdf_requisitos.sqlite'
+LOTE_PAGINAS = 8
+SEPARADOR = '=' * 80
+
+# RF01, RNF02, RN03.1, RF010.08 ...
+PADRAO_REQUISITO = re.compile(r'\b(RNF|RF|RN)\s?(\d{1,4}(?:\.\d+)*)\b')
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS arquivos (
+    caminho   TEXT PRIMARY KEY,
+    hash      TEXT NOT NULL,
+    tamanho   INTEGER NOT NULL,
+    mtime     REAL NOT NULL,
+    paginas   INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS paginas (
+    hash      TEXT PRIMARY KEY,   -- SHA-256 do conteúdo da página
+    texto     TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS trechos (
+    arquivo   TEXT NOT NULL,
+    pagina    INTEGER NOT NULL,
+    requisito TEXT NOT NULL,
+    texto     TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_trechos_requisito ON trechos (requisito);
+CREATE INDEX IF NOT EXISTS idx_trechos_arquivo ON trechos (arquivo);
+"""
+
+ESQUEMA_FTS = """
+CREATE VIRTUAL TABLE IF NOT EXISTS trechos_fts USING fts5 (
+    requisito, arquivo UNINDEXED, pagina UNINDEXED, texto, tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+
+# ==============================================================================
+# CACHE
+# ==============================================================================
+
+def conectar(caminho: Path) -> Tuple[sqlite3.Connection, bool]:
+    """Abre o cache; retorna (conexão, FTS5 disponível)"""
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    conexao = sqlite3.connect(str(caminho))
+    conexao.executescript(ESQUEMA)
+    try:
+        conexao.executescript(ESQUEMA_FTS)
+        fts = True
+    except sqlite3.OperationalError:
+        # SQLite compilado sem FTS5: a busca cai para LIKE na tabela trechos
+        fts = False
+    return conexao, fts
+
+
+def hash_arquivo(caminho: Path) -> str:
+    sha = hashlib.sha256()
+    with open(caminho, 'rb') as f:
+        for bloco in iter(lambda: f.read(1 << 20), b''):
+            sha.update(bloco)
+    return sha.hexdigest()
+
+
+def _dados_conteudo(conteudo) -> bytes:
+    """Bytes decodificados do /Contents: um stream ou um array de streams (PyPDF2 3.x: ``ArrayObject``)"""
+    if conteudo is None:
+        return b''
+    conteudo = conteudo.get_object() if hasattr(conteudo, 'get_object') else conteudo
+    if hasattr(conteudo, 'get_data'):
+        return conteudo.get_data()
+    return b'\n'.join(_dados_conteudo(item) for item in conteudo)
+
+
+def hash_pagina(pagina) -> str:
+    """
+    Hash do content stream da página (o que é desenhado), sem extrair o texto.
+
+    Se o stream não puder ser lido, o hash cai para o texto extraído; se nem
+    isso der, a página recebe um hash único (não entra no cache) - nunca um
+    valor constante, que faria páginas diferentes dividirem a mesma entrada.
+    """
+    sha = hashlib.sha256()
+    try:
+        sha.update(b'stream:' + _dados_conteudo(pagina.get_contents()))
+        # Fontes diferentes com o mesmo stream geram texto diferente
+        fontes = (pagina.get('/Resources') or {}).get('/Font') or {}
+        for nome in sorted(fontes):
+            sha.update(str(nome).encode())
+            sha.update(repr(fontes[nome].get_object().get('/BaseFont')).encode())
+    except Exception:
+        sha = hashlib.sha256()
+        try:
+            sha.update(b'texto:' + (pagina.extract_text() or '').encode('utf-8'))
+        except Exception:
+            sha.update(b'sem_cache:' + os.urandom(16))
+    return sha.hexdigest()
+
+
+# ==============================================================================
+# EXTRAÇÃO (executada nos processos do pool)
+# ==============================================================================
+
+def extrair_paginas(caminho: str, numeros: List[int]) -> List[Tuple[int, str]]:
+    """Texto das páginas ``numeros`` (base 0) do PDF; erros viram um marcador no texto"""
+    leitor = pdf_lib.PdfReader(caminho)
+    resultado = []
+    for numero in numeros:
+        try:
+            texto = leitor.pages[numero].extract_text() or ''
+        except Exception as e:
+            texto = f"[Erro ao extrair página {numero + 1}: {e}]"
+        resultado.append((numero, texto))
+    return resultado
+
+
+# ==============================================================================
+# ÍNDICE DE REQUISITOS
+# ==============================================================================
+
+def trechos_requisitos(texto: str) -> Iterable[Tuple[str, str]]:
+    """(ID, trecho) para cada menção a requisito: do ID até a próxima menção"""
+    mencoes = list(PADRAO_REQUISITO.finditer(texto))
+    for i, mencao in enumerate(mencoes):
+        fim = mencoes[i + 1].start() if i + 1 < len(mencoes) else len(texto)
+        trecho = re.sub(r'\s+', ' ', texto[mencao.start():fim]).strip()
+        yield f"{mencao.group(1)}{mencao.group(2)}", trecho[:2000]
+
+
+def limpar_indice(conexao: sqlite3.Connection, fts: bool, arquivo: str):
+    conexao.execute('DELETE FROM trechos WHERE arquivo = ?', (arquivo,))
+    if fts:
+        conexao.execute('DELETE FROM trechos_fts WHERE arquivo = ?', (arquivo,))
 
-# Configurar stdout para UTF-8
-sys.stdout.reconfigure(encoding='utf-8')
-
-pdf_dir = r"D:\code\python\github-dzabccvf\documentos\requisitos"
-pdf_files = [
-    "espec_requisitos_licenciamento_ambeintal_v4.pdf",
-    "espec_requisitos_licenciamento_ambeintal_v5.pdf"
-]
-
-for pdf_file in pdf_files:
-    pdf_path = os.path.join(pdf_dir, pdf_file)
-    output_file = pdf_path.replace('.pdf', '_content.txt')
-    
-    print(f"\nProcessando: {pdf_file}")
-    
+
+def indexar_pagina(conexao: sqlite3.Connection, fts: bool, arquivo: str, numero: int, texto: str):
+    for requisito, trecho in trechos_requisitos(texto):
+        linha = (arquivo, numero + 1, requisito, trecho)
+        conexao.execute('INSERT INTO trechos (arquivo, pagina, requisito, texto) VALUES (?, ?, ?, ?)', linha)
+        if fts:
+            conexao.execute('INSERT INTO trechos_fts (arquivo, pagina, requisito, texto) VALUES (?, ?, ?, ?)', linha)
+
+
+# ==============================================================================
+# PROCESSAMENTO
+# ==============================================================================
+
+def listar_pdfs(diretorios: List[Path]) -> List[Path]:
+    pdfs = []
+    for diretorio in diretorios:
+        if diretorio.is_file() and diretorio.suffix.lower() == '.pdf':
+            pdfs.append(diretorio)
+        else:
+            pdfs.extend(sorted(p for p in diretorio.rglob('*') if p.suffix.lower() == '.pdf'))
+    return pdfs
+
+
+def escrever_conteudo(pdf: Path, textos: Iterable[Tuple[int, str]], total: int) -> Path:
+    """Grava ``<pdf>_content.txt`` página a página (arquivo temporário + troca atômica)"""
+    saida = pdf.with_name(f"{pdf.stem}_content.txt")
+    temporario = saida.with_suffix('.tmp')
+    with open(temporario, 'w', encoding='utf-8') as out:
+        out.write(f"{SEPARADOR}\nARQUIVO: {pdf.name}\nTotal de páginas: {total}\n{SEPARADOR}\n\n")
+        for numero, texto in textos:
+            out.write(f"\n{SEPARADOR}\nPÁGINA {numero + 1}\n{SEPARADOR}\n\n{texto}\n\n")
+    os.replace(temporario, saida)
+    return saida
+
+
+class PlanoPDF:
+    """PDF que precisa ser (re)escrito: hashes das páginas e lotes já enviados ao pool"""
+
+    def __init__(self, pdf: Path, chave: str, hash_pdf: str, hashes: List[str], em_cache: set, lotes: list):
+        self.pdf = pdf
+        self.chave = chave
+        self.hash_pdf = hash_pdf
+        self.hashes = hashes
+        self.em_cache = em_cache
+        self.lotes = lotes          # [(números, future | None)], na ordem das páginas
+        self.extraidas = sum(len(numeros) for numeros, _ in lotes)
+
+
+def planejar_pdf(pdf: Path, conexao: sqlite3.Connection, executor: Optional[ProcessPoolExecutor],
+                 forcar: bool = False, planejadas: Optional[set] = None) -> Optional[PlanoPDF]:
+    """
+    Decide o que extrair do PDF e já envia ao pool as páginas fora do cache.
+
+    ``planejadas`` acumula os hashes já enviados nesta execução: páginas
+    iguais em outro PDF (ex.: v4 e v5 da especificação) são extraídas uma vez
+    e lidas do cache quando o PDF seguinte for gravado.
+
+    Returns:
+        None se o PDF e o ``_content.txt`` estão atualizados
+    """
+    chave = str(pdf.resolve())
+    stat = pdf.stat()
+    registro = conexao.execute('SELECT hash, tamanho, mtime FROM arquivos WHERE caminho = ?', (chave,)).fetchone()
+    atualizado = registro and not forcar and pdf.with_name(f"{pdf.stem}_content.txt").exists()
+
+    if atualizado and (registro[1], registro[2]) == (stat.st_size, stat.st_mtime):
+        return None
+    hash_pdf = hash_arquivo(pdf)
+    if atualizado and hash_pdf == registro[0]:
+        conexao.execute('UPDATE arquivos SET mtime = ? WHERE caminho = ?', (stat.st_mtime, chave))
+        return None
+
+    hashes = [hash_pagina(p) for p in pdf_lib.PdfReader(str(pdf)).pages]
+    em_cache = set()
+    if not forcar:
+        for i in range(0, len(hashes), 500):
+            bloco = list(set(hashes[i:i + 500]))
+            em_cache.update(h for (h,) in conexao.execute(
+                f"SELECT hash FROM paginas WHERE hash IN ({','.join('?' * len(bloco))})", bloco))
+
+    planejadas = set() if planejadas is None else planejadas
+    em_cache.update(h for h in hashes if h in planejadas)
+    # Só a primeira página de cada hash vai para os lotes; as repetidas (ex.:
+    # páginas em branco) são lidas do cache depois que ela for gravada
+    faltando, vistas = [], set()
+    for n, h in enumerate(hashes):
+        if h not in em_cache and h not in vistas:
+            vistas.add(h)
+            faltando.append(n)
+    planejadas.update(vistas)
+    lotes = []
+    for i in range(0, len(faltando), LOTE_PAGINAS):
+        numeros = faltando[i:i + LOTE_PAGINAS]
+        futuro = executor.submit(extrair_paginas, str(pdf), numeros) if executor is not None else None
+        lotes.append((numeros, futuro))
+    return PlanoPDF(pdf, chave, hash_pdf, hashes, em_cache, lotes)
+
+
+def gravar_pdf(plano: PlanoPDF, conexao: sqlite3.Connection, fts: bool):
+    """Escreve o ``_content.txt``, o cache de páginas e o índice, página a página"""
+    pendentes = iter(plano.lotes)
+
+    def textos():
+        """Páginas em ordem: do cache ou do lote atual do pool (só ele fica em memória)"""
+        lote_atual: Dict[int, str] = {}
+        for numero, hash_p in enumerate(plano.hashes):
+            if numero not in lote_atual and hash_p in plano.em_cache:
+                linha = conexao.execute('SELECT texto FROM paginas WHERE hash = ?', (hash_p,)).fetchone()
+                if linha is None:
+                    # Planejada por um PDF anterior cuja gravação falhou (rollback): extrai aqui
+                    texto = extrair_paginas(str(plano.pdf), [numero])[0][1]
+                    conexao.execute('INSERT OR REPLACE INTO paginas (hash, texto) VALUES (?, ?)', (hash_p, texto))
+                    plano.extraidas += 1
+                else:
+                    texto = linha[0]
+            else:
+                if numero not in lote_atual:
+                    numeros, futuro = next(pendentes)
+                    lote_atual = dict(futuro.result() if futuro else extrair_paginas(str(plano.pdf), numeros))
+                texto = lote_atual.pop(numero)
+                conexao.execute('INSERT OR REPLACE INTO paginas (hash, texto) VALUES (?, ?)', (hash_p, texto))
+                plano.em_cache.add(hash_p)
+            indexar_pagina(conexao, fts, plano.chave, numero, texto)
+            yield numero, texto
+
+    limpar_indice(conexao, fts, plano.chave)
+    escrever_conteudo(plano.pdf, textos(), len(plano.hashes))
+    stat = plano.pdf.stat()
+    conexao.execute('INSERT OR REPLACE INTO arquivos (caminho, hash, tamanho, mtime, paginas) VALUES (?, ?, ?, ?, ?)',
+                    (plano.chave, plano.hash_pdf, stat.st_size, stat.st_mtime, len(plano.hashes)))
+    conexao.commit()
+
+
+# ==============================================================================
+# CONSULTAS
+# ==============================================================================
+
+def buscar(conexao: sqlite3.Connection, fts: bool, termo: Optional[str] = None,
+           requisito: Optional[str] = None, limite: int = 20) -> List[tuple]:
+    """(requisito, arquivo, página, trecho) por ID exato ou por texto"""
+    if requisito:
+        return conexao.execute(
+            'SELECT requisito, arquivo, pagina, texto FROM trechos WHERE requisito = ? '
+            'ORDER BY arquivo, pagina LIMIT ?', (requisito.upper().replace(' ', ''), limite)).fetchall()
+    if fts:
+        consulta = ' '.join(f'"{p}"' for p in termo.replace('"', ' ').split())
+        return conexao.execute(
+            "SELECT requisito, arquivo, pagina, snippet(trechos_fts, 3, '[', ']', '…', 24) "
+            'FROM trechos_fts WHERE trechos_fts MATCH ? ORDER BY rank LIMIT ?', (consulta, limite)).fetchall()
+    return conexao.execute(
+        'SELECT requisito, arquivo, pagina, texto FROM trechos WHERE texto LIKE ? LIMIT ?',
+        (f"%{termo}%", limite)).fetchall()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Extrai os PDFs de requisitos (incremental, paralelo) e indexa os requisitos',
+        formatter_class=argparse.RawDescriptionHelpFormatter, epilog=__doc__)
+    parser.add_argument('diretorios', nargs='*', type=Path, default=[DIRETORIO_PADRAO],
+                        help='Diretórios (recursivo) ou arquivos PDF (padrão: documentos/requisitos)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2, help='Processos de extração')
+    parser.add_argument('--cache', type=Path, default=CACHE_PADRAO, help='Arquivo SQLite do cache/índice')
+    parser.add_argument('--forcar', action='store_true', help='Reextrai tudo, ignorando o cache')
+    parser.add_argument('--buscar', metavar='TEXTO', help='Busca nos trechos indexados (não extrai)')
+    parser.add_argument('--requisito', metavar='ID', help='Trechos de um requisito, ex.: RF04 (não extrai)')
+    args = parser.parse_args(argv)
+
+    sys.stdout.reconfigure(encoding='utf-8')
+    conexao, fts = conectar(args.cache)
+
+    if args.buscar or args.requisito:
+        resultados = buscar(conexao, fts, args.buscar, args.requisito)
+        if not resultados:
+            print("Nenhum trecho encontrado (rode a extração antes de buscar)")
+            return 1
+        for requisito, arquivo, pagina, trecho in resultados:
+            print(f"\n{requisito} - {Path(arquivo).name}, página {pagina}")
+            print(f"  {trecho[:400]}")
+        return 0
+
+    pdfs = listar_pdfs(args.diretorios)
+    if not pdfs:
+        print(f"Nenhum PDF em: {', '.join(str(d) for d in args.diretorios)}")
+        return 1
+
+    inicio = time.time()
+    falhas = 0
+    totais = {'pdfs': len(pdfs), 'sem_alteracao': 0, 'paginas': 0, 'extraidas': 0}
+    executor = ProcessPoolExecutor(max_workers=args.workers) if args.workers > 1 else None
     try:
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            num_pages = len(pdf_reader.pages)
-            
-            # Extrair todo o texto
-            full_text = []
-            full_text.append(f"{'='*80}\n")
-            full_text.append(f"ARQUIVO: {pdf_file}\n")
-            full_text.append(f"Total de páginas: {num_pages}\n")
-            full_text.append(f"{'='*80}\n\n")
-            
-            for i in range(num_pages):
-                try:
-                    page = pdf_reader.pages[i]
-                    text = page.extract_text()
-                    full_text.append(f"\n{'='*80}\n")
-                    full_text.append(f"PÁGINA {i+1}\n")
-                    full_text.append(f"{'='*80}\n\n")
-                    full_text.append(text)
-                    full_text.append("\n\n")
-                except Exception as e:
-                    full_text.append(f"\n[Erro ao extrair página {i+1}: {e}]\n\n")
-            
-            # Salvar em arquivo
-            with open(output_file, 'w', encoding='utf-8') as out:
-                out.write("".join(full_text))
-            
-            print(f"✓ Salvo em: {output_file}")
-                
-    except Exception as e:
-        print(f"✗ Erro ao processar {pdf_file}: {e}")
-
-print("\n✓ Processamento concluído!")
+        # 1) Todos os PDFs alterados vão para o pool de uma vez (PDFs pequenos também rodam em paralelo)
+        planos = []
+        planejadas = set()
+        for pdf in pdfs:
+            try:
+                plano = planejar_pdf(pdf, conexao, executor, args.forcar, planejadas)
+            except Exception as e:
+                print(f"✗ Erro ao processar {pdf}: {e}")
+                falhas += 1
+                continue
+            if plano is None:
+                totais['sem_alteracao'] += 1
+                print(f"= {pdf.name}: sem alterações")
+            else:
+                planos.append(plano)
+        conexao.commit()
+
+        # 2) Grava cada arquivo, na ordem, conforme os lotes ficam prontos
+        for plano in planos:
+            try:
+                gravar_pdf(plano, conexao, fts)
+            except Exception as e:
+                print(f"✗ Erro ao processar {plano.pdf}: {e}")
+                conexao.rollback()
+                falhas += 1
+                continue
+            totais['paginas'] += len(plano.hashes)
+            totais['extraidas'] += plano.extraidas
+            print(f"✓ {plano.pdf.name}: {len(plano.hashes)} página(s), {plano.extraidas} extraída(s), "
+                  f"{len(plano.hashes) - plano.extraidas} do cache")
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        conexao.close()
+
+    print(f"\n✓ {totais['pdfs']} PDF(s) em {time.time() - inicio:.1f}s - {totais['sem_alteracao']} sem alterações, "
+          f"{totais['extraidas']}/{totais['paginas']} página(s) extraída(s)")
+    return 1 if falhas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
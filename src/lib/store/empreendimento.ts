@@ -203,3 +203,10 @@ export const useEmpreendimentoStore = create<EmpreendimentoStore>()(
       }
     })
 );
+
+// 🧪 Em desenvolvimento, expõe o store para os testes E2E
+// (checkpoint/retomada do orquestrador e coleta do JSON no teste 06)
+if (import.meta.env.DEV && typeof window !== 'undefined') {
+  const w = window as any;
+  w.__ZUSTAND_STORES__ = { ...(w.__ZUSTAND_STORES__ || {}), empreendimento: useEmpreendimentoStore };
+}
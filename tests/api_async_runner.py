@@ -0,0 +1,364 @@
+"""
+Runner assíncrono das verificações de API (parametrização e catálogos de referência)
+====================================================================================
+
+``TestParametrizacaoAPI`` (test_api_parametrizacao.py), ``test_api_direct.py`` e
+``test_api_reference_units.py`` fazem leituras independentes, mas rodam uma
+depois da outra: o tempo da camada de API era a soma das chamadas.
+
+Aqui cada teste vira uma verificação declarativa (método, caminho, validação)
+e o runner dispara todas ao mesmo tempo sobre um cliente HTTP assíncrono
+(``httpx.AsyncClient``), limitado por ``--concorrencia``:
+
+- leituras não esperam nada além das dependências declaradas (``depende``);
+- escritas (``escrita=True``) rodam na ordem em que foram declaradas, uma de
+  cada vez - ``test_02`` antes de ``test_03``, como no pytest;
+- o resultado de cada verificação segue a mesma regra do teste original
+  (404 e backend fora do ar = SKIPPED, assert = FAILED), e o resumo final tem
+  o mesmo formato do ``run_summary`` (``N passed, M skipped in Xs``).
+
+Com isso a camada de API termina perto do tempo da chamada mais lenta (ou da
+cadeia de escritas, se for maior).
+
+Sem ``httpx`` instalado as chamadas vão para threads sobre o ``ClienteAPI``
+(api_client.py) - mesmo paralelismo, sem o cliente assíncrono.
+
+Uso:
+    python api_async_runner.py                         # Todas as suítes
+    python api_async_runner.py --suites parametrizacao
+    python api_async_runner.py --concorrencia 2 --listar
+    python test_api_parametrizacao.py --async          # Atalho para a suíte de parametrização
+
+Variáveis de ambiente:
+    API_URL / API_CANDIDATES            ver endpoint_resolver.py
+    API_CONCORRENCIA                    chamadas simultâneas (padrão: 8)
+    TEST_ADMIN_EMAIL / TEST_ADMIN_PASSWORD   login da suíte de parametrização
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+from typing import Dict, List
+
+import requests
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from api_client import ClienteAPI, BACKOFF, TENTATIVAS, STATUS_RETRY, METODOS_IDEMPOTENTES
+from endpoint_resolver import resolver_api, descrever
+
+
+CONCORRENCIA = int(os.getenv('API_CONCORRENCIA', '8'))
+ADMIN_EMAIL = os.getenv('TEST_ADMIN_EMAIL', 'admin@example.com')
+ADMIN_PASSWORD = os.getenv('TEST_ADMIN_PASSWORD', 'admin123')
+
+PASSED, FAILED, SKIPPED = 'PASSED', 'FAILED', 'SKIPPED'
+
+
+class Pular(Exception):
+    """Equivalente ao ``pytest.skip`` dentro de uma validação"""
+
+
+# ==============================================================================
+# VALIDAÇÕES (mesmas regras dos testes originais)
+# ==============================================================================
+
+def _pular_404(resposta, mensagem='Backend não implementado'):
+    if resposta.status_code == 404:
+        raise Pular(mensagem)
+
+
+def _listar_configuracoes(resposta):
+    _pular_404(resposta)
+    if resposta.status_code == 200:
+        configs = resposta.json()
+        assert len(configs) >= 2, "Deveria ter pelo menos 2 configurações"
+        return f"{len(configs)} configuração(ões)"
+    return f"status {resposta.status_code}"
+
+
+def _atualizar_config(resposta):
+    _pular_404(resposta)
+    return f"status {resposta.status_code}"
+
+
+def _pesquisar(resposta):
+    _pular_404(resposta)
+    if resposta.status_code == 200:
+        return f"{len(resposta.json())} resultado(s)"
+    return f"status {resposta.status_code}"
+
+
+def _buscar_config(resposta):
+    _pular_404(resposta)
+    if resposta.status_code == 200:
+        return f"valor {resposta.json().get('config_value')}"
+    return f"status {resposta.status_code}"
+
+
+def _estrutura_config(resposta):
+    if resposta.status_code != 200:
+        raise Pular('Endpoint não disponível')
+    configs = resposta.json()
+    if not configs:
+        return 'nenhuma configuração para validar'
+    faltando = [c for c in ('id', 'config_key', 'config_value') if c not in configs[0]]
+    assert not faltando, f"Campos obrigatórios faltando: {faltando}"
+    return 'estrutura correta'
+
+
+def _lista_ok(resposta):
+    assert 200 <= resposta.status_code < 300, f"status {resposta.status_code}: {resposta.text[:100]}"
+    return f"{len(resposta.json())} item(ns)"
+
+
+def _lista_nao_vazia(resposta):
+    assert resposta.status_code == 200, f"status {resposta.status_code}"
+    dados = resposta.json()
+    assert dados, "Endpoint funcionando mas sem dados"
+    return f"{len(dados)} unidade(s)"
+
+
+# ==============================================================================
+# VERIFICAÇÕES
+# ==============================================================================
+
+_PARAMETRIZACAO = 'test_api_parametrizacao.py::TestParametrizacaoAPI'
+
+VERIFICACOES = [
+    # --- test_api_parametrizacao.py ---
+    {'id': 'test_01_listar_configuracoes', 'suite': 'parametrizacao', 'no': _PARAMETRIZACAO,
+     'metodo': 'GET', 'caminho': '/system-config', 'validar': _listar_configuracoes},
+    {'id': 'test_02_atualizar_config_pesquisa_obrigatoria', 'suite': 'parametrizacao', 'no': _PARAMETRIZACAO,
+     'metodo': 'PUT', 'caminho': '/system-config/empreendimento_search_required',
+     'json': {'config_value': True}, 'escrita': True, 'validar': _atualizar_config},
+    {'id': 'test_03_atualizar_config_permitir_novo', 'suite': 'parametrizacao', 'no': _PARAMETRIZACAO,
+     'metodo': 'PUT', 'caminho': '/system-config/empreendimento_allow_new_register',
+     'json': {'config_value': False}, 'escrita': True, 'validar': _atualizar_config},
+    {'id': 'test_04_pesquisar_empreendimento_cnpj', 'suite': 'parametrizacao', 'no': _PARAMETRIZACAO,
+     'metodo': 'GET', 'caminho': '/enterprises/search', 'params': {'query': '12345678000199'},
+     'validar': _pesquisar},
+    {'id': 'test_05_pesquisar_empreendimento_nome', 'suite': 'parametrizacao', 'no': _PARAMETRIZACAO,
+     'metodo': 'GET', 'caminho': '/enterprises/search', 'params': {'query': 'Empresa'},
+     'validar': _pesquisar},
+    # Lê a chave gravada pelo test_02
+    {'id': 'test_06_buscar_config_especifica', 'suite': 'parametrizacao', 'no': _PARAMETRIZACAO,
+     'metodo': 'GET', 'caminho': '/system-config/empreendimento_search_required',
+     'depende': ['test_02_atualizar_config_pesquisa_obrigatoria'], 'validar': _buscar_config},
+    {'id': 'test_07_validar_estrutura_response', 'suite': 'parametrizacao', 'no': _PARAMETRIZACAO,
+     'metodo': 'GET', 'caminho': '/system-config', 'validar': _estrutura_config},
+
+    # --- test_api_direct.py ---
+    {'id': 'pollution_potentials', 'suite': 'direct', 'no': 'test_api_direct.py',
+     'metodo': 'GET', 'caminho': '/referencias/pollution-potentials', 'validar': _lista_ok},
+    {'id': 'license_types', 'suite': 'direct', 'no': 'test_api_direct.py',
+     'metodo': 'GET', 'caminho': '/license-types', 'validar': _lista_ok},
+    {'id': 'document_templates', 'suite': 'direct', 'no': 'test_api_direct.py',
+     'metodo': 'GET', 'caminho': '/document-templates', 'validar': _lista_ok},
+
+    # --- test_api_reference_units.py ---
+    {'id': 'test_endpoint', 'suite': 'reference-units', 'no': 'test_api_reference_units.py',
+     'metodo': 'GET', 'caminho': '/referencias/unidades-medida', 'params': {'is_active': 'true'},
+     'validar': _lista_nao_vazia},
+]
+
+SUITES = sorted({v['suite'] for v in VERIFICACOES})
+
+
+# ==============================================================================
+# TRANSPORTE
+# ==============================================================================
+
+class TransporteAsync:
+    """``httpx.AsyncClient`` com a política de timeout/retry do ClienteAPI (ou threads, sem httpx)"""
+
+    def __init__(self, base_url: str, concorrencia: int):
+        # ClienteAPI fornece timeouts por endpoint e, sem httpx, faz as chamadas
+        self.sincrono = ClienteAPI(base_url, tamanho_pool=concorrencia)
+        self.base_url = self.sincrono.base_url
+        self.assincrono = httpx is not None
+        if self.assincrono:
+            self._cliente = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=concorrencia, max_keepalive_connections=concorrencia)
+            )
+            self.erros_conexao = (httpx.TransportError,)
+        else:
+            self.erros_conexao = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+        self.headers = {}
+
+    async def requisitar(self, metodo: str, caminho: str, **kwargs):
+        if not self.assincrono:
+            self.sincrono.headers.update(self.headers)
+            return await asyncio.to_thread(self.sincrono.requisitar, metodo, caminho, **kwargs)
+
+        url = self.sincrono.url(caminho)
+        kwargs.setdefault('timeout', self.sincrono.timeout(url))
+        tentativa = 0
+        while True:
+            try:
+                resposta = await self._cliente.request(metodo, url, headers=self.headers, **kwargs)
+            except self.erros_conexao:
+                if tentativa >= TENTATIVAS:
+                    raise
+            else:
+                if resposta.status_code not in STATUS_RETRY or metodo not in METODOS_IDEMPOTENTES \
+                        or tentativa >= TENTATIVAS:
+                    return resposta
+            await asyncio.sleep(BACKOFF * (2 ** tentativa))
+            tentativa += 1
+
+    async def fechar(self):
+        if self.assincrono:
+            await self._cliente.aclose()
+        self.sincrono.close()
+
+
+# ==============================================================================
+# EXECUÇÃO
+# ==============================================================================
+
+async def _login(transporte: TransporteAsync):
+    """Login da suíte de parametrização (uma vez, antes do fan-out)"""
+    try:
+        resposta = await transporte.requisitar(
+            'POST', '/auth/login', json={'email': ADMIN_EMAIL, 'password': ADMIN_PASSWORD})
+        if resposta.status_code == 200:
+            dados = resposta.json()
+            transporte.headers['Authorization'] = f"Bearer {dados.get('token') or dados.get('access_token')}"
+            print("✅ Login realizado com sucesso")
+        else:
+            print(f"⚠️ Login falhou: {resposta.status_code}")
+    except transporte.erros_conexao as e:
+        print(f"⚠️ Erro ao fazer login: {e}")
+        print("   Testes de API podem falhar sem autenticação")
+
+
+async def _executar_verificacao(verificacao: dict, transporte: TransporteAsync,
+                                semaforo: asyncio.Semaphore, anteriores: List[asyncio.Task]) -> dict:
+    if anteriores:
+        await asyncio.wait(anteriores)
+    async with semaforo:
+        inicio = time.perf_counter()
+        try:
+            resposta = await transporte.requisitar(
+                verificacao['metodo'], verificacao['caminho'],
+                params=verificacao.get('params'), json=verificacao.get('json'))
+            resultado, detalhe = PASSED, verificacao['validar'](resposta)
+        except Pular as e:
+            resultado, detalhe = SKIPPED, str(e)
+        except transporte.erros_conexao:
+            resultado, detalhe = SKIPPED, 'Backend não disponível'
+        except AssertionError as e:
+            resultado, detalhe = FAILED, str(e)
+        except Exception as e:
+            resultado, detalhe = FAILED, f"{type(e).__name__}: {e}"
+        ms = (time.perf_counter() - inicio) * 1000
+
+    resultado = dict(verificacao, resultado=resultado, detalhe=detalhe, ms=ms)
+    print(f"{verificacao['no']}::{verificacao['id']} {resultado['resultado']} ({ms:.0f} ms) - {detalhe}")
+    return resultado
+
+
+async def executar_verificacoes(verificacoes: List[dict], base_url: str,
+                                concorrencia: int = CONCORRENCIA) -> List[dict]:
+    """Dispara as verificações respeitando dependências e a ordem das escritas"""
+    transporte = TransporteAsync(base_url, concorrencia)
+    semaforo = asyncio.Semaphore(concorrencia)
+    try:
+        if any(v['suite'] == 'parametrizacao' for v in verificacoes):
+            await _login(transporte)
+
+        tarefas: Dict[str, asyncio.Task] = {}
+        ultima_escrita = None
+        for verificacao in verificacoes:
+            anteriores = [tarefas[d] for d in verificacao.get('depende', []) if d in tarefas]
+            if verificacao.get('escrita') and ultima_escrita is not None:
+                anteriores.append(ultima_escrita)
+            tarefa = asyncio.create_task(_executar_verificacao(verificacao, transporte, semaforo, anteriores))
+            tarefas[verificacao['id']] = tarefa
+            if verificacao.get('escrita'):
+                ultima_escrita = tarefa
+        return list(await asyncio.gather(*tarefas.values()))
+    finally:
+        await transporte.fechar()
+
+
+def imprimir_resumo(resultados: List[dict], tempo_total: float):
+    """Resumo no formato do pytest (``run_summary``) + comparação com a execução serial"""
+    contagem = {}
+    for r in resultados:
+        contagem[r['resultado']] = contagem.get(r['resultado'], 0) + 1
+
+    falhas = [r for r in resultados if r['resultado'] == FAILED]
+    if falhas:
+        print("\n" + "=" * 30 + " short test summary info " + "=" * 25)
+        for r in falhas:
+            print(f"FAILED {r['no']}::{r['id']} - {r['detalhe']}")
+
+    partes = [f"{contagem[k]} {k.lower()}" for k in (FAILED, PASSED, SKIPPED) if contagem.get(k)]
+    print("=" * 25 + f" {', '.join(partes) or 'no tests ran'} in {tempo_total:.2f}s " + "=" * 25)
+
+    if resultados:
+        soma = sum(r['ms'] for r in resultados) / 1000
+        mais_lenta = max(resultados, key=lambda r: r['ms'])
+        print(f"⏱️  Soma das chamadas: {soma:.2f}s | Mais lenta: {mais_lenta['id']} "
+              f"({mais_lenta['ms'] / 1000:.2f}s) | Ganho: {soma / tempo_total if tempo_total else 0:.1f}x")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Runner assíncrono das verificações de API')
+    parser.add_argument('--suites', help=f"Suítes separadas por vírgula ({', '.join(SUITES)})")
+    parser.add_argument('--concorrencia', type=int, default=CONCORRENCIA,
+                        help=f'Chamadas simultâneas (padrão: {CONCORRENCIA})')
+    parser.add_argument('--api', help='URL base da API (padrão: endpoint_resolver)')
+    parser.add_argument('--listar', action='store_true', help='Lista as verificações e sai')
+    args = parser.parse_args(argv)
+
+    args.lista_suites = [s.strip() for s in args.suites.split(',')] if args.suites else SUITES
+    invalidas = [s for s in args.lista_suites if s not in SUITES]
+    if invalidas:
+        parser.error(f"Suíte(s) inválida(s): {', '.join(invalidas)}")
+    if args.concorrencia < 1:
+        parser.error("--concorrencia deve ser >= 1")
+    return args
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    verificacoes = [v for v in VERIFICACOES if v['suite'] in args.lista_suites]
+
+    if args.listar:
+        for v in verificacoes:
+            tipo = 'escrita' if v.get('escrita') else 'leitura'
+            print(f"  {v['suite']:<16} {v['id']:<48} {v['metodo']:<4} {v['caminho']} ({tipo})")
+        return 0
+
+    api = {'url': args.api.rstrip('/'), 'saudavel': True, 'latencia_ms': 0} if args.api else \
+        resolver_api(['http://localhost:3000/api/v1', 'http://localhost:8000/api/v1'])
+
+    print("=" * 80)
+    print(" RESUMO DOS TESTES DE API (runner assíncrono)")
+    print("=" * 80)
+    print(f"📍 API: {descrever(api)}")
+    print(f"🔀 Cliente: {'httpx.AsyncClient' if httpx else 'threads + ClienteAPI (httpx não instalado)'}"
+          f" | concorrência {args.concorrencia}")
+    print(f"📋 Suítes: {', '.join(args.lista_suites)} ({len(verificacoes)} verificações)")
+    print("=" * 80)
+
+    inicio = time.perf_counter()
+    resultados = asyncio.run(executar_verificacoes(verificacoes, api['url'], args.concorrencia))
+    imprimir_resumo(resultados, time.perf_counter() - inicio)
+
+    return 1 if any(r['resultado'] == FAILED for r in resultados) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+"""
+Cliente HTTP compartilhado para os testes de API (pool + keep-alive)
+====================================================================
+
+``test_notifications.py``, ``test_api_direct.py``, ``test_api_reference_units.py``
+e os helpers de ``test_notifications_selenium.py`` chamavam ``requests.get/post``
+soltos: cada chamada abria uma conexão TCP nova (e um handshake TLS contra o
+Render) e a maioria não tinha timeout.
+
+``ClienteAPI`` concentra isso:
+
+- pool de conexões com keep-alive (``requests.Session`` + ``HTTPAdapter``);
+- timeout por endpoint (prefixo do caminho → segundos), com padrão para o resto;
+- retry com backoff exponencial em erro de rede e em 5xx só nos métodos
+  idempotentes; POST/PATCH só são repetidos quando a conexão nem chegou a
+  abrir (recusada / timeout de conexão) - depois de um timeout de leitura a
+  requisição pode já ter sido processada e repetir criaria registro duplicado;
+- HTTP/2 opcional via ``httpx`` (``API_HTTP2=true``; se o pacote não estiver
+  instalado, segue com requests/HTTP 1.1);
+- latência de cada chamada registrada para relatório (``resumo()``).
+
+Uso:
+
+    from api_client import obter_cliente
+
+    api = obter_cliente()                 # base resolvida pelo endpoint_resolver
+    resposta = api.get('/notifications/stats', params={'user_id': USER_ID})
+    api.imprimir_resumo()
+
+Variáveis de ambiente:
+    API_HTTP2          true para usar httpx com HTTP/2 (padrão: false)
+    API_TIMEOUT        timeout padrão em segundos (padrão: 15)
+    API_TENTATIVAS     tentativas extras em falha de conexão/5xx (padrão: 2)
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import os
+import math
+import time
+import threading
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError, ConnectTimeoutError
+
+try:
+    import httpx  # opcional (HTTP/2 requer também o pacote h2)
+except ImportError:
+    httpx = None
+
+from endpoint_resolver import resolver_api
+from impact_analysis import registrar_endpoint
+
+
+HTTP2 = os.getenv('API_HTTP2', 'false').lower() == 'true'
+TIMEOUT_PADRAO = float(os.getenv('API_TIMEOUT', '15'))
+TENTATIVAS = int(os.getenv('API_TENTATIVAS', '2'))
+BACKOFF = 0.3
+
+# Timeout (s) por prefixo do caminho; vale o prefixo mais longo que casar
+TIMEOUTS_ENDPOINT = {
+    '/health': 3,
+    '/auth/login': 10,
+    '/notifications': 10,
+    '/referencias': 10,
+    '/workflow': 20,
+}
+
+STATUS_RETRY = (500, 502, 503, 504)
+METODOS_IDEMPOTENTES = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+
+
+def _antes_do_envio(erro: Exception) -> bool:
+    """True se a falha aconteceu antes de a requisição sair (conexão recusada / timeout ao conectar)"""
+    if httpx is not None and isinstance(erro, (httpx.ConnectError, httpx.ConnectTimeout)):
+        return True
+    if isinstance(erro, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(erro, requests.exceptions.ConnectionError) and erro.args:
+        causa = getattr(erro.args[0], 'reason', erro.args[0])
+        return isinstance(causa, (NewConnectionError, ConnectTimeoutError))
+    return False
+
+
+class ClienteAPI:
+    """Cliente HTTP com pool de conexões, retry, timeouts por endpoint e latências"""
+
+    def __init__(self, base_url: str, timeouts: Optional[Dict[str, float]] = None,
+                 timeout_padrao: float = TIMEOUT_PADRAO, tentativas: int = TENTATIVAS,
+                 backoff: float = BACKOFF, http2: bool = HTTP2, tamanho_pool: int = 10):
+        self.base_url = base_url.rstrip('/')
+        self.prefixo_base = urlparse(self.base_url).path.rstrip('/')
+        self.timeouts = dict(TIMEOUTS_ENDPOINT, **(timeouts or {}))
+        self.timeout_padrao = timeout_padrao
+        self.tentativas = tentativas
+        self.backoff = backoff
+        self.latencias: List[dict] = []
+        self._lock = threading.Lock()
+
+        self.http2 = bool(http2 and httpx is not None)
+        if http2 and not self.http2:
+            print("  ⚠️ API_HTTP2=true mas httpx não está instalado; usando HTTP/1.1 (requests)")
+
+        if self.http2:
+            try:
+                self._sessao = httpx.Client(
+                    http2=True, limits=httpx.Limits(max_keepalive_connections=tamanho_pool)
+                )
+            except ImportError:
+                # httpx sem o extra h2
+                self.http2 = False
+        if not self.http2:
+            self._sessao = requests.Session()
+            adaptador = HTTPAdapter(pool_connections=tamanho_pool, pool_maxsize=tamanho_pool)
+            self._sessao.mount('http://', adaptador)
+            self._sessao.mount('https://', adaptador)
+
+    # ------------------------------------------------------------------
+    # Requisições
+    # ------------------------------------------------------------------
+
+    @property
+    def headers(self):
+        """Cabeçalhos enviados em todas as chamadas (ex.: Authorization)"""
+        return self._sessao.headers
+
+    def url(self, caminho: str) -> str:
+        if caminho.startswith(('http://', 'https://')):
+            return caminho
+        return f"{self.base_url}/{caminho.lstrip('/')}"
+
+    def timeout(self, url: str) -> float:
+        """Timeout do endpoint: prefixo mais longo de ``timeouts`` (caminho relativo à base)"""
+        caminho = urlparse(url).path
+        if caminho.startswith(self.prefixo_base):
+            caminho = caminho[len(self.prefixo_base):]
+        casados = [p for p in self.timeouts if caminho.startswith(p)]
+        return self.timeouts[max(casados, key=len)] if casados else self.timeout_padrao
+
+    def requisitar(self, metodo: str, caminho: str, **kwargs):
+        """Executa a chamada com retry/backoff e registra a latência"""
+        metodo = metodo.upper()
+        url = self.url(caminho)
+        kwargs.setdefault('timeout', self.timeout(url))
+        erros_conexao = (httpx.TransportError,) if self.http2 else (
+            requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+        tentativa = 0
+        while True:
+            inicio = time.perf_counter()
+            try:
+                resposta = self._sessao.request(metodo, url, **kwargs)
+            except erros_conexao as e:
+                self._registrar(metodo, url, None, inicio, tentativa, erro=type(e).__name__)
+                if tentativa >= self.tentativas or (metodo not in METODOS_IDEMPOTENTES and not _antes_do_envio(e)):
+                    raise
+            else:
+                self._registrar(metodo, url, resposta.status_code, inicio, tentativa)
+                repetir = resposta.status_code in STATUS_RETRY and metodo in METODOS_IDEMPOTENTES
+                if not repetir or tentativa >= self.tentativas:
+                    return resposta
+            time.sleep(self.backoff * (2 ** tentativa))
+            tentativa += 1
+
+    def get(self, caminho: str, **kwargs):
+        return self.requisitar('GET', caminho, **kwargs)
+
+    def post(self, caminho: str, **kwargs):
+        return self.requisitar('POST', caminho, **kwargs)
+
+    def put(self, caminho: str, **kwargs):
+        return self.requisitar('PUT', caminho, **kwargs)
+
+    def patch(self, caminho: str, **kwargs):
+        return self.requisitar('PATCH', caminho, **kwargs)
+
+    def delete(self, caminho: str, **kwargs):
+        return self.requisitar('DELETE', caminho, **kwargs)
+
+    def close(self):
+        self._sessao.close()
+
+    # ------------------------------------------------------------------
+    # Latências
+    # ------------------------------------------------------------------
+
+    def _registrar(self, metodo: str, url: str, status, inicio: float, tentativa: int, erro: str = None):
+        registro = {
+            'metodo': metodo,
+            'caminho': urlparse(url).path,
+            'status': status,
+            'ms': round((time.perf_counter() - inicio) * 1000, 1),
+            'tentativa': tentativa,
+            'erro': erro,
+        }
+        with self._lock:
+            self.latencias.append(registro)
+        registrar_endpoint(url)
+
+    def resumo(self) -> Dict[str, dict]:
+        """Latência (ms) por ``MÉTODO caminho``: chamadas, média, p95, máximo, erros e retries"""
+        grupos: Dict[str, List[dict]] = {}
+        with self._lock:
+            for r in self.latencias:
+                grupos.setdefault(f"{r['metodo']} {r['caminho']}", []).append(r)
+        resumo = {}
+        for chave, registros in grupos.items():
+            tempos = sorted(r['ms'] for r in registros)
+            resumo[chave] = {
+                'chamadas': len(registros),
+                'media_ms': round(sum(tempos) / len(tempos), 1),
+                'p95_ms': tempos[max(0, math.ceil(0.95 * len(tempos)) - 1)],
+                'max_ms': tempos[-1],
+                'erros': len([r for r in registros if r['erro'] or (r['status'] or 0) >= 500]),
+                'retries': len([r for r in registros if r['tentativa'] > 0]),
+            }
+        return resumo
+
+    def imprimir_resumo(self):
+        resumo = self.resumo()
+        if not resumo:
+            return
+        protocolo = 'HTTP/2 (httpx)' if self.http2 else 'HTTP/1.1 keep-alive (requests)'
+        print(f"\n📡 Latência da API - {self.base_url} [{protocolo}]")
+        for chave, r in sorted(resumo.items()):
+            extras = f" | erros {r['erros']}" if r['erros'] else ""
+            extras += f" | retries {r['retries']}" if r['retries'] else ""
+            print(f"  {chave:<50} {r['chamadas']:>3}x  média {r['media_ms']:>7.1f} ms  "
+                  f"p95 {r['p95_ms']:>7.1f} ms{extras}")
+
+
+# ==============================================================================
+# CLIENTES COMPARTILHADOS (um por base URL no processo)
+# ==============================================================================
+
+_clientes: Dict[str, ClienteAPI] = {}
+_clientes_lock = threading.Lock()
+
+
+def obter_cliente(base_url: Optional[str] = None, **kwargs) -> ClienteAPI:
+    """Cliente compartilhado da ``base_url`` (padrão: API resolvida pelo endpoint_resolver)"""
+    base_url = (base_url or resolver_api()['url']).rstrip('/')
+    with _clientes_lock:
+        if base_url not in _clientes:
+            _clientes[base_url] = ClienteAPI(base_url, **kwargs)
+        return _clientes[base_url]
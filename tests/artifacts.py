@@ -0,0 +1,415 @@
+"""
+Artefatos de falha (screenshots + DOM) em segundo plano, deduplicados
+=====================================================================
+
+Em caso de erro, ``salvar_screenshot_erro`` (testes 04/05), o
+``debug_motor_bpmn.py`` e outros gravavam PNGs em resolução cheia e o
+``page_source`` de forma síncrona na raiz do repositório e em ``tests/`` -
+daí as dezenas de ``erro_teste_04_*.png`` quase idênticos acumulados.
+
+Este módulo centraliza a captura:
+
+- o screenshot sai do Chrome já comprimido (CDP ``Page.captureScreenshot`` em
+  WebP/JPEG); no thread do teste ficam só as chamadas ao driver, e a
+  deduplicação, a compressão do HTML (gzip) e a escrita em disco rodam num
+  thread em segundo plano;
+- duplicatas são detectadas por hash perceptual (dHash de uma miniatura da
+  tela): capturas visualmente iguais viram só uma referência no manifesto;
+- cada teste mantém um buffer circular com os últimos ``ARTEFATOS_PASSOS``
+  passos (URL e título; com ``ARTEFATOS_MINIATURAS=1`` também uma miniatura),
+  gravado junto com a falha para dar contexto - passos que dão certo não
+  pagam screenshot de tela cheia, só a falha;
+- tudo vai para um diretório por execução (``tests/output/artefatos/<execução>/``)
+  com limite de tamanho; passado o limite, os artefatos só entram no manifesto.
+
+Uso:
+
+    from artifacts import registrar_passo, capturar_falha
+
+    registrar_passo(driver, 'teste_04', 'Preencher dados')      # a cada etapa
+    ...
+    except Exception:
+        capturar_falha(driver, 'teste_04', 'pagina_nao_encontrada')
+
+O ``manifesto.jsonl`` da execução lista cada artefato (teste, descrição,
+URL, arquivo, hash e de qual arquivo ele é duplicata).
+
+Variáveis de ambiente:
+    ARTEFATOS_DIR         pasta base (padrão: tests/output/artefatos)
+    ARTEFATOS_FORMATO     webp, jpeg ou png (padrão: webp)
+    ARTEFATOS_QUALIDADE   qualidade do WebP/JPEG, 0-100 (padrão: 60)
+    ARTEFATOS_PASSOS      passos mantidos por teste; 0 desliga (padrão: 5)
+    ARTEFATOS_MINIATURAS  1 = guarda uma miniatura por passo (padrão: 0, só URL/título)
+    ARTEFATOS_LIMITE_MB   tamanho máximo da execução em MB (padrão: 200)
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import os
+import re
+import gzip
+import json
+import time
+import zlib
+import base64
+import atexit
+import struct
+import hashlib
+import threading
+import unicodedata
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from queue import Queue
+from typing import Dict, List, Optional, Tuple
+
+
+ARTEFATOS_DIR = Path(os.getenv('ARTEFATOS_DIR', Path(__file__).resolve().parent / 'output' / 'artefatos'))
+FORMATO = os.getenv('ARTEFATOS_FORMATO', 'webp').lower()
+QUALIDADE = int(os.getenv('ARTEFATOS_QUALIDADE', '60'))
+PASSOS = int(os.getenv('ARTEFATOS_PASSOS', '5'))
+MINIATURAS = os.getenv('ARTEFATOS_MINIATURAS', '0').lower() in ('1', 'true', 'sim')
+LIMITE_MB = float(os.getenv('ARTEFATOS_LIMITE_MB', '200'))
+
+LARGURA_MINIATURA = 17          # dHash: 16 comparações por linha
+LARGURA_PASSO = 320             # miniatura de passo (ARTEFATOS_MINIATURAS=1)
+DISTANCIA_DUPLICATA = 0.05      # fração máxima de bits diferentes para considerar duplicata
+
+EXTENSOES = {'webp': 'webp', 'jpeg': 'jpg', 'png': 'png'}
+
+
+def _slug(texto: str) -> str:
+    texto = unicodedata.normalize('NFKD', str(texto)).encode('ascii', 'ignore').decode()
+    return re.sub(r'[^a-zA-Z0-9]+', '_', texto).strip('_').lower()[:60] or 'sem_nome'
+
+
+# ==============================================================================
+# HASH PERCEPTUAL (sem Pillow: miniatura PNG decodificada aqui)
+# ==============================================================================
+
+def _pixels_png(dados: bytes) -> Optional[List[List[int]]]:
+    """Tons de cinza de um PNG de 8 bits não entrelaçado (miniaturas do Chrome)"""
+    if dados[:8] != b'\x89PNG\r\n\x1a\n':
+        return None
+    pos, idat, cabecalho = 8, b'', None
+    while pos < len(dados):
+        tamanho, tipo = struct.unpack('>I4s', dados[pos:pos + 8])
+        corpo = dados[pos + 8:pos + 8 + tamanho]
+        pos += 12 + tamanho
+        if tipo == b'IHDR':
+            cabecalho = struct.unpack('>IIBBBBB', corpo)
+        elif tipo == b'IDAT':
+            idat += corpo
+        elif tipo == b'IEND':
+            break
+    if cabecalho is None:
+        return None
+    largura, altura, profundidade, cor, _, _, entrelacado = cabecalho
+    canais = {0: 1, 2: 3, 4: 2, 6: 4}.get(cor)
+    if profundidade != 8 or entrelacado or canais is None:
+        return None
+
+    bruto = zlib.decompress(idat)
+    passo = largura * canais
+    anterior = bytearray(passo)
+    linhas = []
+    for y in range(altura):
+        inicio = y * (passo + 1)
+        filtro, linha = bruto[inicio], bytearray(bruto[inicio + 1:inicio + 1 + passo])
+        for x in range(passo):
+            a = linha[x - canais] if x >= canais else 0
+            b = anterior[x]
+            c = anterior[x - canais] if x >= canais else 0
+            if filtro == 1:
+                linha[x] = (linha[x] + a) & 0xFF
+            elif filtro == 2:
+                linha[x] = (linha[x] + b) & 0xFF
+            elif filtro == 3:
+                linha[x] = (linha[x] + (a + b) // 2) & 0xFF
+            elif filtro == 4:
+                p = a + b - c
+                pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+                linha[x] = (linha[x] + (a if pa <= pb and pa <= pc else b if pb <= pc else c)) & 0xFF
+        if canais >= 3:
+            cinza = [(299 * linha[k] + 587 * linha[k + 1] + 114 * linha[k + 2]) // 1000
+                     for k in range(0, passo, canais)]
+        else:
+            cinza = [linha[k] for k in range(0, passo, canais)]
+        linhas.append(cinza)
+        anterior = linha
+    return linhas
+
+
+def dhash(linhas: List[List[int]]) -> Tuple[int, int]:
+    """(hash, número de bits): 1 quando o pixel é mais claro que o vizinho da direita"""
+    valor, bits = 0, 0
+    for linha in linhas:
+        for esquerda, direita in zip(linha, linha[1:]):
+            valor = (valor << 1) | (esquerda > direita)
+            bits += 1
+    return valor, bits
+
+
+def distancia(a: Tuple[int, int], b: Tuple[int, int]) -> float:
+    """Fração de bits diferentes entre dois dHash (1.0 se incomparáveis)"""
+    if a[1] != b[1] or not a[1]:
+        return 1.0
+    return bin(a[0] ^ b[0]).count('1') / a[1]
+
+
+# ==============================================================================
+# CAPTURA (thread do teste: só chamadas ao driver)
+# ==============================================================================
+
+class Instantaneo:
+    """Estado da tela num momento: imagem já comprimida, miniatura, URL e (opcional) HTML"""
+
+    def __init__(self, teste: str, descricao: str):
+        self.teste = teste
+        self.descricao = descricao
+        self.quando = datetime.now()
+        self.url = None
+        self.titulo = None
+        self.imagem: Optional[bytes] = None
+        self.extensao = EXTENSOES.get(FORMATO, 'webp')
+        self.miniatura: Optional[bytes] = None
+        self.html: Optional[str] = None
+        self.erro: Optional[str] = None
+
+
+def capturar(driver, teste: str, descricao: str, html: bool = False, tela: Optional[str] = 'cheia') -> Instantaneo:
+    """
+    Captura a tela atual; erros do driver ficam em ``erro`` (nunca propagam).
+
+    ``tela``: 'cheia' (screenshot + miniatura do dHash, duas chamadas CDP),
+    'miniatura' (uma chamada CDP, ``LARGURA_PASSO`` px) ou None (só URL/título).
+    """
+    inst = Instantaneo(teste, descricao)
+    try:
+        inst.url, inst.titulo, largura, altura = driver.execute_script(
+            'return [location.href, document.title, window.innerWidth, window.innerHeight]')
+    except Exception as e:
+        inst.erro = str(e).splitlines()[0] if str(e) else type(e).__name__
+        return inst
+    if tela is None:
+        return inst
+
+    parametros = {'format': FORMATO if FORMATO in EXTENSOES else 'webp'}
+    if parametros['format'] != 'png':
+        parametros['quality'] = QUALIDADE
+    if tela == 'miniatura':
+        parametros['clip'] = {'x': 0, 'y': 0, 'width': largura, 'height': altura,
+                              'scale': min(1.0, LARGURA_PASSO / largura)}
+        try:
+            inst.imagem = base64.b64decode(driver.execute_cdp_cmd('Page.captureScreenshot', parametros)['data'])
+        except Exception as e:
+            inst.erro = str(e).splitlines()[0] if str(e) else type(e).__name__
+        return inst
+
+    try:
+        inst.imagem = base64.b64decode(driver.execute_cdp_cmd('Page.captureScreenshot', parametros)['data'])
+        inst.miniatura = base64.b64decode(driver.execute_cdp_cmd('Page.captureScreenshot', {
+            'format': 'png',
+            'clip': {'x': 0, 'y': 0, 'width': largura, 'height': altura, 'scale': LARGURA_MINIATURA / largura},
+        })['data'])
+    except Exception:
+        # Driver sem CDP: PNG do WebDriver, deduplicado só por conteúdo idêntico
+        try:
+            inst.imagem = driver.get_screenshot_as_png()
+            inst.extensao = 'png'
+        except Exception as e:
+            inst.erro = str(e).splitlines()[0] if str(e) else type(e).__name__
+
+    if html:
+        try:
+            inst.html = driver.page_source
+        except Exception:
+            pass
+    return inst
+
+
+# ==============================================================================
+# SERVIÇO (thread de gravação)
+# ==============================================================================
+
+class ServicoArtefatos:
+    """Buffer de passos por teste + fila de gravação em segundo plano"""
+
+    def __init__(self, diretorio: Path = ARTEFATOS_DIR, passos: int = PASSOS, limite_mb: float = LIMITE_MB):
+        nome = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+        self.diretorio = Path(diretorio) / nome
+        self.passos = max(0, passos)
+        self.limite_bytes = int(limite_mb * 1024 * 1024)
+        self.bytes_gravados = 0
+        self.estatisticas = {'falhas': 0, 'arquivos': 0, 'duplicados': 0, 'descartados': 0}
+
+        self._aneis: Dict[str, deque] = {}
+        self._hashes: List[Tuple[Tuple[int, int], str]] = []    # (dHash, arquivo) já gravados
+        self._exatos: Dict[str, str] = {}                      # sha256 → arquivo (sem miniatura)
+        self._contadores: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._fila: Queue = Queue()
+        self._thread = threading.Thread(target=self._trabalhar, daemon=True, name='artefatos')
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # API do teste
+    # ------------------------------------------------------------------
+
+    def registrar_passo(self, driver, teste: str, passo: str):
+        """Guarda URL/título (e a miniatura, se ligada) no buffer circular do teste; só vai a disco na falha"""
+        if not self.passos or driver is None:
+            return
+        inst = capturar(driver, teste, passo, tela='miniatura' if MINIATURAS else None)
+        with self._lock:
+            self._aneis.setdefault(teste, deque(maxlen=self.passos)).append(inst)
+
+    def capturar_falha(self, driver, teste: str, descricao: str) -> Optional[Path]:
+        """Captura tela + DOM e agenda a gravação com os passos anteriores; retorna a pasta do teste"""
+        if driver is None:
+            return None
+        inst = capturar(driver, teste, descricao, html=True)
+        with self._lock:
+            contexto = list(self._aneis.pop(teste, ()))
+            self.estatisticas['falhas'] += 1
+        self._fila.put((inst, contexto, 'falha'))
+        return self.diretorio / _slug(teste)
+
+    def salvar_estado(self, driver, teste: str, descricao: str) -> Optional[Path]:
+        """Como ``capturar_falha``, mas para capturas de depuração (sem passos nem contagem de falha)"""
+        if driver is None:
+            return None
+        self._fila.put((capturar(driver, teste, descricao, html=True), [], 'estado'))
+        return self.diretorio / _slug(teste)
+
+    def finalizar(self, timeout: float = 30):
+        """Espera a fila de gravação esvaziar"""
+        fim = time.time() + timeout
+        while self._fila.unfinished_tasks and time.time() < fim:
+            time.sleep(0.05)
+
+    def resumo(self) -> str:
+        e = self.estatisticas
+        return (f"Artefatos: {e['falhas']} falha(s), {e['arquivos']} arquivo(s) "
+                f"({self.bytes_gravados / 1024:.0f} KB), {e['duplicados']} duplicado(s), "
+                f"{e['descartados']} acima do limite → {self.diretorio}")
+
+    # ------------------------------------------------------------------
+    # Thread de gravação
+    # ------------------------------------------------------------------
+
+    def _trabalhar(self):
+        while True:
+            inst, contexto, tipo = self._fila.get()
+            try:
+                self._gravar_falha(inst, contexto, tipo)
+            except Exception as e:
+                print(f"⚠️  Artefatos: falha ao gravar {inst.teste}/{inst.descricao}: {e}")
+            finally:
+                self._fila.task_done()
+
+    def _gravar_falha(self, inst: Instantaneo, contexto: List[Instantaneo], tipo: str):
+        pasta = self.diretorio / _slug(inst.teste)
+        numero = self._contadores[inst.teste] = self._contadores.get(inst.teste, 0) + 1
+        prefixo = f"{numero:02d}_{_slug(inst.descricao)}"
+
+        for ordem, passo in enumerate(contexto, 1):
+            self._gravar_imagem(passo, pasta / f"{prefixo}_passo{ordem}_{_slug(passo.descricao)}", 'passo')
+        registro = self._gravar_imagem(inst, pasta / prefixo, tipo)
+        if inst.html is not None:
+            dados = gzip.compress(inst.html.encode('utf-8'), 6)
+            registro['html'] = self._gravar_bytes(pasta / f"{prefixo}.html.gz", dados)
+
+    def _gravar_imagem(self, inst: Instantaneo, base: Path, tipo: str) -> dict:
+        registro = {
+            'tipo': tipo, 'teste': inst.teste, 'descricao': inst.descricao,
+            'quando': inst.quando.isoformat(timespec='seconds'), 'url': inst.url, 'titulo': inst.titulo,
+            'arquivo': None, 'duplicado_de': None, 'erro': inst.erro,
+        }
+        if inst.imagem is not None:
+            pixels = _pixels_png(inst.miniatura) if inst.miniatura else None
+            assinatura = dhash(pixels) if pixels else None
+            exato = hashlib.sha256(inst.imagem).hexdigest()
+            registro['hash'] = f"{assinatura[0]:x}/{assinatura[1]}" if assinatura else exato[:16]
+
+            with self._lock:
+                if assinatura:
+                    igual = next((arq for h, arq in self._hashes if distancia(h, assinatura) <= DISTANCIA_DUPLICATA), None)
+                else:
+                    igual = self._exatos.get(exato)
+            if igual:
+                registro['duplicado_de'] = igual
+                self.estatisticas['duplicados'] += 1
+            else:
+                arquivo = self._gravar_bytes(base.with_name(f"{base.name}.{inst.extensao}"), inst.imagem)
+                registro['arquivo'] = arquivo
+                if arquivo:
+                    with self._lock:
+                        if assinatura:
+                            self._hashes.append((assinatura, arquivo))
+                        self._exatos[exato] = arquivo
+        self._manifesto(registro)
+        return registro
+
+    def _gravar_bytes(self, caminho: Path, dados: bytes) -> Optional[str]:
+        """Grava respeitando o limite da execução; retorna o caminho relativo (ou None se descartado)"""
+        if self.bytes_gravados + len(dados) > self.limite_bytes:
+            if not self.estatisticas['descartados']:
+                print(f"⚠️  Artefatos: limite de {self.limite_bytes // (1024 * 1024)} MB atingido em {self.diretorio}")
+            self.estatisticas['descartados'] += 1
+            return None
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        caminho.write_bytes(dados)
+        self.bytes_gravados += len(dados)
+        self.estatisticas['arquivos'] += 1
+        return str(caminho.relative_to(self.diretorio))
+
+    def _manifesto(self, registro: dict):
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+        with open(self.diretorio / 'manifesto.jsonl', 'a', encoding='utf-8') as f:
+            f.write(json.dumps(registro, ensure_ascii=False) + '\n')
+
+
+# ==============================================================================
+# SERVIÇO COMPARTILHADO DO PROCESSO
+# ==============================================================================
+
+_servico: Optional[ServicoArtefatos] = None
+_servico_lock = threading.Lock()
+
+
+def obter_servico() -> ServicoArtefatos:
+    global _servico
+    with _servico_lock:
+        if _servico is None:
+            _servico = ServicoArtefatos()
+            atexit.register(encerrar_servico)
+        return _servico
+
+
+def registrar_passo(driver, teste: str, passo: str):
+    """Atalho: snapshot do passo no buffer circular do teste"""
+    if PASSOS and driver is not None:
+        obter_servico().registrar_passo(driver, teste, passo)
+
+
+def capturar_falha(driver, teste: str, descricao: str) -> Optional[Path]:
+    """Atalho: captura a falha (tela + DOM + passos anteriores) em segundo plano"""
+    return obter_servico().capturar_falha(driver, teste, descricao)
+
+
+def salvar_estado(driver, teste: str, descricao: str) -> Optional[Path]:
+    """Atalho: tela + DOM para depuração, pelo mesmo caminho assíncrono e deduplicado"""
+    return obter_servico().salvar_estado(driver, teste, descricao)
+
+
+def encerrar_servico():
+    """Espera as gravações pendentes e imprime o resumo (registrado em atexit)"""
+    global _servico
+    with _servico_lock:
+        servico, _servico = _servico, None
+    if servico is not None:
+        servico.finalizar()
+        if servico.estatisticas['arquivos'] or servico.estatisticas['duplicados']:
+            print(f"\n📸 {servico.resumo()}")
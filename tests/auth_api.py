@@ -0,0 +1,177 @@
+"""
+Login via API (sem Selenium): token em cache até expirar
+========================================================
+
+Autentica em ``POST /api/v1/auth/login`` uma única vez por execução e guarda o
+token até expirar (memória + arquivo em disco, compartilhado entre processos).
+Separado do ``auth_session`` para que benchmarks e testes só de HTTP não
+precisem importar o Selenium; o ``auth_session`` reexporta estas funções e
+cuida da injeção da sessão no navegador.
+
+Uso:
+
+    from auth_api import autenticar, cabecalhos_auth
+
+    token = autenticar()['token']
+    requests.get(f"{API_URL}/processos", headers=cabecalhos_auth())
+
+Variáveis de ambiente:
+    AUTH_API_URL / API_URL   base da API (padrão: http://localhost:8000/api/v1)
+    TEST_CPF / TEST_PASSWORD credenciais (padrão: usuário de testes)
+    AUTH_TOKEN_TTL           validade assumida (s) quando o token não traz exp
+    AUTH_CACHE_FILE          arquivo de cache do token (padrão: pasta do usuário no temp,
+                             criada com permissão 0700; o arquivo com 0600)
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import base64
+import getpass
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Optional
+
+import requests
+
+
+# ==============================================================================
+# CONFIGURAÇÕES
+# ==============================================================================
+
+API_URL = os.getenv('AUTH_API_URL') or os.getenv('API_URL', 'http://localhost:8000/api/v1')
+CPF = os.getenv('TEST_CPF', '61404694579')
+SENHA = os.getenv('TEST_PASSWORD', 'Senh@01!')
+TOKEN_TTL = int(os.getenv('AUTH_TOKEN_TTL', '1800'))
+MARGEM_EXPIRACAO = 60  # renova o token se faltar menos que isso para expirar
+
+
+def _arquivo_cache_padrao() -> str:
+    """Cache numa pasta do próprio usuário: o arquivo guarda um bearer token válido"""
+    try:
+        usuario = getpass.getuser()
+    except Exception:
+        usuario = str(os.getuid()) if hasattr(os, 'getuid') else 'usuario'
+    return os.path.join(tempfile.gettempdir(), f'licenciamento_auth_{usuario}', 'auth_cache.json')
+
+
+CACHE_ARQUIVO = os.getenv('AUTH_CACHE_FILE') or _arquivo_cache_padrao()
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+# ==============================================================================
+# TOKEN
+# ==============================================================================
+
+def _normalizar_id(valor: str) -> str:
+    """Mesmo ``normalizeId`` do app (src/lib/api/auth.ts): tira a máscara, mantém letras (PASSAPORTE / ID_ESTRANGEIRA)"""
+    return re.sub(r'[^0-9A-Za-z]', '', valor or '')
+
+
+def _expiracao_token(token: str) -> Optional[float]:
+    """Lê ``exp`` do payload do token (JWT ou payload base64 simples)"""
+    partes = token.split('.')
+    payload = partes[1] if len(partes) == 3 else partes[0]
+    try:
+        dados = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        exp = dados.get('exp')
+        return float(exp) if exp else None
+    except Exception:
+        return None
+
+
+def _sessao_valida(sessao: Optional[dict]) -> bool:
+    return bool(sessao and sessao.get('token') and sessao.get('expira_em', 0) - MARGEM_EXPIRACAO > time.time())
+
+
+def _ler_cache_disco(chave: str) -> Optional[dict]:
+    try:
+        with open(CACHE_ARQUIVO, 'r', encoding='utf-8') as f:
+            return json.load(f).get(chave)
+    except Exception:
+        return None
+
+
+def _gravar_cache_disco(chave: str, sessao: dict):
+    try:
+        try:
+            with open(CACHE_ARQUIVO, 'r', encoding='utf-8') as f:
+                dados = json.load(f)
+        except Exception:
+            dados = {}
+        dados[chave] = sessao
+        pasta = os.path.dirname(os.path.abspath(CACHE_ARQUIVO))
+        os.makedirs(pasta, mode=0o700, exist_ok=True)
+        temporario = f"{CACHE_ARQUIVO}.{os.getpid()}.tmp"
+        # Só o dono lê/escreve o token (0600), inclusive se o arquivo já existia com outra permissão
+        with os.fdopen(os.open(temporario, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w', encoding='utf-8') as f:
+            json.dump(dados, f)
+        os.chmod(temporario, 0o600)
+        os.replace(temporario, CACHE_ARQUIVO)
+    except Exception as e:
+        print(f"  ⚠️ Não foi possível gravar cache do token: {e}")
+
+
+def autenticar(cpf: str = CPF, senha: str = SENHA, api_url: str = API_URL,
+               forcar: bool = False, timeout: float = 15) -> dict:
+    """
+    Autentica na API e retorna a sessão (cacheada até o token expirar).
+
+    Returns:
+        dict com token, nome, userId, expira_em e dados (resposta completa)
+
+    Raises:
+        requests.RequestException / ValueError se o login falhar
+    """
+    login = _normalizar_id(cpf)
+    chave = f"{api_url.rstrip('/')}|{login}"
+
+    with _cache_lock:
+        if not forcar:
+            sessao = _cache.get(chave)
+            if not _sessao_valida(sessao):
+                sessao = _ler_cache_disco(chave)
+            if _sessao_valida(sessao):
+                _cache[chave] = sessao
+                return sessao
+
+        response = requests.post(
+            f"{api_url.rstrip('/')}/auth/login",
+            json={'login': login, 'senha': senha},
+            timeout=timeout
+        )
+        response.raise_for_status()
+        dados = response.json()
+        token = dados.get('token') or dados.get('access_token')
+        if not token:
+            raise ValueError(f"Resposta de login sem token: {list(dados.keys())}")
+
+        sessao = {
+            'token': token,
+            'nome': dados.get('nome', ''),
+            'userId': dados.get('userId') or dados.get('id'),
+            'expira_em': _expiracao_token(token) or (time.time() + TOKEN_TTL),
+            'dados': dados,
+        }
+        _cache[chave] = sessao
+        _gravar_cache_disco(chave, sessao)
+        return sessao
+
+
+def invalidar_cache(cpf: str = CPF, api_url: str = API_URL):
+    """Descarta o token em cache (memória e disco)"""
+    chave = f"{api_url.rstrip('/')}|{_normalizar_id(cpf)}"
+    with _cache_lock:
+        _cache.pop(chave, None)
+        _gravar_cache_disco(chave, None)
+
+
+def cabecalhos_auth(**kwargs) -> dict:
+    """Cabeçalho Authorization para chamadas diretas à API"""
+    return {'Authorization': f"Bearer {autenticar(**kwargs)['token']}"}
@@ -0,0 +1,170 @@
+"""
+Login via API com sessão em cache injetada no navegador
+========================================================
+
+Cada suíte refazia o login pelo formulário React (CPF + senha + Entrar +
+sleep de 3-8s). Este módulo autentica uma única vez por execução em
+``POST /api/v1/auth/login`` (``auth_api``: token em cache até expirar, sem
+Selenium) e o injeta direto no navegador antes da primeira navegação:
+
+- localStorage: ``auth_token``, ``auth_user`` e ``userData`` (mesmo formato
+  gravado por ``src/lib/api/auth.ts`` e ``useAutoLogin``);
+- cookie ``auth_token`` no domínio do frontend.
+
+A injeção usa o CDP ``Page.addScriptToEvaluateOnNewDocument``, então o token
+já está no storage quando o app React inicializa. Se a API não responder, cai
+no login pelo formulário (``login_formulario``).
+
+Uso:
+
+    from auth_session import login_navegador
+
+    login_navegador(driver)                      # abre o dashboard autenticado
+    login_navegador(driver, caminho='/admin')    # abre direto a rota desejada
+
+Variáveis de ambiente:
+    AUTH_API_URL / API_URL   base da API (padrão: http://localhost:8000/api/v1)
+    TEST_CPF / TEST_PASSWORD credenciais (padrão: usuário de testes)
+    BASE_URL                 frontend (padrão: http://localhost:5173)
+    AUTH_TOKEN_TTL / AUTH_CACHE_FILE   ver auth_api.py
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import json
+import os
+import time
+from typing import Optional
+from urllib.parse import urlparse
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from smart_wait import aguardar_estavel
+# Token e cache ficam no auth_api (sem Selenium); reexportados para os usos existentes
+from auth_api import API_URL, CPF, SENHA, autenticar, invalidar_cache, cabecalhos_auth
+
+
+# ==============================================================================
+# CONFIGURAÇÕES
+# ==============================================================================
+
+BASE_URL = os.getenv('BASE_URL', 'http://localhost:5173')
+
+_scripts_injetados = {}  # id(driver) -> identificador do script CDP
+
+
+# ==============================================================================
+# INJEÇÃO NO NAVEGADOR
+# ==============================================================================
+
+def _script_storage(sessao: dict, origem: str) -> str:
+    auth_user = dict(sessao.get('dados') or {})
+    auth_user.setdefault('token', sessao['token'])
+    auth_user.setdefault('nome', sessao.get('nome', ''))
+    auth_user.setdefault('userId', sessao.get('userId'))
+    user_data = {'token': sessao['token'], 'userId': sessao.get('userId'), 'nome': sessao.get('nome', '')}
+    itens = {
+        'auth_token': sessao['token'],
+        'auth_user': json.dumps(auth_user),
+        'userData': json.dumps(user_data),
+    }
+    return (
+        "(function(){"
+        f"if (window.location.origin !== {json.dumps(origem)}) return;"
+        f"var itens = {json.dumps(itens)};"
+        "for (var k in itens) { if (window.localStorage.getItem(k) === null) window.localStorage.setItem(k, itens[k]); }"
+        "})();"
+    )
+
+
+def injetar_sessao(driver, sessao: Optional[dict] = None, base_url: str = BASE_URL):
+    """
+    Injeta o token no localStorage e nos cookies antes da próxima navegação.
+
+    Com CDP o script roda no início de todo documento da origem do frontend;
+    sem CDP, abre a origem uma vez e grava o storage via JavaScript.
+    """
+    sessao = sessao or autenticar()
+    url = urlparse(base_url)
+    origem = f"{url.scheme}://{url.netloc}"
+    script = _script_storage(sessao, origem)
+
+    try:
+        remover_sessao(driver)
+        resultado = driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': script})
+        _scripts_injetados[id(driver)] = resultado.get('identifier')
+        driver.execute_cdp_cmd('Network.setCookie', {
+            'name': 'auth_token',
+            'value': sessao['token'],
+            'url': origem,
+            'path': '/',
+            'expires': sessao.get('expira_em'),
+        })
+    except Exception:
+        # Driver sem CDP: grava no storage da origem e segue
+        driver.get(origem)
+        driver.execute_script(script)
+        driver.add_cookie({'name': 'auth_token', 'value': sessao['token'], 'path': '/'})
+
+
+def remover_sessao(driver):
+    """Remove o script de injeção registrado no driver (ex.: ao devolver ao pool)"""
+    identificador = _scripts_injetados.pop(id(driver), None)
+    if identificador:
+        try:
+            driver.execute_cdp_cmd('Page.removeScriptToEvaluateOnNewDocument', {'identifier': identificador})
+        except Exception:
+            pass
+
+
+def login_formulario(driver, cpf: str = CPF, senha: str = SENHA, base_url: str = BASE_URL,
+                     timeout: float = 30) -> bool:
+    """Login pelo formulário React (fallback quando a API não responde)"""
+    driver.get(f"{base_url}/login")
+    wait = WebDriverWait(driver, timeout)
+    cpf_input = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 'input[type="text"]')))
+    cpf_input.clear()
+    cpf_input.send_keys(cpf)
+    password_input = driver.find_element(By.CSS_SELECTOR, 'input[type="password"]')
+    password_input.clear()
+    password_input.send_keys(senha)
+    driver.find_element(By.CSS_SELECTOR, 'button[type="submit"]').click()
+    wait.until(lambda d: '/login' not in d.current_url)
+    aguardar_estavel(driver, timeout=5)
+    return True
+
+
+def login_navegador(driver, caminho: str = '/dashboard', cpf: str = CPF, senha: str = SENHA,
+                    base_url: str = BASE_URL, api_url: str = API_URL) -> bool:
+    """
+    Deixa o navegador autenticado e abre ``caminho``.
+
+    Tenta o login via API + injeção da sessão; se falhar, usa o formulário.
+    """
+    try:
+        sessao = autenticar(cpf, senha, api_url)
+        injetar_sessao(driver, sessao, base_url)
+        print(f"  ✓ Sessão injetada (token em cache até {time.strftime('%H:%M:%S', time.localtime(sessao['expira_em']))})")
+    except Exception as e:
+        print(f"  ⚠️ Login via API indisponível ({e}); usando formulário")
+        login_formulario(driver, cpf, senha, base_url)
+        if caminho and caminho != '/':
+            driver.get(f"{base_url}{caminho}")
+            aguardar_estavel(driver, timeout=5)
+        return True
+
+    driver.get(f"{base_url}{caminho}")
+    aguardar_estavel(driver, timeout=5)
+    if '/login' in driver.current_url:
+        # Token recusado pelo app: descarta cache e usa o formulário
+        print("  ⚠️ Sessão injetada não foi aceita; usando formulário")
+        remover_sessao(driver)
+        invalidar_cache(cpf, api_url)
+        login_formulario(driver, cpf, senha, base_url)
+        if caminho and caminho != '/':
+            driver.get(f"{base_url}{caminho}")
+            aguardar_estavel(driver, timeout=5)
+    return True
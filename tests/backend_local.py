@@ -0,0 +1,1128 @@
+"""
+Backend local (API + PostgREST) para execuções herméticas
+==========================================================
+
+Os testes dependem de uma API viva (``localhost:3000/api/v1``, Render) e de
+um projeto Supabase remoto; a latência e a disponibilidade desses serviços
+ditam a duração da suíte. Este módulo sobe, no próprio processo, um servidor
+HTTP (somente biblioteca padrão) que responde aos endpoints usados pelo app e
+pelos testes, com respostas em milissegundos e sem rede:
+
+API (``/api/v1``):
+    POST /auth/login
+    GET  /health
+    /workflow/instances/start, /current-step, /steps/{id}/complete|back|subprocess,
+    /step-history, /workflow/templates/{code}/steps
+    /notifications (lista, criação, stats, read, read-all, delete)
+    /referencias/* , /license-types, /document-templates (CRUD)
+    /system-config (lista, consulta e atualização por chave)
+
+Supabase REST (``/rest/v1/{tabela}``), subconjunto do PostgREST:
+    select com recursos embutidos (``*, enterprises(*, activities(name))``,
+    ``tabela(count)``), filtros eq/neq/gt/gte/lt/lte/like/ilike/in/is,
+    order, limit/offset, ``Prefer: count=exact``, insert/upsert, update e delete.
+    Insert/update com coluna fora do esquema declarado responde 400 (PGRST204).
+
+Os dados ficam em memória, semeados a partir de ``supabase/migrations``
+(CREATE TABLE, ALTER TABLE ADD COLUMN, DROP TABLE e INSERT) mais as tabelas do
+fluxo de Novo Empreendimento, notificações, configurações e workflow.
+
+Uso:
+
+    python backend_local.py                       # http://localhost:8000
+    python backend_local.py --porta 3000
+    python backend_local.py -- python test_api_direct.py   # sobe, executa e encerra
+
+    # em processo
+    from backend_local import iniciar_backend
+    backend = iniciar_backend(porta=0)            # porta livre
+    os.environ.update(backend.variaveis_ambiente())
+    ...
+    backend.encerrar()
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import argparse
+import base64
+import json
+import os
+import re
+import socket
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlparse
+
+
+# ==============================================================================
+# CONFIGURAÇÕES
+# ==============================================================================
+
+PORTA_PADRAO = int(os.getenv('BACKEND_LOCAL_PORTA', '8000'))
+PASTA_MIGRACOES = Path(__file__).resolve().parent.parent / 'supabase' / 'migrations'
+USER_ID = os.getenv('TEST_USER_ID', '264671')
+USER_NOME = os.getenv('TEST_USER_NOME', 'Usuário de Testes')
+TOKEN_TTL = int(os.getenv('AUTH_TOKEN_TTL', '1800'))
+
+# Chave no formato JWT (o supabase-py valida o formato da chave)
+CHAVE_LOCAL = 'eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJyb2xlIjoiYW5vbiIsImlzcyI6ImJhY2tlbmRfbG9jYWwifQ.bG9jYWw'
+
+TEMPLATE_WORKFLOW = 'LICENCIAMENTO_AMBIENTAL_COMPLETO'
+STEPS_WORKFLOW = [
+    ('PARTICIPANTES', 'Participantes', '/inscricao/participantes'),
+    ('IMOVEL', 'Imóvel', '/inscricao/imovel'),
+    ('EMPREENDIMENTO', 'Empreendimento', '/inscricao/empreendimento'),
+    ('FORMULARIO', 'Formulário', '/inscricao/formulario'),
+    ('DOCUMENTACAO', 'Documentação', '/inscricao/documentacao'),
+    ('REVISAO', 'Revisão', '/inscricao/revisao'),
+]
+
+# Tabelas que não estão nas migrações: colunas com default e chaves estrangeiras
+TABELAS_EXTRAS = {
+    # Colunas de Property (src/types/inscription.ts) e de Enterprise (src/services/enterpriseService.ts)
+    'properties': {'colunas': ['kind', 'nome', 'areatotal', 'municipio_sede', 'roteiro_acesso', 'utm_lat',
+                               'utm_long', 'utm_zona', 'dms_lat', 'dms_long', 'car_codigo',
+                               'arquivogeorreferenciamento', 'address_id', 'created_by', 'municipio_inicio',
+                               'uf_inicio', 'municipio_final', 'uf_final', 'sistema_referencia', 'uf',
+                               'municipio', 'roteiro_acesso_detalhado', 'car_situacao', 'area_total_imovel',
+                               'area_uso_consolidado', 'area_vegetacao_nativa', 'area_app', 'area_cursos_agua',
+                               'area_ocupacao_apos_2008']},
+    'enterprises': {'colunas': ['cnpj_cpf', 'razao_social', 'nome_fantasia', 'nome_completo', 'tipo_pessoa',
+                                'endereco', 'cidade', 'estado', 'cep', 'telefone', 'email'],
+                    'fks': {'property_id': 'properties'}},
+    # Colunas de Activity (src/services/adminService.ts)
+    'enterprise_sizes': {'colunas': ['name', 'description', 'is_active']},
+    'activities': {'colunas': ['code', 'name', 'description', 'cnae_codigo', 'cnae_descricao', 'measurement_unit',
+                               'range_start', 'range_end', 'is_active'],
+                   'fks': {'enterprise_size_id': 'enterprise_sizes', 'pollution_potential_id': 'pollution_potentials'}},
+    'activity_enterprise_ranges': {'colunas': ['range_name', 'range_start', 'range_end'],
+                                   'fks': {'activity_id': 'activities', 'enterprise_size_id': 'enterprise_sizes'}},
+    'enterprise_activities': {'colunas': ['quantity', 'unit'],
+                              'fks': {'enterprise_id': 'enterprises', 'activity_id': 'activities'}},
+    'enterprise_characterization': {'colunas': ['water_origin', 'water_consumption_human', 'effluent_destination'],
+                                    'fks': {'enterprise_id': 'enterprises'}},
+    'enterprise_energy_resources': {'colunas': ['resource_type', 'quantity'],
+                                    'fks': {'enterprise_id': 'enterprises'}},
+    'pollution_potentials': {'colunas': ['name', 'description', 'is_active']},
+    'reference_units': {'colunas': ['code', 'name', 'description', 'is_active']},
+    'system_config': {'colunas': ['config_key', 'config_value', 'config_description']},
+    'notifications': {'colunas': ['user_id', 'type', 'title', 'message', 'severity', 'is_read',
+                                  'target_type', 'target_id', 'action_url']},
+    'workflow_process_instance': {'colunas': ['template_code', 'target_type', 'target_id', 'status',
+                                              'current_step_id']},
+    'workflow_process_instance_step': {'colunas': ['step_id', 'step_key', 'status', 'payload', 'completed_at'],
+                                       'fks': {'instance_id': 'workflow_process_instance'}},
+}
+
+SEMENTES = {
+    'enterprise_sizes': [
+        {'name': 'Micro'}, {'name': 'Pequeno'}, {'name': 'Médio'}, {'name': 'Grande'}, {'name': 'Excepcional'},
+    ],
+    'pollution_potentials': [
+        {'name': 'Baixo', 'description': 'Potencial poluidor baixo'},
+        {'name': 'Médio', 'description': 'Potencial poluidor médio'},
+        {'name': 'Alto', 'description': 'Potencial poluidor alto'},
+    ],
+    'reference_units': [
+        {'code': 'M2', 'name': 'Metro quadrado', 'description': 'Área em m²'},
+        {'code': 'M3', 'name': 'Metro cúbico', 'description': 'Volume em m³'},
+        {'code': 'HA', 'name': 'Hectare', 'description': 'Área em hectares'},
+        {'code': 'TON', 'name': 'Tonelada', 'description': 'Massa em toneladas'},
+        {'code': 'UN', 'name': 'Unidade', 'description': 'Quantidade unitária'},
+    ],
+    'system_config': [
+        {'config_key': 'empreendimento_search_required', 'config_value': False,
+         'config_description': 'Pesquisa de empreendimento obrigatória antes do cadastro'},
+        {'config_key': 'empreendimento_allow_new_register', 'config_value': True,
+         'config_description': 'Permite cadastrar novo empreendimento quando a pesquisa não encontra'},
+    ],
+}
+
+# /api/v1/referencias/{recurso} -> tabela
+MAPA_REFERENCIAS = {
+    'pollution-potentials': 'pollution_potentials',
+    'unidades-medida': 'reference_units',
+}
+
+
+def _agora() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+# ==============================================================================
+# MIGRAÇÕES (parser mínimo de SQL)
+# ==============================================================================
+
+_TOKEN_SQL = re.compile(
+    r"\s*(?:(?P<str>'(?:[^']|'')*')|(?P<cast>::\s*[A-Za-z_][\w ]*(?:\[\])?)|(?P<num>-?\d+(?:\.\d+)?)"
+    r"|(?P<sym>[()\[\],])|(?P<id>[A-Za-z_][\w.]*(?:\(\))?))"
+)
+
+
+def _remover_comentarios(sql: str) -> str:
+    sql = re.sub(r'/\*.*?\*/', ' ', sql, flags=re.S)
+    return re.sub(r'--[^\n]*', ' ', sql)
+
+
+def _dividir_comandos(sql: str) -> list:
+    """Divide o script em comandos, respeitando aspas e blocos $$ ... $$"""
+    comandos, atual, i = [], [], 0
+    em_aspas = em_dolar = False
+    while i < len(sql):
+        c = sql[i]
+        if not em_aspas and sql.startswith('$$', i):
+            em_dolar = not em_dolar
+            atual.append('$$')
+            i += 2
+            continue
+        if c == "'" and not em_dolar:
+            em_aspas = not em_aspas
+        if c == ';' and not em_aspas and not em_dolar:
+            comandos.append(''.join(atual).strip())
+            atual = []
+        else:
+            atual.append(c)
+        i += 1
+    if ''.join(atual).strip():
+        comandos.append(''.join(atual).strip())
+    return [c for c in comandos if c]
+
+
+def _dividir_topo(texto: str) -> list:
+    """Divide por vírgulas fora de parênteses e aspas"""
+    partes, atual, nivel, em_aspas = [], [], 0, False
+    for c in texto:
+        if c == "'":
+            em_aspas = not em_aspas
+        elif not em_aspas and c == '(':
+            nivel += 1
+        elif not em_aspas and c == ')':
+            nivel -= 1
+        if c == ',' and nivel == 0 and not em_aspas:
+            partes.append(''.join(atual).strip())
+            atual = []
+        else:
+            atual.append(c)
+    if ''.join(atual).strip():
+        partes.append(''.join(atual).strip())
+    return partes
+
+
+def _default_coluna(definicao: str):
+    """Converte o DEFAULT da coluna em valor (ou gerador) Python"""
+    m = re.search(r"\bDEFAULT\s+('(?:[^']|'')*'|[\w.]+(?:\([^)]*\)(?:\s*\))?)?)", definicao, re.I)
+    if not m:
+        return None
+    bruto = m.group(1)
+    baixo = bruto.lower()
+    if 'gen_random_uuid' in baixo or 'uuid_generate' in baixo:
+        return lambda: str(uuid.uuid4())
+    if baixo.startswith(('now', 'timezone', 'current_timestamp')):
+        return _agora
+    if baixo in ('true', 'false'):
+        return baixo == 'true'
+    if baixo == 'null':
+        return None
+    if bruto.startswith("'"):
+        valor = bruto[1:-1].replace("''", "'")
+        return [] if valor == '{}' else valor
+    try:
+        return int(bruto)
+    except ValueError:
+        return None
+
+
+def _ler_valores(texto: str) -> list:
+    """Lê a lista de tuplas de um ``VALUES (...), (...)``"""
+    tokens = []
+    pos = 0
+    while pos < len(texto):
+        m = _TOKEN_SQL.match(texto, pos)
+        if not m or m.end() == pos:
+            break
+        pos = m.end()
+        tipo = m.lastgroup
+        if tipo != 'cast':
+            tokens.append((tipo, m.group(tipo)))
+
+    def valor(i):
+        tipo, bruto = tokens[i]
+        if tipo == 'str':
+            return bruto[1:-1].replace("''", "'"), i + 1
+        if tipo == 'num':
+            return (float(bruto) if '.' in bruto else int(bruto)), i + 1
+        if tipo == 'id' and bruto.upper() == 'ARRAY':
+            itens, i = [], i + 2  # ARRAY [
+            while tokens[i][1] != ']':
+                if tokens[i][1] != ',':
+                    item, i = valor(i)
+                    itens.append(item)
+                else:
+                    i += 1
+            return itens, i + 1
+        baixo = bruto.lower()
+        if baixo in ('true', 'false'):
+            return baixo == 'true', i + 1
+        if baixo.startswith(('now', 'current_timestamp')):
+            return _agora(), i + 1
+        return None, i + 1
+
+    tuplas, i = [], 0
+    while i < len(tokens) and tokens[i][1] == '(':
+        i += 1
+        tupla = []
+        while tokens[i][1] != ')':
+            if tokens[i][1] == ',':
+                i += 1
+                continue
+            item, i = valor(i)
+            tupla.append(item)
+        tuplas.append(tupla)
+        i += 1
+        if i < len(tokens) and tokens[i][1] == ',':
+            i += 1
+        else:
+            break
+    return tuplas
+
+
+def aplicar_migracoes(armazem: 'Armazem', pasta: Path = PASTA_MIGRACOES) -> int:
+    """Aplica os arquivos .sql da pasta (em ordem) no armazém; retorna quantos"""
+    arquivos = sorted(Path(pasta).glob('*.sql')) if Path(pasta).exists() else []
+    for arquivo in arquivos:
+        sql = _remover_comentarios(arquivo.read_text(encoding='utf-8'))
+        for comando in _dividir_comandos(sql):
+            _aplicar_comando(armazem, comando)
+    return len(arquivos)
+
+
+def _nome_tabela(nome: str) -> str:
+    return nome.split('.')[-1].strip('"')
+
+
+def _aplicar_comando(armazem: 'Armazem', comando: str):
+    texto = ' '.join(comando.split())
+
+    if texto.upper().startswith('DO '):
+        corpo = texto.split('$$')
+        if len(corpo) >= 3:
+            for interno in corpo[1].split(';'):
+                _aplicar_comando(armazem, interno)
+        return
+
+    m = re.match(r'CREATE TABLE (?:IF NOT EXISTS )?([\w."]+) \((.*)\)$', texto, re.I)
+    if m:
+        tabela = _nome_tabela(m.group(1))
+        colunas, fks = {}, {}
+        for definicao in _dividir_topo(m.group(2)):
+            nome = definicao.split(' ')[0].strip('"')
+            if nome.upper() in ('CONSTRAINT', 'PRIMARY', 'UNIQUE', 'FOREIGN', 'CHECK', 'EXCLUDE'):
+                continue
+            colunas[nome] = _default_coluna(definicao)
+            ref = re.search(r'REFERENCES ([\w."]+)', definicao, re.I)
+            if ref:
+                fks[nome] = _nome_tabela(ref.group(1))
+        armazem.criar_tabela(tabela, colunas, fks, substituir=not re.search(r'IF NOT EXISTS', texto[:40], re.I))
+        return
+
+    m = re.match(r'DROP TABLE (?:IF EXISTS )?([\w."]+)', texto, re.I)
+    if m:
+        armazem.remover_tabela(_nome_tabela(m.group(1)))
+        return
+
+    m = re.search(r'ALTER TABLE (?:ONLY )?([\w."]+) ADD COLUMN (?:IF NOT EXISTS )?([\w"]+)(.*)$', texto, re.I)
+    if m:
+        ref = re.search(r'REFERENCES ([\w."]+)', m.group(3), re.I)
+        armazem.adicionar_coluna(_nome_tabela(m.group(1)), m.group(2).strip('"'),
+                                 _default_coluna(m.group(3)), _nome_tabela(ref.group(1)) if ref else None)
+        return
+
+    m = re.match(r'INSERT INTO ([\w."]+) \(([^)]*)\) (.*)$', texto, re.I)
+    if m:
+        tabela = _nome_tabela(m.group(1))
+        colunas = [c.strip().strip('"') for c in m.group(2).split(',')]
+        resto = m.group(3)
+        inicio = re.search(r'\bVALUES\b', resto, re.I)
+        if not inicio:
+            return
+        for tupla in _ler_valores(resto[inicio.end():]):
+            registro = dict(zip(colunas, tupla))
+            chave = 'abbreviation' if 'abbreviation' in registro else 'name' if 'name' in registro else None
+            if chave and armazem.filtrar(tabela, [(chave, 'eq', registro[chave])]):
+                continue  # ON CONFLICT DO NOTHING / WHERE NOT EXISTS
+            armazem.inserir(tabela, registro)
+
+
+# ==============================================================================
+# ARMAZÉM EM MEMÓRIA
+# ==============================================================================
+
+class Armazem:
+    """Tabelas em memória com defaults de coluna e chaves estrangeiras"""
+
+    def __init__(self):
+        self.tabelas = {}    # tabela -> lista de registros
+        self.colunas = {}    # tabela -> {coluna: default}
+        self.fks = {}        # tabela -> {coluna: tabela referenciada}
+        self.declaradas = set()  # tabelas com esquema conhecido (migrações / TABELAS_EXTRAS)
+        self.lock = threading.RLock()
+
+    # --- esquema -------------------------------------------------------
+
+    def criar_tabela(self, tabela: str, colunas: dict, fks: dict = None, substituir: bool = False,
+                     declarada: bool = True):
+        with self.lock:
+            if tabela in self.tabelas and not substituir:
+                return
+            self.tabelas[tabela] = []
+            self.colunas[tabela] = dict(colunas)
+            self.fks[tabela] = dict(fks or {})
+            if declarada:
+                self.declaradas.add(tabela)
+            else:
+                self.declaradas.discard(tabela)
+
+    def remover_tabela(self, tabela: str):
+        with self.lock:
+            for dicionario in (self.tabelas, self.colunas, self.fks):
+                dicionario.pop(tabela, None)
+            self.declaradas.discard(tabela)
+
+    def adicionar_coluna(self, tabela: str, coluna: str, default=None, referencia: str = None):
+        with self.lock:
+            self._garantir(tabela)
+            self.colunas[tabela].setdefault(coluna, default)
+            if referencia:
+                self.fks[tabela][coluna] = referencia
+            for registro in self.tabelas[tabela]:
+                registro.setdefault(coluna, default() if callable(default) else default)
+
+    def _garantir(self, tabela: str):
+        if tabela not in self.tabelas:
+            self.criar_tabela(tabela, {
+                'id': lambda: str(uuid.uuid4()),
+                'created_at': _agora,
+                'updated_at': _agora,
+            }, declarada=False)
+
+    def colunas_desconhecidas(self, tabela: str, registro: dict) -> list:
+        """Colunas de ``registro`` fora do esquema declarado (vazio se a tabela não tem esquema)"""
+        with self.lock:
+            if tabela not in self.declaradas:
+                return []
+            return [c for c in registro if c not in self.colunas[tabela]]
+
+    # --- dados ---------------------------------------------------------
+
+    def inserir(self, tabela: str, registro: dict) -> dict:
+        with self.lock:
+            self._garantir(tabela)
+            novo = {}
+            for coluna, default in self.colunas[tabela].items():
+                if coluna not in registro:
+                    novo[coluna] = default() if callable(default) else default
+            novo.update(registro)
+            novo.setdefault('id', str(uuid.uuid4()))
+            self.tabelas[tabela].append(novo)
+            return dict(novo)
+
+    def filtrar(self, tabela: str, filtros: list) -> list:
+        with self.lock:
+            return [r for r in self.tabelas.get(tabela, []) if all(_aplicar_filtro(r, f) for f in filtros)]
+
+    def atualizar(self, tabela: str, filtros: list, valores: dict) -> list:
+        with self.lock:
+            alterados = []
+            for registro in self.filtrar(tabela, filtros):
+                registro.update(valores)
+                if 'updated_at' in registro:
+                    registro['updated_at'] = _agora()
+                alterados.append(dict(registro))
+            return alterados
+
+    def excluir(self, tabela: str, filtros: list) -> list:
+        with self.lock:
+            removidos = self.filtrar(tabela, filtros)
+            ids = {id(r) for r in removidos}
+            self.tabelas[tabela] = [r for r in self.tabelas.get(tabela, []) if id(r) not in ids]
+            return [dict(r) for r in removidos]
+
+    def relacao(self, origem: str, destino: str):
+        """
+        Relacionamento para embutir ``destino`` em registros de ``origem``:
+        ('filhos', coluna) se destino.coluna -> origem, ('pai', coluna) se
+        origem.coluna -> destino; None se não houver FK.
+        """
+        for coluna, ref in self.fks.get(destino, {}).items():
+            if ref == origem:
+                return 'filhos', coluna
+        for coluna, ref in self.fks.get(origem, {}).items():
+            if ref == destino:
+                return 'pai', coluna
+        return None
+
+
+def _como_texto(valor) -> str:
+    if isinstance(valor, bool):
+        return 'true' if valor else 'false'
+    return '' if valor is None else str(valor)
+
+
+def _aplicar_filtro(registro: dict, filtro: tuple) -> bool:
+    coluna, operador, esperado = filtro
+    negar = operador.startswith('not.')
+    operador = operador[4:] if negar else operador
+    atual = registro.get(coluna)
+
+    if operador == 'is':
+        resultado = (atual is None) if _como_texto(esperado).lower() == 'null' \
+            else _como_texto(atual) == _como_texto(esperado).lower()
+    elif operador == 'in':
+        resultado = _como_texto(atual) in {_como_texto(v) for v in esperado}
+    elif operador in ('like', 'ilike'):
+        padrao = '^' + re.escape(_como_texto(esperado)).replace(r'\*', '.*').replace('%', '.*') + '$'
+        resultado = re.match(padrao, _como_texto(atual), re.I if operador == 'ilike' else 0) is not None
+    elif operador in ('gt', 'gte', 'lt', 'lte'):
+        try:
+            a, b = float(atual), float(esperado)
+        except (TypeError, ValueError):
+            a, b = _como_texto(atual), _como_texto(esperado)
+        resultado = {'gt': a > b, 'gte': a >= b, 'lt': a < b, 'lte': a <= b}[operador] if atual is not None else False
+    elif operador == 'neq':
+        resultado = _como_texto(atual) != _como_texto(esperado)
+    else:  # eq
+        resultado = _como_texto(atual) == _como_texto(esperado)
+    return not resultado if negar else resultado
+
+
+def criar_armazem(pasta_migracoes: Path = PASTA_MIGRACOES) -> Armazem:
+    """Armazém semeado com as migrações do Supabase e as tabelas extras"""
+    armazem = Armazem()
+    aplicar_migracoes(armazem, pasta_migracoes)
+
+    padrao = {'id': lambda: str(uuid.uuid4()), 'created_at': _agora, 'updated_at': _agora}
+    for tabela, definicao in TABELAS_EXTRAS.items():
+        colunas = dict(padrao)
+        colunas.update({c: (True if c == 'is_active' else False if c == 'is_read' else None)
+                        for c in definicao['colunas']})
+        colunas.update({c: None for c in definicao.get('fks', {})})
+        armazem.criar_tabela(tabela, colunas, definicao.get('fks'))
+
+    for tabela, registros in SEMENTES.items():
+        for registro in registros:
+            armazem.inserir(tabela, registro)
+    return armazem
+
+
+# ==============================================================================
+# POSTGREST
+# ==============================================================================
+
+class ErroApi(Exception):
+    """Erro com status HTTP e corpo JSON"""
+
+    def __init__(self, status: int, mensagem: str, codigo: str = None):
+        super().__init__(mensagem)
+        self.status = status
+        self.corpo = {'message': mensagem, 'detail': mensagem}
+        if codigo:
+            self.corpo['code'] = codigo
+
+
+def _ler_select(texto: str) -> list:
+    """``*, tabela(col, outra(*))`` -> lista de colunas e (alias, tabela, sub-select)"""
+    itens = []
+    for parte in _dividir_topo(texto or '*'):
+        m = re.match(r'^(?:(\w+):)?([\w]+)(?:![\w]+)?\s*\((.*)\)$', parte, re.S)
+        if m:
+            itens.append((m.group(1) or m.group(2), m.group(2), _ler_select(m.group(3))))
+        elif parte:
+            itens.append(parte.split('::')[0].split(':')[-1].strip())
+    return itens
+
+
+def _ler_filtros(parametros: list) -> list:
+    reservados = {'select', 'order', 'limit', 'offset', 'on_conflict', 'columns'}
+    filtros = []
+    for coluna, valor in parametros:
+        if coluna in ('or', 'and'):
+            raise ErroApi(400, f"Filtro '{coluna}' não suportado pelo backend local", 'PGRST100')
+        if coluna in reservados or '.' in coluna:
+            continue
+        operador, _, esperado = valor.partition('.')
+        if operador == 'not':
+            operador2, _, esperado = esperado.partition('.')
+            operador = f'not.{operador2}'
+        if operador.endswith('in'):
+            esperado = [v.strip().strip('"') for v in esperado.strip('()').split(',') if v.strip()]
+        filtros.append((coluna, operador, esperado))
+    return filtros
+
+
+def _ordenar(registros: list, ordem: str) -> list:
+    for termo in reversed([t for t in (ordem or '').split(',') if t]):
+        partes = termo.split('.')
+        coluna, desc = partes[0], 'desc' in partes[1:]
+        registros = sorted(registros, key=lambda r: (r.get(coluna) is None, _como_texto(r.get(coluna))),
+                           reverse=desc)
+    return registros
+
+
+def _projetar(armazem: Armazem, tabela: str, registro: dict, select: list) -> dict:
+    saida = {}
+    for item in select:
+        if item == '*':
+            saida.update(registro)
+        elif isinstance(item, str):
+            if item != 'count':
+                saida[item] = registro.get(item)
+        else:
+            alias, destino, sub = item
+            relacao = armazem.relacao(tabela, destino)
+            if not relacao:
+                raise ErroApi(400, f"Could not find a relationship between '{tabela}' and '{destino}' "
+                                   f"in the schema cache", 'PGRST200')
+            tipo, coluna = relacao
+            if tipo == 'filhos':
+                filhos = armazem.filtrar(destino, [(coluna, 'eq', registro.get('id'))])
+                if sub == ['count']:
+                    saida[alias] = [{'count': len(filhos)}]
+                else:
+                    saida[alias] = [_projetar(armazem, destino, f, sub) for f in filhos]
+            else:
+                pais = armazem.filtrar(destino, [('id', 'eq', registro.get(coluna))])
+                saida[alias] = _projetar(armazem, destino, pais[0], sub) if pais else None
+    return saida
+
+
+def _validar_colunas(armazem: Armazem, tabela: str, registro: dict):
+    """Como o PostgREST: escrita em coluna fora do esquema é 400 (PGRST204), não é aceita em silêncio"""
+    desconhecidas = armazem.colunas_desconhecidas(tabela, registro)
+    if desconhecidas:
+        raise ErroApi(400, f"Could not find the '{desconhecidas[0]}' column of '{tabela}' in the schema cache",
+                      'PGRST204')
+
+
+def postgrest(armazem: Armazem, metodo: str, tabela: str, parametros: list, cabecalhos: dict, corpo):
+    """Executa uma requisição ``/rest/v1/{tabela}``; retorna (status, payload, cabeçalhos)"""
+    if tabela.startswith('rpc/'):
+        raise ErroApi(404, f"Could not find the function public.{tabela[4:]} in the schema cache", 'PGRST202')
+
+    consulta = dict(parametros)
+    filtros = _ler_filtros(parametros)
+    prefer = cabecalhos.get('prefer', '')
+    representacao = 'return=representation' in prefer
+    extras = {}
+
+    if metodo == 'GET' or metodo == 'HEAD':
+        registros = _ordenar(armazem.filtrar(tabela, filtros), consulta.get('order'))
+        total = len(registros)
+        inicio = int(consulta.get('offset', 0))
+        limite = consulta.get('limit')
+        registros = registros[inicio:inicio + int(limite)] if limite else registros[inicio:]
+        select = _ler_select(consulta.get('select', '*'))
+        dados = [_projetar(armazem, tabela, r, select) for r in registros]
+        fim = inicio + len(dados) - 1
+        extras['Content-Range'] = f"{inicio}-{fim}/{total if 'count=' in prefer else '*'}" if dados \
+            else f"*/{total if 'count=' in prefer else '*'}"
+    elif metodo == 'POST':
+        novos = corpo if isinstance(corpo, list) else [corpo or {}]
+        for novo in novos:
+            _validar_colunas(armazem, tabela, novo)
+        conflito = consulta.get('on_conflict')
+        dados = []
+        for novo in novos:
+            if 'resolution=merge-duplicates' in prefer:
+                chave = conflito or 'id'
+                existentes = armazem.filtrar(tabela, [(chave, 'eq', novo.get(chave))]) if chave in novo else []
+                if existentes:
+                    dados.extend(armazem.atualizar(tabela, [(chave, 'eq', novo[chave])], novo))
+                    continue
+            dados.append(armazem.inserir(tabela, novo))
+        if not representacao:
+            return 201, None, extras
+        return 201, dados, extras
+    elif metodo == 'PATCH':
+        _validar_colunas(armazem, tabela, corpo or {})
+        dados = armazem.atualizar(tabela, filtros, corpo or {})
+    elif metodo == 'DELETE':
+        dados = armazem.excluir(tabela, filtros)
+    else:
+        raise ErroApi(405, f"Método {metodo} não suportado")
+
+    if metodo in ('PATCH', 'DELETE') and not representacao:
+        return 204, None, extras
+    if 'vnd.pgrst.object' in cabecalhos.get('accept', ''):
+        if len(dados) != 1:
+            raise ErroApi(406, 'JSON object requested, multiple (or no) rows returned', 'PGRST116')
+        return 200, dados[0], extras
+    return 200, dados, extras
+
+
+# ==============================================================================
+# API (/api/v1)
+# ==============================================================================
+
+ROTAS = []
+
+
+def rota(metodo: str, padrao: str):
+    """Registra um handler para ``metodo`` + regex do caminho (sem /api/v1)"""
+    def decorador(funcao):
+        ROTAS.append((metodo, re.compile(f'^{padrao}/?$'), funcao))
+        return funcao
+    return decorador
+
+
+def _token(user_id: str) -> str:
+    cabecalho = base64.urlsafe_b64encode(b'{"alg":"none","typ":"JWT"}').rstrip(b'=').decode()
+    payload = json.dumps({'sub': user_id, 'exp': int(time.time()) + TOKEN_TTL}).encode()
+    return f"{cabecalho}.{base64.urlsafe_b64encode(payload).rstrip(b'=').decode()}.local"
+
+
+@rota('GET', r'/health')
+def _health(backend, req):
+    return 200, {'status': 'ok', 'backend': 'local'}
+
+
+@rota('POST', r'/auth/login')
+def _login(backend, req):
+    corpo = req['corpo'] or {}
+    login = corpo.get('login') or corpo.get('email')
+    senha = corpo.get('senha') or corpo.get('password')
+    if not login or not senha:
+        raise ErroApi(401, 'Credenciais inválidas')
+    return 200, {'token': _token(USER_ID), 'userId': USER_ID, 'nome': USER_NOME}
+
+
+# --- workflow -------------------------------------------------------------
+
+def _steps_template(codigo: str) -> list:
+    return [
+        {'id': str(uuid.uuid5(uuid.NAMESPACE_URL, f'{codigo}/{chave}')), 'key': chave, 'label': rotulo, 'path': caminho}
+        for chave, rotulo, caminho in STEPS_WORKFLOW
+    ]
+
+
+def _instancia(backend, instance_id: str) -> dict:
+    instancias = backend.armazem.filtrar('workflow_process_instance', [('id', 'eq', instance_id)])
+    if not instancias:
+        raise ErroApi(404, f'Instância de workflow {instance_id} não encontrada')
+    return instancias[0]
+
+
+def _step_atual(instancia: dict):
+    for step in _steps_template(instancia['template_code']):
+        if step['id'] == instancia['current_step_id']:
+            return step
+    return None
+
+
+@rota('GET', r'/workflow/templates/(?P<codigo>[^/]+)/steps')
+def _template_steps(backend, req):
+    return 200, {'steps': _steps_template(req['codigo'])}
+
+
+@rota('POST', r'/workflow/instances/start')
+def _workflow_start(backend, req):
+    corpo = req['corpo'] or {}
+    codigo = corpo.get('template_code', TEMPLATE_WORKFLOW)
+    primeiro = _steps_template(codigo)[0]
+    instancia = backend.armazem.inserir('workflow_process_instance', {
+        'template_code': codigo,
+        'target_type': corpo.get('target_type'),
+        'target_id': corpo.get('target_id'),
+        'status': 'RUNNING',
+        'current_step_id': primeiro['id'],
+    })
+    return 201, {'instanceId': instancia['id'], 'currentStep': primeiro}
+
+
+@rota('GET', r'/workflow/instances/(?P<instancia>[^/]+)/current-step')
+def _current_step(backend, req):
+    instancia = _instancia(backend, req['instancia'])
+    return 200, {'status': instancia['status'], 'step': _step_atual(instancia)}
+
+
+@rota('POST', r'/workflow/instances/(?P<instancia>[^/]+)/steps/(?P<step>[^/]+)/complete')
+def _complete_step(backend, req):
+    with backend.armazem.lock:
+        instancia = _instancia(backend, req['instancia'])
+        if instancia['status'] == 'FINISHED':
+            raise ErroApi(409, 'Workflow já finalizado')
+        steps = _steps_template(instancia['template_code'])
+        atual = _step_atual(instancia)
+        if req['step'] not in (atual['id'], atual['key']):
+            raise ErroApi(409, f"Step {req['step']} não é o step atual ({atual['key']})")
+
+        backend.armazem.inserir('workflow_process_instance_step', {
+            'instance_id': instancia['id'],
+            'step_id': atual['id'],
+            'step_key': atual['key'],
+            'status': 'COMPLETED',
+            'payload': req['corpo'] or {},
+            'completed_at': _agora(),
+        })
+        indice = steps.index(atual)
+        proximo = steps[indice + 1] if indice + 1 < len(steps) else None
+        backend.armazem.atualizar('workflow_process_instance', [('id', 'eq', instancia['id'])], {
+            'status': 'RUNNING' if proximo else 'FINISHED',
+            'current_step_id': proximo['id'] if proximo else None,
+        })
+    return 200, {'status': 'RUNNING' if proximo else 'FINISHED', 'nextStep': proximo}
+
+
+@rota('POST', r'/workflow/instances/(?P<instancia>[^/]+)/steps/(?P<step>[^/]+)/back')
+def _back_step(backend, req):
+    with backend.armazem.lock:
+        instancia = _instancia(backend, req['instancia'])
+        steps = _steps_template(instancia['template_code'])
+        atual = _step_atual(instancia) or steps[-1]
+        anterior = steps[max(steps.index(atual) - 1, 0)]
+        backend.armazem.excluir('workflow_process_instance_step', [
+            ('instance_id', 'eq', instancia['id']), ('step_id', 'eq', anterior['id'])
+        ])
+        backend.armazem.atualizar('workflow_process_instance', [('id', 'eq', instancia['id'])], {
+            'status': 'RUNNING', 'current_step_id': anterior['id'],
+        })
+    return 200, {'status': 'RUNNING', 'previousStep': anterior}
+
+
+@rota('GET', r'/workflow/instances/(?P<instancia>[^/]+)/steps/(?P<step>[^/]+)/subprocess')
+def _subprocess(backend, req):
+    _instancia(backend, req['instancia'])
+    return 200, {'has_subprocess': False}
+
+
+@rota('GET', r'/workflow/instances/(?P<instancia>[^/]+)/step-history')
+def _step_history(backend, req):
+    instancia = _instancia(backend, req['instancia'])
+    registros = backend.armazem.filtrar('workflow_process_instance_step', [('instance_id', 'eq', instancia['id'])])
+    return 200, {'completedSteps': [r['step_id'] for r in registros], 'currentStepId': instancia['current_step_id']}
+
+
+# --- notificações -----------------------------------------------------------
+
+def _filtro_usuario(req) -> list:
+    user_id = req['query'].get('user_id')
+    return [('user_id', 'eq', user_id)] if user_id else []
+
+
+@rota('GET', r'/notifications/stats')
+def _notificacoes_stats(backend, req):
+    todas = backend.armazem.filtrar('notifications', _filtro_usuario(req))
+    return 200, {'unread_count': sum(1 for n in todas if not n.get('is_read')), 'total_count': len(todas)}
+
+
+@rota('PUT', r'/notifications/read-all')
+def _notificacoes_ler_todas(backend, req):
+    alteradas = backend.armazem.atualizar('notifications', _filtro_usuario(req) + [('is_read', 'eq', False)],
+                                          {'is_read': True})
+    return 200, {'success': True, 'updated_count': len(alteradas)}
+
+
+@rota('GET', r'/notifications')
+def _notificacoes_listar(backend, req):
+    filtros = _filtro_usuario(req)
+    if 'is_read' in req['query']:
+        filtros.append(('is_read', 'eq', req['query']['is_read'].lower()))
+    todas = _ordenar(backend.armazem.filtrar('notifications', filtros), 'created_at.desc')
+    inicio = int(req['query'].get('skip', 0))
+    limite = int(req['query'].get('limit', 20))
+    return 200, {'total': len(todas), 'items': todas[inicio:inicio + limite]}
+
+
+@rota('POST', r'/notifications')
+def _notificacoes_criar(backend, req):
+    corpo = dict(req['corpo'] or {})
+    if not corpo.get('user_id') or not corpo.get('title'):
+        raise ErroApi(422, 'user_id e title são obrigatórios')
+    corpo.setdefault('severity', 'INFO')
+    corpo['is_read'] = False
+    corpo['user_id'] = str(corpo['user_id'])
+    return 201, backend.armazem.inserir('notifications', corpo)
+
+
+@rota('PUT', r'/notifications/(?P<id>[^/]+)/read')
+def _notificacoes_ler(backend, req):
+    alteradas = backend.armazem.atualizar('notifications', [('id', 'eq', req['id'])], {'is_read': True})
+    if not alteradas:
+        raise ErroApi(404, 'Notificação não encontrada')
+    return 200, {'success': True, 'updated_count': 1}
+
+
+@rota('DELETE', r'/notifications/(?P<id>[^/]+)')
+def _notificacoes_excluir(backend, req):
+    if not backend.armazem.excluir('notifications', [('id', 'eq', req['id'])]):
+        raise ErroApi(404, 'Notificação não encontrada')
+    return 200, {'success': True}
+
+
+# --- configurações do sistema -----------------------------------------------
+
+@rota('GET', r'/system-config')
+def _configs_listar(backend, req):
+    return 200, backend.armazem.filtrar('system_config', [])
+
+
+@rota('GET', r'/system-config/(?P<chave>[^/]+)')
+def _config_buscar(backend, req):
+    configs = backend.armazem.filtrar('system_config', [('config_key', 'eq', req['chave'])])
+    if not configs:
+        raise ErroApi(404, f"Configuração {req['chave']} não encontrada")
+    return 200, configs[0]
+
+
+@rota('PUT', r'/system-config/(?P<chave>[^/]+)')
+def _config_atualizar(backend, req):
+    valores = {k: v for k, v in (req['corpo'] or {}).items() if k in ('config_value', 'config_description')}
+    alteradas = backend.armazem.atualizar('system_config', [('config_key', 'eq', req['chave'])], valores)
+    if not alteradas:
+        raise ErroApi(404, f"Configuração {req['chave']} não encontrada")
+    return 200, alteradas[0]
+
+
+# --- cadastros (CRUD genérico) ------------------------------------------------
+
+def _tabela_cadastro(req) -> str:
+    recurso = req['recurso']
+    if req.get('grupo') == 'referencias':
+        return MAPA_REFERENCIAS.get(recurso, recurso.replace('-', '_'))
+    return {'license-types': 'license_types', 'document-templates': 'documentation_templates'}[recurso]
+
+
+_CADASTROS = r'/(?:(?P<grupo>referencias)/(?P<recurso>[\w-]+)|(?P<recurso2>license-types|document-templates))'
+
+
+def _req_cadastro(req) -> dict:
+    req['recurso'] = req.get('recurso') or req.get('recurso2')
+    return req
+
+
+@rota('GET', _CADASTROS)
+def _cadastro_listar(backend, req):
+    tabela = _tabela_cadastro(_req_cadastro(req))
+    filtros = [(c, 'eq', v) for c, v in req['query'].items() if c in backend.armazem.colunas.get(tabela, {})]
+    return 200, _ordenar(backend.armazem.filtrar(tabela, filtros), 'name')
+
+
+@rota('GET', _CADASTROS + r'/(?P<id>[^/]+)')
+def _cadastro_buscar(backend, req):
+    registros = backend.armazem.filtrar(_tabela_cadastro(_req_cadastro(req)), [('id', 'eq', req['id'])])
+    if not registros:
+        raise ErroApi(404, 'Registro não encontrado')
+    return 200, registros[0]
+
+
+@rota('POST', _CADASTROS)
+def _cadastro_criar(backend, req):
+    return 201, backend.armazem.inserir(_tabela_cadastro(_req_cadastro(req)), dict(req['corpo'] or {}))
+
+
+@rota('PUT', _CADASTROS + r'/(?P<id>[^/]+)')
+def _cadastro_atualizar(backend, req):
+    alterados = backend.armazem.atualizar(_tabela_cadastro(_req_cadastro(req)), [('id', 'eq', req['id'])],
+                                          dict(req['corpo'] or {}))
+    if not alterados:
+        raise ErroApi(404, 'Registro não encontrado')
+    return 200, alterados[0]
+
+
+@rota('DELETE', _CADASTROS + r'/(?P<id>[^/]+)')
+def _cadastro_excluir(backend, req):
+    if not backend.armazem.excluir(_tabela_cadastro(_req_cadastro(req)), [('id', 'eq', req['id'])]):
+        raise ErroApi(404, 'Registro não encontrado')
+    return 204, None
+
+
+# ==============================================================================
+# SERVIDOR HTTP
+# ==============================================================================
+
+class _Manipulador(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    backend = None  # definido pela subclasse criada em BackendLocal
+
+    def setup(self):
+        super().setup()
+        # Cabeçalhos e corpo saem em escritas separadas; sem NODELAY o keep-alive
+        # esbarra no delayed ACK (~40 ms por requisição)
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, formato, *args):
+        if self.backend.verbose:
+            super().log_message(formato, *args)
+
+    def _responder(self, status: int, payload=None, extras: dict = None):
+        corpo = b'' if payload is None else json.dumps(payload, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Access-Control-Allow-Origin', self.headers.get('Origin') or '*')
+        self.send_header('Access-Control-Allow-Credentials', 'true')
+        self.send_header('Access-Control-Expose-Headers', 'Content-Range')
+        if payload is not None:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+        for chave, valor in (extras or {}).items():
+            self.send_header(chave, valor)
+        self.send_header('Content-Length', str(len(corpo)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(corpo)
+
+    def do_OPTIONS(self):
+        self._responder(204, extras={
+            'Access-Control-Allow-Methods': 'GET, POST, PUT, PATCH, DELETE, OPTIONS',
+            'Access-Control-Allow-Headers': self.headers.get('Access-Control-Request-Headers') or '*',
+            'Access-Control-Max-Age': '600',
+        })
+
+    def _processar(self):
+        url = urlparse(self.path)
+        parametros = parse_qsl(url.query, keep_blank_values=True)
+        tamanho = int(self.headers.get('Content-Length') or 0)
+        bruto = self.rfile.read(tamanho) if tamanho else b''
+        try:
+            corpo = json.loads(bruto) if bruto else None
+        except ValueError:
+            self._responder(400, {'message': 'JSON inválido'})
+            return
+
+        self.backend.requisicoes += 1
+        try:
+            if url.path.startswith('/rest/v1/'):
+                cabecalhos = {k.lower(): v for k, v in self.headers.items()}
+                status, payload, extras = postgrest(
+                    self.backend.armazem, self.command, url.path[len('/rest/v1/'):], parametros, cabecalhos, corpo
+                )
+                self._responder(status, payload, extras)
+                return
+
+            caminho = url.path[len('/api/v1'):] if url.path.startswith('/api/v1') else url.path
+            for metodo, padrao, funcao in ROTAS:
+                m = padrao.match(caminho)
+                if m and metodo == self.command:
+                    req = {k: v for k, v in m.groupdict().items() if v is not None}
+                    req.update({'query': dict(parametros), 'corpo': corpo})
+                    status, payload = funcao(self.backend, req)
+                    self._responder(status, payload)
+                    return
+            self._responder(404, {'message': f'Rota não encontrada: {self.command} {url.path}', 'detail': 'Not Found'})
+        except ErroApi as e:
+            self._responder(e.status, e.corpo)
+        except Exception as e:
+            self._responder(500, {'message': f'Erro interno no backend local: {e}'})
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _processar
+
+
+class BackendLocal:
+    """Servidor HTTP local (thread em background) com armazém em memória"""
+
+    def __init__(self, porta: int = PORTA_PADRAO, host: str = '127.0.0.1',
+                 pasta_migracoes: Path = PASTA_MIGRACOES, verbose: bool = False):
+        self.armazem = criar_armazem(pasta_migracoes)
+        self.verbose = verbose
+        self.requisicoes = 0
+        manipulador = type('Manipulador', (_Manipulador,), {'backend': self})
+        self.servidor = ThreadingHTTPServer((host, porta), manipulador)
+        self.servidor.daemon_threads = True
+        self.host, self.porta = self.servidor.server_address[:2]
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{'localhost' if self.host in ('127.0.0.1', '0.0.0.0') else self.host}:{self.porta}"
+
+    @property
+    def api_url(self) -> str:
+        return f"{self.url}/api/v1"
+
+    def iniciar(self) -> 'BackendLocal':
+        self._thread = threading.Thread(target=self.servidor.serve_forever, daemon=True, name='backend-local')
+        self._thread.start()
+        return self
+
+    def encerrar(self):
+        self.servidor.shutdown()
+        self.servidor.server_close()
+
+    def variaveis_ambiente(self) -> dict:
+        """Variáveis que apontam os testes (e o app, via VITE_*) para este backend"""
+        return {
+            'API_URL': self.api_url,
+            'AUTH_API_URL': self.api_url,
+            'VITE_API_BASE_URL': self.api_url,
+            'SUPABASE_URL': self.url,
+            'SUPABASE_KEY': CHAVE_LOCAL,
+            'VITE_SUPABASE_URL': self.url,
+            'VITE_SUPABASE_ANON_KEY': CHAVE_LOCAL,
+        }
+
+    def resumo(self) -> str:
+        tabelas = {t: len(r) for t, r in self.armazem.tabelas.items() if r}
+        return f"{self.requisicoes} requisição(ões) atendidas; registros: {tabelas}"
+
+
+def iniciar_backend(porta: int = 0, **kwargs) -> BackendLocal:
+    """Sobe o backend local em background (porta 0 = porta livre)"""
+    return BackendLocal(porta=porta, **kwargs).iniciar()
+
+
+# ==============================================================================
+# LINHA DE COMANDO
+# ==============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Backend local (API + PostgREST em memória) para os testes',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='Exemplo: python backend_local.py -- python test_api_direct.py'
+    )
+    parser.add_argument('--porta', type=int, default=PORTA_PADRAO, help=f'Porta HTTP (padrão: {PORTA_PADRAO})')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface (padrão: 127.0.0.1)')
+    parser.add_argument('--migracoes', default=str(PASTA_MIGRACOES), help='Pasta com as migrações .sql')
+    parser.add_argument('--verbose', action='store_true', help='Loga cada requisição')
+    parser.add_argument('comando', nargs=argparse.REMAINDER,
+                        help='Comando a executar com o backend no ar (após --)')
+    args = parser.parse_args(argv)
+
+    backend = BackendLocal(args.porta, args.host, Path(args.migracoes), args.verbose).iniciar()
+    variaveis = backend.variaveis_ambiente()
+
+    print("=" * 80)
+    print(f"🧪 Backend local em {backend.url}")
+    print(f"   API:      {backend.api_url}")
+    print(f"   Supabase: {backend.url}/rest/v1")
+    print(f"   Tabelas:  {len(backend.armazem.tabelas)} (migrações de {args.migracoes})")
+    print("=" * 80)
+
+    comando = [c for c in args.comando if c != '--'] if args.comando else []
+    if comando:
+        try:
+            codigo = subprocess.call(comando, env={**os.environ, **variaveis})
+        finally:
+            print(f"\n📊 Backend local: {backend.resumo()}")
+            backend.encerrar()
+        return codigo
+
+    print("Variáveis para os testes:")
+    for chave, valor in variaveis.items():
+        print(f"   {chave}={valor}")
+    print("\nCtrl+C para encerrar")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print(f"\n📊 Backend local: {backend.resumo()}")
+        backend.encerrar()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,395 @@
+"""
+Benchmark do caminho de upload geoespacial do imóvel (GeoJSON / SHP.zip)
+=======================================================================
+
+Gera fixtures com ``geo_fixtures.py`` (1k a 5M vértices, com buracos,
+multipolígonos e anéis inválidos) e mede, no navegador, o custo de cada uma
+no código real do frontend:
+
+- **módulos** (padrão): a página autenticada importa pelo Vite
+  ``src/lib/geo/utils/geoFileLoader.ts`` e ``src/lib/geo/bufferCalculations.ts``
+  e roda ``loadGeoFileFromServer`` (fetch + ``JSON``/``shpjs``),
+  ``calcularBuffer`` e ``calcularArea`` (a conta do ``AreaMetricsPanel``). As
+  fixtures são copiadas para ``public/geo/_benchmark/`` durante a execução;
+- **interface** (``--ui``): roda os testes 01 e 02 até o imóvel existir, volta
+  para a etapa Imóvel, abre o mapa do ``ImovelGeoPanel`` e envia cada GeoJSON
+  pelo modal "Importar Dados" (``GeoUpload.tsx``); depois abre o
+  ``AreaMetricsPanel`` da camada importada. O modal só aceita
+  CSV/JSON/GeoJSON/KML, então o SHP.zip é medido só no modo módulos.
+
+Para cada fixture: tempo de parse, buffer e área; long tasks da thread
+principal (``PerformanceObserver('longtask')``) em cada fase; e crescimento do
+heap JS (CDP ``Performance.getMetrics``, com ``HeapProfiler.collectGarbage``
+antes da medição e depois, para separar lixo de memória retida).
+
+Precisa do servidor de desenvolvimento (``npm run dev``): o build de produção
+não serve ``/src/...``.
+
+Uso:
+
+    python benchmark_geo_upload.py                                  # 1k-1M, todos os tipos, GeoJSON e SHP
+    python benchmark_geo_upload.py --vertices 5M --tipos multi --formatos shp
+    python benchmark_geo_upload.py --vertices 10k 100k --tipos simples buracos --ui --json geo.json
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+import geo_fixtures
+
+
+# ==============================================================================
+# CONFIGURAÇÕES
+# ==============================================================================
+
+BASE_URL = os.getenv('BASE_URL', 'http://localhost:5173')
+RAIZ = Path(__file__).resolve().parent.parent
+PUBLICO = RAIZ / 'public' / 'geo' / '_benchmark'
+TIMEOUT = float(os.getenv('BENCH_GEO_TIMEOUT', '900'))
+
+# Roda na página autenticada: importa os módulos reais pelo Vite e mede cada fase
+HARNESS_JS = """
+const [arquivo, distancia, steps, concluir] = arguments;
+(async () => {
+    const r = {fases: {}};
+    const longas = [];
+    let observador = null;
+    try {
+        observador = new PerformanceObserver(lista => longas.push(...lista.getEntries()));
+        observador.observe({type: 'longtask'});
+    } catch (e) {}
+    const heap = () => (performance.memory ? performance.memory.usedJSHeapSize : null);
+    const heapInicial = heap();
+    let heapMaximo = heapInicial;
+
+    const fase = async (nome, funcao) => {
+        const f = {inicio: performance.now()};
+        let resultado = null;
+        try {
+            resultado = await funcao();
+        } catch (e) {
+            f.erro = String((e && e.message) || e);
+        }
+        f.fim = performance.now();
+        f.ms = f.fim - f.inicio;
+        const h = heap();
+        if (h !== null && h > heapMaximo) heapMaximo = h;
+        r.fases[nome] = f;
+        await new Promise(ok => setTimeout(ok, 0));   // entrega as long tasks pendentes
+        return resultado;
+    };
+
+    try {
+        const loader = await import('/src/lib/geo/utils/geoFileLoader.ts');
+        const calculos = await import('/src/lib/geo/bufferCalculations.ts');
+        const dados = await fase('parse', () => loader.loadGeoFileFromServer(arquivo));
+        // shpjs devolve uma lista quando o zip tem mais de uma camada
+        const colecao = Array.isArray(dados)
+            ? {type: 'FeatureCollection', features: dados.flatMap(c => c.features || [])}
+            : dados;
+        r.features = colecao && colecao.features ? colecao.features.length : 0;
+        if (r.features) {
+            const buffer = await fase('buffer', () => calculos.calcularBuffer(colecao, distancia, steps));
+            r.features_buffer = buffer ? buffer.features.length : 0;
+            const metricas = await fase('area', () => calculos.calcularArea(colecao));
+            r.area_ha = metricas ? metricas.totalAreaHa : null;
+        }
+    } catch (e) {
+        r.erro = String((e && e.message) || e);
+    }
+
+    if (observador) {
+        longas.push(...observador.takeRecords());
+        observador.disconnect();
+    }
+    for (const f of Object.values(r.fases)) {
+        const dentro = longas.filter(t => t.startTime < f.fim && t.startTime + t.duration > f.inicio);
+        f.long_tasks = dentro.length;
+        f.long_tasks_ms = dentro.reduce((soma, t) => soma + t.duration, 0);
+    }
+    r.heap_fases_mb = heapInicial !== null ? (heapMaximo - heapInicial) / 1048576 : null;
+    concluir(r);
+})();
+"""
+
+# Modo interface: long tasks desde a instalação até a coleta
+OBSERVADOR_UI_JS = """
+if (window.__benchGeo && window.__benchGeo.observador) window.__benchGeo.observador.disconnect();
+window.__benchGeo = {longas: []};
+try {
+    window.__benchGeo.observador = new PerformanceObserver(l => window.__benchGeo.longas.push(...l.getEntries()));
+    window.__benchGeo.observador.observe({type: 'longtask'});
+} catch (e) {}
+return performance.now();
+"""
+
+LONGAS_UI_JS = """
+const desde = arguments[0];
+const b = window.__benchGeo || {longas: []};
+if (b.observador) b.longas.push(...b.observador.takeRecords());
+const dentro = b.longas.filter(t => t.startTime + t.duration > desde);
+return [dentro.length, dentro.reduce((s, t) => s + t.duration, 0)];
+"""
+
+XPATH_IMPORTAR = "//button[contains(., 'Importar Dados')]"
+XPATH_RESULTADO_UPLOAD = ("//*[contains(text(), 'Arquivo carregado com sucesso') or "
+                          "contains(text(), 'Erro ao processar arquivo') or "
+                          "contains(text(), 'Nenhum dado georreferenciado')]")
+XPATH_FECHAR_UPLOAD = ("//h2[contains(., 'Upload de Dados Georreferenciados')]"
+                       "/ancestor::div[contains(@class, 'border-b')][1]//button")
+XPATH_METRICAS = "//h3[contains(., 'Métricas de Área e Perímetro')]"
+
+
+# ==============================================================================
+# MEDIÇÃO
+# ==============================================================================
+
+def heap_mb(driver, coletar_lixo: bool = False) -> Optional[float]:
+    """Heap JS usado (MB) via CDP; com ``coletar_lixo`` força um GC antes"""
+    try:
+        if coletar_lixo:
+            driver.execute_cdp_cmd('HeapProfiler.collectGarbage', {})
+        metricas = driver.execute_cdp_cmd('Performance.getMetrics', {})['metrics']
+        valor = next(m['value'] for m in metricas if m['name'] == 'JSHeapUsedSize')
+        return round(valor / 2 ** 20, 1)
+    except Exception:
+        return None
+
+
+def _delta(depois: Optional[float], antes: Optional[float]) -> Optional[float]:
+    return round(depois - antes, 1) if depois is not None and antes is not None else None
+
+
+def medir_modulos(driver, fixture: Path, buffer_m: float, steps: int) -> dict:
+    """Parse + buffer + área de uma fixture, chamando os módulos do frontend na página"""
+    antes = heap_mb(driver, coletar_lixo=True)
+    inicio = time.perf_counter()
+    resultado = driver.execute_async_script(HARNESS_JS, f"{PUBLICO.name}/{fixture.name}", buffer_m, steps)
+    total_ms = (time.perf_counter() - inicio) * 1000
+    depois = heap_mb(driver)
+    retido = heap_mb(driver, coletar_lixo=True)
+
+    fases = resultado.get('fases', {})
+    medida = {
+        'modo': 'modulos',
+        'total_ms': round(total_ms, 1),
+        'features': resultado.get('features'),
+        'area_ha': round(resultado['area_ha'], 2) if resultado.get('area_ha') is not None else None,
+        'heap_antes_mb': antes,
+        'heap_delta_mb': _delta(depois, antes),
+        'heap_retido_mb': _delta(retido, antes),
+        'heap_fases_mb': round(resultado['heap_fases_mb'], 1) if resultado.get('heap_fases_mb') is not None else None,
+        'erro': resultado.get('erro'),
+    }
+    for nome in ('parse', 'buffer', 'area'):
+        f = fases.get(nome) or {}
+        medida[f'{nome}_ms'] = round(f['ms'], 1) if 'ms' in f else None
+        medida[f'{nome}_long_tasks'] = f.get('long_tasks')
+        medida[f'{nome}_long_tasks_ms'] = round(f.get('long_tasks_ms') or 0, 1) if f else None
+        if f.get('erro'):
+            medida['erro'] = medida['erro'] or f"{nome}: {f['erro']}"
+    return medida
+
+
+def abrir_painel_imovel(driver) -> bool:
+    """Testes 01 e 02 até o imóvel existir; volta para a etapa Imóvel e abre o mapa"""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from smart_wait import aguardar_estavel
+    import test_novo_empreendimento_01_menu_navegacao as teste01
+    import test_novo_empreendimento_02_imovel as teste02
+
+    contexto = teste01.executar_teste(driver_existente=driver)
+    if contexto.get('status') == 'sucesso':
+        contexto = teste02.executar_teste(driver_existente=driver, contexto_anterior=contexto)
+    if contexto.get('status') != 'sucesso':
+        print(f"❌ Não foi possível cadastrar o imóvel: {contexto.get('erro')}")
+        return False
+
+    wait = WebDriverWait(driver, 20)
+    voltar = wait.until(EC.element_to_be_clickable(
+        (By.XPATH, "//button[contains(., 'Anterior') or contains(., 'Voltar')]")))
+    driver.execute_script("arguments[0].click();", voltar)
+    abrir = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Abrir Mapa')]")))
+    driver.execute_script("arguments[0].click();", abrir)
+    wait.until(EC.element_to_be_clickable((By.XPATH, XPATH_IMPORTAR)))
+    aguardar_estavel(driver, timeout=3)
+    return True
+
+
+def medir_interface(driver, fixture: Path, timeout: float) -> dict:
+    """Upload pelo modal "Importar Dados" e abertura do AreaMetricsPanel da camada"""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from smart_wait import aguardar_estavel
+
+    wait = WebDriverWait(driver, timeout)
+    medida = {'modo': 'interface', 'erro': None}
+    antes = heap_mb(driver, coletar_lixo=True)
+    try:
+        driver.execute_script("arguments[0].click();", driver.find_element(By.XPATH, XPATH_IMPORTAR))
+        campo = wait.until(EC.presence_of_element_located(
+            (By.CSS_SELECTOR, "input[type='file'][accept*='.geojson']")))
+        desde = driver.execute_script(OBSERVADOR_UI_JS)
+
+        inicio = time.perf_counter()
+        campo.send_keys(str(fixture))
+        resultado = wait.until(EC.presence_of_element_located((By.XPATH, XPATH_RESULTADO_UPLOAD)))
+        medida['parse_ms'] = round((time.perf_counter() - inicio) * 1000, 1)
+        if 'sucesso' not in resultado.text:
+            medida['erro'] = resultado.text.strip()[:200]
+        aguardar_estavel(driver, timeout=timeout)
+        medida['render_ms'] = round((time.perf_counter() - inicio) * 1000 - medida['parse_ms'], 1)
+        for botao in driver.find_elements(By.XPATH, XPATH_FECHAR_UPLOAD)[:1]:
+            driver.execute_script("arguments[0].click();", botao)
+
+        if not medida['erro']:
+            camadas = driver.find_elements(By.XPATH, "//button[@title='Calcular área e perímetro']")
+            inicio = time.perf_counter()
+            driver.execute_script("arguments[0].click();", camadas[-1])
+            wait.until(EC.visibility_of_element_located((By.XPATH, XPATH_METRICAS)))
+            medida['area_ms'] = round((time.perf_counter() - inicio) * 1000, 1)
+            fechar = driver.find_elements(By.XPATH, XPATH_METRICAS + "/following::button[1]")
+            if fechar:
+                driver.execute_script("arguments[0].click();", fechar[0])
+
+        medida['long_tasks'], longas_ms = driver.execute_script(LONGAS_UI_JS, desde)
+        medida['long_tasks_ms'] = round(longas_ms, 1)
+    except Exception as e:
+        medida['erro'] = medida['erro'] or (str(e).splitlines()[0] if str(e) else type(e).__name__)
+    # Camadas ficam no mapa: o retido acumula entre uploads, como no uso real
+    medida['heap_antes_mb'] = antes
+    medida['heap_delta_mb'] = _delta(heap_mb(driver), antes)
+    medida['heap_retido_mb'] = _delta(heap_mb(driver, coletar_lixo=True), antes)
+    return medida
+
+
+# ==============================================================================
+# RELATÓRIO
+# ==============================================================================
+
+def imprimir_relatorio(medidas: List[dict]):
+    def fmt(v, casas=0):
+        return '-' if v is None else f"{v:,.{casas}f}".replace(',', '.')
+
+    print("\n" + "=" * 80)
+    print("🗺️  BENCHMARK DO UPLOAD GEOESPACIAL DO IMÓVEL")
+    print("=" * 80)
+    print(f"{'Fixture':<34}{'Modo':<6}{'MB':>7}{'Parse':>9}{'Buffer':>9}{'Área':>8}{'LT':>5}{'LT ms':>8}{'ΔHeap':>8}{'Retido':>8}")
+    print("-" * 102)
+    for m in medidas:
+        longas = sum(m.get(k) or 0 for k in ('long_tasks', 'parse_long_tasks', 'buffer_long_tasks', 'area_long_tasks'))
+        longas_ms = sum(m.get(k) or 0 for k in ('long_tasks_ms', 'parse_long_tasks_ms',
+                                                 'buffer_long_tasks_ms', 'area_long_tasks_ms'))
+        print(f"{m['fixture'][:33]:<34}{m['modo'][:5]:<6}{m['mb']:>7.1f}{fmt(m.get('parse_ms')):>9}"
+              f"{fmt(m.get('buffer_ms')):>9}{fmt(m.get('area_ms')):>8}{longas:>5}{fmt(longas_ms):>8}"
+              f"{fmt(m.get('heap_delta_mb'), 1):>8}{fmt(m.get('heap_retido_mb'), 1):>8}")
+        if m.get('erro'):
+            print(f"   {'⚠️' if m['esperado'] else '✗'} {m['erro'][:95]}")
+    print("-" * 102)
+    print("Tempos em ms | LT = long tasks (>50ms) na thread principal | ΔHeap/Retido em MB (antes/depois do GC)")
+    print("Modo interface: Parse = envio até o aviso do GeoUpload; a renderização fica em 'render_ms' no JSON")
+    print("=" * 80)
+
+
+# ==============================================================================
+# LINHA DE COMANDO
+# ==============================================================================
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Mede parse, buffer, long tasks e heap do upload geoespacial do imóvel',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument('--vertices', nargs='+', default=list(geo_fixtures.TAMANHOS_PADRAO),
+                        help=f"Tamanhos das fixtures (padrão: {' '.join(geo_fixtures.TAMANHOS_PADRAO)}; até 5M)")
+    parser.add_argument('--tipos', nargs='+', choices=geo_fixtures.TIPOS, default=list(geo_fixtures.TIPOS))
+    parser.add_argument('--formatos', nargs='+', choices=geo_fixtures.FORMATOS, default=list(geo_fixtures.FORMATOS))
+    parser.add_argument('--buffer', type=float, default=100, help='Distância do buffer em metros (padrão: 100)')
+    parser.add_argument('--steps', type=int, default=16, help='Segmentos por quarto de círculo no buffer (padrão: 16)')
+    parser.add_argument('--repeticoes', type=int, default=1, help='Medições por fixture (padrão: 1)')
+    parser.add_argument('--ui', action='store_true', help='Também mede o upload pelo modal do ImovelGeoPanel (GeoJSON)')
+    parser.add_argument('--timeout', type=float, default=TIMEOUT, help=f'Limite por fixture em s (padrão: {TIMEOUT:g})')
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--json', dest='saida_json', help='Grava as medidas neste arquivo JSON')
+    args = parser.parse_args(argv)
+
+    from driver_pool import obter_driver, devolver_driver
+    from auth_session import login_navegador
+
+    print("=" * 80)
+    print("🗺️  Gerando fixtures...")
+    fixtures = [geo_fixtures.gerar(tipo, geo_fixtures.ler_tamanho(tamanho), formato, semente=args.semente)
+                for tamanho in args.vertices for tipo in args.tipos for formato in args.formatos]
+    PUBLICO.mkdir(parents=True, exist_ok=True)
+    for fixture in fixtures:
+        destino = PUBLICO / fixture.name
+        if not destino.exists():
+            try:
+                os.link(fixture, destino)
+            except OSError:
+                shutil.copy2(fixture, destino)
+    print(f"  ✓ {len(fixtures)} fixture(s) em {PUBLICO.relative_to(RAIZ)}")
+
+    medidas = []
+    driver = obter_driver()
+    try:
+        driver.set_script_timeout(args.timeout)
+        driver.execute_cdp_cmd('Performance.enable', {})
+        login_navegador(driver, '/dashboard', base_url=BASE_URL)
+
+        # Aquecimento: compila os módulos (e o shpjs) fora da medição
+        for formato in args.formatos:
+            primeira = next((f for f in fixtures if f.suffix == ('.zip' if formato == 'shp' else '.geojson')), None)
+            if primeira:
+                driver.execute_async_script(HARNESS_JS, f"{PUBLICO.name}/{primeira.name}", args.buffer, args.steps)
+
+        for fixture in fixtures:
+            for repeticao in range(args.repeticoes):
+                print(f"▶️  {fixture.name} ({repeticao + 1}/{args.repeticoes})")
+                medida = medir_modulos(driver, fixture, args.buffer, args.steps)
+                medidas.append({'fixture': fixture.name, 'mb': fixture.stat().st_size / 2 ** 20,
+                                'repeticao': repeticao + 1, 'esperado': 'invalido' in fixture.name, **medida})
+
+        if args.ui:
+            print("\n🖱️  Modo interface: cadastrando imóvel (testes 01 e 02)...")
+            if abrir_painel_imovel(driver):
+                for fixture in (f for f in fixtures if f.suffix == '.geojson'):
+                    print(f"▶️  {fixture.name} (interface)")
+                    medida = medir_interface(driver, fixture, args.timeout)
+                    medidas.append({'fixture': fixture.name, 'mb': fixture.stat().st_size / 2 ** 20,
+                                    'repeticao': 1, 'esperado': 'invalido' in fixture.name, **medida})
+            else:
+                medidas.append({'fixture': '-', 'mb': 0, 'modo': 'interface', 'esperado': False,
+                                'erro': 'painel do imóvel não aberto'})
+    finally:
+        devolver_driver(driver)
+        shutil.rmtree(PUBLICO, ignore_errors=True)
+
+    imprimir_relatorio(medidas)
+    if args.saida_json:
+        with open(args.saida_json, 'w', encoding='utf-8') as f:
+            json.dump({'gerado_em': datetime.now().isoformat(timespec='seconds'), 'base_url': BASE_URL,
+                       'buffer_m': args.buffer, 'steps': args.steps, 'medidas': medidas},
+                      f, ensure_ascii=False, indent=2)
+        print(f"💾 Medidas gravadas em {args.saida_json}")
+
+    # Erros em fixtures inválidas são o comportamento esperado; nas válidas, falha
+    return 1 if any(m.get('erro') and not m['esperado'] for m in medidas) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,408 @@
+"""
+Carga no pipeline de notificações (vazão e latência de entrega ponta a ponta)
+=============================================================================
+
+``test_notifications.py`` e ``test_notifications_selenium.py`` criam três
+notificações e consultam ``/notifications/stats`` uma vez. Em produção as
+notificações chegam em rajadas (transições de workflow de vários processos ao
+mesmo tempo); este script gera essa carga e mede quanto tempo cada notificação
+leva para ficar visível:
+
+    POST /notifications                       → aceite (resposta 201)
+    GET  /notifications?user_id=...           → item aparece na lista
+    GET  /notifications/stats?user_id=...     → ``unread_count`` inclui o item
+    página /notificacoes (navegador headless) → contador "Não lidas" atualizado
+
+As notificações são criadas a uma taxa fixa (``--taxa`` por segundo) para
+``--usuarios`` user_ids sintéticos (prefixo único por execução); cada uma é
+observada em paralelo até aparecer ou estourar ``--timeout``.
+
+A amostra de interface (``--ui N``) usa o usuário logado (TEST_CPF): cria N
+notificações para ele durante a carga e mede até o contador da aba "Não lidas"
+mudar. A página /notificacoes não faz polling (o sino, em /inscricao/*, atualiza
+a cada 30s), então o script alterna as abas "Todas"/"Não lidas" - cada troca
+dispara ``fetchStats`` - e mede o primeiro ciclo em que o número novo aparece.
+Os POSTs da sonda entram na etapa ``ui_post``, fora de "Criadas" e da taxa
+alcançada, que contam só a carga (``--total``).
+
+Relatório: notificações/s (alvo x alcançado), p50/p95/p99 de cada etapa, itens
+não entregues no prazo e erros.
+
+    python benchmark_notifications.py --backend-local --taxa 50 --total 500 --ui 0
+    python benchmark_notifications.py --taxa 20 --total 200 --usuarios 40 --ui 5
+    python benchmark_notifications.py --api-url https://staging/api/v1 --json carga_notif.json
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from api_client import ClienteAPI
+from benchmark_workflow_engine import percentil
+
+
+# ==============================================================================
+# CONFIGURAÇÕES
+# ==============================================================================
+
+API_URL = os.getenv('API_URL', 'http://localhost:8000/api/v1')
+BASE_URL = os.getenv('BASE_URL', 'http://localhost:5173')
+TIMEOUT = float(os.getenv('BENCH_TIMEOUT', '15'))
+ETAPAS = ('post', 'lista', 'stats', 'ui_post', 'ui')
+
+XPATH_ABA = "//button[contains(normalize-space(.), '{}')]"
+XPATH_CONTADOR_NAO_LIDAS = XPATH_ABA.format('Não lidas') + "/span"
+
+
+# ==============================================================================
+# CARGA
+# ==============================================================================
+
+class CargaNotificacoes:
+    """Cria notificações a taxa fixa e mede quando cada uma fica visível"""
+
+    def __init__(self, api_url: str, taxa: float = 20, usuarios: int = 20, workers: int = 16,
+                 timeout: float = TIMEOUT, intervalo: float = 0.05, token: str = None):
+        self.api_url = api_url.rstrip('/')
+        self.taxa = taxa
+        self.usuarios = [f"carga-{uuid.uuid4().hex[:8]}-{i:03d}" for i in range(usuarios)]
+        self.workers = workers
+        self.timeout = timeout
+        self.intervalo = intervalo
+        # Sem retry: uma falha tem que aparecer no relatório, não virar latência
+        self.api = ClienteAPI(self.api_url, tentativas=0, tamanho_pool=workers * 2)
+        if token:
+            self.api.headers['Authorization'] = f"Bearer {token}"
+
+        self.latencias = defaultdict(list)
+        self.erros = defaultdict(list)
+        self.nao_entregues = defaultdict(int)
+        self.criadas = []  # (user_id, id) para limpeza
+        self._por_usuario = defaultdict(int)
+        self._lock = threading.Lock()
+        self._ultima_entrega = None
+
+    # ------------------------------------------------------------------
+    # Etapas
+    # ------------------------------------------------------------------
+
+    def _registrar(self, etapa: str, ms: float = None, erro: str = None):
+        with self._lock:
+            if erro is not None:
+                self.erros[etapa].append(erro)
+            else:
+                self.latencias[etapa].append(ms)
+
+    def criar(self, user_id: str, indice: int, etapa: str = 'post') -> dict:
+        """
+        POST /notifications; retorna a notificação criada (ou None).
+
+        ``etapa`` separa a latência do POST: a sonda de interface usa ``ui_post``
+        para não somar às criadas/s da carga.
+        """
+        payload = {
+            'user_id': user_id,
+            'type': 'PROCESS',
+            'title': f'Carga {indice:05d}',
+            'message': 'Notificação gerada pelo benchmark de notificações.',
+            'severity': 'INFO',
+            'target_type': 'benchmark',
+            'target_id': f'carga-{indice}',
+            'action_url': '/notificacoes',
+        }
+        inicio = time.perf_counter()
+        try:
+            resposta = self.api.post('/notifications', json=payload)
+        except Exception as e:
+            self._registrar(etapa, erro=type(e).__name__)
+            return None
+        if resposta.status_code not in (200, 201):
+            self._registrar(etapa, erro=f"HTTP {resposta.status_code}")
+            return None
+        self._registrar(etapa, (time.perf_counter() - inicio) * 1000)
+        criada = resposta.json()
+        with self._lock:
+            self._por_usuario[user_id] += 1
+            self.criadas.append((user_id, criada.get('id')))
+            ordem = self._por_usuario[user_id]
+        return {'id': criada.get('id'), 'user_id': user_id, 'ordem': ordem, 'inicio': inicio}
+
+    def observar(self, item: dict):
+        """Consulta lista e stats até o item aparecer nas duas (ou até o timeout)"""
+        pendentes = {'lista', 'stats'}
+        limite = item['inicio'] + self.timeout
+        while pendentes and time.perf_counter() < limite:
+            for etapa in list(pendentes):
+                try:
+                    if etapa == 'lista':
+                        resposta = self.api.get('/notifications', params={'user_id': item['user_id'], 'limit': 50})
+                        visivel = any(n.get('id') == item['id'] for n in resposta.json().get('items', []))
+                    else:
+                        resposta = self.api.get('/notifications/stats', params={'user_id': item['user_id']})
+                        visivel = resposta.json().get('unread_count', 0) >= item['ordem']
+                except Exception as e:
+                    self._registrar(etapa, erro=type(e).__name__)
+                    pendentes.discard(etapa)
+                    continue
+                if visivel:
+                    agora = time.perf_counter()
+                    self._registrar(etapa, (agora - item['inicio']) * 1000)
+                    pendentes.discard(etapa)
+                    with self._lock:
+                        self._ultima_entrega = max(self._ultima_entrega or agora, agora)
+            if pendentes:
+                time.sleep(self.intervalo)
+        for etapa in pendentes:
+            with self._lock:
+                self.nao_entregues[etapa] += 1
+
+    # ------------------------------------------------------------------
+    # Execução
+    # ------------------------------------------------------------------
+
+    def executar(self, total: int, sonda_ui=None) -> dict:
+        print(f"🚀 {total} notificações a {self.taxa}/s para {len(self.usuarios)} usuários "
+              f"({self.workers} workers)...")
+        envio = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='notif-envio')
+        observacao = ThreadPoolExecutor(max_workers=self.workers * 2, thread_name_prefix='notif-obs')
+        thread_ui = None
+        if sonda_ui:
+            thread_ui = threading.Thread(target=sonda_ui, args=(self,), name='notif-ui', daemon=True)
+            thread_ui.start()
+
+        def enviar(indice: int):
+            item = self.criar(self.usuarios[indice % len(self.usuarios)], indice)
+            if item:
+                observacao.submit(self.observar, item)
+
+        inicio = time.perf_counter()
+        futuros = []
+        for indice in range(total):
+            atraso = inicio + indice / self.taxa - time.perf_counter()
+            if atraso > 0:
+                time.sleep(atraso)
+            futuros.append(envio.submit(enviar, indice))
+        for futuro in futuros:
+            futuro.result()
+        duracao_envio = time.perf_counter() - inicio
+        envio.shutdown(wait=True)
+        observacao.shutdown(wait=True)
+        if thread_ui:
+            thread_ui.join()
+        duracao = time.perf_counter() - inicio
+        return self.relatorio(total, duracao_envio, duracao, inicio)
+
+    def relatorio(self, total: int, duracao_envio: float, duracao: float, inicio: float) -> dict:
+        etapas = {}
+        for etapa in ETAPAS:
+            amostras = sorted(self.latencias.get(etapa, []))
+            erros = self.erros.get(etapa, [])
+            if not amostras and not erros and not self.nao_entregues.get(etapa):
+                continue
+            etapas[etapa] = {
+                'amostras': len(amostras),
+                'erros': len(erros),
+                'nao_entregues': self.nao_entregues.get(etapa, 0),
+                'p50_ms': percentil(amostras, 50),
+                'p95_ms': percentil(amostras, 95),
+                'p99_ms': percentil(amostras, 99),
+                'max_ms': round(amostras[-1], 2) if amostras else None,
+                'exemplos_erro': sorted(set(erros))[:3],
+            }
+        # Só a carga: os POSTs da sonda de interface ficam em ``ui_post``
+        criadas = len(self.latencias.get('post', []))
+        entregues = len(self.latencias.get('lista', []))
+        janela_entrega = (self._ultima_entrega - inicio) if self._ultima_entrega else duracao
+        return {
+            'api_url': self.api_url,
+            'data': datetime.now().isoformat(),
+            'total': total,
+            'usuarios': len(self.usuarios),
+            'workers': self.workers,
+            'taxa_alvo': self.taxa,
+            'duracao_s': round(duracao, 3),
+            'criadas': criadas,
+            'criadas_por_s': round(criadas / duracao_envio, 2) if duracao_envio else 0,
+            'entregues_por_s': round(entregues / janela_entrega, 2) if janela_entrega else 0,
+            'etapas': etapas,
+        }
+
+    def limpar(self):
+        """Remove as notificações criadas pela carga"""
+        removidas = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for resposta in executor.map(
+                    lambda c: self._excluir(*c), [c for c in self.criadas if c[1]]):
+                removidas += int(resposta)
+        print(f"🧹 {removidas}/{len(self.criadas)} notificações de carga removidas")
+
+    def _excluir(self, user_id: str, notificacao_id: str) -> bool:
+        try:
+            return self.api.delete(f'/notifications/{notificacao_id}', params={'user_id': user_id}).ok
+        except Exception:
+            return False
+
+
+# ==============================================================================
+# SONDA DE INTERFACE (/notificacoes)
+# ==============================================================================
+
+def criar_sonda_ui(amostras: int, api_url: str, base_url: str = BASE_URL, user_id: str = None):
+    """Sonda que roda em paralelo à carga, numa página /notificacoes headless"""
+    from selenium.webdriver.common.by import By
+
+    def contador(driver):
+        try:
+            return int(driver.find_element(By.XPATH, XPATH_CONTADOR_NAO_LIDAS).text.strip())
+        except Exception:
+            return None
+
+    def alternar_aba(driver, aba: str):
+        driver.execute_script("arguments[0].click();", driver.find_element(By.XPATH, XPATH_ABA.format(aba)))
+
+    def sonda(carga: CargaNotificacoes):
+        from auth_api import autenticar
+        from auth_session import login_navegador
+        from driver_pool import obter_driver, devolver_driver
+
+        alvo = user_id or os.getenv('TEST_USER_ID')
+        if not alvo:
+            try:
+                alvo = str(autenticar(api_url=api_url)['userId'])
+            except Exception as e:
+                print(f"  ⚠️ Sonda de interface desativada: sem user_id do usuário logado ({e})")
+                return
+
+        driver = obter_driver()
+        try:
+            login_navegador(driver, '/notificacoes', base_url=base_url, api_url=api_url)
+            for indice in range(amostras):
+                anterior = contador(driver)
+                if anterior is None:
+                    carga._registrar('ui', erro='contador "Não lidas" não encontrado')
+                    return
+                item = carga.criar(alvo, 90000 + indice, etapa='ui_post')
+                if not item:
+                    continue
+                abas = ('Todas', 'Não lidas')
+                limite = item['inicio'] + carga.timeout
+                ciclo = 0
+                while time.perf_counter() < limite:
+                    alternar_aba(driver, abas[ciclo % 2])
+                    ciclo += 1
+                    time.sleep(carga.intervalo)
+                    valor = contador(driver)
+                    if valor is not None and valor > anterior:
+                        carga._registrar('ui', (time.perf_counter() - item['inicio']) * 1000)
+                        break
+                else:
+                    with carga._lock:
+                        carga.nao_entregues['ui'] += 1
+        finally:
+            devolver_driver(driver)
+
+    return sonda
+
+
+# ==============================================================================
+# RELATÓRIO
+# ==============================================================================
+
+def imprimir_relatorio(relatorio: dict):
+    print("\n" + "=" * 80)
+    print("📊 CARGA NO PIPELINE DE NOTIFICAÇÕES")
+    print("=" * 80)
+    print(f"API: {relatorio['api_url']}  |  usuários: {relatorio['usuarios']}  |  workers: {relatorio['workers']}  |  "
+          f"duração: {relatorio['duracao_s']}s")
+    print(f"Criadas: {relatorio['criadas']}/{relatorio['total']}  |  alvo {relatorio['taxa_alvo']}/s  |  "
+          f"alcançado {relatorio['criadas_por_s']}/s  |  entregues {relatorio['entregues_por_s']}/s")
+    print("-" * 80)
+    print(f"{'Etapa':<10}{'Amostras':>10}{'Erros':>8}{'Atraso':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'máx':>10}")
+    for etapa, m in relatorio['etapas'].items():
+        def fmt(v):
+            return '-' if v is None else f"{v:.1f}"
+        print(f"{etapa:<10}{m['amostras']:>10}{m['erros']:>8}{m['nao_entregues']:>8}{fmt(m['p50_ms']):>10}"
+              f"{fmt(m['p95_ms']):>10}{fmt(m['p99_ms']):>10}{fmt(m['max_ms']):>10}")
+        for exemplo in m['exemplos_erro']:
+            print(f"   ✗ {exemplo}")
+    print("-" * 80)
+    print("post = aceite do POST | ui_post = POST da sonda (fora das criadas/s) | "
+          "lista/stats/ui = do POST até aparecer | Atraso = não visível no timeout")
+    print("=" * 80)
+
+
+# ==============================================================================
+# LINHA DE COMANDO
+# ==============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Carga e latência de entrega do pipeline de notificações',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('--api-url', default=API_URL, help=f'Base da API (padrão: {API_URL})')
+    parser.add_argument('--taxa', type=float, default=20, help='Notificações criadas por segundo (padrão: 20)')
+    parser.add_argument('--total', type=int, default=200, help='Notificações a criar (padrão: 200)')
+    parser.add_argument('--usuarios', type=int, default=20, help='user_ids sintéticos (padrão: 20)')
+    parser.add_argument('--workers', type=int, default=16, help='POSTs simultâneos (padrão: 16)')
+    parser.add_argument('--timeout', type=float, default=TIMEOUT, help=f'Prazo de entrega em s (padrão: {TIMEOUT:g})')
+    parser.add_argument('--intervalo', type=float, default=0.05, help='Intervalo entre consultas em s (padrão: 0.05)')
+    parser.add_argument('--ui', type=int, default=3, help='Amostras na página /notificacoes (0 desativa; padrão: 3)')
+    parser.add_argument('--manter', action='store_true', help='Não remove as notificações criadas')
+    parser.add_argument('--json', dest='saida_json', help='Grava o relatório neste arquivo JSON')
+    parser.add_argument('--sem-auth', action='store_true', help='Não autentica (API sem token)')
+    parser.add_argument('--backend-local', action='store_true', help='Executa contra o backend_local em processo')
+    args = parser.parse_args(argv)
+    if args.taxa <= 0 or args.total < 1 or args.usuarios < 1 or args.workers < 1:
+        parser.error('--taxa, --total, --usuarios e --workers devem ser positivos')
+
+    backend = None
+    if args.backend_local:
+        from backend_local import iniciar_backend
+        backend = iniciar_backend()
+        args.api_url = backend.api_url
+        print(f"🧪 Backend local em {backend.api_url}")
+
+    token = None
+    if not args.sem_auth:
+        try:
+            from auth_api import autenticar
+            token = autenticar(api_url=args.api_url)['token']
+        except Exception as e:
+            print(f"⚠️ Login indisponível ({e}); seguindo sem token")
+
+    try:
+        carga = CargaNotificacoes(args.api_url, args.taxa, args.usuarios, args.workers,
+                                  args.timeout, args.intervalo, token)
+        sonda = criar_sonda_ui(args.ui, args.api_url) if args.ui > 0 else None
+        relatorio = carga.executar(args.total, sonda)
+        if not args.manter:
+            carga.limpar()
+    finally:
+        if backend:
+            backend.encerrar()
+
+    imprimir_relatorio(relatorio)
+    if args.saida_json:
+        with open(args.saida_json, 'w', encoding='utf-8') as f:
+            json.dump(relatorio, f, ensure_ascii=False, indent=2)
+        print(f"💾 Relatório gravado em {args.saida_json}")
+
+    etapas = relatorio['etapas'].values()
+    falhou = any(m['erros'] or m['nao_entregues'] for m in etapas)
+    return 1 if falhou or relatorio['criadas'] == 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
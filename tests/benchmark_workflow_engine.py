@@ -0,0 +1,305 @@
+"""
+Benchmark do motor de workflow (vazão e latência via HTTP)
+===========================================================
+
+Dispara várias instâncias de processo em paralelo pelos seis steps do
+template ``LICENCIAMENTO_AMBIENTAL_COMPLETO`` (Participantes → Revisão),
+direto na API do motor (sem navegador), e mede cada endpoint usado pelo
+``src/services/workflowApi.ts``:
+
+    POST /workflow/instances/start
+    GET  /workflow/instances/{id}/current-step
+    POST /workflow/instances/{id}/steps/{stepId}/complete
+    GET  /workflow/instances/{id}/step-history
+
+Relatório: p50/p95/p99 por endpoint, instâncias/s, requisições/s e erros.
+
+A carga (ids dos processos e payloads de cada step) é gerada a partir de uma
+semente e pode ser gravada/reaproveitada, para repetir exatamente o mesmo
+cenário no backend local e no staging:
+
+    python benchmark_workflow_engine.py --backend-local --instancias 200 --concorrencia 20
+    python benchmark_workflow_engine.py --instancias 200 --salvar-carga carga.json
+    python benchmark_workflow_engine.py --api-url https://staging/api/v1 --carga carga.json
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# ==============================================================================
+# CONFIGURAÇÕES
+# ==============================================================================
+
+API_URL = os.getenv('API_URL', 'http://localhost:3000/api/v1')
+TEMPLATE = 'LICENCIAMENTO_AMBIENTAL_COMPLETO'
+TIMEOUT = float(os.getenv('BENCH_TIMEOUT', '30'))
+ENDPOINTS = ('workflow_start', 'current_step', 'complete_step', 'step_history')
+
+
+# ==============================================================================
+# CARGA
+# ==============================================================================
+
+def gerar_carga(instancias: int, semente: int = 42) -> dict:
+    """Carga determinística: um processo por instância, com payload por step"""
+    gerador = random.Random(semente)
+    processos = []
+    for _ in range(instancias):
+        processos.append({
+            'target_id': str(uuid.UUID(int=gerador.getrandbits(128), version=4)),
+            'payloads': [{'bench': True, 'campos': gerador.randint(1, 20)} for _ in range(6)],
+        })
+    return {'template_code': TEMPLATE, 'semente': semente, 'processos': processos}
+
+
+def salvar_carga(carga: dict, caminho: str):
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump(carga, f, ensure_ascii=False, indent=2)
+
+
+def carregar_carga(caminho: str) -> dict:
+    with open(caminho, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# ==============================================================================
+# EXECUÇÃO
+# ==============================================================================
+
+class BenchmarkWorkflow:
+    """Executa a carga com N workers e agrega latências por endpoint"""
+
+    def __init__(self, api_url: str, concorrencia: int = 10, token: str = None, timeout: float = TIMEOUT):
+        self.api_url = api_url.rstrip('/')
+        self.concorrencia = concorrencia
+        self.token = token
+        self.timeout = timeout
+        self.latencias = defaultdict(list)    # endpoint -> [ms]
+        self.erros = defaultdict(list)        # endpoint -> [mensagem]
+        self.instancias_ok = 0
+        self.instancias_erro = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _sessao(self) -> requests.Session:
+        sessao = getattr(self._local, 'sessao', None)
+        if sessao is None:
+            sessao = requests.Session()
+            adaptador = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+            sessao.mount('http://', adaptador)
+            sessao.mount('https://', adaptador)
+            if self.token:
+                sessao.headers['Authorization'] = f'Bearer {self.token}'
+            self._local.sessao = sessao
+        return sessao
+
+    def _chamar(self, endpoint: str, metodo: str, caminho: str, corpo: dict = None) -> dict:
+        inicio = time.perf_counter()
+        try:
+            response = self._sessao().request(metodo, f"{self.api_url}{caminho}", json=corpo, timeout=self.timeout)
+            duracao = (time.perf_counter() - inicio) * 1000
+            if response.status_code >= 400:
+                raise RuntimeError(f"HTTP {response.status_code}: {response.text[:120]}")
+            dados = response.json() if response.content else {}
+        except Exception as e:
+            with self._lock:
+                self.erros[endpoint].append(str(e))
+            raise
+        with self._lock:
+            self.latencias[endpoint].append(duracao)
+        return dados
+
+    def executar_instancia(self, template: str, processo: dict) -> bool:
+        """Uma instância do início ao fim: start → (current-step + complete) × 6 → step-history"""
+        try:
+            inicio = self._chamar('workflow_start', 'POST', '/workflow/instances/start', {
+                'template_code': template,
+                'target_type': 'LICENSE_PROCESS',
+                'target_id': processo['target_id'],
+            })
+            instance_id = inicio['instanceId']
+            step = inicio.get('currentStep')
+            indice = 0
+            while step:
+                atual = self._chamar('current_step', 'GET', f'/workflow/instances/{instance_id}/current-step')
+                step = atual.get('step') or step
+                payload = processo['payloads'][indice % len(processo['payloads'])]
+                resultado = self._chamar('complete_step', 'POST',
+                                         f"/workflow/instances/{instance_id}/steps/{step['id']}/complete", payload)
+                step = resultado.get('nextStep')
+                indice += 1
+                if indice > 20:
+                    raise RuntimeError('Workflow não finalizou após 20 steps')
+            self._chamar('step_history', 'GET', f'/workflow/instances/{instance_id}/step-history')
+        except Exception:
+            with self._lock:
+                self.instancias_erro += 1
+            return False
+        with self._lock:
+            self.instancias_ok += 1
+        return True
+
+    def executar(self, carga: dict, aquecimento: int = 0) -> dict:
+        """Roda a carga; as ``aquecimento`` primeiras instâncias não entram nas métricas"""
+        processos = carga['processos']
+        template = carga.get('template_code', TEMPLATE)
+
+        if aquecimento:
+            print(f"🔥 Aquecimento: {aquecimento} instância(s)")
+            for processo in processos[:aquecimento]:
+                self.executar_instancia(template, processo)
+            self.latencias.clear()
+            self.erros.clear()
+            self.instancias_ok = self.instancias_erro = 0
+            processos = processos[aquecimento:]
+
+        print(f"🚀 {len(processos)} instância(s) com {self.concorrencia} worker(s) em {self.api_url}")
+        inicio = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concorrencia, thread_name_prefix='bench') as executor:
+            futuros = [executor.submit(self.executar_instancia, template, p) for p in processos]
+            for i, futuro in enumerate(as_completed(futuros), 1):
+                futuro.result()
+                if i % max(1, len(futuros) // 10) == 0:
+                    print(f"   {i}/{len(futuros)} instâncias concluídas")
+        duracao = time.perf_counter() - inicio
+        return self.relatorio(duracao)
+
+    def relatorio(self, duracao: float) -> dict:
+        endpoints = {}
+        total_requisicoes = 0
+        for endpoint in ENDPOINTS:
+            amostras = sorted(self.latencias.get(endpoint, []))
+            erros = self.erros.get(endpoint, [])
+            total_requisicoes += len(amostras) + len(erros)
+            endpoints[endpoint] = {
+                'requisicoes': len(amostras) + len(erros),
+                'erros': len(erros),
+                'p50_ms': percentil(amostras, 50),
+                'p95_ms': percentil(amostras, 95),
+                'p99_ms': percentil(amostras, 99),
+                'media_ms': round(sum(amostras) / len(amostras), 2) if amostras else None,
+                'max_ms': round(amostras[-1], 2) if amostras else None,
+                'exemplos_erro': sorted(set(erros))[:3],
+            }
+        return {
+            'api_url': self.api_url,
+            'data': datetime.now().isoformat(),
+            'concorrencia': self.concorrencia,
+            'duracao_s': round(duracao, 3),
+            'instancias_ok': self.instancias_ok,
+            'instancias_erro': self.instancias_erro,
+            'instancias_por_s': round(self.instancias_ok / duracao, 2) if duracao else 0,
+            'requisicoes_por_s': round(total_requisicoes / duracao, 2) if duracao else 0,
+            'endpoints': endpoints,
+        }
+
+
+def percentil(amostras_ordenadas: list, p: float):
+    """Percentil pelo método nearest-rank (None se não houver amostras)"""
+    if not amostras_ordenadas:
+        return None
+    posicao = min(len(amostras_ordenadas), max(1, math.ceil(p / 100 * len(amostras_ordenadas)))) - 1
+    return round(amostras_ordenadas[posicao], 2)
+
+
+def imprimir_relatorio(relatorio: dict):
+    print("\n" + "=" * 80)
+    print("📊 BENCHMARK DO MOTOR DE WORKFLOW")
+    print("=" * 80)
+    print(f"API: {relatorio['api_url']}  |  workers: {relatorio['concorrencia']}  |  "
+          f"duração: {relatorio['duracao_s']}s")
+    print(f"Instâncias: {relatorio['instancias_ok']} ok / {relatorio['instancias_erro']} com erro  |  "
+          f"{relatorio['instancias_por_s']} inst/s  |  {relatorio['requisicoes_por_s']} req/s")
+    print("-" * 80)
+    print(f"{'Endpoint':<16}{'Req':>8}{'Erros':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'média':>10}{'máx':>10}")
+    for endpoint, m in relatorio['endpoints'].items():
+        def fmt(v):
+            return '-' if v is None else f"{v:.1f}"
+        print(f"{endpoint:<16}{m['requisicoes']:>8}{m['erros']:>8}{fmt(m['p50_ms']):>10}{fmt(m['p95_ms']):>10}"
+              f"{fmt(m['p99_ms']):>10}{fmt(m['media_ms']):>10}{fmt(m['max_ms']):>10}")
+        for exemplo in m['exemplos_erro']:
+            print(f"   ✗ {exemplo}")
+    print("=" * 80)
+
+
+# ==============================================================================
+# LINHA DE COMANDO
+# ==============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Benchmark de vazão/latência do motor de workflow via HTTP',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('--api-url', default=API_URL, help=f'Base da API (padrão: {API_URL})')
+    parser.add_argument('--instancias', type=int, default=50, help='Instâncias a executar (padrão: 50)')
+    parser.add_argument('--concorrencia', type=int, default=10, help='Instâncias simultâneas (padrão: 10)')
+    parser.add_argument('--aquecimento', type=int, default=0, help='Instâncias iniciais fora das métricas')
+    parser.add_argument('--semente', type=int, default=42, help='Semente da carga gerada')
+    parser.add_argument('--carga', help='Reexecuta a carga gravada neste arquivo JSON')
+    parser.add_argument('--salvar-carga', help='Grava a carga gerada neste arquivo JSON')
+    parser.add_argument('--json', dest='saida_json', help='Grava o relatório neste arquivo JSON')
+    parser.add_argument('--sem-auth', action='store_true', help='Não autentica (API sem token)')
+    parser.add_argument('--backend-local', action='store_true', help='Executa contra o backend_local em processo')
+    args = parser.parse_args(argv)
+
+    backend = None
+    if args.backend_local:
+        from backend_local import iniciar_backend
+        backend = iniciar_backend()
+        args.api_url = backend.api_url
+        print(f"🧪 Backend local em {backend.api_url}")
+
+    if args.carga:
+        carga = carregar_carga(args.carga)
+        print(f"📁 Carga: {args.carga} ({len(carga['processos'])} instâncias, semente {carga.get('semente')})")
+    else:
+        carga = gerar_carga(args.instancias + args.aquecimento, args.semente)
+    if args.salvar_carga:
+        salvar_carga(carga, args.salvar_carga)
+        print(f"💾 Carga gravada em {args.salvar_carga}")
+
+    token = None
+    if not args.sem_auth:
+        try:
+            from auth_api import autenticar
+            token = autenticar(api_url=args.api_url)['token']
+        except Exception as e:
+            print(f"⚠️ Login indisponível ({e}); seguindo sem token")
+
+    try:
+        benchmark = BenchmarkWorkflow(args.api_url, args.concorrencia, token)
+        relatorio = benchmark.executar(carga, args.aquecimento)
+    finally:
+        if backend:
+            backend.encerrar()
+
+    imprimir_relatorio(relatorio)
+    if args.saida_json:
+        with open(args.saida_json, 'w', encoding='utf-8') as f:
+            json.dump(relatorio, f, ensure_ascii=False, indent=2)
+        print(f"💾 Relatório gravado em {args.saida_json}")
+
+    return 0 if relatorio['instancias_erro'] == 0 and relatorio['instancias_ok'] > 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
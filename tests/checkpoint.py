@@ -0,0 +1,257 @@
+"""
+Checkpoint e retomada da cadeia de Novo Empreendimento
+=======================================================
+
+Quando o teste 04 (Atividades) ou 05 (Caracterização) falha, a cadeia
+recomeçava do 01: login, criação do imóvel e dados gerais eram refeitos.
+Após cada etapa com sucesso o orquestrador grava um checkpoint com:
+
+- ``contexto``: o dict repassado entre os testes (sem driver/wait, só o que é
+  serializável em JSON);
+- ``navegador``: URL atual, localStorage (inclui ``empreendimento-storage``
+  e rascunhos), sessionStorage e cookies. O token de sessão (``auth_token``,
+  ``auth_user``, ``userData`` e o cookie ``auth_token``) não vai para o disco:
+  na restauração o login é refeito pelo ``auth_api`` e reinjetado no navegador;
+- ``store``: snapshot do store Zustand do wizard (``window.__ZUSTAND_STORES__``,
+  exposto pelo app em modo desenvolvimento), que guarda o step atual;
+- ``ids``: IDs dos registros criados (imóvel, empreendimento, workflow...).
+
+Com ``--resume-from 04`` o orquestrador carrega o checkpoint da etapa 03,
+restaura o storage num navegador novo, reabre o wizard (teste 01, com login
+via API), reidrata o store e segue direto para o teste 04. Os arquivos são
+gravados só para o dono (0600, pasta 0700), como o cache do ``auth_api``.
+
+Variáveis de ambiente:
+    CHECKPOINT_DIR   pasta dos checkpoints (padrão: tests/output/checkpoints)
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import json
+import os
+from datetime import date, datetime
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlparse
+
+from smart_wait import aguardar_estavel
+
+
+CHECKPOINT_DIR = Path(os.getenv('CHECKPOINT_DIR', Path(__file__).resolve().parent / 'output' / 'checkpoints'))
+
+# Chaves do contexto que nunca vão para o checkpoint (objetos do Selenium)
+CHAVES_IGNORADAS = {'driver', 'wait'}
+
+# Itens com o token de sessão: ficam fora do arquivo e são reinjetados na restauração
+CHAVES_SESSAO = ('auth_token', 'auth_user', 'userData')
+
+# Campos do store que identificam registros criados
+CAMPOS_ID_STORE = ('empreendimentoId', 'propertyId', 'workflowInstanceId', 'currentStepId')
+
+_SCRIPT_CAPTURA = """
+const dump = (s) => { const o = {}; for (let i = 0; i < s.length; i++) { const k = s.key(i); o[k] = s.getItem(k); } return o; };
+let store = null;
+try {
+    const stores = window.__ZUSTAND_STORES__ || {};
+    if (stores.empreendimento) { store = JSON.parse(JSON.stringify(stores.empreendimento.getState())); }
+} catch (e) { store = null; }
+return {url: window.location.href, local: dump(window.localStorage), sessao: dump(window.sessionStorage), store: store};
+"""
+
+_SCRIPT_STORAGE = """
+const [local, sessao] = arguments;
+window.localStorage.clear();
+window.sessionStorage.clear();
+for (const k in local) { window.localStorage.setItem(k, local[k]); }
+for (const k in sessao) { window.sessionStorage.setItem(k, sessao[k]); }
+"""
+
+_SCRIPT_HIDRATAR = """
+const stores = window.__ZUSTAND_STORES__ || {};
+if (!stores.empreendimento) { return false; }
+stores.empreendimento.setState(arguments[0]);
+return true;
+"""
+
+
+# ==============================================================================
+# SERIALIZAÇÃO
+# ==============================================================================
+
+# Marcador para valores que não entram no JSON (driver, wait, WebElements...)
+_DESCARTAR = object()
+
+
+def serializar_contexto(valor):
+    """Cópia JSON-safe do contexto (descarta driver/wait e objetos não serializáveis)"""
+    if isinstance(valor, dict):
+        saida = {}
+        for chave, item in valor.items():
+            if chave in CHAVES_IGNORADAS:
+                continue
+            convertido = serializar_contexto(item)
+            if convertido is not _DESCARTAR:
+                saida[str(chave)] = convertido
+        return saida
+    if isinstance(valor, (list, tuple, set)):
+        itens = [serializar_contexto(i) for i in valor]
+        return [i for i in itens if i is not _DESCARTAR]
+    if isinstance(valor, (datetime, date)):
+        return valor.isoformat()
+    if isinstance(valor, Path):
+        return str(valor)
+    if valor is None or isinstance(valor, (str, int, float, bool)):
+        return valor
+    return _DESCARTAR
+
+
+def extrair_ids(contexto: dict, store: Optional[dict] = None) -> dict:
+    """IDs de registros criados: chaves ``id``/``*_id`` do contexto e campos do store"""
+    ids = {}
+
+    def visitar(dados, prefixo=''):
+        for chave, valor in dados.items():
+            if isinstance(valor, dict):
+                visitar(valor, f"{prefixo}{chave}.")
+            elif (chave == 'id' or chave.endswith('_id') or chave.endswith('Id')) and valor not in (None, ''):
+                ids[f"{prefixo}{chave}"] = valor
+
+    visitar(contexto)
+    for campo in CAMPOS_ID_STORE:
+        if store and store.get(campo) not in (None, ''):
+            ids[f"store.{campo}"] = store[campo]
+    return ids
+
+
+# ==============================================================================
+# GRAVAÇÃO / LEITURA
+# ==============================================================================
+
+def _arquivo(etapa: int, cadeia: str = 'padrao') -> Path:
+    return CHECKPOINT_DIR / f"checkpoint_{cadeia}_{etapa:02d}.json"
+
+
+def capturar_navegador(driver) -> dict:
+    """URL, localStorage, sessionStorage, cookies e snapshot do store do wizard"""
+    try:
+        estado = driver.execute_script(_SCRIPT_CAPTURA) or {}
+    except Exception as e:
+        print(f"  ⚠️ Não foi possível ler o storage do navegador: {e}")
+        estado = {}
+    try:
+        estado['cookies'] = driver.get_cookies()
+    except Exception:
+        estado['cookies'] = []
+    return estado
+
+
+def _sem_sessao(navegador: dict) -> dict:
+    """Cópia do estado do navegador sem o token (localStorage e cookie ``auth_token``)"""
+    if not navegador:
+        return navegador
+    limpo = dict(navegador)
+    limpo['local'] = {k: v for k, v in (navegador.get('local') or {}).items() if k not in CHAVES_SESSAO}
+    limpo['cookies'] = [c for c in navegador.get('cookies') or [] if c.get('name') not in CHAVES_SESSAO]
+    limpo['sessao_removida'] = True
+    return limpo
+
+
+def salvar_checkpoint(etapa: int, nome: str, contexto: dict, driver=None, cadeia: str = 'padrao') -> Path:
+    """Grava o checkpoint da ``etapa`` concluída com sucesso (sem o token, arquivo 0600)"""
+    navegador = _sem_sessao(capturar_navegador(driver)) if driver else {}
+    store = navegador.pop('store', None)
+    contexto_json = serializar_contexto(contexto or {})
+    dados = {
+        'etapa': etapa,
+        'nome': nome,
+        'cadeia': cadeia,
+        'criado_em': datetime.now().isoformat(),
+        'contexto': contexto_json,
+        'navegador': navegador,
+        'store': store,
+        'ids': extrair_ids(contexto_json, store),
+    }
+    CHECKPOINT_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    caminho = _arquivo(etapa, cadeia)
+    temporario = caminho.with_suffix('.tmp')
+    # Só o dono lê/escreve (0600), inclusive se o arquivo já existia com outra permissão
+    with os.fdopen(os.open(temporario, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w', encoding='utf-8') as f:
+        json.dump(dados, f, ensure_ascii=False, indent=2)
+    os.chmod(temporario, 0o600)
+    os.replace(temporario, caminho)
+    return caminho
+
+
+def carregar_checkpoint(etapa: int, cadeia: str = 'padrao') -> dict:
+    """Lê o checkpoint da ``etapa``; FileNotFoundError se não existir"""
+    caminho = _arquivo(etapa, cadeia)
+    if not caminho.exists():
+        raise FileNotFoundError(
+            f"Checkpoint da etapa {etapa:02d} (cadeia '{cadeia}') não encontrado em {caminho}. "
+            f"Execute a cadeia completa ao menos uma vez até essa etapa."
+        )
+    with open(caminho, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def limpar_checkpoints(cadeia: str = 'padrao', a_partir_de: int = 1):
+    """Remove checkpoints da cadeia a partir da etapa informada (estado obsoleto)"""
+    if not CHECKPOINT_DIR.exists():
+        return
+    for arquivo in CHECKPOINT_DIR.glob(f"checkpoint_{cadeia}_*.json"):
+        try:
+            if int(arquivo.stem.rsplit('_', 1)[-1]) >= a_partir_de:
+                arquivo.unlink()
+        except (ValueError, OSError):
+            pass
+
+
+# ==============================================================================
+# RESTAURAÇÃO
+# ==============================================================================
+
+def _reinjetar_sessao(driver, origem: str):
+    """Login pelo ``auth_api`` (token em cache) e injeção no navegador, no lugar do token removido"""
+    try:
+        from auth_session import injetar_sessao
+        injetar_sessao(driver, base_url=origem)
+    except Exception as e:
+        print(f"  ⚠️ Não foi possível reinjetar a sessão: {e}")
+
+
+def restaurar_navegador(driver, checkpoint: dict):
+    """Restaura storage e cookies na origem do app e volta para a URL gravada"""
+    navegador = checkpoint.get('navegador') or {}
+    url = navegador.get('url')
+    if not url:
+        return
+    partes = urlparse(url)
+    origem = f"{partes.scheme}://{partes.netloc}"
+
+    driver.get(origem)
+    driver.execute_script(_SCRIPT_STORAGE, navegador.get('local') or {}, navegador.get('sessao') or {})
+    for cookie in navegador.get('cookies') or []:
+        cookie = {k: v for k, v in cookie.items() if k in ('name', 'value', 'path', 'domain', 'secure', 'httpOnly', 'expiry')}
+        try:
+            driver.add_cookie(cookie)
+        except Exception:
+            pass
+    if navegador.get('sessao_removida'):
+        _reinjetar_sessao(driver, origem)
+    driver.get(url)
+    aguardar_estavel(driver, timeout=5)
+
+
+def hidratar_store(driver, checkpoint: dict) -> bool:
+    """Reaplica o snapshot do store do wizard (retorna False se o app não expõe o store)"""
+    store = checkpoint.get('store')
+    if not store:
+        return False
+    try:
+        ok = bool(driver.execute_script(_SCRIPT_HIDRATAR, store))
+    except Exception:
+        ok = False
+    if ok:
+        aguardar_estavel(driver, timeout=5)
+    return ok
@@ -0,0 +1,148 @@
+"""
+Specs declarativas dos cadastros de parametrização (Administração)
+===================================================================
+
+Cada catálogo descreve o que os antigos ``test_*_selenium.py`` faziam à mão
+sobre as telas ``GenericCRUD.tsx`` / ``GenericForm.tsx`` (e os formulários
+próprios de Tipos de Licença e Configuração de Cobrança). O ``crud_engine``
+executa o ciclo criar → editar → excluir de cada spec.
+
+Campos de uma spec:
+    menu       texto do botão no submenu Administração (src/pages/Dashboard.tsx)
+    tabela     tabela do Supabase (só informativo, aparece no relatório)
+    colunas    cabeçalhos esperados na lista (GenericCRUD)
+    campos     campos do formulário, localizados pelo texto do <label>:
+                 rotulo   texto do label (sem o "*" de obrigatório)
+                 tipo     texto | textarea | numero | select | multiselect | checkbox | arquivo
+                 valor    valor na criação (select sem valor = primeira opção;
+                          multiselect = lista de opções; arquivo = caminho)
+                 editado  valor na edição (opcional)
+    linha      texto que identifica a linha na lista após criar (padrão:
+               ``valor`` do primeiro campo com ``editado``)
+    linha_editada  idem após editar (padrão: ``editado`` desse campo)
+
+Placeholders nos valores: ``{sufixo}`` (HHMMSS da execução), ``{s4}`` e
+``{s3}`` (últimos 4/3 dígitos - para siglas e valores numéricos).
+
+Adicionar um catálogo = adicionar uma entrada em ``CATALOGOS``.
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import os
+
+
+ARQUIVO_MODELO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'test_document.txt')
+
+
+CATALOGOS = {
+    'property-types': {
+        'menu': 'Tipos de Imóvel',
+        'tabela': 'property_types',
+        'colunas': ['Nome', 'Descrição'],
+        'campos': [
+            {'rotulo': 'Nome', 'tipo': 'texto', 'valor': 'Tipo Teste {sufixo}', 'editado': 'Tipo Editado {sufixo}'},
+            {'rotulo': 'Descrição', 'tipo': 'textarea', 'valor': 'Descrição do tipo de imóvel criado em teste às {sufixo}'},
+        ],
+    },
+    'process-types': {
+        'menu': 'Tipos de Processo',
+        'tabela': 'process_types',
+        'colunas': ['Nome', 'Sigla', 'Descrição', 'Prazo (dias)', 'Ordem'],
+        'campos': [
+            {'rotulo': 'Nome do Tipo de Processo', 'tipo': 'texto', 'valor': 'Processo Teste {sufixo}',
+             'editado': 'Processo Editado {sufixo}'},
+            {'rotulo': 'Sigla/Abreviação', 'tipo': 'texto', 'valor': 'PT{s4}'},
+            {'rotulo': 'Descrição', 'tipo': 'textarea', 'valor': 'Tipo de processo criado em teste às {sufixo}'},
+            {'rotulo': 'Prazo Padrão (dias)', 'tipo': 'numero', 'valor': '180', 'editado': '120'},
+            {'rotulo': 'Ordem de Exibição', 'tipo': 'numero', 'valor': '99'},
+            {'rotulo': 'Fluxo', 'tipo': 'select', 'valor': 'regular'},
+            {'rotulo': 'Categoria do Processo', 'tipo': 'select', 'valor': 'licenciamento'},
+            {'rotulo': 'Prazo para cumprimento do ofício de pendência (dias)', 'tipo': 'numero', 'valor': '30'},
+            {'rotulo': 'Prazo para confirmação de recebimento do e-mail (dias)', 'tipo': 'numero', 'valor': '5'},
+            {'rotulo': 'Limite para criação de Ofícios de Pendências', 'tipo': 'numero', 'valor': '3'},
+        ],
+    },
+    'license-types': {
+        'menu': 'Tipos de Licença',
+        'tabela': 'license_types',
+        'colunas': ['Sigla', 'Nome', 'Prazo', 'Unidade'],
+        'campos': [
+            {'rotulo': 'Sigla/Abreviação', 'tipo': 'texto', 'valor': 'LT{s4}'},
+            {'rotulo': 'Tipo da Licença', 'tipo': 'texto', 'valor': 'Licença Teste {sufixo}',
+             'editado': 'Licença Editada {sufixo}'},
+            {'rotulo': 'Prazo de Validade', 'tipo': 'numero', 'valor': '5', 'editado': '4'},
+            {'rotulo': 'Unidade de Tempo', 'tipo': 'select', 'valor': 'anos'},
+            {'rotulo': 'Descrição', 'tipo': 'textarea', 'valor': 'Descrição da licença criada em teste às {sufixo}'},
+        ],
+    },
+    'enterprise-sizes': {
+        'menu': 'Porte do Empreendimento',
+        'tabela': 'enterprise_sizes',
+        'colunas': ['Nome', 'Descrição'],
+        'campos': [
+            {'rotulo': 'Nome', 'tipo': 'texto', 'valor': 'Porte Teste {sufixo}', 'editado': 'Porte Editado {sufixo}'},
+            {'rotulo': 'Descrição', 'tipo': 'textarea', 'valor': 'Porte criado em teste às {sufixo}'},
+        ],
+    },
+    'pollution-potentials': {
+        'menu': 'Potencial Poluidor',
+        'tabela': 'pollution_potentials',
+        'colunas': ['Nome', 'Descrição'],
+        'campos': [
+            {'rotulo': 'Nome', 'tipo': 'texto', 'valor': 'Potencial Teste {sufixo}',
+             'editado': 'Potencial Editado {sufixo}'},
+            {'rotulo': 'Descrição', 'tipo': 'textarea', 'valor': 'Potencial poluidor criado em teste às {sufixo}'},
+        ],
+    },
+    'reference-units': {
+        'menu': 'Unidades de Referência',
+        'tabela': 'reference_units',
+        'colunas': ['Código', 'Nome', 'Descrição'],
+        'campos': [
+            {'rotulo': 'Código', 'tipo': 'texto', 'valor': 'UR{s4}'},
+            {'rotulo': 'Nome', 'tipo': 'texto', 'valor': 'Unidade Teste {sufixo}', 'editado': 'Unidade Editada {sufixo}'},
+            {'rotulo': 'Descrição', 'tipo': 'textarea', 'valor': 'Unidade de referência criada em teste às {sufixo}'},
+        ],
+    },
+    'study-types': {
+        'menu': 'Tipos de Estudo',
+        'tabela': 'study_types',
+        'colunas': ['Sigla', 'Nome', 'Descrição'],
+        'campos': [
+            {'rotulo': 'Sigla/Abreviação', 'tipo': 'texto', 'valor': 'ET{s4}'},
+            {'rotulo': 'Nome do Estudo', 'tipo': 'texto', 'valor': 'Estudo Teste {sufixo}',
+             'editado': 'Estudo Editado {sufixo}'},
+            {'rotulo': 'Descrição', 'tipo': 'textarea', 'valor': 'Tipo de estudo criado em teste às {sufixo}'},
+        ],
+    },
+    'documentation-templates': {
+        'menu': 'Documentação',
+        'tabela': 'documentation_templates',
+        'colunas': ['Nome', 'Descrição', 'Tipos', 'Modelo'],
+        'campos': [
+            {'rotulo': 'Nome do Documento', 'tipo': 'texto', 'valor': 'Documento Teste {sufixo}',
+             'editado': 'Documento Editado {sufixo}'},
+            {'rotulo': 'Descrição', 'tipo': 'textarea', 'valor': 'Documento de teste criado em {sufixo}'},
+            {'rotulo': 'Tipos de Documento', 'tipo': 'multiselect', 'valor': ['PDF']},
+            {'rotulo': 'Upload de Modelo (Opcional)', 'tipo': 'arquivo', 'valor': ARQUIVO_MODELO},
+        ],
+    },
+    'billing-configurations': {
+        'menu': 'Configuração de Cobrança',
+        'tabela': 'billing_configurations',
+        'colunas': ['Atividade', 'Tipo de Licença', 'Unidade Ref.', 'Valor Base', 'Fator', 'Isenção'],
+        'campos': [
+            {'rotulo': 'Atividade', 'tipo': 'select'},
+            {'rotulo': 'Tipo de Licença', 'tipo': 'select'},
+            {'rotulo': 'Unidade de Referência', 'tipo': 'select'},
+            {'rotulo': 'Valor Base (R$)', 'tipo': 'numero', 'valor': '1{s3}.00', 'editado': '2{s3}.00'},
+            {'rotulo': 'Fator de Multiplicação', 'tipo': 'numero', 'valor': '1.5'},
+            {'rotulo': 'Observações', 'tipo': 'textarea', 'valor': 'Configuração criada em teste às {sufixo}'},
+        ],
+        # Valor Base é renderizado com toLocaleString('pt-BR')
+        'linha': 'R$ 1.{s3},00',
+        'linha_editada': 'R$ 2.{s3},00',
+    },
+}
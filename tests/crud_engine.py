@@ -0,0 +1,394 @@
+"""
+Motor genérico de CRUD para os cadastros de parametrização (Administração)
+===========================================================================
+
+Os scripts ``test_property_types_selenium.py``, ``test_study_types_selenium.py``,
+``test_process_types_selenium.py``, ``test_license_types_selenium.py``,
+``test_pollution_potentials_selenium.py``, ``test_enterprise_sizes_selenium.py``,
+``test_billing_configurations_selenium.py``, ``test_reference_units_selenium.py``
+e ``test_documentation_selenium.py`` eram cópias quase idênticas: login,
+Administração → catálogo, "Novo", preencher, salvar e procurar o item na
+lista, um depois do outro e com pausas fixas.
+
+Aqui cada catálogo é uma spec (``crud_catalogos.CATALOGOS``) e o motor executa
+o ciclo completo sobre ``GenericCRUD.tsx`` / ``GenericForm.tsx``:
+
+1. login (sessão via API, auth_session) e navegação pelo menu Administração;
+2. confere os cabeçalhos da lista;
+3. criar: "Novo" → preenche os campos pelo <label> → Salvar → linha na lista;
+4. editar: ícone "Editar" da linha → altera os campos com ``editado`` → linha atualizada;
+5. excluir: ícone "Excluir" → "Confirmar Exclusão" → linha some da lista.
+
+Todos os catálogos rodam ao mesmo tempo, cada um num navegador emprestado do
+driver_pool; as esperas são por condição (WebDriverWait / aguardar_estavel),
+não por tempo fixo. Adicionar um catálogo não aumenta o tempo total enquanto
+houver workers livres.
+
+O dashboard e a lista de cada catálogo ("admin/<catálogo>") viram amostras
+de page_metrics.py; a execução falha se alguma página estourar o orçamento
+(tests/perf_budget.json).
+
+Cada catálogo é um span do rastro de etapas (step_trace.py), com um filho
+por etapa (navegar, lista, criar, editar, excluir).
+
+Uso:
+    python crud_engine.py                                   # Todos os catálogos
+    python crud_engine.py --catalogos property-types,study-types
+    python crud_engine.py --workers 3 --sem-exclusao        # Mantém os registros
+    python crud_engine.py --listar
+
+Variáveis de ambiente:
+    BASE_URL / TEST_CPF / TEST_PASSWORD   como nos scripts antigos
+    CRUD_WORKERS                          navegadores simultâneos (padrão: todos)
+    HEADLESS / DRIVER_POOL_*              ver driver_pool.py
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import os
+import sys
+import time
+import argparse
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support import expected_conditions as EC
+from dotenv import load_dotenv
+
+from driver_pool import obter_pool
+from smart_wait import aguardar_estavel
+from auth_session import login_navegador
+from crud_catalogos import CATALOGOS
+from page_metrics import registrar_etapa, finalizar as finalizar_metricas
+from artifacts import registrar_passo, capturar_falha
+from step_trace import span
+
+load_dotenv()
+
+
+# ==============================================================================
+# CONFIGURAÇÕES
+# ==============================================================================
+
+CPF = os.getenv('TEST_CPF', '61404694579')
+PASSWORD = os.getenv('TEST_PASSWORD', 'Senh@01!')
+BASE_URL = os.getenv('BASE_URL', 'http://localhost:5173')
+TIMEOUT = 15
+WORKERS = int(os.getenv('CRUD_WORKERS', '0')) or None
+
+# Controles de formulário que seguem o <label> (GenericForm e formulários próprios)
+_CONTROLE = "*[self::input or self::textarea or self::select]"
+
+
+def _literal(texto: str) -> str:
+    """Literal XPath seguro para textos com aspas"""
+    if '"' not in texto:
+        return f'"{texto}"'
+    if "'" not in texto:
+        return f"'{texto}'"
+    partes = texto.split('"')
+    return "concat(" + ", '\"', ".join(f'"{p}"' for p in partes) + ")"
+
+
+def _xpath_label(rotulo: str) -> str:
+    # text() ignora o <span>*</span> de obrigatório
+    return f"//label[normalize-space(text())={_literal(rotulo)}]"
+
+
+def _xpath_linha(texto: str) -> str:
+    return f"//tbody/tr[td[contains(normalize-space(.), {_literal(texto)})]]"
+
+
+# ==============================================================================
+# SPECS
+# ==============================================================================
+
+def placeholders(sufixo: str) -> dict:
+    return {'sufixo': sufixo, 's4': sufixo[-4:], 's3': sufixo[-3:]}
+
+
+def resolver(valor, variaveis: dict):
+    """Aplica os placeholders em strings (e listas de strings)"""
+    if isinstance(valor, str):
+        return valor.format(**variaveis)
+    if isinstance(valor, list):
+        return [resolver(v, variaveis) for v in valor]
+    return valor
+
+
+def textos_linha(spec: dict, variaveis: dict):
+    """(texto da linha após criar, texto da linha após editar)"""
+    chave = next((c for c in spec['campos'] if 'editado' in c), spec['campos'][0])
+    criado = spec.get('linha', chave.get('valor'))
+    editado = spec.get('linha_editada', chave.get('editado', criado))
+    return resolver(criado, variaveis), resolver(editado, variaveis)
+
+
+# ==============================================================================
+# EXECUÇÃO DE UM CATÁLOGO
+# ==============================================================================
+
+class ExecucaoCRUD:
+    """Ciclo criar → editar → excluir de um catálogo num navegador"""
+
+    def __init__(self, nome: str, spec: dict, driver, sufixo: str, excluir: bool = True):
+        self.nome = nome
+        self.spec = spec
+        self.driver = driver
+        self.wait = WebDriverWait(driver, TIMEOUT)
+        self.variaveis = placeholders(sufixo)
+        self.excluir = excluir
+        self.etapas = {}
+        self.etapa_atual = None
+        self.avisos = []
+
+    def log(self, mensagem: str):
+        print(f"[{self.nome}] {mensagem}")
+
+    def etapa(self, nome: str, funcao):
+        self.etapa_atual = nome
+        inicio = time.time()
+        with span(nome):
+            funcao()
+        self.etapas[nome] = round(time.time() - inicio, 2)
+        self.log(f"✅ {nome} ({self.etapas[nome]:.2f}s)")
+        registrar_passo(self.driver, f"crud_{self.nome}", nome)
+
+    def executar(self) -> dict:
+        linha_criada, linha_editada = textos_linha(self.spec, self.variaveis)
+        self.etapa('navegar', self.navegar)
+        self.etapa('lista', self.conferir_colunas)
+        self.etapa('criar', lambda: self.salvar_formulario(self.abrir_novo, 'valor', linha_criada))
+        if any('editado' in c for c in self.spec['campos']):
+            self.etapa('editar', lambda: self.salvar_formulario(
+                lambda: self.clicar_acao(linha_criada, 'Editar'), 'editado', linha_editada))
+            linha_criada = linha_editada
+        if self.excluir:
+            self.etapa('excluir', lambda: self.excluir_linha(linha_criada))
+        return {'linha': linha_criada, 'etapas': self.etapas, 'avisos': self.avisos}
+
+    # ------------------------------------------------------------------
+    # Navegação e lista
+    # ------------------------------------------------------------------
+
+    def navegar(self):
+        login_navegador(self.driver, caminho='/dashboard', cpf=CPF, senha=PASSWORD, base_url=BASE_URL)
+        registrar_etapa(self.driver, 'dashboard')
+        self.wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Administração')]"))).click()
+        menu = _literal(self.spec['menu'])
+        self.wait.until(EC.element_to_be_clickable(
+            (By.XPATH, f"//button[normalize-space(.)={menu}] | //button[contains(normalize-space(.), {menu})]")
+        )).click()
+        self.aguardar_lista()
+        # /admin é aberto pelo menu (sem rota própria): amostra marcada aqui
+        registrar_etapa(self.driver, f"admin/{self.nome}")
+
+    def aguardar_lista(self):
+        # GenericCRUD mostra "Carregando..." até a query terminar
+        self.wait.until(EC.presence_of_element_located((By.XPATH, "//button[contains(., 'Novo')]")))
+        self.wait.until(EC.invisibility_of_element_located((By.XPATH, "//span[contains(., 'Carregando...')]")))
+
+    def conferir_colunas(self):
+        cabecalhos = [th.text.strip().lower() for th in self.driver.find_elements(By.CSS_SELECTOR, 'thead th')]
+        faltando = [c for c in self.spec.get('colunas', []) if c.lower() not in cabecalhos]
+        if faltando:
+            raise AssertionError(f"colunas ausentes na lista: {', '.join(faltando)}")
+
+    def clicar_acao(self, texto_linha: str, titulo: str):
+        botao = self.wait.until(EC.element_to_be_clickable(
+            (By.XPATH, f"{_xpath_linha(texto_linha)}//button[@title={_literal(titulo)}]")
+        ))
+        botao.click()
+
+    # ------------------------------------------------------------------
+    # Formulário
+    # ------------------------------------------------------------------
+
+    def abrir_novo(self):
+        self.wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Novo')]"))).click()
+
+    def controle(self, rotulo: str):
+        return self.wait.until(EC.presence_of_element_located(
+            (By.XPATH, f"{_xpath_label(rotulo)}/following::{_CONTROLE}[1]")
+        ))
+
+    def preencher(self, campo: dict, valor):
+        tipo = campo['tipo']
+        rotulo = campo['rotulo']
+
+        if tipo == 'select':
+            select = Select(self.controle(rotulo))
+            if valor:
+                select.select_by_value(valor)
+            else:
+                # Opções carregadas do banco: aguarda e usa a primeira válida
+                WebDriverWait(self.driver, TIMEOUT).until(lambda d: len(select.options) > 1)
+                select.select_by_index(1)
+        elif tipo == 'multiselect':
+            for opcao in valor:
+                caixa = self.wait.until(EC.presence_of_element_located((
+                    By.XPATH,
+                    f"{_xpath_label(rotulo)}/following-sibling::div[1]"
+                    f"//label[normalize-space(.)={_literal(opcao)}]//input[@type='checkbox']"
+                )))
+                if not caixa.is_selected():
+                    caixa.click()
+        elif tipo == 'checkbox':
+            caixa = self.controle(rotulo)
+            if caixa.is_selected() != bool(valor):
+                caixa.click()
+        elif tipo == 'arquivo':
+            if not os.path.exists(valor):
+                self.avisos.append(f"arquivo de modelo não encontrado: {valor}")
+                return
+            entrada = self.driver.find_element(
+                By.XPATH, f"{_xpath_label(rotulo)}/following::input[@type='file'][1]"
+            )
+            entrada.send_keys(os.path.abspath(valor))
+        else:
+            entrada = self.controle(rotulo)
+            # clear() não dispara onChange em inputs controlados do React
+            entrada.send_keys(Keys.CONTROL, 'a')
+            entrada.send_keys(Keys.DELETE)
+            entrada.send_keys(str(valor))
+
+    def salvar_formulario(self, abrir, chave_valor: str, texto_linha: str):
+        abrir()
+        self.wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Salvar')]")))
+        for campo in self.spec['campos']:
+            if chave_valor == 'editado' and 'editado' not in campo:
+                continue
+            self.preencher(campo, resolver(campo.get(chave_valor), self.variaveis))
+
+        self.driver.find_element(By.XPATH, "//button[contains(., 'Salvar')]").click()
+        # O formulário fecha e a lista é recarregada (refreshKey) quando o save dá certo
+        try:
+            self.wait.until(EC.presence_of_element_located((By.XPATH, _xpath_linha(texto_linha))))
+        except Exception:
+            raise AssertionError(f"'{texto_linha}' não apareceu na lista ({self.toast() or 'sem toast'})")
+        aguardar_estavel(self.driver, timeout=2)
+
+    def excluir_linha(self, texto_linha: str):
+        self.clicar_acao(texto_linha, 'Excluir')
+        self.wait.until(EC.element_to_be_clickable(
+            (By.XPATH, "//h3[contains(., 'Confirmar Exclusão')]/ancestor::div[contains(@class, 'fixed')]"
+                       "//button[normalize-space(.)='Excluir']")
+        )).click()
+        try:
+            self.wait.until(EC.invisibility_of_element_located((By.XPATH, _xpath_linha(texto_linha))))
+        except Exception:
+            raise AssertionError(f"'{texto_linha}' continua na lista após excluir ({self.toast() or 'sem toast'})")
+
+    def toast(self):
+        try:
+            return self.driver.find_element(By.CSS_SELECTOR, '.Toastify__toast').text
+        except Exception:
+            return None
+
+
+# ==============================================================================
+# EXECUÇÃO CONCORRENTE
+# ==============================================================================
+
+def executar_catalogos(nomes=None, workers=WORKERS, excluir=True) -> list:
+    """
+    Executa o ciclo CRUD dos catálogos em paralelo (um navegador do pool por catálogo).
+
+    Returns:
+        Lista de resultados: nome, status, etapas (s), duracao, erro
+    """
+    nomes = list(nomes or CATALOGOS)
+    workers = workers or len(nomes)
+    sufixo = datetime.now().strftime("%H%M%S")
+    pool = obter_pool(tamanho=workers)
+
+    def executar(nome):
+        resultado = {'nome': nome, 'tabela': CATALOGOS[nome].get('tabela'), 'status': 'erro', 'etapas': {}}
+        inicio = time.time()
+        with pool.emprestar() as driver:
+            execucao = ExecucaoCRUD(nome, CATALOGOS[nome], driver, sufixo, excluir)
+            try:
+                with span(f"crud/{nome}"):
+                    resultado.update(execucao.executar())
+                resultado['status'] = 'sucesso'
+            except Exception as e:
+                resultado['etapas'] = execucao.etapas
+                resultado['erro'] = str(e).splitlines()[0] if str(e) else type(e).__name__
+                capturar_falha(driver, f"crud_{nome}", execucao.etapa_atual or 'erro')
+                execucao.log(f"❌ {resultado['erro']}")
+        resultado['duracao'] = round(time.time() - inicio, 2)
+        return resultado
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='crud') as executor:
+        return list(executor.map(executar, nomes))
+
+
+def imprimir_relatorio(resultados: list, tempo_total: float):
+    print("\n" + "=" * 80)
+    print("📊 RELATÓRIO - CRUD DOS CADASTROS DE PARAMETRIZAÇÃO")
+    print("=" * 80)
+    for r in resultados:
+        icone = '✅' if r['status'] == 'sucesso' else '❌'
+        etapas = ' | '.join(f"{k} {v:.1f}s" for k, v in r['etapas'].items())
+        print(f"{icone} {r['nome']:<26} {r['duracao']:>6.1f}s   {etapas}")
+        if r.get('erro'):
+            print(f"   ↳ Erro: {r['erro']}")
+        for aviso in r.get('avisos', []):
+            print(f"   ⚠️ {aviso}")
+
+    soma = sum(r['duracao'] for r in resultados)
+    sucesso = len([r for r in resultados if r['status'] == 'sucesso'])
+    print("-" * 80)
+    print(f"⏱️  Tempo total: {tempo_total:.1f}s | Soma dos catálogos: {soma:.1f}s "
+          f"(ganho: {soma / tempo_total if tempo_total else 0:.1f}x)")
+    print(f"📋 {sucesso}/{len(resultados)} catálogos com sucesso")
+    print("=" * 80)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='CRUD genérico dos cadastros de parametrização')
+    parser.add_argument('--catalogos', help=f"Catálogos separados por vírgula ({', '.join(CATALOGOS)})")
+    parser.add_argument('--workers', type=int, default=WORKERS,
+                        help='Navegadores simultâneos (padrão: um por catálogo)')
+    parser.add_argument('--sem-exclusao', action='store_true', help='Não exclui os registros criados')
+    parser.add_argument('--listar', action='store_true', help='Lista os catálogos disponíveis e sai')
+    args = parser.parse_args(argv)
+
+    args.lista_catalogos = [c.strip() for c in args.catalogos.split(',')] if args.catalogos else list(CATALOGOS)
+    invalidos = [c for c in args.lista_catalogos if c not in CATALOGOS]
+    if invalidos:
+        parser.error(f"Catálogo(s) inválido(s): {', '.join(invalidos)}")
+    return args
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    if args.listar:
+        for nome, spec in CATALOGOS.items():
+            print(f"  {nome:<26} {spec['menu']:<28} ({len(spec['campos'])} campos)")
+        return 0
+
+    print("=" * 80)
+    print("🧪 CRUD GENÉRICO - CADASTROS DE PARAMETRIZAÇÃO")
+    print("=" * 80)
+    print(f"👤 CPF: {CPF}")
+    print(f"🔗 URL: {BASE_URL}")
+    print(f"📋 Catálogos: {', '.join(args.lista_catalogos)}")
+    print(f"🧵 Workers: {args.workers or len(args.lista_catalogos)}")
+    print("=" * 80 + "\n")
+
+    inicio = time.time()
+    resultados = executar_catalogos(args.lista_catalogos, args.workers, excluir=not args.sem_exclusao)
+    imprimir_relatorio(resultados, time.time() - inicio)
+
+    violacoes = finalizar_metricas()
+    return 0 if all(r['status'] == 'sucesso' for r in resultados) and not violacoes else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,486 @@
+"""
+Massa de dados sintética em volume de produção (empreendimentos, imóveis, atividades)
+====================================================================================
+
+Os testes usam um único registro aleatório por execução (``DADOS_RURAL`` /
+``DADOS_URBANO`` / ``DADOS_LINEAR`` no teste 02) e o
+``test_data_activities_selenium.json``; nada mostra como a pesquisa de
+empreendimentos (``test_04``/``test_05`` de test_api_parametrizacao.py) ou a
+lista de atividades se comportam com 100 mil linhas.
+
+Este script gera dados realistas e reproduzíveis (mesma ``--semente`` = mesmos
+registros) e insere em lote pelo PostgREST do Supabase:
+
+- ``properties``: rurais (CAR no formato do SICAR, ``RO-<IBGE>-<hash>``),
+  urbanas e lineares, em municípios de Rondônia, com coordenadas dentro do
+  município;
+- ``enterprises``: PJ (CNPJ válido) e PF (CPF válido), ligadas ao imóvel;
+- ``activities``: códigos CNAE de atividades licenciáveis, com potencial
+  poluidor e unidade de medida;
+- ``activity_enterprise_ranges``: faixas de porte contínuas por atividade
+  (usa os portes cadastrados em ``enterprise_sizes``);
+- ``enterprise_activities``: 1 a 3 atividades por empreendimento.
+
+Cada lote (``--lote`` linhas) é um único POST com array JSON; ``--workers``
+lotes vão em paralelo. Os ids inseridos vão para um manifesto
+(``output/seeds/<nome>.json``) e ``--remover`` apaga tudo com
+``DELETE ?id=in.(...)`` em paralelo, na ordem inversa das dependências.
+
+Não há endpoint em lote na API (/api/v1) para essas entidades, por isso a
+carga vai direto ao PostgREST - o mesmo banco que a API consulta.
+
+Uso:
+    python data_seeder.py --empreendimentos 100000 --atividades 2000
+    python data_seeder.py --empreendimentos 1000 --nome pequeno --dry-run
+    python data_seeder.py --remover --nome padrao
+    python data_seeder.py --backend-local --empreendimentos 5000      # Mede a carga no backend em memória
+
+Variáveis de ambiente:
+    SUPABASE_URL / SUPABASE_KEY   projeto alvo (use a service role para ignorar RLS)
+    SEED_DIR                      pasta dos manifestos (padrão: tests/output/seeds)
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from api_client import ClienteAPI
+
+
+SUPABASE_URL = os.getenv('SUPABASE_URL', '')
+SUPABASE_KEY = os.getenv('SUPABASE_KEY', '')
+SEED_DIR = Path(os.getenv('SEED_DIR', Path(__file__).resolve().parent / 'output' / 'seeds'))
+
+# Ordem de inserção (a remoção usa a inversa)
+TABELAS = ('properties', 'enterprises', 'activities', 'activity_enterprise_ranges', 'enterprise_activities')
+TAMANHO_DELETE = 200  # ids por DELETE (limite prático da URL)
+
+
+# ==============================================================================
+# DADOS DE REFERÊNCIA
+# ==============================================================================
+
+# (município, código IBGE, latitude, longitude) - sede aproximada
+MUNICIPIOS_RO = [
+    ('Porto Velho', '1100205', -8.7619, -63.9039),
+    ('Ariquemes', '1100023', -9.9133, -63.0408),
+    ('Ji-Paraná', '1100122', -10.8853, -61.9517),
+    ('Vilhena', '1100304', -12.7406, -60.1458),
+    ('Cacoal', '1100049', -11.4386, -61.4472),
+    ('Rolim de Moura', '1100288', -11.7271, -61.7714),
+    ('Jaru', '1100114', -10.4318, -62.4788),
+    ('Guajará-Mirim', '1100106', -10.7889, -65.3296),
+    ('Ouro Preto do Oeste', '1100155', -10.7167, -62.2565),
+    ('Pimenta Bueno', '1100189', -11.6725, -61.1936),
+    ('Buritis', '1100452', -10.2120, -63.8289),
+    ("Machadinho D'Oeste", '1100130', -9.4436, -61.9818),
+    ("Espigão D'Oeste", '1100098', -11.5266, -61.0252),
+    ('Nova Mamoré', '1100338', -10.4077, -65.3346),
+    ('Candeias do Jamari', '1100809', -8.7907, -63.7005),
+]
+
+# (CNAE, descrição, unidade de medida)
+CNAES = [
+    ('0151-2/01', 'Criação de bovinos para corte', 'cabeças'),
+    ('0151-2/02', 'Criação de bovinos para leite', 'cabeças'),
+    ('0115-6/00', 'Cultivo de soja', 'ha'),
+    ('0111-3/02', 'Cultivo de milho', 'ha'),
+    ('0322-1/01', 'Criação de peixes em água doce', 'ha'),
+    ('0210-1/07', 'Extração de madeira em florestas plantadas', 'm³'),
+    ('0220-9/01', 'Extração de madeira em florestas nativas', 'm³'),
+    ('0810-0/06', 'Extração de areia, cascalho ou pedregulho', 'm³'),
+    ('0724-3/01', 'Extração de minério de metais preciosos', 'ha'),
+    ('1011-2/01', 'Frigorífico - abate de bovinos', 'cabeças/dia'),
+    ('1052-0/00', 'Fabricação de laticínios', 'litros/dia'),
+    ('1610-2/01', 'Serrarias com desdobramento de madeira em bruto', 'm³/mês'),
+    ('2330-3/01', 'Fabricação de estruturas pré-moldadas de concreto armado', 'm²'),
+    ('3511-5/01', 'Geração de energia elétrica', 'MW'),
+    ('3600-6/01', 'Captação, tratamento e distribuição de água', 'l/s'),
+    ('3821-1/00', 'Tratamento e disposição de resíduos não-perigosos', 'ton/dia'),
+    ('4211-1/01', 'Construção de rodovias e ferrovias', 'km'),
+    ('4731-8/00', 'Comércio varejista de combustíveis para veículos automotores', 'm³'),
+]
+
+RAMOS = ['Agropecuária', 'Mineração', 'Madeireira', 'Laticínios', 'Frigorífico', 'Piscicultura',
+         'Construtora', 'Transportes', 'Energia', 'Saneamento', 'Cerâmica', 'Agroindústria']
+NOMES = ['Rio Madeira', 'Jamari', 'Guaporé', 'Mamoré', 'Machado', 'Candeias', 'Pacaás', 'Cautário',
+         'Jaci-Paraná', 'Abunã', 'Ji-Paraná', 'Urupá', 'Muqui', 'Massangana', 'Preto', 'Roosevelt']
+SUFIXOS = ['Ltda', 'S.A.', 'EIRELI', 'ME', 'EPP']
+PRENOMES = ['Ana', 'João', 'Maria', 'José', 'Francisca', 'Antônio', 'Luiza', 'Carlos', 'Raimunda',
+            'Paulo', 'Sandra', 'Pedro', 'Marcos', 'Juliana', 'Rafael', 'Cleide']
+SOBRENOMES = ['Silva', 'Souza', 'Oliveira', 'Santos', 'Pereira', 'Lima', 'Costa', 'Ferreira',
+              'Rodrigues', 'Almeida', 'Nascimento', 'Araújo', 'Carvalho', 'Gomes']
+LOGRADOUROS = ['Avenida 7 de Setembro', 'Rua Dom Pedro II', 'Avenida Jorge Teixeira', 'Rua José de Alencar',
+               'Avenida Brasil', 'Rua Rio de Janeiro', 'Avenida Transcontinental', 'Rua Marechal Deodoro']
+
+
+# ==============================================================================
+# DOCUMENTOS
+# ==============================================================================
+
+def _digito(numeros: list, pesos: list) -> int:
+    resto = sum(n * p for n, p in zip(numeros, pesos)) % 11
+    return 0 if resto < 2 else 11 - resto
+
+
+def gerar_cpf(gerador: random.Random) -> str:
+    """CPF válido (11 dígitos, sem máscara)"""
+    while True:
+        base = [gerador.randint(0, 9) for _ in range(9)]
+        if len(set(base)) > 1:
+            break
+    base.append(_digito(base, range(10, 1, -1)))
+    base.append(_digito(base, range(11, 1, -1)))
+    return ''.join(map(str, base))
+
+
+def gerar_cnpj(gerador: random.Random) -> str:
+    """CNPJ válido de matriz (14 dígitos, sem máscara)"""
+    base = [gerador.randint(0, 9) for _ in range(8)] + [0, 0, 0, 1]
+    base.append(_digito(base, [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]))
+    base.append(_digito(base, [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]))
+    return ''.join(map(str, base))
+
+
+def cpf_valido(cpf: str) -> bool:
+    numeros = [int(c) for c in cpf]
+    return len(numeros) == 11 and len(set(numeros)) > 1 and \
+        numeros[9] == _digito(numeros[:9], range(10, 1, -1)) and numeros[10] == _digito(numeros[:10], range(11, 1, -1))
+
+
+def cnpj_valido(cnpj: str) -> bool:
+    numeros = [int(c) for c in cnpj]
+    return len(numeros) == 14 and \
+        numeros[12] == _digito(numeros[:12], [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]) and \
+        numeros[13] == _digito(numeros[:13], [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2])
+
+
+def gerar_car(gerador: random.Random, codigo_ibge: str) -> str:
+    """Código do CAR no formato do SICAR: UF-<código IBGE>-<32 hex>"""
+    return f"RO-{codigo_ibge}-{gerador.getrandbits(128):032X}"
+
+
+# ==============================================================================
+# GERAÇÃO
+# ==============================================================================
+
+def _unico(gerador: random.Random, funcao, vistos: set) -> str:
+    while True:
+        valor = funcao(gerador)
+        if valor not in vistos:
+            vistos.add(valor)
+            return valor
+
+
+def _slug(texto: str) -> str:
+    sem_acento = unicodedata.normalize('NFKD', texto).encode('ascii', 'ignore').decode()
+    return ''.join(c for c in sem_acento.lower() if c.isalnum())
+
+
+def gerar_imovel(gerador: random.Random, indice: int) -> dict:
+    municipio, ibge, lat, lon = gerador.choice(MUNICIPIOS_RO)
+    kind = gerador.choices(['RURAL', 'URBANO', 'LINEAR'], weights=[70, 25, 5])[0]
+    imovel = {
+        'kind': kind,
+        'municipio_sede': municipio,
+        'uf': 'RO',
+        'utm_lat': f"{lat + gerador.uniform(-0.35, 0.35):.6f}",
+        'utm_long': f"{lon + gerador.uniform(-0.35, 0.35):.6f}",
+        'car_codigo': None,
+    }
+    if kind == 'RURAL':
+        imovel.update(nome=f"Fazenda {gerador.choice(NOMES)} {indice}", car_codigo=gerar_car(gerador, ibge),
+                      areatotal=round(gerador.lognormvariate(5, 1.2), 2))
+    elif kind == 'URBANO':
+        imovel.update(nome=f"Lote {gerador.choice(LOGRADOUROS)}, {gerador.randint(10, 9999)}",
+                      areatotal=round(gerador.uniform(0.02, 5), 2))
+    else:
+        imovel.update(nome=f"Linha {gerador.choice(NOMES)} {indice}",
+                      areatotal=round(gerador.uniform(5, 300), 2))
+    return imovel
+
+
+def gerar_empreendimento(gerador: random.Random, vistos: set) -> dict:
+    municipio = gerador.choice(MUNICIPIOS_RO)[0]
+    comum = {
+        'cidade': municipio,
+        'estado': 'RO',
+        'cep': f"{gerador.randint(76800, 76999)}-{gerador.randint(0, 999):03d}",
+        'endereco': f"{gerador.choice(LOGRADOUROS)}, {gerador.randint(1, 5000)}",
+        'telefone': f"(69) 9{gerador.randint(8000, 9999)}-{gerador.randint(0, 9999):04d}",
+    }
+    if gerador.random() < 0.7:
+        nome = f"{gerador.choice(RAMOS)} {gerador.choice(NOMES)}"
+        return dict(comum, tipo_pessoa='juridica', cnpj_cpf=_unico(gerador, gerar_cnpj, vistos),
+                    razao_social=f"{nome} {gerador.choice(SUFIXOS)}", nome_fantasia=nome,
+                    email=f"contato@{_slug(nome)}.com.br")
+    nome = f"{gerador.choice(PRENOMES)} {gerador.choice(SOBRENOMES)} {gerador.choice(SOBRENOMES)}"
+    return dict(comum, tipo_pessoa='fisica', cnpj_cpf=_unico(gerador, gerar_cpf, vistos), nome_completo=nome)
+
+
+def gerar_atividade(gerador: random.Random, indice: int, potenciais: list) -> dict:
+    cnae, descricao, unidade = CNAES[indice % len(CNAES)]
+    atividade = {
+        'code': 900000 + indice,
+        'name': f"{descricao} ({indice + 1:05d})",
+        'description': f"{descricao} - atividade sintética de carga",
+        'cnae_codigo': cnae,
+        'cnae_descricao': descricao,
+        'measurement_unit': unidade,
+        'is_active': gerador.random() < 0.95,
+    }
+    if potenciais:
+        atividade['pollution_potential_id'] = gerador.choice(potenciais)
+    return atividade
+
+
+def gerar_faixas(gerador: random.Random, activity_id: str, portes: list) -> list:
+    """Faixas contínuas e sem sobreposição, uma por porte (em ordem crescente)"""
+    faixas, inicio = [], 0
+    for posicao, porte_id in enumerate(portes):
+        ultimo = posicao == len(portes) - 1
+        fim = None if ultimo else inicio + gerador.randint(10, 500) * (posicao + 1)
+        faixas.append({
+            'activity_id': activity_id,
+            'enterprise_size_id': porte_id,
+            'range_name': f"Faixa {posicao + 1}",
+            'range_start': inicio,
+            'range_end': fim,
+        })
+        inicio = (fim or 0) + 1
+    return faixas
+
+
+# ==============================================================================
+# POSTGREST
+# ==============================================================================
+
+class SemeadorPostgrest:
+    """Inserção/remoção em lote via ``/rest/v1`` com workers paralelos"""
+
+    def __init__(self, supabase_url: str, chave: str, workers: int = 8, tamanho_lote: int = 1000):
+        self.cliente = ClienteAPI(f"{supabase_url.rstrip('/')}/rest/v1", timeout_padrao=120,
+                                  tamanho_pool=workers)
+        self.cliente.headers.update({'apikey': chave, 'Authorization': f"Bearer {chave}"})
+        self.workers = workers
+        self.tamanho_lote = tamanho_lote
+        self.ids = {t: [] for t in TABELAS}
+        self.tempos = {}
+        self._lock = threading.Lock()
+
+    def listar_ids(self, tabela: str) -> list:
+        """ids de uma tabela de referência (vazia ou inexistente = [])"""
+        try:
+            resposta = self.cliente.get(f'/{tabela}', params={'select': 'id', 'order': 'id'})
+            return [r['id'] for r in resposta.json()] if resposta.ok else []
+        except Exception:
+            return []
+
+    def _inserir_lote(self, tabela: str, lote: list) -> list:
+        resposta = self.cliente.post(
+            f'/{tabela}', params={'select': 'id'}, json=lote,
+            headers={'Prefer': 'return=representation'}
+        )
+        if resposta.status_code not in (200, 201):
+            raise RuntimeError(f"{tabela}: HTTP {resposta.status_code} - {resposta.text[:200]}")
+        ids = [r['id'] for r in resposta.json()]
+        with self._lock:
+            self.ids.setdefault(tabela, []).extend(ids)
+        return ids
+
+    def inserir(self, tabela: str, registros: list) -> list:
+        """Insere em lotes paralelos; retorna os ids na ordem dos registros"""
+        inicio = time.perf_counter()
+        lotes = [registros[i:i + self.tamanho_lote] for i in range(0, len(registros), self.tamanho_lote)]
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f'seed-{tabela}') as executor:
+            resultados = list(executor.map(lambda lote: self._inserir_lote(tabela, lote), lotes))
+        self.tempos[tabela] = time.perf_counter() - inicio
+        ids = [i for lote in resultados for i in lote]
+        print(f"  ✓ {tabela:<28} {len(ids):>8} linhas em {self.tempos[tabela]:6.1f}s "
+              f"({len(ids) / self.tempos[tabela] if self.tempos[tabela] else 0:,.0f}/s)")
+        return ids
+
+    def _remover_lote(self, tabela: str, ids: list) -> int:
+        resposta = self.cliente.delete(f'/{tabela}', params={'id': f"in.({','.join(map(str, ids))})"})
+        if resposta.status_code not in (200, 204):
+            raise RuntimeError(f"{tabela}: HTTP {resposta.status_code} - {resposta.text[:200]}")
+        return len(ids)
+
+    def remover(self, ids_por_tabela: dict):
+        """DELETE em paralelo, filhos antes dos pais"""
+        for tabela in reversed(TABELAS):
+            ids = ids_por_tabela.get(tabela) or []
+            if not ids:
+                continue
+            inicio = time.perf_counter()
+            lotes = [ids[i:i + TAMANHO_DELETE] for i in range(0, len(ids), TAMANHO_DELETE)]
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f'unseed-{tabela}') as executor:
+                removidos = sum(executor.map(lambda lote: self._remover_lote(tabela, lote), lotes))
+            duracao = time.perf_counter() - inicio
+            print(f"  ✓ {tabela:<28} {removidos:>8} linhas removidas em {duracao:6.1f}s")
+
+
+# ==============================================================================
+# EXECUÇÃO
+# ==============================================================================
+
+def _manifesto(nome: str) -> Path:
+    return SEED_DIR / f"{nome}.json"
+
+
+def salvar_manifesto(caminho: Path, semeador: SemeadorPostgrest, args):
+    SEED_DIR.mkdir(parents=True, exist_ok=True)
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump({
+            'criado_em': datetime.now().isoformat(),
+            'semente': args.semente,
+            'empreendimentos': args.empreendimentos,
+            'atividades': args.atividades,
+            'ids': semeador.ids,
+        }, f, ensure_ascii=False)
+
+
+def semear(semeador: SemeadorPostgrest, empreendimentos: int, atividades: int, semente: int):
+    """Gera e insere a massa (os ids inseridos ficam em ``semeador.ids``)"""
+    gerador = random.Random(semente)
+    potenciais = semeador.listar_ids('pollution_potentials')
+    portes = semeador.listar_ids('enterprise_sizes')
+    if not portes:
+        print("  ⚠️ enterprise_sizes vazia: atividades sem faixas de porte")
+
+    print(f"\n🌱 Gerando {empreendimentos} empreendimentos/imóveis e {atividades} atividades (semente {semente})...")
+    imoveis = [gerar_imovel(gerador, i) for i in range(empreendimentos)]
+    documentos = set()
+    empresas = [gerar_empreendimento(gerador, documentos) for _ in range(empreendimentos)]
+    lista_atividades = [gerar_atividade(gerador, i, potenciais) for i in range(atividades)]
+
+    print("\n📤 Inserindo...")
+    ids_imoveis = semeador.inserir('properties', imoveis)
+    for empresa, property_id in zip(empresas, ids_imoveis):
+        empresa['property_id'] = property_id
+    ids_empresas = semeador.inserir('enterprises', empresas)
+    ids_atividades = semeador.inserir('activities', lista_atividades)
+
+    if portes:
+        faixas = [f for activity_id in ids_atividades for f in gerar_faixas(gerador, activity_id, portes)]
+        semeador.inserir('activity_enterprise_ranges', faixas)
+    if ids_atividades:
+        vinculos = []
+        for enterprise_id in ids_empresas:
+            for activity_id in gerador.sample(ids_atividades, min(len(ids_atividades), gerador.randint(1, 3))):
+                vinculos.append({'enterprise_id': enterprise_id, 'activity_id': activity_id,
+                                 'quantity': round(gerador.uniform(1, 1000), 2)})
+        semeador.inserir('enterprise_activities', vinculos)
+
+
+def amostra(empreendimentos: int, atividades: int, semente: int):
+    """--dry-run: mostra registros de exemplo sem inserir"""
+    gerador = random.Random(semente)
+    print(json.dumps({
+        'properties': [gerar_imovel(gerador, i) for i in range(min(3, empreendimentos))],
+        'enterprises': [gerar_empreendimento(gerador, set()) for _ in range(min(3, empreendimentos))],
+        'activities': [gerar_atividade(gerador, i, []) for i in range(min(3, atividades))],
+        'activity_enterprise_ranges': gerar_faixas(gerador, '<activity_id>', ['<porte_1>', '<porte_2>', '<porte_3>']),
+    }, ensure_ascii=False, indent=2))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Massa de dados sintética em volume (empreendimentos, imóveis, atividades)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('--empreendimentos', type=int, default=10000,
+                        help='Empreendimentos (e imóveis) a gerar (padrão: 10000)')
+    parser.add_argument('--atividades', type=int, default=500, help='Atividades a gerar (padrão: 500)')
+    parser.add_argument('--semente', type=int, default=42, help='Semente (mesma semente = mesmos dados)')
+    parser.add_argument('--lote', type=int, default=1000, help='Linhas por POST (padrão: 1000)')
+    parser.add_argument('--workers', type=int, default=8, help='Requisições simultâneas (padrão: 8)')
+    parser.add_argument('--nome', default='padrao', help='Nome da massa / manifesto (padrão: padrao)')
+    parser.add_argument('--remover', action='store_true', help='Remove a massa registrada no manifesto')
+    parser.add_argument('--dry-run', action='store_true', help='Só mostra registros de exemplo')
+    parser.add_argument('--backend-local', action='store_true', help='Semeia o backend_local em processo')
+    args = parser.parse_args(argv)
+    if args.lote < 1 or args.workers < 1 or args.empreendimentos < 0 or args.atividades < 0:
+        parser.error('--lote e --workers devem ser >= 1; quantidades não podem ser negativas')
+    return args
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.dry_run:
+        amostra(args.empreendimentos, args.atividades, args.semente)
+        return 0
+
+    backend = None
+    supabase_url, chave = SUPABASE_URL, SUPABASE_KEY
+    if args.backend_local:
+        from backend_local import iniciar_backend
+        backend = iniciar_backend()
+        supabase_url, chave = backend.url, backend.variaveis_ambiente()['SUPABASE_KEY']
+    if not supabase_url or not chave:
+        print("❌ Configure SUPABASE_URL e SUPABASE_KEY (ou use --backend-local)")
+        return 1
+
+    print("=" * 80)
+    print("🌱 MASSA DE DADOS SINTÉTICA")
+    print("=" * 80)
+    print(f"🔗 PostgREST: {supabase_url}/rest/v1")
+    print(f"📦 Lote: {args.lote} linhas | 🧵 Workers: {args.workers} | 🏷️  Massa: {args.nome}")
+    print("=" * 80)
+
+    semeador = SemeadorPostgrest(supabase_url, chave, args.workers, args.lote)
+    manifesto = _manifesto(args.nome)
+    inicio = time.perf_counter()
+    try:
+        if args.remover:
+            if not manifesto.exists():
+                print(f"❌ Manifesto não encontrado: {manifesto}")
+                return 1
+            with open(manifesto, 'r', encoding='utf-8') as f:
+                dados = json.load(f)
+            print(f"\n🧹 Removendo massa '{args.nome}' (semente {dados['semente']})...")
+            semeador.remover(dados['ids'])
+            manifesto.unlink()
+        else:
+            if manifesto.exists() and not backend:
+                print(f"❌ Já existe a massa '{args.nome}' ({manifesto}); remova com --remover ou use outro --nome")
+                return 1
+            try:
+                semear(semeador, args.empreendimentos, args.atividades, args.semente)
+            finally:
+                # Grava mesmo em falha parcial: o que entrou precisa poder sair
+                if not backend:
+                    salvar_manifesto(manifesto, semeador, args)
+                    print(f"\n💾 Manifesto: {manifesto}")
+    except RuntimeError as e:
+        print(f"\n❌ {e}")
+        return 1
+    finally:
+        if backend:
+            backend.encerrar()
+
+    total = sum(len(ids) for ids in semeador.ids.values()) if not args.remover else None
+    duracao = time.perf_counter() - inicio
+    print("-" * 80)
+    if total is not None:
+        print(f"⏱️  {total} linhas em {duracao:.1f}s ({total / duracao if duracao else 0:,.0f} linhas/s)")
+    else:
+        print(f"⏱️  Remoção concluída em {duracao:.1f}s")
+    print("=" * 80)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,443 @@
+"""
+Pool de WebDrivers Chrome reutilizáveis (sessões "quentes")
+============================================================
+
+Todas as suítes Selenium subiam o próprio Chrome + ChromeDriver (muitas vezes
+resolvendo o binário de novo com ``ChromeDriverManager().install()``). Em
+testes curtos de CRUD administrativo o cold start do Chrome é a maior parte do
+tempo de execução.
+
+Este módulo mantém um pool de sessões Chrome já iniciadas e as empresta aos
+testes:
+
+- pré-aquece ``DRIVER_POOL_SIZE`` sessões (headless por padrão) em background;
+- entre empréstimos reseta o estado: cookies, localStorage/sessionStorage,
+  IndexedDB, sessão injetada (auth_session), implicit wait e navegação
+  para ``about:blank``;
+- recicla a sessão após ``DRIVER_POOL_MAX_USOS`` empréstimos ou quando ela
+  trava (reset falha / sessão inválida);
+- resolve o caminho do ChromeDriver uma única vez por processo;
+- instrumenta cada sessão com as métricas de página (``page_metrics``) e,
+  no aprendizado da análise de impacto, com a cobertura JS (``impact_analysis``);
+- mede o tempo de cada comando WebDriver para o rastro de etapas (``step_trace``).
+
+Uso em testes estruturados:
+
+    from driver_pool import obter_pool
+
+    with obter_pool().emprestar() as driver:
+        driver.get(BASE_URL)
+
+Uso em scripts de módulo (setup/teardown separados):
+
+    from driver_pool import obter_driver, devolver_driver
+
+    driver = obter_driver()
+    try:
+        ...
+    finally:
+        devolver_driver(driver)
+
+Para aproveitar as sessões quentes entre vários scripts, execute-os no mesmo
+processo:
+
+    python tests/driver_pool.py tests/test_license_types_selenium.py tests/test_study_types_selenium.py
+
+Variáveis de ambiente:
+    HEADLESS               true/false (padrão: true)
+    DRIVER_POOL_SIZE       número de sessões mantidas (padrão: 1)
+    DRIVER_POOL_MAX_USOS   empréstimos antes de reciclar (padrão: 20)
+    CHROMEDRIVER_PATH      caminho manual do chromedriver
+    PERF_METRICAS          true/false - métricas e orçamento das páginas (padrão: true)
+    TRACE_ETAPAS           true/false - rastro de etapas com tempo de WebDriver (padrão: true)
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import os
+import sys
+import time
+import atexit
+import runpy
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+
+from smart_wait import reiniciar_monitor
+from auth_session import remover_sessao
+import page_metrics
+import impact_analysis
+import step_trace
+
+
+# ==============================================================================
+# CONFIGURAÇÕES
+# ==============================================================================
+
+CHROMEDRIVER_PATH = os.getenv('CHROMEDRIVER_PATH', r'C:\chromedriver\chromedriver.exe')
+HEADLESS = os.getenv('HEADLESS', 'true').lower() == 'true'
+POOL_SIZE = int(os.getenv('DRIVER_POOL_SIZE', '1'))
+MAX_USOS = int(os.getenv('DRIVER_POOL_MAX_USOS', '20'))
+
+_chromedriver_resolvido: Optional[str] = None
+_chromedriver_lock = threading.Lock()
+
+
+def resolver_chromedriver() -> str:
+    """
+    Retorna o caminho do ChromeDriver, resolvendo apenas uma vez por processo.
+
+    Prioridade: CHROMEDRIVER_PATH (ou C:\\chromedriver) e, se não existir,
+    webdriver_manager (que também mantém cache em disco).
+    """
+    global _chromedriver_resolvido
+    with _chromedriver_lock:
+        if _chromedriver_resolvido is None:
+            if os.path.exists(CHROMEDRIVER_PATH):
+                _chromedriver_resolvido = CHROMEDRIVER_PATH
+            else:
+                from webdriver_manager.chrome import ChromeDriverManager
+                _chromedriver_resolvido = ChromeDriverManager().install()
+        return _chromedriver_resolvido
+
+
+def criar_opcoes(headless: bool = HEADLESS) -> Options:
+    """Opções padrão do Chrome compartilhadas pelas suítes"""
+    options = Options()
+    if headless:
+        options.add_argument('--headless=new')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--window-size=1920,1080')
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    # Logs de performance (eventos CDP Network.*) usados pela suíte do motor de workflow
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL', 'browser': 'ALL'})
+    return options
+
+
+def criar_driver(headless: bool = HEADLESS) -> webdriver.Chrome:
+    """Cria uma sessão Chrome nova (sem passar pelo pool)"""
+    service = Service(executable_path=resolver_chromedriver())
+    driver = webdriver.Chrome(service=service, options=criar_opcoes(headless))
+    if not headless:
+        driver.maximize_window()
+    if page_metrics.HABILITADO:
+        page_metrics.instrumentar(driver)
+    if impact_analysis.ATIVO:
+        impact_analysis.instrumentar(driver)
+    step_trace.instrumentar(driver)
+    return driver
+
+
+# ==============================================================================
+# POOL
+# ==============================================================================
+
+class _Sessao:
+    """Sessão Chrome controlada pelo pool"""
+
+    def __init__(self, driver: webdriver.Chrome):
+        self.driver = driver
+        self.usos = 0
+        self.criada_em = time.time()
+
+
+class DriverPool:
+    """
+    Pool de sessões Chrome emprestadas aos testes.
+
+    Sessões livres ficam aquecidas; ao devolver, a sessão é resetada e volta
+    para o pool, ou é encerrada (e reposta em background) se atingiu o limite
+    de usos ou se o reset falhou.
+    """
+
+    def __init__(self, tamanho: int = POOL_SIZE, max_usos: int = MAX_USOS,
+                 headless: bool = HEADLESS, pre_aquecer: bool = True):
+        self.tamanho = max(1, tamanho)
+        self.max_usos = max(1, max_usos)
+        self.headless = headless
+
+        self._livres = []
+        self._emprestadas: Dict[int, _Sessao] = {}
+        self._criando = 0
+        self._encerrado = False
+        self._cond = threading.Condition()
+
+        self.estatisticas = {'criadas': 0, 'recicladas': 0, 'emprestimos': 0, 'reaproveitadas': 0}
+
+        if pre_aquecer:
+            self.aquecer()
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida das sessões
+    # ------------------------------------------------------------------
+
+    def _total(self) -> int:
+        return len(self._livres) + len(self._emprestadas) + self._criando
+
+    def aquecer(self):
+        """Completa o pool até ``tamanho`` sessões, criando-as em background"""
+        with self._cond:
+            faltando = self.tamanho - self._total()
+            self._criando += max(0, faltando)
+        for _ in range(max(0, faltando)):
+            threading.Thread(target=self._criar_em_background, daemon=True,
+                             name='driver-pool-aquecer').start()
+
+    def _criar_em_background(self):
+        try:
+            sessao = _Sessao(criar_driver(self.headless))
+        except Exception as e:
+            print(f"⚠️  DriverPool: falha ao pré-aquecer sessão Chrome: {e}")
+            sessao = None
+        with self._cond:
+            self._criando -= 1
+            if sessao is not None:
+                self.estatisticas['criadas'] += 1
+                if self._encerrado:
+                    self._encerrar_sessao(sessao)
+                else:
+                    self._livres.append(sessao)
+            self._cond.notify_all()
+
+    def _encerrar_sessao(self, sessao: _Sessao):
+        try:
+            sessao.driver.quit()
+        except Exception:
+            pass
+
+    def _resetar(self, driver: webdriver.Chrome) -> bool:
+        """
+        Limpa o estado da sessão para o próximo teste.
+
+        Retorna False se a sessão não responde (deve ser reciclada).
+        """
+        try:
+            # Amostra da última página do teste, antes de limpar a sessão
+            page_metrics.fechar(driver)
+            impact_analysis.coletar(driver)
+            origem = driver.execute_script('return window.location.origin')
+            try:
+                driver.execute_script('window.localStorage.clear(); window.sessionStorage.clear();')
+            except Exception:
+                pass
+            if origem and origem.startswith('http'):
+                driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+                    'origin': origem,
+                    'storageTypes': 'local_storage,session_storage,indexeddb,websql,service_workers,cache_storage',
+                })
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            driver.delete_all_cookies()
+            driver.implicitly_wait(0)
+            reiniciar_monitor(driver)
+            remover_sessao(driver)
+
+            # Fecha abas extras abertas pelo teste
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            driver.get('about:blank')
+            return True
+        except Exception:
+            return False
+
+    # ------------------------------------------------------------------
+    # Empréstimo
+    # ------------------------------------------------------------------
+
+    def obter(self, timeout: float = 120) -> webdriver.Chrome:
+        """Empresta uma sessão (bloqueia até haver uma livre)"""
+        limite = time.time() + timeout
+        with self._cond:
+            if self._encerrado:
+                raise RuntimeError("DriverPool já foi encerrado")
+            while not self._livres:
+                if self._total() < self.tamanho:
+                    # Nenhuma sessão sendo aquecida: cria no próprio thread
+                    self._criando += 1
+                    self._cond.release()
+                    try:
+                        sessao = _Sessao(criar_driver(self.headless))
+                    finally:
+                        self._cond.acquire()
+                        self._criando -= 1
+                    self.estatisticas['criadas'] += 1
+                    self._livres.append(sessao)
+                    break
+                restante = limite - time.time()
+                if restante <= 0:
+                    raise TimeoutError(f"Nenhuma sessão Chrome livre em {timeout}s")
+                self._cond.wait(restante)
+
+            sessao = self._livres.pop()
+            if sessao.usos:
+                self.estatisticas['reaproveitadas'] += 1
+            self.estatisticas['emprestimos'] += 1
+            self._emprestadas[id(sessao.driver)] = sessao
+            return sessao.driver
+
+    def devolver(self, driver: webdriver.Chrome, descartar: bool = False):
+        """
+        Devolve a sessão ao pool.
+
+        Args:
+            driver: driver obtido com ``obter()``
+            descartar: True para encerrar a sessão em vez de reaproveitá-la
+        """
+        if driver is None:
+            return
+        with self._cond:
+            sessao = self._emprestadas.pop(id(driver), None)
+        if sessao is None:
+            # Driver não pertence ao pool: apenas encerra
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            return
+
+        sessao.usos += 1
+        reaproveitar = (not descartar and not self._encerrado
+                        and sessao.usos < self.max_usos and self._resetar(driver))
+
+        with self._cond:
+            if reaproveitar:
+                self._livres.append(sessao)
+            else:
+                self.estatisticas['recicladas'] += 1
+            self._cond.notify_all()
+
+        if not reaproveitar:
+            self._encerrar_sessao(sessao)
+            if not self._encerrado:
+                self.aquecer()
+
+    @contextmanager
+    def emprestar(self, timeout: float = 120):
+        """Context manager: empresta e devolve a sessão, descartando em caso de crash"""
+        driver = self.obter(timeout)
+        descartar = False
+        try:
+            yield driver
+        except Exception as e:
+            # Erros de sessão (Chrome travou/fechou) não devem voltar ao pool
+            descartar = type(e).__name__ in ('InvalidSessionIdException', 'NoSuchWindowException',
+                                             'WebDriverException')
+            raise
+        finally:
+            self.devolver(driver, descartar=descartar)
+
+    def encerrar(self):
+        """Encerra todas as sessões do pool"""
+        with self._cond:
+            self._encerrado = True
+            sessoes = self._livres + list(self._emprestadas.values())
+            self._livres = []
+            self._emprestadas = {}
+            self._cond.notify_all()
+        for sessao in sessoes:
+            self._encerrar_sessao(sessao)
+
+    def resumo(self) -> str:
+        e = self.estatisticas
+        return (f"DriverPool: {e['criadas']} sessão(ões) criada(s), {e['emprestimos']} empréstimo(s), "
+                f"{e['reaproveitadas']} reaproveitada(s), {e['recicladas']} reciclada(s)")
+
+
+# ==============================================================================
+# POOL COMPARTILHADO DO PROCESSO
+# ==============================================================================
+
+_pool: Optional[DriverPool] = None
+_pool_lock = threading.Lock()
+
+
+def obter_pool(tamanho: Optional[int] = None) -> DriverPool:
+    """
+    Retorna o pool compartilhado do processo (criado na primeira chamada).
+
+    Args:
+        tamanho: se informado e maior que o atual, amplia o pool
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DriverPool(tamanho=tamanho or POOL_SIZE)
+            atexit.register(encerrar_pool)
+        elif tamanho and tamanho > _pool.tamanho:
+            _pool.tamanho = tamanho
+            _pool.aquecer()
+        return _pool
+
+
+def obter_driver(timeout: float = 120) -> webdriver.Chrome:
+    """Atalho: empresta uma sessão do pool compartilhado"""
+    return obter_pool().obter(timeout)
+
+
+def devolver_driver(driver: webdriver.Chrome, descartar: bool = False):
+    """Atalho: devolve uma sessão ao pool compartilhado"""
+    if _pool is None:
+        if driver is not None:
+            driver.quit()
+        return
+    _pool.devolver(driver, descartar=descartar)
+
+
+def encerrar_pool():
+    """Encerra o pool compartilhado (registrado em atexit)"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        print(f"\n🔧 {pool.resumo()}")
+        pool.encerrar()
+
+
+# ==============================================================================
+# EXECUÇÃO DE VÁRIOS SCRIPTS NO MESMO PROCESSO
+# ==============================================================================
+
+def main(argv=None) -> int:
+    """Executa scripts Selenium em sequência compartilhando o pool de sessões"""
+    scripts = list(sys.argv[1:] if argv is None else argv)
+    if not scripts:
+        print("Uso: python tests/driver_pool.py <script1.py> [script2.py ...]")
+        return 2
+
+    obter_pool()
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    falhas = 0
+    for script in scripts:
+        print("\n" + "=" * 80)
+        print(f"▶️  {script}")
+        print("=" * 80)
+        inicio = time.time()
+        try:
+            runpy.run_path(script, run_name='__main__')
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                falhas += 1
+        except Exception as e:
+            print(f"❌ {script}: {e}")
+            falhas += 1
+        print(f"⏱️  {script}: {time.time() - inicio:.1f}s")
+
+    if page_metrics.finalizar():
+        falhas += 1
+    encerrar_pool()
+    return 1 if falhas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+"""
+Descoberta da API disponível (health check concorrente, com cache)
+==================================================================
+
+``detect_api_url`` (test_notifications_selenium.py) testava cada URL de
+``API_BASE_URLS`` em sequência, com timeout de 5s, no import do módulo: com o
+backend local fora do ar cada execução esperava todos os hosts mortos antes de
+chegar ao Render. Outras suítes simplesmente fixavam ``API_BASE_URL`` /
+``API_BASE`` num host que podia estar fora do ar.
+
+Este módulo sonda todos os candidatos em paralelo (``GET {url}/health``) e
+devolve o de maior prioridade que responde 200: um candidato mais abaixo na
+lista só é escolhido depois que todos os de cima falharam ou estouraram o
+timeout, e a resposta sai assim que isso se decide, sem esperar os de baixo.
+O resultado fica em cache no processo por
+``API_RESOLVER_TTL`` segundos e traz a latência medida, para os testes
+reportarem:
+
+    from endpoint_resolver import resolver_api
+
+    api = resolver_api(preferidas=['http://localhost:3000/api/v1'])
+    print(api['url'], api['latencia_ms'])
+
+Ordem dos candidatos: ``API_URL``, ``preferidas`` (o padrão histórico de cada
+suíte), ``API_CANDIDATES`` (separadas por vírgula) e os hosts locais conhecidos
+(8000/3000). Se nenhum responder, devolve o primeiro candidato com
+``saudavel=False`` (mesmo fallback do detect_api_url antigo).
+
+Hosts remotos (o sandbox no Render) nunca entram sozinhos: só quando a suíte
+já apontava para eles (``preferidas`` das suítes de notificações) ou quando
+vêm explícitos em ``API_URL`` / ``API_CANDIDATES``. Uma suíte que grava
+(``system-config``, ``workflow``...) não pode cair no sandbox só porque o
+backend local estava fora do ar.
+
+Variáveis de ambiente:
+    API_URL              API preferida (também usada por backend_local.py)
+    API_CANDIDATES       candidatos extras, separados por vírgula
+    API_RESOLVER_TIMEOUT timeout de cada sonda em segundos (padrão: 3)
+    API_RESOLVER_TTL     validade do cache em segundos (padrão: 60)
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import os
+import sys
+import time
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, List, Optional, Tuple
+
+
+# Só hosts locais: remotos entram apenas por ``preferidas`` ou variável de ambiente
+APIS_CONHECIDAS = [
+    'http://localhost:8000/api/v1',
+    'http://localhost:3000/api/v1',
+]
+
+TIMEOUT = float(os.getenv('API_RESOLVER_TIMEOUT', '3'))
+TTL = float(os.getenv('API_RESOLVER_TTL', '60'))
+
+_cache: Dict[Tuple[str, ...], Tuple[float, dict]] = {}
+_cache_lock = threading.Lock()
+
+
+def candidatos(preferidas: Optional[List[str]] = None) -> List[str]:
+    """Lista de URLs base (sem barra final, sem repetição), na ordem de preferência"""
+    extras = [u.strip() for u in os.getenv('API_CANDIDATES', '').split(',')]
+    lista = [os.getenv('API_URL')] + list(preferidas or []) + extras + APIS_CONHECIDAS
+    vistos = []
+    for url in lista:
+        url = (url or '').strip().rstrip('/')
+        if url and url not in vistos:
+            vistos.append(url)
+    return vistos
+
+
+def sondar(url: str, timeout: float = TIMEOUT) -> dict:
+    """GET {url}/health: status, latência (ms) e erro"""
+    inicio = time.perf_counter()
+    sonda = {'url': url, 'status': None, 'latencia_ms': None, 'saudavel': False, 'erro': None}
+    try:
+        with urllib.request.urlopen(f"{url}/health", timeout=timeout) as resposta:
+            sonda['status'] = resposta.status
+    except urllib.error.HTTPError as e:
+        sonda['status'] = e.code
+        sonda['erro'] = f"HTTP {e.code}"
+    except Exception as e:
+        sonda['erro'] = str(getattr(e, 'reason', e))
+    sonda['latencia_ms'] = round((time.perf_counter() - inicio) * 1000, 1)
+    sonda['saudavel'] = sonda['status'] == 200
+    return sonda
+
+
+def _sondar_todos(urls: List[str], timeout: float) -> dict:
+    """
+    Dispara todas as sondas e escolhe o candidato saudável de maior prioridade.
+
+    Retorna assim que um candidato saudável não tem mais nenhum de prioridade
+    maior pendente (os de cima já falharam ou estouraram o timeout).
+    """
+    executor = ThreadPoolExecutor(max_workers=len(urls), thread_name_prefix='resolver-api')
+    indices = {executor.submit(sondar, url, timeout): i for i, url in enumerate(urls)}
+    pendentes = set(indices)
+    resultados: Dict[int, dict] = {}
+    sondas = []
+    escolhida = None
+    try:
+        while pendentes and escolhida is None:
+            concluidas, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in concluidas:
+                sonda = futuro.result()
+                sondas.append(sonda)
+                resultados[indices[futuro]] = sonda
+            # Percorre em ordem de prioridade até o primeiro sem resposta
+            for i in range(len(urls)):
+                if i not in resultados:
+                    break
+                if resultados[i]['saudavel']:
+                    escolhida = resultados[i]
+                    break
+    finally:
+        # Hosts mortos terminam o timeout em background, sem segurar o chamador
+        executor.shutdown(wait=False)
+
+    if escolhida is None:
+        escolhida = {'url': urls[0], 'status': None, 'latencia_ms': None, 'saudavel': False,
+                     'erro': 'nenhuma API respondeu ao health check'}
+    return dict(escolhida, sondas=sondas, resolvido_em=time.time())
+
+
+def resolver_api(preferidas: Optional[List[str]] = None, timeout: float = TIMEOUT,
+                 ttl: float = TTL, forcar: bool = False) -> dict:
+    """
+    Resolve a URL base da API (com cache por processo).
+
+    Returns:
+        dict com ``url``, ``saudavel``, ``status``, ``latencia_ms``, ``erro``
+        e ``sondas`` (resultado de cada candidato que respondeu a tempo)
+    """
+    urls = candidatos(preferidas)
+    chave = tuple(urls)
+    agora = time.time()
+    with _cache_lock:
+        em_cache = _cache.get(chave)
+        if em_cache and not forcar and em_cache[0] > agora:
+            return em_cache[1]
+
+    resultado = _sondar_todos(urls, timeout)
+    with _cache_lock:
+        # Falha fica em cache por pouco tempo: a API pode subir logo em seguida
+        _cache[chave] = (time.time() + (ttl if resultado['saudavel'] else min(ttl, 5)), resultado)
+    return resultado
+
+
+def api_base_url(preferidas: Optional[List[str]] = None) -> str:
+    """Atalho: só a URL base resolvida"""
+    return resolver_api(preferidas)['url']
+
+
+def descrever(resultado: dict) -> str:
+    """Texto curto para logs: URL, latência e se respondeu ao health check"""
+    if resultado['saudavel']:
+        return f"{resultado['url']} (health {resultado['latencia_ms']:.0f} ms)"
+    return f"{resultado['url']} (⚠️ {resultado.get('erro') or 'sem resposta'})"
+
+
+def invalidar_cache():
+    with _cache_lock:
+        _cache.clear()
+
+
+def main(argv=None) -> int:
+    """Sonda os candidatos e imprime o resultado de cada um"""
+    preferidas = list(sys.argv[1:] if argv is None else argv)
+    inicio = time.perf_counter()
+    resultado = resolver_api(preferidas, forcar=True)
+    total = (time.perf_counter() - inicio) * 1000
+
+    print("🔍 Candidatos:")
+    respondidas = {s['url']: s for s in resultado['sondas']}
+    for url in candidatos(preferidas):
+        sonda = respondidas.get(url)
+        if sonda is None:
+            print(f"  ⏳ {url}: sem resposta até a escolha")
+        elif sonda['saudavel']:
+            print(f"  ✅ {url}: {sonda['status']} em {sonda['latencia_ms']:.0f} ms")
+        else:
+            print(f"  ❌ {url}: {sonda['erro']} ({sonda['latencia_ms']:.0f} ms)")
+    print(f"\n🔔 API: {descrever(resultado)} - resolvida em {total:.0f} ms")
+    return 0 if resultado['saudavel'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,404 @@
+"""
+Gerador de fixtures geoespaciais grandes (GeoJSON e SHP.zip)
+============================================================
+
+O ``test_novo_empreendimento_02_imovel.py`` só digita um par lat/long, mas os
+CARs de Rondônia chegam como GeoJSON e SHP.zip de vários MB e passam por
+``geoFileLoader.ts``, ``GeoUpload.tsx``, ``bufferCalculations.ts`` e
+``AreaMetricsPanel``. Este módulo gera arquivos válidos (ou propositalmente
+inválidos) com número de vértices controlado - de 1k a 5M - para o
+``benchmark_geo_upload.py``.
+
+Tipos de fixture:
+    simples    um polígono com um anel
+    buracos    polígono com 4 buracos
+    multi      MultiPolygon com ``--partes`` polígonos
+    invalido   anel auto-intersectante (gravata), anel aberto, anel com 3
+               posições, buraco fora do polígono e vértices duplicados - um
+               defeito por feição (propriedade ``defeito``)
+
+Os anéis são "estrelados" em torno de um centro em Rondônia (SIRGAS 2000,
+EPSG:4674): ângulo sempre crescente e raio ondulado, então são simples e a
+orientação é controlada (anti-horário para cascas no GeoJSON, horário no
+shapefile). Os vértices são gerados sob demanda - nem o de 5M fica inteiro na
+memória - e a mesma ``--semente`` gera sempre os mesmos arquivos.
+
+O SHP.zip traz ``.shp``, ``.shx``, ``.dbf``, ``.prj`` e ``.cpg`` escritos
+aqui mesmo (sem GDAL/pyshp).
+
+Uso:
+
+    python geo_fixtures.py                                   # 1k, 10k, 100k, 1M - todos os tipos
+    python geo_fixtures.py --vertices 5M --tipos multi --formatos shp
+    python geo_fixtures.py --vertices 50k --tipos invalido --saida /tmp/geo
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import io
+import os
+import sys
+import json
+import math
+import random
+import struct
+import zipfile
+import argparse
+from array import array
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+
+SAIDA = Path(__file__).resolve().parent / 'output' / 'geo'
+
+CENTRO = (-63.903850, -8.761940)   # Porto Velho - mesmo ponto do teste 02
+RAIO_GRAUS = 0.05                  # ~5,5 km: ordem de grandeza de um imóvel rural grande
+CASAS = 9                          # 1e-9 grau: vértices distintos mesmo com 5M num anel
+
+TIPOS = ('simples', 'buracos', 'multi', 'invalido')
+FORMATOS = ('geojson', 'shp')
+TAMANHOS_PADRAO = ('1k', '10k', '100k', '1M')
+
+PRJ_SIRGAS_2000 = ('GEOGCS["GCS_SIRGAS_2000",DATUM["D_SIRGAS_2000",SPHEROID["GRS_1980",6378137.0,'
+                   '298.257222101]],PRIMEM["Greenwich",0.0],UNIT["Degree",0.0174532925199433]]')
+
+
+def ler_tamanho(texto: str) -> int:
+    """``'1k'`` → 1000, ``'5M'`` → 5000000"""
+    texto = texto.strip()
+    multiplicador = {'k': 1_000, 'm': 1_000_000}.get(texto[-1].lower(), 1)
+    return int(float(texto[:-1] if multiplicador > 1 else texto) * multiplicador)
+
+
+def formatar_tamanho(n: int) -> str:
+    if n % 1_000_000 == 0:
+        return f"{n // 1_000_000}M"
+    if n % 1_000 == 0:
+        return f"{n // 1_000}k"
+    return str(n)
+
+
+# ==============================================================================
+# GEOMETRIA
+# ==============================================================================
+
+class Anel:
+    """
+    Anel gerado sob demanda.
+
+    ``forma``: ``estrela`` (simples), ``gravata`` (cruza a si mesmo),
+    ``duplicado`` (cada vértice repetido). ``fechado=False`` omite a posição
+    de fechamento. Cada vértice é função só do índice, então percorrer ao
+    contrário inverte a orientação sem guardar a lista.
+    """
+
+    def __init__(self, cx: float, cy: float, raio: float, vertices: int, semente: int,
+                 forma: str = 'estrela', fechado: bool = True):
+        self.cx, self.cy, self.raio = cx, cy, raio
+        self.vertices = max(3, vertices)
+        self.semente = semente
+        self.forma = forma
+        self.fechado = fechado
+        rnd = random.Random(semente)
+        self._ondas = rnd.randint(3, 9)
+        self._fase = rnd.uniform(0, 2 * math.pi)
+        # Ruído menor que o espaçamento entre vértices: contorno "natural", sem serrilhado
+        self._ruido = min(0.04, 2 * math.pi / self._distintos)
+
+    @property
+    def _distintos(self) -> int:
+        return max(3, self.vertices // 2) if self.forma == 'duplicado' else self.vertices
+
+    def _ponto(self, i: int) -> Tuple[float, float]:
+        t = 2 * math.pi * i / self._distintos
+        if self.forma == 'gravata':
+            # Lemniscata de Gerono: um "8" que cruza no centro
+            return (self.cx + self.raio * math.sin(t), self.cy + self.raio * math.sin(t) * math.cos(t))
+        ruido = (math.sin((i + 1) * 12.9898 + self.semente * 78.233) * 43758.5453) % 1.0
+        r = self.raio * (1 + 0.15 * math.sin(self._ondas * t + self._fase) + self._ruido * (ruido - 0.5))
+        return (self.cx + r * math.cos(t), self.cy + r * math.sin(t))
+
+    def pontos(self, horario: bool = False) -> Iterator[Tuple[float, float]]:
+        """Posições do anel (anti-horário por padrão), com o fechamento se ``fechado``"""
+        n = self._distintos
+        indices = range(n) if not horario else range(n - 1, -1, -1)
+        repeticoes = 2 if self.forma == 'duplicado' else 1
+        primeiro = None
+        for i in indices:
+            ponto = self._ponto(i)
+            if primeiro is None:
+                primeiro = ponto
+            for _ in range(repeticoes):
+                yield ponto
+        if self.fechado:
+            yield primeiro
+
+    def posicoes(self) -> int:
+        return self._distintos * (2 if self.forma == 'duplicado' else 1) + (1 if self.fechado else 0)
+
+    def caixa(self) -> Tuple[float, float, float, float]:
+        """Caixa envolvente conservadora (sem percorrer os vértices)"""
+        r = self.raio * 1.17
+        return (self.cx - r, self.cy - r, self.cx + r, self.cy + r)
+
+
+class Feicao:
+    """Feição: lista de polígonos (cada um = casca + buracos) e propriedades"""
+
+    def __init__(self, poligonos: List[List[Anel]], propriedades: dict):
+        self.poligonos = poligonos
+        self.propriedades = propriedades
+
+    @property
+    def tipo(self) -> str:
+        return 'MultiPolygon' if len(self.poligonos) > 1 else 'Polygon'
+
+    def aneis(self) -> Iterator[Tuple[Anel, bool]]:
+        """(anel, é_buraco)"""
+        for poligono in self.poligonos:
+            for indice, anel in enumerate(poligono):
+                yield anel, indice > 0
+
+
+def _propriedades(tipo: str, indice: int, **extras) -> dict:
+    return {
+        'recibo': f"RO-1100205-BENCH{indice:04d}{tipo.upper()[:4]}",
+        'tema': 'Área do Imóvel',
+        'municipio': 'Porto Velho',
+        'estado': 'Rondônia',
+        **extras,
+    }
+
+
+def gerar_feicoes(tipo: str, vertices: int, semente: int = 42, partes: int = 8) -> List[Feicao]:
+    """Feições do tipo pedido somando (aproximadamente) ``vertices`` vértices distintos"""
+    cx, cy = CENTRO
+    r = RAIO_GRAUS
+
+    if tipo == 'simples':
+        return [Feicao([[Anel(cx, cy, r, vertices, semente)]], _propriedades(tipo, 1))]
+
+    if tipo == 'buracos':
+        casca = Anel(cx, cy, r, int(vertices * 0.6), semente)
+        buracos = [Anel(cx + 0.45 * r * math.cos(a), cy + 0.45 * r * math.sin(a), 0.12 * r,
+                        int(vertices * 0.1), semente + k + 1)
+                   for k, a in enumerate(k * math.pi / 2 for k in range(4))]
+        return [Feicao([[casca, *buracos]], _propriedades(tipo, 1, buracos=4))]
+
+    if tipo == 'multi':
+        colunas = math.ceil(math.sqrt(partes))
+        poligonos = [[Anel(cx + (k % colunas) * 2.6 * r, cy - (k // colunas) * 2.6 * r, r,
+                           vertices // partes, semente + k)]
+                     for k in range(partes)]
+        return [Feicao(poligonos, _propriedades(tipo, 1, partes=partes))]
+
+    if tipo == 'invalido':
+        passo = 2.6 * r
+        defeitos = [
+            ('auto_intersecao', [[Anel(cx, cy, r, int(vertices * 0.4), semente, forma='gravata')]]),
+            ('anel_aberto', [[Anel(cx + passo, cy, r, int(vertices * 0.2), semente + 1, fechado=False)]]),
+            ('buraco_fora', [[Anel(cx + 2 * passo, cy, r, int(vertices * 0.2), semente + 2),
+                              Anel(cx + 3 * passo, cy, 0.2 * r, int(vertices * 0.1), semente + 3)]]),
+            ('vertices_duplicados', [[Anel(cx, cy - passo, r, int(vertices * 0.1), semente + 4, forma='duplicado')]]),
+            ('anel_curto', [[Anel(cx + passo, cy - passo, r, 3, semente + 5, fechado=False)]]),
+        ]
+        return [Feicao(poligonos, _propriedades(tipo, i + 1, defeito=defeito))
+                for i, (defeito, poligonos) in enumerate(defeitos)]
+
+    raise ValueError(f"Tipo desconhecido: {tipo} (use {', '.join(TIPOS)})")
+
+
+# ==============================================================================
+# GEOJSON
+# ==============================================================================
+
+def escrever_geojson(feicoes: List[Feicao], caminho: Path) -> Path:
+    """FeatureCollection RFC 7946 (casca anti-horária, buracos horários), gravada em streaming"""
+    fmt = f"[%.{CASAS}f,%.{CASAS}f]"
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        arquivo.write('{"type":"FeatureCollection","name":%s,'
+                      '"crs":{"type":"name","properties":{"name":"urn:ogc:def:crs:EPSG::4674"}},'
+                      '"features":[\n' % json.dumps(caminho.name.split('.')[0]))
+        for i, feicao in enumerate(feicoes):
+            if i:
+                arquivo.write(',\n')
+            arquivo.write('{"type":"Feature","properties":%s,"geometry":{"type":"%s","coordinates":'
+                          % (json.dumps(feicao.propriedades, ensure_ascii=False), feicao.tipo))
+            multi = feicao.tipo == 'MultiPolygon'
+            arquivo.write('[' if multi else '')
+            for p, poligono in enumerate(feicao.poligonos):
+                arquivo.write((',' if p else '') + '[')
+                for a, anel in enumerate(poligono):
+                    arquivo.write((',' if a else '') + '[')
+                    bloco = []
+                    primeiro = True
+                    for ponto in anel.pontos(horario=a > 0):
+                        bloco.append(fmt % ponto)
+                        if len(bloco) >= 10_000:
+                            arquivo.write(('' if primeiro else ',') + ','.join(bloco))
+                            bloco, primeiro = [], False
+                    if bloco:
+                        arquivo.write(('' if primeiro else ',') + ','.join(bloco))
+                    arquivo.write(']')
+                arquivo.write(']')
+            arquivo.write(']' if multi else '')
+            arquivo.write('}}')
+        arquivo.write('\n]}\n')
+    return caminho
+
+
+# ==============================================================================
+# SHAPEFILE (.shp/.shx/.dbf/.prj/.cpg dentro de um .zip)
+# ==============================================================================
+
+def _duplas(pontos: Iterator[Tuple[float, float]], bloco: int = 65_536) -> Iterator[bytes]:
+    """Coordenadas como doubles little-endian, em blocos"""
+    buffer = array('d')
+    for x, y in pontos:
+        buffer.append(x)
+        buffer.append(y)
+        if len(buffer) >= bloco:
+            yield _le(buffer)
+            buffer = array('d')
+    if buffer:
+        yield _le(buffer)
+
+
+def _le(buffer: array) -> bytes:
+    if sys.byteorder != 'little':
+        buffer.byteswap()
+    return buffer.tobytes()
+
+
+def _caixa(aneis: List[Anel]) -> Tuple[float, float, float, float]:
+    caixas = [a.caixa() for a in aneis]
+    return (min(c[0] for c in caixas), min(c[1] for c in caixas),
+            max(c[2] for c in caixas), max(c[3] for c in caixas))
+
+
+def _cabecalho_shp(tamanho_palavras: int, caixa: Tuple[float, float, float, float]) -> bytes:
+    return (struct.pack('>7i', 9994, 0, 0, 0, 0, 0, tamanho_palavras)
+            + struct.pack('<2i', 1000, 5)
+            + struct.pack('<8d', *caixa, 0.0, 0.0, 0.0, 0.0))
+
+
+def _dbf(feicoes: List[Feicao]) -> bytes:
+    campos = [('ID', 'N', 10), ('RECIBO', 'C', 40), ('TEMA', 'C', 40), ('DEFEITO', 'C', 30)]
+    registro = 1 + sum(c[2] for c in campos)
+    cabecalho = 32 + 32 * len(campos) + 1
+    saida = io.BytesIO()
+    saida.write(struct.pack('<B3BIHH20x', 3, 125, 11, 27, len(feicoes), cabecalho, registro))
+    for nome, tipo, tamanho in campos:
+        saida.write(struct.pack('<11sc4xBB14x', nome.encode('ascii'), tipo.encode('ascii'), tamanho, 0))
+    saida.write(b'\r')
+    for i, feicao in enumerate(feicoes, 1):
+        valores = [str(i).rjust(10), feicao.propriedades.get('recibo', ''),
+                   feicao.propriedades.get('tema', ''), feicao.propriedades.get('defeito', '')]
+        saida.write(b' ')
+        for (nome, tipo, tamanho), valor in zip(campos, valores):
+            saida.write(str(valor).encode('utf-8')[:tamanho].ljust(tamanho, b' '))
+    saida.write(b'\x1a')
+    return saida.getvalue()
+
+
+def escrever_shp_zip(feicoes: List[Feicao], caminho: Path) -> Path:
+    """SHP.zip com um registro Polygon por feição (cascas horárias, buracos anti-horários)"""
+    todos = [anel for f in feicoes for anel, _ in f.aneis()]
+    caixa_total = _caixa(todos)
+    base = caminho.name.split('.')[0]
+
+    # Tamanho de cada registro é conhecido antes de gerar os vértices
+    conteudos = []
+    for feicao in feicoes:
+        aneis = list(feicao.aneis())
+        pontos = sum(a.posicoes() for a, _ in aneis)
+        conteudos.append((4 + 32 + 4 + 4 + 4 * len(aneis) + 16 * pontos, aneis, pontos))
+    tamanho_shp = 100 + sum(8 + c[0] for c in conteudos)
+    tamanho_shx = 100 + 8 * len(feicoes)
+
+    with zipfile.ZipFile(caminho, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zf:
+        shx = io.BytesIO()
+        shx.write(_cabecalho_shp(tamanho_shx // 2, caixa_total))
+        with zf.open(f"{base}.shp", 'w', force_zip64=True) as shp:
+            shp.write(_cabecalho_shp(tamanho_shp // 2, caixa_total))
+            deslocamento = 100
+            for numero, (conteudo, aneis, pontos) in enumerate(conteudos, 1):
+                shx.write(struct.pack('>2i', deslocamento // 2, conteudo // 2))
+                shp.write(struct.pack('>2i', numero, conteudo // 2))
+                shp.write(struct.pack('<i4d2i', 5, *_caixa([a for a, _ in aneis]), len(aneis), pontos))
+                inicio = 0
+                for anel, _ in aneis:
+                    shp.write(struct.pack('<i', inicio))
+                    inicio += anel.posicoes()
+                for anel, buraco in aneis:
+                    for bloco in _duplas(anel.pontos(horario=not buraco)):
+                        shp.write(bloco)
+                deslocamento += 8 + conteudo
+        zf.writestr(f"{base}.shx", shx.getvalue())
+        zf.writestr(f"{base}.dbf", _dbf(feicoes))
+        zf.writestr(f"{base}.prj", PRJ_SIRGAS_2000)
+        zf.writestr(f"{base}.cpg", 'UTF-8')
+    return caminho
+
+
+# ==============================================================================
+# API
+# ==============================================================================
+
+def nome_fixture(tipo: str, vertices: int, formato: str, semente: int = 42) -> str:
+    extensao = 'geojson' if formato == 'geojson' else 'zip'
+    return f"car_{tipo}_{formatar_tamanho(vertices)}_s{semente}.{extensao}"
+
+
+def gerar(tipo: str, vertices: int, formato: str, saida: Path = SAIDA, semente: int = 42,
+          partes: int = 8, forcar: bool = False) -> Path:
+    """Gera (ou reaproveita) a fixture e devolve o caminho"""
+    saida = Path(saida)
+    saida.mkdir(parents=True, exist_ok=True)
+    caminho = saida / nome_fixture(tipo, vertices, formato, semente)
+    if caminho.exists() and not forcar:
+        return caminho
+    feicoes = gerar_feicoes(tipo, vertices, semente, partes)
+    temporario = caminho.with_name(caminho.name + '.tmp')
+    if formato == 'geojson':
+        escrever_geojson(feicoes, temporario)
+    elif formato == 'shp':
+        escrever_shp_zip(feicoes, temporario)
+    else:
+        raise ValueError(f"Formato desconhecido: {formato} (use {', '.join(FORMATOS)})")
+    os.replace(temporario, caminho)
+    return caminho
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Gera fixtures GeoJSON / SHP.zip com número de vértices controlado',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument('--vertices', nargs='+', default=list(TAMANHOS_PADRAO),
+                        help=f"Vértices por fixture: 1k, 250k, 5M... (padrão: {' '.join(TAMANHOS_PADRAO)})")
+    parser.add_argument('--tipos', nargs='+', choices=TIPOS, default=list(TIPOS))
+    parser.add_argument('--formatos', nargs='+', choices=FORMATOS, default=list(FORMATOS))
+    parser.add_argument('--partes', type=int, default=8, help='Polígonos do tipo multi (padrão: 8)')
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--saida', type=Path, default=SAIDA, help=f'Pasta de saída (padrão: {SAIDA})')
+    parser.add_argument('--forcar', action='store_true', help='Regera mesmo se o arquivo já existir')
+    args = parser.parse_args(argv)
+
+    print("=" * 80)
+    print("🗺️  FIXTURES GEOESPACIAIS")
+    print("=" * 80)
+    for tamanho in args.vertices:
+        vertices = ler_tamanho(tamanho)
+        for tipo in args.tipos:
+            for formato in args.formatos:
+                caminho = gerar(tipo, vertices, formato, args.saida, args.semente, args.partes, args.forcar)
+                print(f"  ✓ {caminho.name:<40} {caminho.stat().st_size / 1024 / 1024:>9.2f} MB")
+    print(f"\n📁 {args.saida}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,564 @@
+"""
+Análise de impacto: roda só as suítes afetadas pelos arquivos alterados
+======================================================================
+
+Qualquer mudança em ``src/`` obrigava a rodar tudo - CRUDs da
+Administração, a cadeia do Novo Empreendimento e os testes de workflow. Este
+módulo aprende de que arquivos do frontend cada suíte depende e, dado um diff
+do git, seleciona só as suítes afetadas:
+
+- **cobertura JS por suíte**: no modo ``aprender`` cada sessão do pool liga a
+  cobertura do V8 via CDP (``Profiler.startPreciseCoverage``); os scripts
+  servidos pelo Vite (``/src/...``) com alguma função executada entram no
+  mapa da suíte. A cobertura é recolhida antes de cada ``driver.get`` e no
+  reset da sessão, para não se perder na navegação;
+- **endpoints por suíte**: chamadas ``fetch``/XHR do navegador e as feitas
+  pelo ``ClienteAPI`` (``api_client``). Na seleção, um arquivo de ``src/``
+  que cita um desses endpoints (``/activities/${id}/ranges``,
+  ``.from('activities')``) também afeta a suíte;
+- **código dos testes**: mudou um script de suíte, ela roda; mudou um módulo
+  compartilhado (``driver_pool.py``, ``crud_catalogos.py``...) ou um arquivo
+  citado por ele (``perf_budget.json``), rodam as suítes que o importam;
+- arquivos globais (``package.json``, ``vite.config.ts``, ``src/main.tsx``,
+  ``src/App.tsx``, ``src/pages/Dashboard.tsx``, migrações...) selecionam tudo;
+- suítes ainda sem mapa rodam a cada mudança em ``src/``: só a cobertura
+  aprendida pode excluir uma suíte. Pistas estáticas - rotas e endpoints
+  citados no próprio script (``'/inscricao/imovel'``,
+  ``f"{API}/workflow/instances"``), a tabela do catálogo (``CATALOGO`` →
+  ``crud_catalogos``) e o nome (``ActivityForm.tsx`` → ``test_activities_*``)
+  - só explicam o motivo.
+
+O mapa fica em ``tests/impact_map.json`` e deve ser reaprendido contra o
+servidor de desenvolvimento (``npm run dev`` - o build de produção junta
+tudo num bundle e não dá para mapear arquivos).
+
+Uso:
+
+    python impact_analysis.py aprender                          # Todas as suítes
+    python impact_analysis.py aprender test_activities_crud_selenium.py test_license_types_selenium.py
+    python impact_analysis.py selecionar --base origin/main     # Só lista
+    python impact_analysis.py selecionar --arquivos src/components/admin/ActivityForm.tsx
+    python impact_analysis.py executar --base origin/main       # Lista e roda (pool compartilhado)
+    python impact_analysis.py mapa
+
+Variáveis de ambiente:
+    IMPACTO_MAPA        caminho do mapa (padrão: tests/impact_map.json)
+    IMPACTO_COBERTURA   true/false - coleta cobertura fora do ``aprender`` (padrão: false)
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import os
+import re
+import ast
+import sys
+import json
+import time
+import runpy
+import argparse
+import threading
+import subprocess
+import weakref
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+from urllib.parse import urlparse
+
+
+TESTS_DIR = Path(__file__).resolve().parent
+RAIZ = TESTS_DIR.parent
+MAPA = Path(os.getenv('IMPACTO_MAPA', TESTS_DIR / 'impact_map.json'))
+ATIVO = os.getenv('IMPACTO_COBERTURA', 'false').lower() == 'true'
+
+# Mudanças nestes caminhos (prefixos, relativos à raiz) afetam todas as suítes
+GLOBAIS = (
+    'package.json', 'package-lock.json', 'index.html', 'vite.config.ts', 'tsconfig',
+    'tailwind.config.js', 'postcss.config.js', '.env', 'src/main.tsx', 'src/index.css',
+    'src/vite-env.d.ts', 'supabase/', 'public/',
+    # Casca do app: rotas, login e navegação passam por aqui em todas as suítes
+    'src/App.tsx', 'src/pages/Dashboard.tsx',
+)
+# Documentação e imagens não afetam nenhuma suíte
+IGNORADOS = ('.md', '.pdf', '.png', '.jpg', '.jpeg', '.txt')
+
+# Passos da cadeia Novo Empreendimento: rodam pelo orchestrator, não sozinhos
+PASSO_CADEIA = re.compile(r'^test_novo_empreendimento_0\d_')
+# crud_engine.py não entra: cada catálogo já tem o seu test_*_selenium.py
+SUITES_EXTRAS = ('orchestrator_novo_empreendimento.py',)
+
+PREFIXOS_API = ('api', 'v1', 'rest')
+SEGMENTO_VARIAVEL = re.compile(r'^(\d+|[0-9a-f]{8}-[0-9a-f-]{27,}|[0-9a-f]{24,})$', re.I)
+
+# Palavras de nome que não identificam a funcionalidade (pistas por nome)
+PALAVRAS_GENERICAS = {
+    'test', 'selenium', 'crud', 'complete', 'integration', 'manual', 'edit', 'setup', 'direct',
+    'api', 'py', 'tsx', 'ts', 'form', 'view', 'list', 'modal', 'page', 'service', 'index', 'admin',
+    'orchestrator',
+}
+
+RECURSOS_JS = """
+return performance.getEntriesByType('resource')
+    .filter(e => e.initiatorType === 'fetch' || e.initiatorType === 'xmlhttprequest')
+    .map(e => e.name);
+"""
+
+
+# ==============================================================================
+# SUÍTES E DEPENDÊNCIAS ENTRE OS MÓDULOS DE TESTE
+# ==============================================================================
+
+def listar_suites() -> List[str]:
+    """Scripts de suíte em tests/ (``test_*.py`` fora da cadeia + orchestrator)"""
+    suites = sorted(p.name for p in TESTS_DIR.glob('test_*.py') if not PASSO_CADEIA.match(p.name))
+    return suites + [s for s in SUITES_EXTRAS if (TESTS_DIR / s).exists()]
+
+
+def _imports(caminho: Path) -> Set[str]:
+    """Módulos de tests/ importados por um script"""
+    try:
+        arvore = ast.parse(caminho.read_text(encoding='utf-8'))
+    except (SyntaxError, UnicodeDecodeError):
+        return set()
+    # Só imports de módulo: os feitos dentro de funções (lazy) não contam
+    nomes, pilha = set(), list(arvore.body)
+    while pilha:
+        no = pilha.pop()
+        if isinstance(no, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            continue
+        pilha.extend(ast.iter_child_nodes(no))
+        if isinstance(no, ast.Import):
+            nomes.update(a.name.split('.')[0] for a in no.names)
+        elif isinstance(no, ast.ImportFrom) and no.module and not no.level:
+            nomes.add(no.module.split('.')[0])
+        elif isinstance(no, ast.Constant) and isinstance(no.value, str) and no.value.isidentifier():
+            # Módulo importado por nome no momento do uso (ex.: TESTES_CADEIA do orquestrador)
+            nomes.add(no.value)
+    return {n for n in nomes if (TESTS_DIR / f"{n}.py").exists()}
+
+
+def grafo_imports() -> Dict[str, Set[str]]:
+    """módulo → módulos de tests/ dos quais depende (transitivamente)"""
+    diretos = {p.stem: _imports(p) for p in TESTS_DIR.glob('*.py')}
+    fechado = {}
+    for modulo in diretos:
+        vistos, pilha = set(), list(diretos[modulo])
+        while pilha:
+            atual = pilha.pop()
+            if atual not in vistos:
+                vistos.add(atual)
+                pilha.extend(diretos.get(atual, ()))
+        fechado[modulo] = vistos
+    return fechado
+
+
+def modulos_que_citam(nome_arquivo: str) -> Set[str]:
+    """Módulos de tests/ cujo código cita o arquivo (ex.: ``perf_budget.json``)"""
+    return {p.stem for p in TESTS_DIR.glob('*.py')
+            if nome_arquivo in p.read_text(encoding='utf-8', errors='ignore')}
+
+
+# ==============================================================================
+# ENDPOINTS
+# ==============================================================================
+
+def _segmentos(caminho: str) -> List[str]:
+    partes = [p for p in caminho.split('?')[0].split('/') if p]
+    while partes and (partes[0] in PREFIXOS_API or partes[0] == '*'):
+        partes.pop(0)
+    return partes
+
+
+def normalizar_endpoint(url: str) -> Optional[str]:
+    """``https://host/api/v1/activities/12/ranges?x=1`` → ``/activities/*/ranges``"""
+    partes = _segmentos(urlparse(url).path)
+    if not partes or partes[0] in ('src', 'node_modules') or partes[0].startswith('@'):
+        return None
+    return '/' + '/'.join('*' if SEGMENTO_VARIAVEL.match(p) else p for p in partes)
+
+
+def _casa(padrao: List[str], endpoint: List[str]) -> bool:
+    return len(padrao) == len(endpoint) and all(
+        p == '*' or e == '*' or p == e for p, e in zip(padrao, endpoint))
+
+
+_LITERAL = re.compile(r"[`'\"]((?:\$\{[^}`]+\})?/[\w\-/.${}:]*)[?`'\"]")
+_SUPABASE_FROM = re.compile(r"\.from\(\s*['\"]([\w\-]+)['\"]\s*\)")
+
+
+def padroes_endpoint(codigo: str) -> List[List[str]]:
+    """Caminhos de API citados num arquivo do frontend, com ``${...}`` como curinga"""
+    padroes = []
+    for literal in _LITERAL.findall(codigo):
+        partes = _segmentos(re.sub(r'\$\{[^}]*\}', '*', literal))
+        if partes and any(p != '*' for p in partes):
+            padroes.append(partes)
+    padroes.extend([tabela] for tabela in _SUPABASE_FROM.findall(codigo))
+    return padroes
+
+
+def cita_endpoints(arquivo: Path, endpoints: Iterable[str]) -> List[str]:
+    """Endpoints (normalizados) citados pelo arquivo de ``src/``"""
+    try:
+        padroes = padroes_endpoint(arquivo.read_text(encoding='utf-8', errors='ignore'))
+    except OSError:
+        return []
+    return [e for e in endpoints if any(_casa(p, _segmentos(e)) for p in padroes)]
+
+
+# ==============================================================================
+# PISTAS ESTÁTICAS (suítes ainda sem mapa)
+# ==============================================================================
+
+_LITERAL_PY = re.compile(r"[\'\"]((?:\{[^}\'\"]*\})?/[\w\-/.{}:]*)[?\'\"]")
+_CATALOGO = re.compile(r"^CATALOGO\s*=\s*['\"]([\w\-]+)['\"]", re.M)
+
+
+def _palavras(nome: str) -> Set[str]:
+    """``ActivityForm`` / ``test_activities_crud`` → {'activity'} (singular, sem palavras genéricas)"""
+    palavras = set()
+    for palavra in re.findall(r'[A-Z]?[a-z]+|[A-Z]+(?![a-z])', nome):
+        palavra = palavra.lower()
+        palavra = palavra[:-3] + 'y' if palavra.endswith('ies') else palavra.rstrip('s') or palavra
+        if palavra not in PALAVRAS_GENERICAS and len(palavra) > 2:
+            palavras.add(palavra)
+    return palavras
+
+
+def _padroes_rede() -> Dict[str, str]:
+    """Nomes de ``PADROES_WORKFLOW`` (network_recorder) → endpoint com ``*`` (sem importar o módulo)"""
+    try:
+        arvore = ast.parse((TESTS_DIR / 'network_recorder.py').read_text(encoding='utf-8'))
+    except (OSError, SyntaxError):
+        return {}
+    for no in arvore.body:
+        if isinstance(no, ast.Assign) and any(getattr(t, 'id', None) == 'PADROES_WORKFLOW' for t in no.targets):
+            return {nome: regex.replace('[^/]+', '*').rstrip('$')
+                    for nome, regex in ast.literal_eval(no.value).items()}
+    return {}
+
+
+def pistas_estaticas(suite: str) -> Dict[str, object]:
+    """Endpoints/rotas citados no script da suíte (e a tabela do catálogo) + palavras do nome"""
+    # O orquestrador roda os passos da cadeia: as pistas deles são dele
+    arquivos = [TESTS_DIR / suite] + [TESTS_DIR / f"{m}.py" for m in sorted(grafo_imports().get(Path(suite).stem, ()))
+                                      if PASSO_CADEIA.match(f"{m}.py")]
+    codigo = ''
+    for arquivo in arquivos:
+        try:
+            codigo += arquivo.read_text(encoding='utf-8', errors='ignore')
+        except OSError:
+            pass
+    endpoints = {endpoint for nome, endpoint in _padroes_rede().items() if f"'{nome}'" in codigo}
+    for literal in _LITERAL_PY.findall(codigo):
+        partes = _segmentos(re.sub(r'\{[^}]*\}', '*', literal))
+        if partes and any(p != '*' for p in partes):
+            endpoints.add('/' + '/'.join(partes))
+    catalogo = _CATALOGO.search(codigo)
+    if catalogo:
+        try:
+            from crud_catalogos import CATALOGOS
+            spec = CATALOGOS.get(catalogo.group(1), {})
+        except ImportError:
+            spec = {}
+        endpoints.add(f"/{catalogo.group(1)}")
+        if spec.get('tabela'):
+            endpoints.add(f"/{spec['tabela']}")
+    return {'endpoints': sorted(endpoints), 'palavras': _palavras(Path(suite).stem)}
+
+
+# ==============================================================================
+# COLETA (cobertura V8 + endpoints) DURANTE O APRENDIZADO
+# ==============================================================================
+
+_drivers = weakref.WeakSet()
+_atual: Optional[dict] = None
+_lock = threading.Lock()
+
+
+def arquivo_fonte(url: str) -> Optional[str]:
+    """URL de módulo servido pelo Vite → caminho em ``src/``"""
+    caminho = urlparse(url).path
+    return caminho[1:] if caminho.startswith('/src/') else None
+
+
+def _executado(script: dict) -> bool:
+    """Alguma função além do corpo do módulo rodou (importar não conta)"""
+    return any(f['ranges'][0]['count'] > 0 for f in script.get('functions', [])
+               if f.get('functionName') or f['ranges'][0]['startOffset'] > 0)
+
+
+def instrumentar(driver):
+    """Liga a cobertura JS na sessão e recolhe antes de cada ``driver.get`` (idempotente)"""
+    if driver in _drivers:
+        return
+    try:
+        driver.execute_cdp_cmd('Profiler.enable', {})
+        driver.execute_cdp_cmd('Profiler.startPreciseCoverage', {'callCount': False, 'detailed': False})
+    except Exception:
+        return
+    _drivers.add(driver)
+    get_original = driver.get
+
+    def get(url):
+        coletar(driver)
+        return get_original(url)
+
+    driver.get = get
+
+
+def coletar(driver):
+    """Soma à suíte atual os arquivos executados e os endpoints chamados desde a última coleta"""
+    if _atual is None or driver not in _drivers:
+        return
+    try:
+        # takePreciseCoverage também zera os contadores
+        scripts = driver.execute_cdp_cmd('Profiler.takePreciseCoverage', {}).get('result', [])
+        recursos = driver.execute_script(RECURSOS_JS) or []
+    except Exception:
+        return
+    arquivos = {arquivo_fonte(s['url']) for s in scripts if _executado(s)}
+    endpoints = {normalizar_endpoint(url) for url in recursos}
+    with _lock:
+        if _atual is not None:
+            _atual['arquivos'].update(a for a in arquivos if a)
+            _atual['endpoints'].update(e for e in endpoints if e)
+
+
+def registrar_endpoint(url: str):
+    """Chamada feita pelo Python (``ClienteAPI``) durante a suíte atual"""
+    if _atual is None:
+        return
+    endpoint = normalizar_endpoint(url)
+    if endpoint:
+        with _lock:
+            if _atual is not None:
+                _atual['endpoints'].add(endpoint)
+
+
+def iniciar_suite(nome: str):
+    global _atual
+    with _lock:
+        _atual = {'suite': nome, 'arquivos': set(), 'endpoints': set()}
+
+
+def encerrar_suite() -> dict:
+    """Recolhe a cobertura pendente de todas as sessões e devolve o que a suíte usou"""
+    global _atual
+    for driver in list(_drivers):
+        coletar(driver)
+    with _lock:
+        atual, _atual = _atual, None
+    return {'arquivos': sorted(atual['arquivos']), 'endpoints': sorted(atual['endpoints'])}
+
+
+# ==============================================================================
+# MAPA
+# ==============================================================================
+
+def carregar_mapa(caminho: Path = MAPA) -> dict:
+    if not Path(caminho).exists():
+        return {'suites': {}}
+    with open(caminho, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def salvar_mapa(mapa: dict, caminho: Path = MAPA):
+    mapa['atualizado_em'] = datetime.now().isoformat(timespec='seconds')
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump(mapa, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def aprender(scripts: List[str], caminho: Path = MAPA) -> int:
+    """Roda as suítes no mesmo processo (pool compartilhado) coletando cobertura e endpoints"""
+    global ATIVO
+    ATIVO = True
+    import driver_pool
+
+    mapa = carregar_mapa(caminho)
+    driver_pool.obter_pool()
+    sys.path.insert(0, str(TESTS_DIR))
+
+    falhas = 0
+    for script in scripts:
+        nome = Path(script).name
+        print("\n" + "=" * 80)
+        print(f"🧭 Aprendendo: {nome}")
+        print("=" * 80)
+        iniciar_suite(nome)
+        inicio, status = time.time(), 'sucesso'
+        try:
+            runpy.run_path(str(TESTS_DIR / nome), run_name='__main__')
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                status = 'falha'
+        except Exception as e:
+            print(f"❌ {nome}: {e}")
+            status = 'falha'
+        uso = encerrar_suite()
+        falhas += status != 'sucesso'
+        mapa['suites'][nome] = {**uso, 'status': status, 'duracao': round(time.time() - inicio, 1),
+                                'aprendido_em': datetime.now().isoformat(timespec='seconds')}
+        print(f"🧭 {nome}: {len(uso['arquivos'])} arquivo(s) de src/, {len(uso['endpoints'])} endpoint(s)")
+        salvar_mapa(mapa, caminho)
+
+    driver_pool.encerrar_pool()
+    print(f"\n💾 Mapa salvo em: {caminho}")
+    return 1 if falhas else 0
+
+
+# ==============================================================================
+# SELEÇÃO
+# ==============================================================================
+
+def _git(*args: str) -> List[str]:
+    saida = subprocess.run(['git', *args], cwd=RAIZ, capture_output=True, text=True, check=True).stdout
+    return [linha.strip() for linha in saida.splitlines() if linha.strip()]
+
+
+def arquivos_alterados(base: str) -> List[str]:
+    """Commits desde ``base`` + mudanças não commitadas + arquivos novos"""
+    alterados = set(_git('diff', '--name-only', f'{base}...HEAD'))
+    alterados.update(_git('diff', '--name-only', 'HEAD'))
+    alterados.update(_git('ls-files', '--others', '--exclude-standard'))
+    return sorted(alterados)
+
+
+def selecionar(alterados: Iterable[str], mapa: dict) -> Dict[str, List[str]]:
+    """suíte → motivos (arquivos alterados que a afetam)"""
+    suites = listar_suites()
+    aprendidas = mapa.get('suites', {})
+    grafo = grafo_imports()
+    motivos: Dict[str, List[str]] = {}
+
+    def marcar(suite: str, motivo: str):
+        if suite in suites and motivo not in motivos.setdefault(suite, []):
+            motivos[suite].append(motivo)
+
+    def importadores(modulos: Set[str]) -> List[str]:
+        return [s for s in suites if (Path(s).stem in modulos) or (grafo.get(Path(s).stem, set()) & modulos)]
+
+    alterados_src = []
+    for arquivo in alterados:
+        if arquivo.startswith('tests/'):
+            nome = arquivo[len('tests/'):]
+            if nome in suites:
+                marcar(nome, arquivo)
+            elif nome.endswith('.py') and '/' not in nome:
+                for suite in importadores({nome[:-3]}):
+                    marcar(suite, arquivo)
+            elif not nome.endswith(IGNORADOS):
+                for suite in importadores(modulos_que_citam(Path(nome).name)):
+                    marcar(suite, arquivo)
+        elif arquivo.startswith(GLOBAIS):
+            for suite in suites:
+                marcar(suite, f"{arquivo} (global)")
+        elif arquivo.startswith('src/') and not arquivo.endswith(IGNORADOS):
+            alterados_src.append(arquivo)
+            for suite, uso in aprendidas.items():
+                if arquivo in uso.get('arquivos', ()):
+                    marcar(suite, arquivo)
+                else:
+                    citados = cita_endpoints(RAIZ / arquivo, uso.get('endpoints', ()))
+                    if citados:
+                        marcar(suite, f"{arquivo} ({citados[0]})")
+
+    sem_mapa = [s for s in suites if s not in aprendidas]
+    pistas = {suite: pistas_estaticas(suite) for suite in sem_mapa} if alterados_src else {}
+    for arquivo in alterados_src:
+        # Sem cobertura aprendida nada exclui a suíte: as pistas só dizem o motivo
+        for suite, pista in pistas.items():
+            citados = cita_endpoints(RAIZ / arquivo, pista['endpoints'])
+            if citados:
+                marcar(suite, f"{arquivo} ({citados[0]}, sem mapa)")
+            elif pista['palavras'] and pista['palavras'] <= _palavras(Path(arquivo).stem):
+                marcar(suite, f"{arquivo} (nome, sem mapa)")
+            else:
+                marcar(suite, f"{arquivo} (sem mapa - rode aprender)")
+    return motivos
+
+
+def sem_suite(alterados: Iterable[str], motivos: Dict[str, List[str]]) -> List[str]:
+    """Arquivos de ``src/`` alterados que nenhuma suíte exercita"""
+    usados = {m.split(' ')[0] for lista in motivos.values() for m in lista}
+    return [a for a in alterados if a.startswith('src/') and a not in usados and not a.endswith(IGNORADOS)]
+
+
+def imprimir_selecao(alterados: List[str], motivos: Dict[str, List[str]]):
+    print("=" * 80)
+    print(f"🎯 ANÁLISE DE IMPACTO: {len(alterados)} arquivo(s) alterado(s) → "
+          f"{len(motivos)}/{len(listar_suites())} suíte(s)")
+    print("=" * 80)
+    for suite, lista in sorted(motivos.items()):
+        extra = f" (+{len(lista) - 3})" if len(lista) > 3 else ''
+        print(f"  ▶️  {suite:<45} {', '.join(lista[:3])}{extra}")
+    descobertos = sem_suite(alterados, motivos)
+    if descobertos:
+        print(f"\n⚠️  Sem suíte que os exercite ({len(descobertos)}):")
+        for arquivo in descobertos:
+            print(f"     {arquivo}")
+
+
+# ==============================================================================
+# CLI
+# ==============================================================================
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Seleciona as suítes afetadas por um diff (cobertura JS + endpoints por suíte)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument('--mapa', type=Path, default=MAPA, help=f'Mapa de dependências (padrão: {MAPA})')
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    p = sub.add_parser('aprender', help='Roda as suítes coletando cobertura e endpoints')
+    p.add_argument('scripts', nargs='*', help='Suítes (padrão: todas)')
+
+    for nome, ajuda in (('selecionar', 'Lista as suítes afetadas'), ('executar', 'Roda as suítes afetadas')):
+        p = sub.add_parser(nome, help=ajuda)
+        p.add_argument('--base', default='origin/main', help='Ref de comparação (padrão: origin/main)')
+        p.add_argument('--arquivos', nargs='+', help='Arquivos alterados (em vez do git diff)')
+        p.add_argument('--json', action='store_true', help='Saída em JSON')
+
+    sub.add_parser('mapa', help='Resumo do mapa aprendido')
+    args = parser.parse_args(argv)
+
+    if args.comando == 'aprender':
+        return aprender(args.scripts or listar_suites(), args.mapa)
+
+    mapa = carregar_mapa(args.mapa)
+    if args.comando == 'mapa':
+        suites = mapa.get('suites', {})
+        print(f"🗺️  {args.mapa} (atualizado em {mapa.get('atualizado_em', '-')})")
+        for suite in listar_suites():
+            uso = suites.get(suite)
+            if uso:
+                print(f"  {suite:<45} {len(uso['arquivos']):>4} arquivo(s) {len(uso['endpoints']):>3} endpoint(s)"
+                      f"  {uso['duracao']:>6.1f}s  {uso['aprendido_em']}")
+            else:
+                print(f"  {suite:<45} (sem mapa)")
+        return 0
+
+    alterados = sorted(args.arquivos) if args.arquivos else arquivos_alterados(args.base)
+    motivos = selecionar(alterados, mapa)
+    if args.json:
+        print(json.dumps({'alterados': alterados, 'suites': motivos,
+                          'sem_suite': sem_suite(alterados, motivos)}, ensure_ascii=False, indent=2))
+    else:
+        imprimir_selecao(alterados, motivos)
+
+    if args.comando == 'executar':
+        if not motivos:
+            print("\n✅ Nenhuma suíte afetada")
+            return 0
+        import driver_pool
+        return driver_pool.main(sorted(str(TESTS_DIR / s) for s in motivos))
+    return 0
+
+
+if __name__ == "__main__":
+    # driver_pool/api_client importam "impact_analysis": mesmo módulo (e estado) que o __main__
+    sys.modules.setdefault('impact_analysis', sys.modules[__name__])
+    sys.exit(main())
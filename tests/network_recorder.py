@@ -0,0 +1,302 @@
+"""
+Gravador de rede via CDP (streaming) com índice por padrão de URL
+==================================================================
+
+Substitui o parsing posterior do log de performance em
+``WorkflowEngineTestSuite.intercept_network_requests`` (que relia o buffer
+inteiro a cada chamada, fazia ``json.loads`` de cada entrada e carimbava as
+requisições com ``datetime.now()`` na hora do parsing).
+
+O ``GravadorRede`` assina os eventos ``Network.*`` enquanto eles acontecem:
+
+- modo websocket: thread em background conectada ao DevTools do próprio
+  Chrome (``goog:chromeOptions.debuggerAddress``), requer ``websocket-client``;
+- modo fallback: ouvinte do ``MonitorRede`` do smart_wait, alimentado
+  incrementalmente pelo log de performance (sem reprocessar entradas).
+
+Cada requisição vira um registro com timestamps reais do navegador, status
+HTTP e tempo de resposta, indexado pelo nome do padrão de URL. Consultas são
+O(1):
+
+    rede = GravadorRede(driver)
+    rede.iniciar()
+    ...
+    inicio = rede.aguardar('workflow_start', timeout=10)
+    print(inicio['status'], inicio['duracao_ms'])
+    for req in rede.todas('complete_step'):
+        ...
+    rede.parar()
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import json
+import re
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+try:
+    import websocket  # websocket-client (opcional)
+except ImportError:
+    websocket = None
+
+from smart_wait import monitor_rede
+
+
+# Padrões de URL da API do motor de workflow (src/services/workflowApi.ts)
+PADROES_WORKFLOW = {
+    'workflow_start': r'/workflow/instances/start$',
+    'complete_step': r'/workflow/instances/[^/]+/steps/[^/]+/complete$',
+    'current_step': r'/workflow/instances/[^/]+/current-step$',
+    'step_history': r'/workflow/instances/[^/]+/step-history$',
+    'template_steps': r'/workflow/templates/[^/]+/steps$',
+}
+
+TIPOS_RECURSO = ('XHR', 'Fetch')
+
+
+class GravadorRede:
+    """Grava requisições XHR/fetch do navegador, indexadas por padrão de URL"""
+
+    def __init__(self, driver, padroes: Optional[Dict[str, str]] = None, usar_websocket: bool = True):
+        self.driver = driver
+        self.padroes = {nome: re.compile(regex) for nome, regex in (padroes or PADROES_WORKFLOW).items()}
+        self.usar_websocket = usar_websocket and websocket is not None
+
+        self.requisicoes: Dict[str, dict] = {}            # requestId -> registro
+        self.indice: Dict[str, List[dict]] = defaultdict(list)  # padrão -> registros
+        self.ordem: List[dict] = []                        # todas, na ordem de envio
+
+        self.modo = None
+        self._cond = threading.Condition()
+        self._ws = None
+        self._thread = None
+        self._parar = threading.Event()
+        self._proximo_id = 0
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+
+    def iniciar(self) -> 'GravadorRede':
+        """Começa a gravar (websocket se disponível, senão log de performance)"""
+        if self.modo:
+            return self
+        if self.usar_websocket:
+            try:
+                self._conectar_websocket()
+                self.modo = 'websocket'
+                return self
+            except Exception as e:
+                print(f"  ⚠️ GravadorRede: websocket CDP indisponível ({e}); usando log de performance")
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+        except Exception:
+            pass
+        monitor_rede(self.driver).ouvintes.append(self._processar_evento)
+        self.modo = 'performance'
+        return self
+
+    def parar(self):
+        """Encerra a gravação (registros continuam disponíveis)"""
+        self._parar.set()
+        if self._ws is not None:
+            try:
+                self._ws.close()
+            except Exception:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+        if self.modo == 'performance':
+            try:
+                monitor_rede(self.driver).ouvintes.remove(self._processar_evento)
+            except ValueError:
+                pass
+        self.modo = None
+
+    @property
+    def ativo(self) -> bool:
+        """True se há uma fonte de eventos funcionando (websocket ou log de performance)"""
+        if self.modo == 'websocket':
+            return self._thread is not None and self._thread.is_alive()
+        if self.modo == 'performance':
+            monitor = monitor_rede(self.driver)
+            monitor.atualizar()
+            return monitor.usa_cdp
+        return False
+
+    def limpar(self):
+        """Descarta os registros gravados até agora"""
+        with self._cond:
+            self.requisicoes.clear()
+            self.indice.clear()
+            self.ordem.clear()
+
+    # ------------------------------------------------------------------
+    # Transporte
+    # ------------------------------------------------------------------
+
+    def _conectar_websocket(self):
+        endereco = self.driver.capabilities.get('goog:chromeOptions', {}).get('debuggerAddress')
+        if not endereco:
+            raise RuntimeError("debuggerAddress não informado pelo ChromeDriver")
+        alvo = self.driver.execute_cdp_cmd('Target.getTargetInfo', {})['targetInfo']['targetId']
+        self._ws = websocket.create_connection(
+            f"ws://{endereco}/devtools/page/{alvo}", timeout=5, suppress_origin=True
+        )
+        self._enviar('Network.enable', {})
+        self._ws.settimeout(0.5)
+        self._thread = threading.Thread(target=self._loop_websocket, daemon=True, name='gravador-rede')
+        self._thread.start()
+
+    def _enviar(self, metodo: str, params: dict):
+        self._proximo_id += 1
+        self._ws.send(json.dumps({'id': self._proximo_id, 'method': metodo, 'params': params}))
+
+    def _loop_websocket(self):
+        while not self._parar.is_set():
+            try:
+                mensagem = json.loads(self._ws.recv())
+            except websocket.WebSocketTimeoutException:
+                continue
+            except Exception:
+                break
+            metodo = mensagem.get('method')
+            if metodo:
+                self._processar_evento(metodo, mensagem.get('params', {}))
+
+    def _sincronizar(self):
+        """No modo fallback, consome as entradas novas do log de performance"""
+        if self.modo == 'performance':
+            monitor_rede(self.driver).atualizar()
+
+    # ------------------------------------------------------------------
+    # Eventos
+    # ------------------------------------------------------------------
+
+    def _classificar(self, url: str) -> Optional[str]:
+        caminho = urlparse(url).path.rstrip('/')
+        for nome, regex in self.padroes.items():
+            if regex.search(caminho):
+                return nome
+        return None
+
+    def _processar_evento(self, metodo: str, params: dict):
+        request_id = params.get('requestId')
+        with self._cond:
+            if metodo == 'Network.requestWillBeSent':
+                if params.get('type') not in TIPOS_RECURSO:
+                    return
+                request = params.get('request', {})
+                registro = {
+                    'request_id': request_id,
+                    'url': request.get('url', ''),
+                    'method': request.get('method', ''),
+                    'padrao': self._classificar(request.get('url', '')),
+                    'inicio_ts': params.get('timestamp'),
+                    'timestamp': datetime.fromtimestamp(params.get('wallTime', time.time())).isoformat(),
+                    'wall_time': params.get('wallTime'),
+                    'status': None,
+                    'duracao_ms': None,
+                    'concluida': False,
+                    'erro': None,
+                }
+                self.requisicoes[request_id] = registro
+                self.ordem.append(registro)
+                if registro['padrao']:
+                    self.indice[registro['padrao']].append(registro)
+
+            elif metodo == 'Network.responseReceived':
+                registro = self.requisicoes.get(request_id)
+                if registro:
+                    registro['status'] = params.get('response', {}).get('status')
+                    registro['ttfb_ms'] = self._delta_ms(registro, params.get('timestamp'))
+
+            elif metodo in ('Network.loadingFinished', 'Network.loadingFailed'):
+                registro = self.requisicoes.get(request_id)
+                if registro:
+                    registro['duracao_ms'] = self._delta_ms(registro, params.get('timestamp'))
+                    registro['concluida'] = True
+                    if metodo == 'Network.loadingFailed':
+                        registro['erro'] = params.get('errorText')
+                    self._cond.notify_all()
+
+    @staticmethod
+    def _delta_ms(registro: dict, timestamp: Optional[float]) -> Optional[float]:
+        if timestamp is None or registro.get('inicio_ts') is None:
+            return None
+        return round((timestamp - registro['inicio_ts']) * 1000, 1)
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def todas(self, padrao: str) -> List[dict]:
+        """Requisições que casaram com o padrão, na ordem de envio"""
+        self._sincronizar()
+        with self._cond:
+            return list(self.indice.get(padrao, []))
+
+    def ultima(self, padrao: str) -> Optional[dict]:
+        """Requisição mais recente do padrão (ou None)"""
+        self._sincronizar()
+        with self._cond:
+            registros = self.indice.get(padrao)
+            return registros[-1] if registros else None
+
+    def contar(self, padrao: str) -> int:
+        self._sincronizar()
+        with self._cond:
+            return len(self.indice.get(padrao, []))
+
+    def aguardar(self, padrao: str, timeout: float = 10, apos: int = 0) -> Optional[dict]:
+        """
+        Aguarda uma requisição concluída do padrão.
+
+        Args:
+            apos: ignora as ``apos`` primeiras ocorrências (use ``contar()``
+                  antes da ação para esperar apenas pela próxima chamada)
+        """
+        limite = time.time() + timeout
+        while True:
+            self._sincronizar()
+            with self._cond:
+                registros = self.indice.get(padrao, [])[apos:]
+                concluidas = [r for r in registros if r['concluida']]
+                if concluidas:
+                    return concluidas[-1]
+                restante = limite - time.time()
+                if restante <= 0:
+                    return None
+                # No modo websocket os eventos acordam a espera; no fallback, faz polling
+                self._cond.wait(min(restante, 0.1))
+
+    def corpo_resposta(self, registro: dict) -> Optional[dict]:
+        """Corpo JSON da resposta (Network.getResponseBody), se ainda disponível"""
+        try:
+            corpo = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': registro['request_id']})
+            return json.loads(corpo.get('body') or 'null')
+        except Exception:
+            return None
+
+    def latencias(self) -> Dict[str, dict]:
+        """Resumo de latência (ms) por padrão: quantidade, média, mínimo e máximo"""
+        self._sincronizar()
+        resumo = {}
+        with self._cond:
+            for padrao, registros in self.indice.items():
+                duracoes = [r['duracao_ms'] for r in registros if r['duracao_ms'] is not None]
+                if not duracoes:
+                    continue
+                resumo[padrao] = {
+                    'quantidade': len(duracoes),
+                    'media_ms': round(sum(duracoes) / len(duracoes), 1),
+                    'min_ms': min(duracoes),
+                    'max_ms': max(duracoes),
+                }
+        return resumo
@@ -5,6 +5,28 @@ ORQUESTRADOR - Testes Automatizados de Novo Empreendimento
 Este orquestrador gerencia a execução sequencial de todos os testes
 do fluxo de cadastro de Novo Empreendimento.
 
+Também suporta o modo paralelo (pool de workers): N cadeias independentes
+(01 → 06) rodam ao mesmo tempo, cada uma com seu próprio navegador e seu
+próprio contexto. Ex.: uma cadeia por tipo de imóvel (RURAL/URBANO/LINEAR)
+ou N cópias da mesma cadeia para carga.
+
+Checkpoint e retomada (checkpoint.py): após cada teste com sucesso o contexto,
+o storage do navegador e os IDs criados são gravados em
+tests/output/checkpoints. Com --resume-from NN a cadeia reabre o wizard num
+navegador novo, restaura o estado da etapa NN-1 e segue direto do teste NN.
+
+Histórico (run_store.py): cada execução, o status/duração de cada teste e os
+JSONs parciais das etapas vão para tests/output/historico.sqlite
+(``python run_store.py tendencia --suite novo_empreendimento --etapa 04``).
+
+Métricas de página (page_metrics.py): cada teste concluído vira uma amostra
+(etapa "inscricao/NN ...") com LCP, CLS, long tasks e heap; a execução falha
+se alguma página estourar o orçamento de tests/perf_budget.json.
+
+Rastro de etapas (step_trace.py): cada teste é um span e suas ETAPAs ficam
+dentro dele, com o tempo dividido em WebDriver, espera e sono; o rastro vai
+para tests/output/traces (JSON + Chrome trace-event).
+
 Arquitetura:
 - Cada teste é um "agente" especializado em uma etapa
 - Testes são executados em cadeia (um chama o próximo)
@@ -18,6 +40,12 @@ Testes Disponíveis:
 04 - Atividades: Seleciona atividades e preenche quantidades
 05 - Caracterização: Preenche caracterização completa
 
+Uso:
+    python orchestrator_novo_empreendimento.py                          # Sequencial (1 navegador)
+    python orchestrator_novo_empreendimento.py --cenarios rural,urbano,linear
+    python orchestrator_novo_empreendimento.py --copias 4 --workers 2   # Carga
+    python orchestrator_novo_empreendimento.py --resume-from 04         # Retoma do teste 04
+
 Autor: GitHub Copilot
 Data: 2025-11-22
 Branch: feature/evolucao-features
@@ -25,24 +53,48 @@ Branch: feature/evolucao-features
 
 import time
 import sys
+import argparse
+import importlib
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from concurrent.futures import ThreadPoolExecutor
+
+from driver_pool import obter_pool, obter_driver, devolver_driver
+from page_metrics import registrar_etapa, finalizar as finalizar_metricas
+from run_store import iniciar_execucao
+from step_trace import span
+from checkpoint import (
+    salvar_checkpoint, carregar_checkpoint, limpar_checkpoints,
+    restaurar_navegador, hidratar_store
+)
 
 # Configuração
 CHROME_DRIVER_PATH = "C:\\chromedriver\\chromedriver.exe"
 BASE_URL = "http://localhost:5173"
 USE_WEBDRIVER_MANAGER = True  # Usar webdriver-manager para compatibilidade automática
 
-# Importar testes
-import test_novo_empreendimento_01_menu_navegacao as teste01
-import test_novo_empreendimento_02_imovel as teste02
-import test_novo_empreendimento_03_dados_gerais as teste03
-import test_novo_empreendimento_04_atividades as teste04
-import test_novo_empreendimento_05_caracterizacao as teste05
-import test_novo_empreendimento_06_coletar_json as teste06
-# import test_novo_empreendimento_06_validacao_dados as teste_validacao  # Desativado - será refatorado para usar APIs
+# Testes da cadeia (nome, módulo, função): importados só no main, ao montar a
+# execução - importar o orquestrador (ex.: coleta do pytest) não carrega os seis
+TESTES_CADEIA = (
+    ("01 - Menu e Navegação", 'test_novo_empreendimento_01_menu_navegacao', 'executar_teste'),
+    ("02 - Etapa Imóvel", 'test_novo_empreendimento_02_imovel', 'executar_teste'),
+    ("03 - Etapa Dados Gerais", 'test_novo_empreendimento_03_dados_gerais', 'executar_teste'),
+    ("04 - Etapa Atividades", 'test_novo_empreendimento_04_atividades', 'executar_teste_atividades'),
+    ("05 - Etapa Caracterização", 'test_novo_empreendimento_05_caracterizacao', 'executar_teste_caracterizacao'),
+    ("06 - Coletar JSON do Store", 'test_novo_empreendimento_06_coletar_json', 'executar_teste_coletar_json'),
+    # ("06 - Validação de Dados", 'test_novo_empreendimento_06_validacao_dados', ...)  # Desativado - será refatorado para usar APIs
+)
+
+# Cenários disponíveis para o modo paralelo (uma cadeia por tipo de imóvel).
+# O contexto do cenário é repassado ao teste 01 e propagado pela cadeia;
+# o teste 02 usa 'tipo_imovel' em vez de sortear o tipo.
+CENARIOS_IMOVEL = {
+    'rural': {'tipo_imovel': 'RURAL'},
+    'urbano': {'tipo_imovel': 'URBANO'},
+    'linear': {'tipo_imovel': 'LINEAR'},
+}
+
+# Status que não impedem o fechamento do navegador / devolução ao pool
+STATUS_OK = ('sucesso', 'desativado', 'restaurado')
 
 
 class OrquestradorNovoEmpreendimento:
@@ -54,6 +106,8 @@ class OrquestradorNovoEmpreendimento:
         self.driver = None
         self.inicio = None
         self.fim = None
+        self.cadeias = []  # Preenchido apenas no modo paralelo
+        self.execucao = None  # Execução no histórico (run_store)
         
     def adicionar_teste(self, nome, funcao, ativo=True):
         """Adiciona um teste à lista de execução."""
@@ -64,8 +118,8 @@ class OrquestradorNovoEmpreendimento:
             'status': 'pendente'
         })
     
-    def executar_todos(self):
-        """Executa todos os testes em sequência."""
+    def executar_todos(self, retomar_de=None):
+        """Executa todos os testes em sequência (opcionalmente a partir do teste ``retomar_de``)."""
         print("=" * 100)
         print(" " * 25 + "ORQUESTRADOR DE TESTES - NOVO EMPREENDIMENTO")
         print("=" * 100)
@@ -73,35 +127,151 @@ class OrquestradorNovoEmpreendimento:
         print(f"🌐 URL Base: {BASE_URL}")
         print(f"🔧 ChromeDriver: {CHROME_DRIVER_PATH}")
         print(f"📋 Total de testes: {len([t for t in self.testes if t['ativo']])}")
+        if retomar_de:
+            print(f"♻️  Retomando do teste {retomar_de:02d} (checkpoint da etapa {retomar_de - 1:02d})")
         print("\n" + "=" * 100 + "\n")
         
+        self.execucao = iniciar_execucao('novo_empreendimento', {'modo': 'sequencial', 'retomar_de': retomar_de})
+        self.inicio = time.time()
+        self.driver = self._executar_cadeia(self.testes, retomar_de=retomar_de)
+        self.fim = time.time()
+        self.gerar_relatorio()
+        self.salvar_historico()
+    
+    def executar_paralelo(self, cenarios, max_workers=None, retomar_de=None):
+        """
+        Executa N cadeias independentes em paralelo (pool de workers).
+        
+        Cada cadeia recebe uma cópia da lista de testes, um navegador
+        emprestado do pool compartilhado (driver_pool) e mantém o próprio
+        contexto. Cadeias que terminam com sucesso devolvem o navegador ao
+        pool; cadeias com erro o mantêm aberto para debug.
+        
+        Args:
+            cenarios: Lista de tuplas (nome, contexto_inicial) - uma por cadeia
+            max_workers: Número máximo de cadeias simultâneas (padrão: todas)
+            retomar_de: Retoma cada cadeia do teste informado (checkpoint por cadeia)
+        """
+        max_workers = max_workers or len(cenarios)
+        
+        print("=" * 100)
+        print(" " * 20 + "ORQUESTRADOR DE TESTES - NOVO EMPREENDIMENTO (MODO PARALELO)")
+        print("=" * 100)
+        print(f"\n📅 Data/Hora: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
+        print(f"🌐 URL Base: {BASE_URL}")
+        print(f"🧵 Cadeias: {len(cenarios)} | Workers: {max_workers}")
+        print(f"📋 Testes por cadeia: {len([t for t in self.testes if t['ativo']])}")
+        print("\n" + "=" * 100 + "\n")
+        
+        self.cadeias = [
+            {
+                'nome': nome,
+                'cenario': cenario,
+                # Cópia dos testes: status/duração são por cadeia
+                'testes': [
+                    {'nome': t['nome'], 'funcao': t['funcao'], 'ativo': t['ativo'], 'status': 'pendente'}
+                    for t in self.testes
+                ],
+                'driver': None,
+                'inicio': None,
+                'fim': None
+            }
+            for nome, cenario in cenarios
+        ]
+        
+        pool_drivers = obter_pool(tamanho=max_workers)
+        
+        def executar(cadeia):
+            cadeia['inicio'] = time.time()
+            try:
+                cadeia['driver'] = self._executar_cadeia(
+                    cadeia['testes'],
+                    contexto_inicial=dict(cadeia['cenario']),
+                    rotulo=f"[{cadeia['nome']}] ",
+                    driver=pool_drivers.obter(),
+                    retomar_de=retomar_de
+                )
+            finally:
+                cadeia['fim'] = time.time()
+            
+            if all(t['status'] in STATUS_OK for t in cadeia['testes']):
+                pool_drivers.devolver(cadeia['driver'])
+                cadeia['driver'] = None
+            return cadeia
+        
+        self.execucao = iniciar_execucao('novo_empreendimento', {
+            'modo': 'paralelo', 'cadeias': [c['nome'] for c in self.cadeias],
+            'workers': max_workers, 'retomar_de': retomar_de,
+        })
         self.inicio = time.time()
-        contexto_anterior = None
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='cadeia') as pool:
+            list(pool.map(executar, self.cadeias))
+        self.fim = time.time()
+        
+        self.gerar_relatorio()
+        self.salvar_historico()
+    
+    def _executar_cadeia(self, testes, contexto_inicial=None, rotulo='', driver=None, retomar_de=None):
+        """
+        Executa uma cadeia de testes (01 → N), parando no primeiro erro.
+        
+        Registra status, erro e duração (wall time) em cada item de `testes`
+        e grava um checkpoint após cada teste com sucesso.
+        
+        Args:
+            driver: WebDriver já aberto (ex.: emprestado do pool) repassado ao teste 01
+            retomar_de: Número do teste a partir do qual retomar (usa o checkpoint anterior)
         
-        for idx, teste in enumerate(self.testes, 1):
+        Returns:
+            WebDriver usado pela cadeia (ou None se não chegou a ser criado)
+        """
+        contexto_anterior = contexto_inicial
+        cadeia = (contexto_inicial or {}).get('cadeia', 'padrao')
+        
+        if retomar_de:
+            driver = driver or obter_driver()
+            try:
+                driver, contexto_anterior = self._retomar_cadeia(testes, retomar_de, cadeia, rotulo, driver)
+            except Exception as e:
+                print(f"\n{rotulo}❌ Não foi possível retomar do teste {retomar_de:02d}: {e}")
+                teste = testes[retomar_de - 1]
+                teste['status'] = 'erro'
+                teste['erro'] = f"Retomada falhou: {e}"
+                return driver
+        limpar_checkpoints(cadeia, a_partir_de=retomar_de or 1)
+        
+        for idx, teste in enumerate(testes, 1):
+            if teste['status'] == 'restaurado':
+                continue
             if not teste['ativo']:
-                print(f"⏭️  Teste {idx} - {teste['nome']}: DESATIVADO")
+                print(f"{rotulo}⏭️  Teste {idx} - {teste['nome']}: DESATIVADO")
                 teste['status'] = 'desativado'
                 continue
             
             print(f"\n{'=' * 100}")
-            print(f"▶️  EXECUTANDO TESTE {idx}/{len(self.testes)}: {teste['nome']}")
+            print(f"{rotulo}▶️  EXECUTANDO TESTE {idx}/{len(testes)}: {teste['nome']}")
             print(f"{'=' * 100}\n")
             
+            inicio_teste = time.time()
             try:
-                # Primeiro teste não recebe driver
-                if idx == 1:
-                    contexto = teste['funcao']()
-                else:
-                    # Testes subsequentes recebem driver e contexto
-                    contexto = teste['funcao'](
-                        driver_existente=self.driver,
-                        contexto_anterior=contexto_anterior
-                    )
+                # Span do teste no rastro de etapas (as ETAPAs do teste ficam dentro dele)
+                with span(f"{idx:02d} {teste['nome']}", cadeia=cadeia) as trecho:
+                    # Primeiro teste não recebe driver (cria o próprio navegador)
+                    if idx == 1 and contexto_anterior is None and driver is None:
+                        contexto = teste['funcao']()
+                    else:
+                        # Testes subsequentes recebem driver e contexto
+                        contexto = teste['funcao'](
+                            driver_existente=driver,
+                            contexto_anterior=contexto_anterior
+                        )
+                    if trecho is not None and contexto['status'] != 'sucesso':
+                        trecho.status = 'erro'
+                teste['duracao'] = time.time() - inicio_teste
                 
                 # Salvar driver para próximos testes
                 if 'driver' in contexto:
-                    self.driver = contexto['driver']
+                    driver = contexto['driver']
                 
                 # Verificar status
                 if contexto['status'] == 'sucesso':
@@ -109,7 +279,14 @@ class OrquestradorNovoEmpreendimento:
                     teste['contexto'] = contexto
                     contexto_anterior = contexto
                     
-                    print(f"\n✅ Teste {idx} - {teste['nome']}: SUCESSO")
+                    print(f"\n{rotulo}✅ Teste {idx} - {teste['nome']}: SUCESSO ({teste['duracao']:.2f}s)")
+                    registrar_etapa(driver, f"{rotulo}inscricao/{idx:02d} {teste['nome']}")
+                    
+                    try:
+                        caminho = salvar_checkpoint(idx, teste['nome'], contexto, driver, cadeia)
+                        print(f"{rotulo}💾 Checkpoint salvo: {caminho.name}")
+                    except Exception as e:
+                        print(f"{rotulo}⚠️ Checkpoint não salvo: {e}")
                     
                     # Pequena pausa entre testes
                     time.sleep(2)
@@ -117,68 +294,118 @@ class OrquestradorNovoEmpreendimento:
                     teste['status'] = 'erro'
                     teste['erro'] = contexto.get('erro', 'Erro desconhecido')
                     
-                    print(f"\n❌ Teste {idx} - {teste['nome']}: FALHOU")
+                    print(f"\n{rotulo}❌ Teste {idx} - {teste['nome']}: FALHOU")
                     print(f"   Erro: {teste['erro']}")
                     
                     # Parar execução
-                    print(f"\n🛑 EXECUÇÃO INTERROMPIDA NO TESTE {idx}")
+                    print(f"\n{rotulo}🛑 EXECUÇÃO INTERROMPIDA NO TESTE {idx}")
                     break
                     
             except Exception as e:
+                teste['duracao'] = time.time() - inicio_teste
                 teste['status'] = 'erro'
                 teste['erro'] = str(e)
                 
-                print(f"\n❌ Teste {idx} - {teste['nome']}: EXCEÇÃO")
+                print(f"\n{rotulo}❌ Teste {idx} - {teste['nome']}: EXCEÇÃO")
                 print(f"   Erro: {str(e)}")
                 
                 # Parar execução
-                print(f"\n🛑 EXECUÇÃO INTERROMPIDA NO TESTE {idx}")
+                print(f"\n{rotulo}🛑 EXECUÇÃO INTERROMPIDA NO TESTE {idx}")
                 break
         
-        self.fim = time.time()
-        self.gerar_relatorio()
+        return driver
+    
+    def _retomar_cadeia(self, testes, retomar_de, cadeia, rotulo, driver):
+        """
+        Restaura o estado do checkpoint ``retomar_de - 1`` num navegador novo.
+        
+        O store do wizard é só em memória e o teste 01 é quem abre o wizard
+        (startNewEmpreendimento zera o store). Por isso: restaura storage e
+        cookies, reexecuta o teste 01 (login via API + navegação), reidrata o
+        store com o snapshot do checkpoint e devolve o contexto gravado.
+        
+        Returns:
+            (driver, contexto) para continuar a cadeia a partir de ``retomar_de``
+        """
+        checkpoint = carregar_checkpoint(retomar_de - 1, cadeia)
+        print(f"{rotulo}♻️  Checkpoint carregado: etapa {checkpoint['etapa']:02d} - {checkpoint['nome']} "
+              f"({checkpoint['criado_em']})")
+        for chave, valor in checkpoint.get('ids', {}).items():
+            print(f"{rotulo}   • {chave}: {valor}")
+        
+        restaurar_navegador(driver, checkpoint)
+        
+        inicio = time.time()
+        reabertura = testes[0]['funcao'](driver_existente=driver, contexto_anterior=checkpoint['contexto'])
+        if reabertura.get('status') != 'sucesso':
+            raise RuntimeError(f"wizard não reaberto: {reabertura.get('erro', 'erro desconhecido')}")
+        
+        if hidratar_store(driver, checkpoint):
+            print(f"{rotulo}✓ Store do wizard reidratado (step {checkpoint['store'].get('currentStep')})")
+        else:
+            print(f"{rotulo}⚠️ Store do wizard não exposto (build de produção?) - wizard segue no step inicial")
+        
+        duracao = time.time() - inicio
+        for teste in testes[:retomar_de - 1]:
+            if teste['ativo']:
+                teste['status'] = 'restaurado'
+        testes[0]['duracao'] = duracao
+        print(f"{rotulo}♻️  Estado restaurado em {duracao:.2f}s - seguindo do teste {retomar_de:02d}")
+        
+        contexto = dict(checkpoint['contexto'])
+        contexto['driver'] = driver
+        contexto['wait'] = reabertura.get('wait')
+        return driver, contexto
+    
+    def todos_os_testes(self):
+        """Retorna os testes de todas as cadeias (ou da execução sequencial)."""
+        if self.cadeias:
+            return [t for cadeia in self.cadeias for t in cadeia['testes']]
+        return self.testes
     
     def gerar_relatorio(self):
-        """Gera relatório final da execução."""
+        """Gera relatório final da execução (unificado no modo paralelo)."""
         print("\n" + "=" * 100)
         print(" " * 35 + "RELATÓRIO FINAL")
         print("=" * 100 + "\n")
         
         tempo_total = self.fim - self.inicio
+        testes = self.todos_os_testes()
         
-        sucesso = len([t for t in self.testes if t['status'] == 'sucesso'])
-        erro = len([t for t in self.testes if t['status'] == 'erro'])
-        desativado = len([t for t in self.testes if t['status'] == 'desativado'])
-        pendente = len([t for t in self.testes if t['status'] == 'pendente'])
+        sucesso = len([t for t in testes if t['status'] == 'sucesso'])
+        erro = len([t for t in testes if t['status'] == 'erro'])
+        desativado = len([t for t in testes if t['status'] == 'desativado'])
+        pendente = len([t for t in testes if t['status'] == 'pendente'])
+        restaurado = len([t for t in testes if t['status'] == 'restaurado'])
         
         print(f"⏱️  Tempo total: {tempo_total:.2f}s")
+        if self.cadeias:
+            tempo_somado = sum(c['fim'] - c['inicio'] for c in self.cadeias)
+            print(f"🧵 Cadeias: {len(self.cadeias)} | Soma dos tempos das cadeias: {tempo_somado:.2f}s "
+                  f"(ganho: {tempo_somado / tempo_total:.1f}x)")
         print(f"📊 Resumo:")
         print(f"   ✅ Sucesso: {sucesso}")
         print(f"   ❌ Erro: {erro}")
         print(f"   ⏭️  Desativado: {desativado}")
         print(f"   ⏸️  Pendente: {pendente}")
+        if restaurado:
+            print(f"   ♻️  Restaurado (checkpoint): {restaurado}")
         print("\n" + "-" * 100 + "\n")
         
         print("📋 Detalhes:")
-        for idx, teste in enumerate(self.testes, 1):
-            status_icon = {
-                'sucesso': '✅',
-                'erro': '❌',
-                'desativado': '⏭️',
-                'pendente': '⏸️'
-            }.get(teste['status'], '❓')
-            
-            print(f"   {idx}. {status_icon} {teste['nome']}: {teste['status'].upper()}")
-            
-            if teste['status'] == 'erro' and 'erro' in teste:
-                print(f"      ↳ Erro: {teste['erro']}")
+        if self.cadeias:
+            for cadeia in self.cadeias:
+                print(f"\n   🧵 Cadeia '{cadeia['nome']}' - {cadeia['fim'] - cadeia['inicio']:.2f}s")
+                self._imprimir_detalhes(cadeia['testes'], indentacao="      ")
+        else:
+            self._imprimir_detalhes(self.testes, indentacao="   ")
         
         print("\n" + "=" * 100 + "\n")
         
         # Resultado final
         if erro > 0:
             print("❌ EXECUÇÃO FALHOU - Corrija os erros antes de prosseguir")
-            print(f"   Primeiro erro no teste: {[t['nome'] for t in self.testes if t['status'] == 'erro'][0]}")
+            print(f"   Primeiro erro no teste: {[t['nome'] for t in testes if t['status'] == 'erro'][0]}")
         elif pendente > 0:
             print("⏸️  EXECUÇÃO PARCIAL - Alguns testes não foram executados")
         else:
@@ -186,63 +413,160 @@ class OrquestradorNovoEmpreendimento:
         
         print("\n" + "=" * 100 + "\n")
     
+    def salvar_historico(self):
+        """Grava status e duração de cada teste no histórico de execuções (run_store)."""
+        if self.execucao is None:
+            return
+        testes = self.todos_os_testes()
+        if any(t['status'] == 'erro' for t in testes):
+            status = 'erro'
+        elif any(t['status'] == 'pendente' for t in testes):
+            status = 'parcial'
+        else:
+            status = 'sucesso'
+        try:
+            if self.cadeias:
+                for cadeia in self.cadeias:
+                    self.execucao.registrar_etapas(cadeia['testes'], cadeia=cadeia['nome'])
+            else:
+                self.execucao.registrar_etapas(self.testes, cadeia='padrao')
+            self.execucao.finalizar(status, duracao=self.fim - self.inicio)
+            print(f"🗄️  Execução #{self.execucao.id} gravada no histórico (run_store.py)")
+        except Exception as e:
+            print(f"⚠️ Histórico não gravado: {e}")
+    
+    def _imprimir_detalhes(self, testes, indentacao="   "):
+        """Imprime status e duração de cada etapa."""
+        for idx, teste in enumerate(testes, 1):
+            status_icon = {
+                'sucesso': '✅',
+                'erro': '❌',
+                'desativado': '⏭️',
+                'pendente': '⏸️',
+                'restaurado': '♻️'
+            }.get(teste['status'], '❓')
+            
+            duracao = f" ({teste['duracao']:.2f}s)" if 'duracao' in teste else ""
+            print(f"{indentacao}{idx}. {status_icon} {teste['nome']}: {teste['status'].upper()}{duracao}")
+            
+            if teste['status'] == 'erro' and 'erro' in teste:
+                print(f"{indentacao}   ↳ Erro: {teste['erro']}")
+    
     def fechar_navegador(self):
-        """Fecha o navegador se estiver aberto."""
-        if self.driver:
-            try:
-                self.driver.quit()
-                print("🔒 Navegador fechado")
-            except:
-                pass
+        """Fecha o(s) navegador(es) se estiver(em) aberto(s)."""
+        drivers = [self.driver] + [c['driver'] for c in self.cadeias]
+        for driver in drivers:
+            if driver:
+                try:
+                    # Drivers do pool voltam ao pool; os demais são encerrados
+                    devolver_driver(driver)
+                    print("🔒 Navegador fechado")
+                except:
+                    pass
+        self.driver = None
+        for cadeia in self.cadeias:
+            cadeia['driver'] = None
+    
+    def possui_navegador(self):
+        """Indica se há algum navegador aberto."""
+        return bool(self.driver or any(c['driver'] for c in self.cadeias))
 
 
-def main():
-    """Função principal."""
-    print("\n🚀 Iniciando Orquestrador de Testes - Novo Empreendimento\n")
+def montar_cenarios(nomes_cenarios=None, copias=1):
+    """
+    Monta a lista de cenários (nome, contexto_inicial) para o modo paralelo.
     
-    # Criar orquestrador
-    orquestrador = OrquestradorNovoEmpreendimento()
+    Args:
+        nomes_cenarios: Lista com chaves de CENARIOS_IMOVEL (ex: ['rural', 'urbano'])
+        copias: Número de cópias de cada cenário (ou da cadeia padrão, se não houver cenários)
+    """
+    base = [(nome, CENARIOS_IMOVEL[nome]) for nome in (nomes_cenarios or [])] or [('padrao', {})]
     
-    # Adicionar testes na ordem de execução
-    orquestrador.adicionar_teste(
-        nome="01 - Menu e Navegação",
-        funcao=teste01.executar_teste,
-        ativo=True
+    cenarios = []
+    for nome, cenario in base:
+        for copia in range(1, copias + 1):
+            rotulo = nome if copias == 1 else f"{nome}-{copia}"
+            cenarios.append((rotulo, dict(cenario, cadeia=rotulo)))
+    return cenarios
+
+
+def parse_args(argv=None):
+    """Lê os argumentos de linha de comando."""
+    parser = argparse.ArgumentParser(
+        description='Orquestrador de testes - Novo Empreendimento',
+        formatter_class=argparse.RawDescriptionHelpFormatter
     )
-    
-    orquestrador.adicionar_teste(
-        nome="02 - Etapa Imóvel",
-        funcao=teste02.executar_teste,
-        ativo=True
+    parser.add_argument(
+        '--cenarios',
+        help=f"Cadeias paralelas por tipo de imóvel, separadas por vírgula ({', '.join(CENARIOS_IMOVEL)})"
     )
-    
-    orquestrador.adicionar_teste(
-        nome="03 - Etapa Dados Gerais",
-        funcao=teste03.executar_teste,
-        ativo=True
+    parser.add_argument(
+        '--copias',
+        type=int,
+        default=1,
+        help='Número de cópias de cada cadeia (modo paralelo / carga)'
     )
-    
-    orquestrador.adicionar_teste(
-        nome="04 - Etapa Atividades",
-        funcao=teste04.executar_teste_atividades,
-        ativo=True
+    parser.add_argument(
+        '--resume-from',
+        dest='resume_from',
+        type=int,
+        default=None,
+        metavar='NN',
+        help='Retoma a cadeia do teste NN usando o checkpoint da etapa anterior (ex: 04)'
     )
-    
-    orquestrador.adicionar_teste(
-        nome="05 - Etapa Caracterização",
-        funcao=teste05.executar_teste_caracterizacao,
-        ativo=True
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Número máximo de cadeias simultâneas (padrão: uma por cadeia)'
     )
+    args = parser.parse_args(argv)
     
-    orquestrador.adicionar_teste(
-        nome="06 - Coletar JSON do Store",
-        funcao=teste06.executar_teste_coletar_json,
-        ativo=True
-    )
+    args.lista_cenarios = [c.strip().lower() for c in args.cenarios.split(',')] if args.cenarios else []
+    invalidos = [c for c in args.lista_cenarios if c not in CENARIOS_IMOVEL]
+    if invalidos:
+        parser.error(f"Cenário(s) inválido(s): {', '.join(invalidos)}")
+    if args.copias < 1:
+        parser.error("--copias deve ser >= 1")
+    
+    if args.resume_from is not None and args.resume_from < 2:
+        parser.error("--resume-from deve ser >= 02 (não há checkpoint antes do teste 01)")
+    
+    args.paralelo = bool(args.lista_cenarios) or args.copias > 1
+    return args
+
+
+def main(argv=None):
+    """Função principal."""
+    args = parse_args(argv)
+    
+    print("\n🚀 Iniciando Orquestrador de Testes - Novo Empreendimento\n")
+    
+    # Criar orquestrador
+    orquestrador = OrquestradorNovoEmpreendimento()
+    
+    # Adicionar testes na ordem de execução
+    for nome, modulo, funcao in TESTES_CADEIA:
+        orquestrador.adicionar_teste(
+            nome=nome,
+            funcao=getattr(importlib.import_module(modulo), funcao),
+            ativo=True
+        )
+    
+    if args.resume_from and args.resume_from > len(orquestrador.testes):
+        print(f"❌ --resume-from {args.resume_from:02d}: só existem {len(orquestrador.testes)} testes")
+        return 2
     
     # Executar todos os testes
     try:
-        orquestrador.executar_todos()
+        if args.paralelo:
+            orquestrador.executar_paralelo(
+                montar_cenarios(args.lista_cenarios, args.copias),
+                max_workers=args.workers,
+                retomar_de=args.resume_from
+            )
+        else:
+            orquestrador.executar_todos(retomar_de=args.resume_from)
         
         # ===================================================================
         # VALIDAÇÃO DE DADOS NO BANCO - COMENTADO
@@ -273,9 +597,8 @@ def main():
         print("\n\n⚠️  Execução interrompida pelo usuário (Ctrl+C)")
     finally:
         # Fechar navegador automaticamente se todos os testes passaram
-        if orquestrador.driver:
-            todos_sucesso = all(t['status'] == 'sucesso' or t['status'] == 'desativado' 
-                               for t in orquestrador.testes)
+        if orquestrador.possui_navegador():
+            todos_sucesso = all(t['status'] in STATUS_OK for t in orquestrador.todos_os_testes())
             
             if todos_sucesso:
                 print("\n" + "=" * 100)
@@ -299,7 +622,11 @@ def main():
                     orquestrador.fechar_navegador()
     
     # Retornar código de saída apropriado
-    if any(t['status'] == 'erro' for t in orquestrador.testes):
+    violacoes = finalizar_metricas()
+    if any(t['status'] == 'erro' for t in orquestrador.todos_os_testes()):
+        return 1
+    if violacoes:
+        print(f"\n❌ {len(violacoes)} métrica(s) de página acima do orçamento (tests/perf_budget.json)")
         return 1
     return 0
 
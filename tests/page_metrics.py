@@ -0,0 +1,419 @@
+"""
+Métricas de desempenho das páginas e orçamento por página (Selenium)
+====================================================================
+
+As suítes Selenium só conferiam se os elementos acabavam aparecendo; nenhuma
+registrava quanto as páginas demoravam. Este módulo instrumenta os drivers
+criados pelo ``driver_pool`` e, para cada página/etapa visitada, coleta:
+
+- Navigation Timing (TTFB, DOMContentLoaded, load, bytes transferidos) e FCP;
+- LCP, CLS e long tasks (``PerformanceObserver`` instalado em todo documento
+  via ``Page.addScriptToEvaluateOnNewDocument``);
+- heap JS, nós do DOM e tempo de script/layout/tarefas do renderer via CDP
+  ``Performance.getMetrics``.
+
+Cada amostra cobre uma "janela": de um ``driver.get`` (ou do fim da etapa
+anterior) até a próxima navegação, o próximo ``registrar_etapa`` ou a
+devolução do driver ao pool. A coleta é feita ao sair da janela, quando LCP e
+CLS já se estabilizaram. Em etapas de SPA (sem navegação de documento, ex.:
+passos do wizard ``/inscricao``) as métricas de navegação ficam ``None`` e não
+contam para o orçamento.
+
+Uso nas suítes (o driver do pool já vem instrumentado):
+
+    from page_metrics import registrar_etapa
+
+    driver.get(f"{BASE_URL}/dashboard")     # amostra '/dashboard'
+    ...                                     # ações do passo do wizard
+    registrar_etapa(driver, 'inscricao/imovel')
+
+Ao fim do processo as amostras vão para ``tests/output/perf/metricas_*.json``
+e são conferidas contra o orçamento (``perf_budget.json``): limites em
+``padrao`` valem para todas as páginas e cada chave ``/caminho`` sobrescreve
+os limites das páginas com esse prefixo (vale o prefixo mais longo). Os
+runners (orchestrator, crud_engine, driver_pool) falham a execução quando
+alguma página estoura o orçamento. Para conferir um relatório já gravado:
+
+    python page_metrics.py --verificar output/perf/metricas_20251127_101500_1234.json
+
+Variáveis de ambiente:
+    PERF_METRICAS   true/false - instrumenta os drivers do pool (padrão: true)
+    PERF_ORCAMENTO  arquivo JSON do orçamento (padrão: tests/perf_budget.json)
+    PERF_DIR        pasta dos relatórios (padrão: tests/output/perf)
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+import argparse
+import threading
+import weakref
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+
+# ==============================================================================
+# CONFIGURAÇÕES
+# ==============================================================================
+
+HABILITADO = os.getenv('PERF_METRICAS', 'true').lower() == 'true'
+ORCAMENTO_PADRAO = Path(os.getenv('PERF_ORCAMENTO', Path(__file__).resolve().parent / 'perf_budget.json'))
+PERF_DIR = Path(os.getenv('PERF_DIR', Path(__file__).resolve().parent / 'output' / 'perf'))
+
+# Métricas conferidas pelo orçamento (limite máximo de cada uma)
+METRICAS_ORCAMENTO = ('ttfb_ms', 'load_ms', 'fcp_ms', 'lcp_ms', 'cls', 'long_tasks_ms', 'heap_mb', 'nos_dom')
+
+# Observadores instalados antes de qualquer script da página
+OBSERVADOR_JS = """
+(function () {
+  if (window.__metricasPagina || !window.PerformanceObserver) return;
+  var m = window.__metricasPagina = {lcp: null, cls: 0, clsMarca: 0, longTasks: []};
+  function observar(tipo, callback) {
+    try { new PerformanceObserver(function (lista) { lista.getEntries().forEach(callback); })
+            .observe({type: tipo, buffered: true}); } catch (e) {}
+  }
+  observar('largest-contentful-paint', function (e) { m.lcp = e.startTime; });
+  observar('layout-shift', function (e) {
+    if (!e.hadRecentInput) { m.cls += e.value; m.clsMarca += e.value; }
+  });
+  observar('longtask', function (e) { m.longTasks.push([e.startTime, e.duration]); });
+})();
+"""
+
+# Leitura da janela atual; arguments[0] = performance.now() da marca anterior
+COLETA_JS = """
+var marca = arguments[0] || 0;
+var m = window.__metricasPagina || null;
+var nav = performance.getEntriesByType('navigation')[0];
+var fcp = performance.getEntriesByName('first-contentful-paint')[0];
+var tarefas = m ? m.longTasks.filter(function (t) { return t[0] >= marca; }) : [];
+var r = {
+  origem: performance.timeOrigin, agora: performance.now(), url: location.href,
+  observado: !!m, lcp: m ? m.lcp : null, cls: m ? m.cls : null, clsMarca: m ? m.clsMarca : null,
+  fcp: fcp ? fcp.startTime : null, longTasks: tarefas.length,
+  longTasksMs: tarefas.reduce(function (s, t) { return s + t[1]; }, 0),
+  nav: nav ? {ttfb: nav.responseStart, dcl: nav.domContentLoadedEventEnd,
+              load: nav.loadEventEnd, bytes: nav.transferSize} : null
+};
+if (m) m.clsMarca = 0;
+return r;
+"""
+
+
+# ==============================================================================
+# ESTADO POR DRIVER
+# ==============================================================================
+
+class _Janela:
+    """Intervalo medido de um driver (desde a última navegação/etapa)"""
+
+    def __init__(self, rotulo: Optional[str] = None, origem: Optional[float] = None, marca: float = 0):
+        self.rotulo = rotulo
+        self.origem = origem      # performance.timeOrigin na marca (None = documento novo)
+        self.marca = marca        # performance.now() na marca
+        self.inicio = time.time()
+
+
+class _EstadoDriver:
+    def __init__(self):
+        self.janela = _Janela()
+        self.cdp_anterior: Dict[str, float] = {}
+        self.lock = threading.Lock()
+
+
+_estados = weakref.WeakKeyDictionary()
+_estados_lock = threading.Lock()
+
+_amostras: List[dict] = []
+_amostras_lock = threading.Lock()
+_relatorio: Dict[str, object] = {'caminho': None, 'salvas': 0, 'violacoes': [], 'atexit': False}
+
+
+def instrumentar(driver):
+    """
+    Ativa a coleta no driver (idempotente).
+
+    Instala os observadores em todo documento novo, habilita o domínio CDP
+    ``Performance`` e envolve ``driver.get`` para fechar a amostra da página
+    anterior e abrir a da próxima.
+    """
+    with _estados_lock:
+        if driver in _estados:
+            return driver
+        _estados[driver] = _EstadoDriver()
+        if not _relatorio['atexit']:
+            # Registrado depois do encerrar_pool: roda antes dele, com os drivers vivos
+            atexit.register(finalizar)
+            _relatorio['atexit'] = True
+
+    for comando, params in (('Page.addScriptToEvaluateOnNewDocument', {'source': OBSERVADOR_JS}),
+                            ('Performance.enable', {'timeDomain': 'timeTicks'})):
+        try:
+            driver.execute_cdp_cmd(comando, params)
+        except Exception:
+            pass
+
+    get_original = driver.get
+
+    def get(url):
+        coletar(driver)
+        get_original(url)
+        estado = _estados.get(driver)
+        if estado is not None:
+            estado.janela = _Janela(_caminho(url))
+
+    driver.get = get
+    return driver
+
+
+def _caminho(url: str) -> Optional[str]:
+    partes = urlparse(url or '')
+    if partes.scheme not in ('http', 'https'):
+        return None
+    return partes.path.rstrip('/') or '/'
+
+
+def _metricas_cdp(driver) -> Dict[str, float]:
+    try:
+        resposta = driver.execute_cdp_cmd('Performance.getMetrics', {})
+        return {m['name']: m['value'] for m in resposta.get('metrics', [])}
+    except Exception:
+        return {}
+
+
+def _ms(valor) -> Optional[float]:
+    return round(valor, 1) if valor else None
+
+
+def coletar(driver, etapa: Optional[str] = None) -> Optional[dict]:
+    """
+    Fecha a janela atual do driver e registra a amostra.
+
+    Args:
+        etapa: nome da etapa (padrão: caminho do ``driver.get`` que abriu a janela)
+
+    Returns:
+        amostra registrada, ou None (driver sem instrumentação, página fora
+        do app como ``about:blank``, janela sem nome ou driver sem resposta)
+    """
+    estado = _estados.get(driver)
+    if estado is None:
+        return None
+    with estado.lock:
+        janela = estado.janela
+        try:
+            dados = driver.execute_script(COLETA_JS, janela.marca if janela.origem else 0)
+        except Exception:
+            return None
+        cdp = _metricas_cdp(driver)
+        # Próxima janela começa aqui (mesmo documento até haver outra navegação);
+        # sem driver.get no meio, ela só vira amostra com o nome de uma etapa
+        estado.janela = _Janela(None, dados.get('origem'), dados.get('agora') or 0)
+        pagina = _caminho(dados.get('url'))
+        if pagina is None or not (etapa or janela.rotulo):
+            estado.cdp_anterior = cdp
+            return None
+
+        # Documento novo desde a marca: vale o Navigation Timing / LCP dele
+        documento_novo = janela.origem is None or janela.origem != dados.get('origem')
+        nav = (dados.get('nav') or {}) if documento_novo else {}
+        anterior, estado.cdp_anterior = estado.cdp_anterior, cdp
+
+    def delta(nome):
+        if nome not in cdp:
+            return None
+        return round(max(0.0, cdp[nome] - anterior.get(nome, 0.0)) * 1000, 1)
+
+    amostra = {
+        'etapa': etapa or janela.rotulo,
+        'pagina': pagina,
+        'url': dados.get('url'),
+        'navegacao': documento_novo,
+        'quando': datetime.fromtimestamp(janela.inicio).isoformat(timespec='seconds'),
+        'duracao_ms': round((time.time() - janela.inicio) * 1000, 1),
+        'ttfb_ms': _ms(nav.get('ttfb')),
+        'dcl_ms': _ms(nav.get('dcl')),
+        'load_ms': _ms(nav.get('load')),
+        'bytes': nav.get('bytes'),
+        'fcp_ms': _ms(dados.get('fcp')) if documento_novo else None,
+        'lcp_ms': _ms(dados.get('lcp')) if documento_novo else None,
+        'cls': round(dados.get('cls' if documento_novo else 'clsMarca') or 0, 4) if dados.get('observado') else None,
+        'long_tasks': dados.get('longTasks') if dados.get('observado') else None,
+        'long_tasks_ms': round(dados.get('longTasksMs') or 0, 1) if dados.get('observado') else None,
+        'heap_mb': round(cdp['JSHeapUsedSize'] / 2 ** 20, 1) if 'JSHeapUsedSize' in cdp else None,
+        'nos_dom': int(cdp['Nodes']) if 'Nodes' in cdp else None,
+        'script_ms': delta('ScriptDuration'),
+        'layout_ms': delta('LayoutDuration'),
+        'tarefas_ms': delta('TaskDuration'),
+    }
+    with _amostras_lock:
+        _amostras.append(amostra)
+    return amostra
+
+
+def registrar_etapa(driver, nome: str) -> Optional[dict]:
+    """
+    Marca o fim da etapa ``nome`` (ex.: passo do wizard) e registra a amostra.
+
+    Instrumenta o driver se ainda não estiver (ex.: navegador criado pelo
+    próprio teste 01); nesse caso a primeira amostra só traz as métricas CDP.
+    """
+    if not HABILITADO or driver is None:
+        return None
+    instrumentar(driver)
+    return coletar(driver, etapa=nome)
+
+
+def fechar(driver):
+    """Registra a janela aberta e descarta o estado (ex.: ao resetar a sessão do pool)"""
+    coletar(driver)
+    estado = _estados.get(driver)
+    if estado is not None:
+        with estado.lock:
+            estado.janela = _Janela()
+            estado.cdp_anterior = {}
+
+
+def amostras() -> List[dict]:
+    with _amostras_lock:
+        return list(_amostras)
+
+
+# ==============================================================================
+# ORÇAMENTO
+# ==============================================================================
+
+def carregar_orcamento(caminho=None) -> dict:
+    caminho = Path(caminho or ORCAMENTO_PADRAO)
+    if not caminho.exists():
+        return {}
+    with open(caminho, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def limites_pagina(pagina: str, orcamento: dict) -> dict:
+    """Limites de ``padrao`` sobrescritos pela chave de prefixo mais longo que casar com a página"""
+    casados = [p for p in orcamento if p.startswith('/') and (pagina == p or pagina.startswith(p.rstrip('/') + '/'))]
+    limites = dict(orcamento.get('padrao', {}))
+    if casados:
+        limites.update(orcamento[max(casados, key=len)])
+    return limites
+
+
+def verificar_orcamento(lista: List[dict], orcamento: dict) -> List[dict]:
+    """Violações (etapa, página, métrica, valor, limite); métricas ``None`` não contam"""
+    violacoes = []
+    for amostra in lista:
+        limites = limites_pagina(amostra['pagina'], orcamento)
+        for metrica in METRICAS_ORCAMENTO:
+            valor, limite = amostra.get(metrica), limites.get(metrica)
+            if valor is not None and limite is not None and valor > limite:
+                violacoes.append({'etapa': amostra['etapa'], 'pagina': amostra['pagina'],
+                                  'metrica': metrica, 'valor': valor, 'limite': limite})
+    return violacoes
+
+
+# ==============================================================================
+# RELATÓRIO
+# ==============================================================================
+
+def salvar_relatorio(lista: List[dict], violacoes: List[dict], orcamento_arquivo=None) -> Path:
+    """Grava o JSON da execução (um arquivo por processo, reescrito a cada chamada)"""
+    if _relatorio['caminho'] is None:
+        nome = f"metricas_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}.json"
+        _relatorio['caminho'] = PERF_DIR / nome
+    caminho = _relatorio['caminho']
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump({
+            'gerado_em': datetime.now().isoformat(timespec='seconds'),
+            'orcamento': str(orcamento_arquivo or ORCAMENTO_PADRAO),
+            'amostras': lista,
+            'violacoes': violacoes,
+        }, f, indent=2, ensure_ascii=False)
+    return caminho
+
+
+def _fmt(valor, sufixo=''):
+    if valor is None:
+        return '-'
+    if isinstance(valor, float) and valor >= 10:
+        valor = round(valor)
+    return f"{valor}{sufixo}"
+
+
+def imprimir_resumo(lista: List[dict], violacoes: List[dict], caminho: Optional[Path] = None):
+    print("\n" + "=" * 80)
+    print("⏱️  MÉTRICAS DAS PÁGINAS")
+    print("=" * 80)
+    print(f"  {'Etapa':<34} {'load':>7} {'LCP':>7} {'CLS':>6} {'LT ms':>6} {'heap':>7}")
+    for a in lista:
+        print(f"  {a['etapa'][:34]:<34} {_fmt(a['load_ms']):>7} {_fmt(a['lcp_ms']):>7} "
+              f"{_fmt(a['cls']):>6} {_fmt(a['long_tasks_ms']):>6} {_fmt(a['heap_mb'], 'MB'):>7}")
+    if violacoes:
+        print(f"\n❌ {len(violacoes)} métrica(s) acima do orçamento:")
+        for v in violacoes:
+            print(f"   {v['etapa']} ({v['pagina']}): {v['metrica']} = {v['valor']} > {v['limite']}")
+    else:
+        print("\n✅ Todas as páginas dentro do orçamento")
+    if caminho:
+        print(f"📄 {caminho}")
+    print("=" * 80)
+
+
+def finalizar(orcamento_arquivo=None) -> List[dict]:
+    """
+    Fecha as janelas abertas, grava o relatório e confere o orçamento.
+
+    Pode ser chamado pelos runners (para falhar a execução) e também roda no
+    ``atexit``; sem amostras novas desde a última chamada, só devolve as
+    violações já apuradas.
+
+    Returns:
+        lista de violações do orçamento
+    """
+    with _estados_lock:
+        drivers = list(_estados.keys())
+    for driver in drivers:
+        coletar(driver)
+
+    lista = amostras()
+    if not lista or len(lista) == _relatorio['salvas']:
+        return list(_relatorio['violacoes'])
+
+    violacoes = verificar_orcamento(lista, carregar_orcamento(orcamento_arquivo))
+    caminho = salvar_relatorio(lista, violacoes, orcamento_arquivo)
+    _relatorio['salvas'] = len(lista)
+    _relatorio['violacoes'] = violacoes
+    imprimir_resumo(lista, violacoes, caminho)
+    return list(violacoes)
+
+
+# ==============================================================================
+# CLI: conferir um relatório gravado contra o orçamento
+# ==============================================================================
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Confere um relatório de métricas das páginas contra o orçamento',
+        formatter_class=argparse.RawDescriptionHelpFormatter, epilog=__doc__)
+    parser.add_argument('--verificar', required=True, help='Relatório metricas_*.json')
+    parser.add_argument('--orcamento', default=str(ORCAMENTO_PADRAO), help='Arquivo do orçamento')
+    args = parser.parse_args(argv)
+
+    with open(args.verificar, 'r', encoding='utf-8') as f:
+        lista = json.load(f).get('amostras', [])
+    violacoes = verificar_orcamento(lista, carregar_orcamento(args.orcamento))
+    imprimir_resumo(lista, violacoes)
+    return 1 if violacoes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,491 @@
+"""
+Histórico de execuções em SQLite (etapas, durações e payloads)
+==============================================================
+
+Cada execução da cadeia de Novo Empreendimento deixava em ``tests/output/``
+um ``imovel_json_*``, ``dados_gerais_json_*``, ``atividades_json_*``,
+``caracterizacao_json_*`` e ``empreendimento_json_*`` com timestamp, e o que
+``gerar_relatorio`` / ``print_summary`` imprimiam se perdia ao fim do
+processo. Não havia como responder "o teste 04 ficou mais lento?".
+
+Este módulo guarda tudo num SQLite local (``tests/output/historico.sqlite``):
+
+- ``execucoes``: suíte, início, duração, status e metadados de cada execução;
+- ``etapas``: status, duração e erro de cada teste/etapa (por cadeia);
+- ``payloads``: JSONs coletados, comprimidos (zlib) e deduplicados pelo
+  SHA-256 do conteúdo canônico - a mesma caracterização gravada em 50
+  execuções ocupa espaço uma vez só;
+- ``payloads_execucao``: qual payload cada etapa gerou em cada execução.
+
+Uso nas suítes:
+
+    from run_store import iniciar_execucao, salvar_payload, carregar_payload
+
+    execucao = iniciar_execucao('novo_empreendimento', {'modo': 'sequencial'})
+    referencia = salvar_payload('atividades', json_parcial)   # hash do conteúdo
+    execucao.registrar_etapa('Atividades', 'sucesso', duracao=12.4, ordem=4)
+    execucao.finalizar('sucesso')
+
+``salvar_payload`` vincula o payload à execução em andamento no processo (se
+houver); scripts rodados sozinhos gravam o payload sem execução.
+
+Consultas (CLI):
+
+    python run_store.py execucoes --suite novo_empreendimento
+    python run_store.py tendencia --suite novo_empreendimento --etapa 04 --ultimas 50
+    python run_store.py regressoes --suite workflow_engine --recentes 5 --limiar 1.3
+    python run_store.py payload 3f2a9c... --saida empreendimento.json
+    python run_store.py importar --remover      # migra os *_json_*.json soltos de output/
+
+``regressoes`` termina com código 1 quando alguma etapa regrediu (uso em CI).
+
+Variáveis de ambiente:
+    RUN_STORE   caminho do banco (padrão: tests/output/historico.sqlite)
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import zlib
+import socket
+import sqlite3
+import hashlib
+import argparse
+import threading
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+RUN_STORE = Path(os.getenv('RUN_STORE', Path(__file__).resolve().parent / 'output' / 'historico.sqlite'))
+OUTPUT_DIR = Path(__file__).resolve().parent / 'output'
+
+# Arquivos soltos que o histórico substitui (etapa do payload → padrão do nome)
+PADROES_LEGADOS = {
+    'imovel': 'imovel_json_*.json',
+    'dados_gerais': 'dados_gerais_json_*.json',
+    'atividades': 'atividades_json_*.json',
+    'caracterizacao': 'caracterizacao_json_*.json',
+    'empreendimento': 'empreendimento_json_*.json',
+}
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS execucoes (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    suite       TEXT NOT NULL,
+    iniciada_em REAL NOT NULL,
+    duracao     REAL,
+    status      TEXT NOT NULL,
+    host        TEXT,
+    commit_git  TEXT,
+    metadados   TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_execucoes_suite ON execucoes (suite, iniciada_em);
+
+CREATE TABLE IF NOT EXISTS etapas (
+    execucao_id INTEGER NOT NULL REFERENCES execucoes (id) ON DELETE CASCADE,
+    ordem       INTEGER,
+    nome        TEXT NOT NULL,
+    cadeia      TEXT NOT NULL DEFAULT '',
+    status      TEXT NOT NULL,
+    duracao     REAL,
+    erro        TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_etapas_execucao ON etapas (execucao_id);
+
+CREATE TABLE IF NOT EXISTS payloads (
+    hash        TEXT PRIMARY KEY,
+    dados       BLOB NOT NULL,
+    tamanho     INTEGER NOT NULL,
+    criado_em   REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS payloads_execucao (
+    execucao_id INTEGER REFERENCES execucoes (id) ON DELETE CASCADE,
+    etapa       TEXT NOT NULL,
+    cadeia      TEXT NOT NULL DEFAULT '',
+    hash        TEXT NOT NULL REFERENCES payloads (hash),
+    criado_em   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_payloads_etapa ON payloads_execucao (etapa, criado_em);
+"""
+
+_inicializados = set()
+_lock = threading.Lock()
+
+
+def conectar(caminho=None) -> sqlite3.Connection:
+    """Conexão nova com o esquema garantido (uma por operação: seguro entre threads)"""
+    caminho = Path(caminho or RUN_STORE)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    conexao = sqlite3.connect(str(caminho), timeout=30)
+    conexao.row_factory = sqlite3.Row
+    conexao.execute('PRAGMA foreign_keys = ON')
+    with _lock:
+        if str(caminho) not in _inicializados:
+            conexao.execute('PRAGMA journal_mode = WAL')
+            conexao.executescript(ESQUEMA)
+            _inicializados.add(str(caminho))
+    return conexao
+
+
+def _commit_git() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=Path(__file__).resolve().parent, timeout=5).stdout.strip() or None
+    except Exception:
+        return None
+
+
+# ==============================================================================
+# EXECUÇÕES
+# ==============================================================================
+
+class Execucao:
+    """Execução em andamento: etapas e payloads vão para o mesmo ``execucao_id``"""
+
+    def __init__(self, suite: str, metadados: Optional[dict] = None, caminho=None):
+        self.suite = suite
+        self.caminho = caminho
+        self.inicio = time.time()
+        with conectar(caminho) as conexao:
+            cursor = conexao.execute(
+                'INSERT INTO execucoes (suite, iniciada_em, status, host, commit_git, metadados) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (suite, self.inicio, 'em_andamento', socket.gethostname(), _commit_git(),
+                 json.dumps(metadados or {}, ensure_ascii=False, default=str)))
+            self.id = cursor.lastrowid
+        conexao.close()
+
+    def registrar_etapa(self, nome: str, status: str, duracao: Optional[float] = None,
+                        erro: Optional[str] = None, ordem: Optional[int] = None, cadeia: str = ''):
+        with conectar(self.caminho) as conexao:
+            conexao.execute(
+                'INSERT INTO etapas (execucao_id, ordem, nome, cadeia, status, duracao, erro) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (self.id, ordem, nome, cadeia or '', status, duracao, erro))
+        conexao.close()
+
+    def registrar_etapas(self, testes: List[dict], cadeia: str = ''):
+        """Registra a lista de testes no formato do orquestrador (nome/status/duracao/erro)"""
+        for ordem, teste in enumerate(testes, 1):
+            self.registrar_etapa(teste['nome'], teste['status'], teste.get('duracao'),
+                                 teste.get('erro'), ordem, cadeia)
+
+    def salvar_payload(self, etapa: str, dados: Any, cadeia: str = '') -> str:
+        return salvar_payload(etapa, dados, cadeia, execucao=self)
+
+    def finalizar(self, status: str, duracao: Optional[float] = None):
+        global _execucao_atual
+        duracao = time.time() - self.inicio if duracao is None else duracao
+        with conectar(self.caminho) as conexao:
+            conexao.execute('UPDATE execucoes SET status = ?, duracao = ? WHERE id = ?',
+                            (status, duracao, self.id))
+        conexao.close()
+        with _lock:
+            if _execucao_atual is self:
+                _execucao_atual = None
+
+
+_execucao_atual: Optional[Execucao] = None
+
+
+def iniciar_execucao(suite: str, metadados: Optional[dict] = None, caminho=None) -> Execucao:
+    """Abre uma execução e a torna a execução corrente do processo"""
+    global _execucao_atual
+    execucao = Execucao(suite, metadados, caminho)
+    with _lock:
+        _execucao_atual = execucao
+    return execucao
+
+
+def execucao_atual() -> Optional[Execucao]:
+    return _execucao_atual
+
+
+# ==============================================================================
+# PAYLOADS (comprimidos e deduplicados)
+# ==============================================================================
+
+def _canonico(dados: Any) -> bytes:
+    return json.dumps(dados, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def salvar_payload(etapa: str, dados: Any, cadeia: str = '', execucao: Optional[Execucao] = None,
+                   caminho=None) -> str:
+    """
+    Grava o JSON de uma etapa e retorna o hash (SHA-256) do conteúdo.
+
+    Conteúdo idêntico é armazenado uma única vez; cada chamada registra só o
+    vínculo etapa → hash (na execução corrente, se houver).
+    """
+    execucao = execucao or _execucao_atual
+    caminho = caminho or (execucao.caminho if execucao else None)
+    bruto = _canonico(dados)
+    chave = hashlib.sha256(bruto).hexdigest()
+    agora = time.time()
+    with conectar(caminho) as conexao:
+        conexao.execute('INSERT OR IGNORE INTO payloads (hash, dados, tamanho, criado_em) VALUES (?, ?, ?, ?)',
+                        (chave, zlib.compress(bruto, 6), len(bruto), agora))
+        conexao.execute('INSERT INTO payloads_execucao (execucao_id, etapa, cadeia, hash, criado_em) '
+                        'VALUES (?, ?, ?, ?, ?)',
+                        (execucao.id if execucao else None, etapa, cadeia or '', chave, agora))
+    conexao.close()
+    return chave
+
+
+def carregar_payload(chave: Optional[str], caminho=None) -> Optional[Any]:
+    """JSON do payload pelo hash (aceita prefixo com 8+ caracteres); None se não existir"""
+    if not chave or len(chave) < 8:
+        return None
+    conexao = conectar(caminho)
+    try:
+        linha = conexao.execute('SELECT dados FROM payloads WHERE hash LIKE ? ORDER BY criado_em DESC LIMIT 1',
+                                (chave + '%',)).fetchone()
+    finally:
+        conexao.close()
+    return json.loads(zlib.decompress(linha['dados']).decode('utf-8')) if linha else None
+
+
+def ultimo_payload(etapa: str, cadeia: Optional[str] = None, caminho=None) -> Optional[Any]:
+    """Payload mais recente da etapa (opcionalmente de uma cadeia)"""
+    sql = 'SELECT hash FROM payloads_execucao WHERE etapa = ?'
+    params: list = [etapa]
+    if cadeia is not None:
+        sql += ' AND cadeia = ?'
+        params.append(cadeia)
+    conexao = conectar(caminho)
+    try:
+        linha = conexao.execute(sql + ' ORDER BY criado_em DESC LIMIT 1', params).fetchone()
+    finally:
+        conexao.close()
+    return carregar_payload(linha['hash'], caminho) if linha else None
+
+
+# ==============================================================================
+# CONSULTAS
+# ==============================================================================
+
+def _percentil(ordenados: List[float], p: float) -> Optional[float]:
+    """Percentil por nearest-rank (mesma convenção de benchmark_workflow_engine)"""
+    if not ordenados:
+        return None
+    return ordenados[max(0, math.ceil(p / 100 * len(ordenados)) - 1)]
+
+
+def _filtro_etapa(etapa: Optional[str]):
+    """'04' / '4' casa com a ordem; outro texto casa com parte do nome"""
+    if not etapa:
+        return '', []
+    if etapa.isdigit():
+        return ' AND e.ordem = ?', [int(etapa)]
+    return ' AND e.nome LIKE ?', [f"%{etapa}%"]
+
+
+def duracoes_por_etapa(suite: str, ultimas: int = 50, etapa: Optional[str] = None,
+                       caminho=None) -> Dict[str, List[tuple]]:
+    """{nome da etapa: [(execucao_id, duracao), ...]} das últimas ``ultimas`` execuções, da mais antiga à mais nova"""
+    filtro, params = _filtro_etapa(etapa)
+    conexao = conectar(caminho)
+    try:
+        ids = [r['id'] for r in conexao.execute(
+            "SELECT id FROM execucoes WHERE suite = ? AND status != 'em_andamento' "
+            'ORDER BY iniciada_em DESC LIMIT ?', (suite, ultimas))]
+        if not ids:
+            return {}
+        linhas = conexao.execute(
+            f"SELECT e.execucao_id, e.ordem, e.nome, e.duracao FROM etapas e "
+            f"WHERE e.execucao_id IN ({','.join('?' * len(ids))}) AND e.status = 'sucesso' "
+            f"AND e.duracao IS NOT NULL{filtro} ORDER BY e.execucao_id, e.ordem",
+            ids + params).fetchall()
+    finally:
+        conexao.close()
+    grupos: Dict[str, List[tuple]] = {}
+    for linha in linhas:
+        rotulo = f"{linha['ordem']:02d} {linha['nome']}" if linha['ordem'] is not None else linha['nome']
+        grupos.setdefault(rotulo, []).append((linha['execucao_id'], linha['duracao']))
+    return grupos
+
+
+def tendencia(suite: str, ultimas: int = 50, etapa: Optional[str] = None, caminho=None) -> Dict[str, dict]:
+    """Estatísticas de duração (s) por etapa nas últimas execuções"""
+    resultado = {}
+    for rotulo, pares in duracoes_por_etapa(suite, ultimas, etapa, caminho).items():
+        tempos = sorted(d for _, d in pares)
+        resultado[rotulo] = {
+            'execucoes': len(tempos),
+            'media': round(sum(tempos) / len(tempos), 2),
+            'p50': round(_percentil(tempos, 50), 2),
+            'p95': round(_percentil(tempos, 95), 2),
+            'min': round(tempos[0], 2),
+            'max': round(tempos[-1], 2),
+            'ultima': round(pares[-1][1], 2),
+        }
+    return resultado
+
+
+def regressoes(suite: str, ultimas: int = 50, recentes: int = 5, limiar: float = 1.25,
+               minimo_s: float = 0.5, caminho=None) -> List[dict]:
+    """
+    Etapas cuja mediana nas ``recentes`` execuções mais novas passou de
+    ``limiar`` × a mediana das anteriores (janela de ``ultimas``), com pelo
+    menos ``minimo_s`` segundos de diferença.
+    """
+    encontradas = []
+    for rotulo, pares in duracoes_por_etapa(suite, ultimas, caminho=caminho).items():
+        base = sorted(d for _, d in pares[:-recentes])
+        atual = sorted(d for _, d in pares[-recentes:])
+        if len(base) < 3 or not atual:
+            continue
+        mediana_base, mediana_atual = _percentil(base, 50), _percentil(atual, 50)
+        if mediana_atual > mediana_base * limiar and mediana_atual - mediana_base >= minimo_s:
+            encontradas.append({
+                'etapa': rotulo,
+                'base_s': round(mediana_base, 2),
+                'atual_s': round(mediana_atual, 2),
+                'variacao': round(mediana_atual / mediana_base, 2) if mediana_base else None,
+                'amostras_base': len(base),
+                'amostras_atuais': len(atual),
+            })
+    return encontradas
+
+
+def listar_execucoes(suite: Optional[str] = None, ultimas: int = 20, caminho=None) -> List[dict]:
+    sql = ('SELECT x.*, (SELECT COUNT(*) FROM etapas e WHERE e.execucao_id = x.id) AS etapas, '
+           "(SELECT COUNT(*) FROM etapas e WHERE e.execucao_id = x.id AND e.status = 'erro') AS erros "
+           'FROM execucoes x')
+    params: list = []
+    if suite:
+        sql += ' WHERE x.suite = ?'
+        params.append(suite)
+    conexao = conectar(caminho)
+    try:
+        return [dict(r) for r in conexao.execute(sql + ' ORDER BY x.iniciada_em DESC LIMIT ?', params + [ultimas])]
+    finally:
+        conexao.close()
+
+
+def importar_legados(pasta=OUTPUT_DIR, remover: bool = False, caminho=None) -> int:
+    """Migra os ``*_json_*.json`` soltos de ``pasta`` para o histórico (sem execução vinculada)"""
+    importados = 0
+    for etapa, padrao in PADROES_LEGADOS.items():
+        for arquivo in sorted(Path(pasta).glob(padrao)):
+            try:
+                with open(arquivo, 'r', encoding='utf-8') as f:
+                    dados = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"  ⚠️ {arquivo.name}: {e}")
+                continue
+            salvar_payload(etapa, dados, cadeia='importado', caminho=caminho)
+            importados += 1
+            if remover:
+                arquivo.unlink()
+    return importados
+
+
+# ==============================================================================
+# CLI
+# ==============================================================================
+
+def _data(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp).strftime('%d/%m/%Y %H:%M')
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Consulta o histórico de execuções das suítes',
+        formatter_class=argparse.RawDescriptionHelpFormatter, epilog=__doc__)
+    parser.add_argument('--banco', default=None, help=f'Arquivo SQLite (padrão: {RUN_STORE})')
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    p = sub.add_parser('execucoes', help='Lista as execuções mais recentes')
+    p.add_argument('--suite')
+    p.add_argument('--ultimas', type=int, default=20)
+
+    p = sub.add_parser('tendencia', help='Média/p50/p95 da duração de cada etapa')
+    p.add_argument('--suite', required=True)
+    p.add_argument('--etapa', help="Ordem ('04') ou parte do nome da etapa")
+    p.add_argument('--ultimas', type=int, default=50)
+
+    p = sub.add_parser('regressoes', help='Etapas que ficaram mais lentas (código 1 se houver)')
+    p.add_argument('--suite', required=True)
+    p.add_argument('--ultimas', type=int, default=50)
+    p.add_argument('--recentes', type=int, default=5, help='Execuções comparadas com as anteriores')
+    p.add_argument('--limiar', type=float, default=1.25, help='Razão mínima entre medianas (padrão: 1.25)')
+    p.add_argument('--minimo', type=float, default=0.5, help='Diferença mínima em segundos (padrão: 0.5)')
+
+    p = sub.add_parser('payload', help='Exibe/exporta um payload pelo hash')
+    p.add_argument('hash')
+    p.add_argument('--saida', help='Grava o JSON neste arquivo')
+
+    p = sub.add_parser('importar', help='Migra os *_json_*.json soltos de tests/output')
+    p.add_argument('--remover', action='store_true', help='Apaga os arquivos importados')
+
+    args = parser.parse_args(argv)
+    banco = args.banco
+
+    if args.comando == 'execucoes':
+        execucoes = listar_execucoes(args.suite, args.ultimas, banco)
+        if not execucoes:
+            print("📭 Nenhuma execução registrada")
+            return 0
+        print(f"{'ID':>5}  {'Suíte':<22} {'Início':<17} {'Duração':>9}  {'Status':<13} Etapas")
+        for x in execucoes:
+            duracao = f"{x['duracao']:.1f}s" if x['duracao'] is not None else '-'
+            erros = f" ({x['erros']} com erro)" if x['erros'] else ''
+            print(f"{x['id']:>5}  {x['suite']:<22} {_data(x['iniciada_em']):<17} {duracao:>9}  "
+                  f"{x['status']:<13} {x['etapas']}{erros}")
+        return 0
+
+    if args.comando == 'tendencia':
+        resultado = tendencia(args.suite, args.ultimas, args.etapa, banco)
+        if not resultado:
+            print(f"📭 Sem etapas com sucesso para '{args.suite}'")
+            return 0
+        print(f"📈 {args.suite} - últimas {args.ultimas} execuções (segundos)")
+        print(f"  {'Etapa':<40} {'n':>4} {'média':>7} {'p50':>7} {'p95':>7} {'máx':>7} {'última':>7}")
+        for rotulo, r in resultado.items():
+            print(f"  {rotulo[:40]:<40} {r['execucoes']:>4} {r['media']:>7.2f} {r['p50']:>7.2f} "
+                  f"{r['p95']:>7.2f} {r['max']:>7.2f} {r['ultima']:>7.2f}")
+        return 0
+
+    if args.comando == 'regressoes':
+        encontradas = regressoes(args.suite, args.ultimas, args.recentes, args.limiar, args.minimo, banco)
+        if not encontradas:
+            print(f"✅ Nenhuma etapa de '{args.suite}' regrediu (limiar {args.limiar}x)")
+            return 0
+        print(f"❌ {len(encontradas)} etapa(s) mais lenta(s) em '{args.suite}':")
+        for r in encontradas:
+            print(f"   {r['etapa']}: {r['base_s']:.2f}s → {r['atual_s']:.2f}s ({r['variacao']}x; "
+                  f"{r['amostras_base']} vs {r['amostras_atuais']} execuções)")
+        return 1
+
+    if args.comando == 'payload':
+        dados = carregar_payload(args.hash, banco)
+        if dados is None:
+            print(f"❌ Payload {args.hash} não encontrado")
+            return 1
+        texto = json.dumps(dados, indent=2, ensure_ascii=False)
+        if args.saida:
+            Path(args.saida).write_text(texto, encoding='utf-8')
+            print(f"💾 {args.saida}")
+        else:
+            print(texto)
+        return 0
+
+    if args.comando == 'importar':
+        total = importar_legados(remover=args.remover, caminho=banco)
+        print(f"📦 {total} arquivo(s) importado(s) para {banco or RUN_STORE}")
+        return 0
+
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
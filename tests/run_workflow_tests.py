@@ -7,6 +7,7 @@ Uso:
     python run_workflow_tests.py              # Executa todos os testes
     python run_workflow_tests.py --headless   # Executa em modo headless (padrão)
     python run_workflow_tests.py --show       # Executa mostrando o navegador
+    python run_workflow_tests.py --backend-local  # API/Supabase locais em memória (backend_local.py)
     python run_workflow_tests.py --help       # Mostra ajuda
 
 Variáveis de ambiente (arquivo .env):
@@ -87,11 +88,24 @@ def main():
         help='Executa em modo headless (padrão)'
     )
     
+    parser.add_argument(
+        '--backend-local',
+        action='store_true',
+        help='Sobe o backend local (API + Supabase REST em memória) e aponta os testes para ele'
+    )
+    
     args = parser.parse_args()
     
     # Carregar .env
     load_env()
     
+    backend = None
+    if args.backend_local:
+        from backend_local import iniciar_backend
+        backend = iniciar_backend()
+        os.environ.update(backend.variaveis_ambiente())
+        print(f"🧪 Backend local em {backend.api_url}")
+    
     # Verificar dependências
     if not check_dependencies():
         return 1
@@ -112,6 +126,10 @@ def main():
         import traceback
         traceback.print_exc()
         return 1
+    finally:
+        if backend:
+            print(f"📊 Backend local: {backend.resumo()}")
+            backend.encerrar()
 
 if __name__ == '__main__':
     sys.exit(main())
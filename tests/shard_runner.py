@@ -0,0 +1,483 @@
+"""
+Execução das suítes Selenium em shards balanceados por duração
+==============================================================
+
+``run_tests.py`` chama o pytest uma vez só e ``run_workflow_tests.py`` importa
+um único ``main``: não havia como dividir as suítes entre workers de CI.
+
+Este módulo:
+
+- lista as unidades de execução: cada script de suíte (``test_*.py`` fora da
+  cadeia de Novo Empreendimento + orquestrador, como na análise de impacto;
+  os catálogos rodam pelos wrappers ``test_*_selenium.py``, não pelo
+  ``crud_engine``) e, nos módulos pytest, cada classe de teste
+  (``arquivo::Classe``) - os testes de uma classe dividem estado (ex.: o
+  test_06 de test_api_parametrizacao.py lê a configuração gravada pelo
+  test_02) e nunca são separados entre shards. Módulos com funções de teste
+  soltas são uma unidade só (``arquivo``), e arquivos que mexem no mesmo
+  estado global (``MESMO_SHARD``) vão para o mesmo shard;
+- estima a duração de cada unidade pela mediana das últimas execuções
+  gravadas no histórico (``run_store``, suíte ``shards``); suítes sem
+  histórico usam a duração do ``impact_map.json`` ou a mediana das demais;
+- distribui as unidades em N shards pelo maior-primeiro (LPT): cada unidade
+  vai para o shard com menor carga estimada;
+- roda cada shard no próprio processo, com o próprio pool de Chrome headless
+  (``driver_pool``), grava a duração real de cada unidade no histórico e
+  junta os resultados num relatório único.
+
+Localmente (N processos nesta máquina):
+
+    python shard_runner.py planejar --shards 4
+    python shard_runner.py executar --shards 4
+
+Em CI (um shard por máquina, relatório mesclado no final):
+
+    python shard_runner.py planejar --shards 4 --saida plano.json   # artefato compartilhado
+    python shard_runner.py shard 2/4 --plano plano.json              # em cada máquina
+    python shard_runner.py mesclar output/shards/resultado_*.json
+
+Sem ``--plano``, cada máquina calcula o plano sozinha: ele é determinístico,
+mas só coincide entre máquinas se o histórico (``RUN_STORE``) for o mesmo.
+
+Variáveis de ambiente:
+    SHARD_DURACAO_PADRAO   estimativa (s) quando não há histórico nenhum (padrão: 60)
+    SHARD_HISTORICO        execuções consideradas na mediana (padrão: 20)
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import os
+import sys
+import ast
+import json
+import time
+import heapq
+import runpy
+import socket
+import argparse
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import run_store
+import impact_analysis
+
+
+# ==============================================================================
+# CONFIGURAÇÕES
+# ==============================================================================
+
+TESTS_DIR = Path(__file__).resolve().parent
+SHARDS_DIR = TESTS_DIR / 'output' / 'shards'
+SUITE_HISTORICO = 'shards'
+DURACAO_PADRAO = float(os.getenv('SHARD_DURACAO_PADRAO', '60'))
+HISTORICO = int(os.getenv('SHARD_HISTORICO', '20'))
+
+# Arquivos que alteram o mesmo estado global do servidor (a parametrização de
+# pesquisa/cadastro em /system-config): rodam no mesmo shard, em sequência
+MESMO_SHARD = (
+    ('test_api_parametrizacao.py', 'test_parametrizacao_empreendimento.py'),
+)
+
+
+# ==============================================================================
+# UNIDADES E ESTIMATIVAS
+# ==============================================================================
+
+def unidades_pytest(caminho: Path) -> List[str]:
+    """
+    Unidades indivisíveis de um módulo pytest (vazio para scripts): uma por
+    classe ``Test*`` (``arquivo::Classe``), ou o módulo inteiro (``arquivo``)
+    se ele tiver funções de teste soltas, que podem dividir estado do módulo.
+    """
+    try:
+        arvore = ast.parse(caminho.read_text(encoding='utf-8'))
+    except (SyntaxError, UnicodeDecodeError):
+        return []
+    usa_pytest = any(isinstance(no, ast.Import) and any(a.name == 'pytest' for a in no.names)
+                     for no in arvore.body)
+    if not usa_pytest:
+        return []
+    if any(isinstance(no, ast.FunctionDef) and no.name.startswith('test_') for no in arvore.body):
+        return [caminho.name]
+    return [f"{caminho.name}::{no.name}" for no in arvore.body
+            if isinstance(no, ast.ClassDef) and no.name.startswith('Test')
+            and any(isinstance(f, ast.FunctionDef) and f.name.startswith('test_') for f in no.body)]
+
+
+def _eh_pytest(unidade: str) -> bool:
+    return '::' in unidade or unidades_pytest(TESTS_DIR / unidade) == [unidade]
+
+
+def listar_unidades(suites: Optional[List[str]] = None) -> List[str]:
+    """Scripts de suíte e, nos módulos pytest, cada classe de teste"""
+    unidades = []
+    for suite in suites or impact_analysis.listar_suites():
+        nome = Path(suite).name
+        unidades.extend(unidades_pytest(TESTS_DIR / nome) or [nome])
+    return unidades
+
+
+def _mediana(valores: List[float]) -> float:
+    ordenados = sorted(valores)
+    meio = len(ordenados) // 2
+    return ordenados[meio] if len(ordenados) % 2 else (ordenados[meio - 1] + ordenados[meio]) / 2
+
+
+def duracoes_historicas(caminho=None) -> Dict[str, float]:
+    """Mediana da duração (s) de cada unidade nas últimas execuções de shard"""
+    pares = run_store.duracoes_por_etapa(SUITE_HISTORICO, HISTORICO, caminho=caminho)
+    return {unidade: _mediana([d for _, d in lista]) for unidade, lista in pares.items()}
+
+
+def estimar(unidades: List[str], historico: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+    """Duração estimada de cada unidade: histórico, mapa de impacto ou mediana das conhecidas"""
+    historico = duracoes_historicas() if historico is None else historico
+    mapa = impact_analysis.carregar_mapa().get('suites', {})
+    estimativas = {}
+    for unidade in unidades:
+        # Histórico antigo, gravado por função de teste, soma na classe
+        partes = [d for u, d in historico.items() if u.startswith(unidade + '::')]
+        if unidade in historico:
+            estimativas[unidade] = historico[unidade]
+        elif partes:
+            estimativas[unidade] = sum(partes)
+        elif '::' not in unidade and mapa.get(unidade, {}).get('duracao'):
+            estimativas[unidade] = mapa[unidade]['duracao']
+    padrao = _mediana(list(estimativas.values())) if estimativas else DURACAO_PADRAO
+    return {u: round(estimativas.get(u, padrao), 1) for u in unidades}
+
+
+def planejar(unidades: List[str], shards: int, estimativas: Dict[str, float]) -> List[List[str]]:
+    """
+    Maior-primeiro (LPT): a unidade mais longa vai para o shard menos carregado.
+
+    O resultado é determinístico (empates pelo nome) e cada shard mantém a
+    ordem original das unidades. Uma classe pytest é uma unidade só (ver
+    ``unidades_pytest``), então os testes dela sempre caem no mesmo shard; os
+    arquivos de ``MESMO_SHARD`` também.
+    """
+    ordem = {u: i for i, u in enumerate(unidades)}
+    # Unidades de MESMO_SHARD entram no LPT como um bloco só
+    blocos: Dict[str, List[str]] = {}
+    for unidade in unidades:
+        arquivo = unidade.split('::')[0]
+        grupo = next((g for g in MESMO_SHARD if arquivo in g), None)
+        blocos.setdefault(grupo[0] if grupo else unidade, []).append(unidade)
+    carga_bloco = {chave: sum(estimativas[u] for u in bloco) for chave, bloco in blocos.items()}
+
+    cargas = [(0.0, indice) for indice in range(shards)]
+    plano: List[List[str]] = [[] for _ in range(shards)]
+    for chave in sorted(blocos, key=lambda c: (-carga_bloco[c], c)):
+        carga, indice = heapq.heappop(cargas)
+        plano[indice].extend(blocos[chave])
+        heapq.heappush(cargas, (carga + carga_bloco[chave], indice))
+    return [sorted(shard, key=ordem.get) for shard in plano]
+
+
+def gerar_plano(shards: int, suites: Optional[List[str]] = None) -> dict:
+    unidades = listar_unidades(suites)
+    estimativas = estimar(unidades)
+    plano = planejar(unidades, shards, estimativas)
+    return {
+        'gerado_em': datetime.now().isoformat(timespec='seconds'),
+        'shards': [{'indice': i + 1, 'estimado': round(sum(estimativas[u] for u in shard), 1),
+                    'unidades': shard} for i, shard in enumerate(plano)],
+        'estimativas': estimativas,
+    }
+
+
+def ler_json(caminho: Path) -> dict:
+    with open(caminho, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def imprimir_plano(plano: dict):
+    print("=" * 80)
+    print(f"🧩 PLANO DE SHARDS ({len(plano['shards'])} shard(s), {len(plano['estimativas'])} unidade(s))")
+    print("=" * 80)
+    for shard in plano['shards']:
+        print(f"\n  Shard {shard['indice']}: ~{shard['estimado']:.0f}s em {len(shard['unidades'])} unidade(s)")
+        for unidade in shard['unidades']:
+            print(f"    {plano['estimativas'][unidade]:>7.1f}s  {unidade}")
+    cargas = [s['estimado'] for s in plano['shards']]
+    if cargas and max(cargas):
+        print(f"\n  Sequencial ~{sum(cargas):.0f}s | maior shard ~{max(cargas):.0f}s | "
+              f"ganho estimado {sum(cargas) / max(cargas):.2f}x")
+
+
+# ==============================================================================
+# EXECUÇÃO DE UM SHARD (neste processo)
+# ==============================================================================
+
+class _ColetorPytest:
+    """Plugin do pytest: soma setup/call/teardown de cada teste"""
+
+    def __init__(self):
+        self.resultados: Dict[str, dict] = {}
+
+    def pytest_runtest_logreport(self, report):
+        item = self.resultados.setdefault(report.nodeid, {'status': 'sucesso', 'duracao': 0.0, 'erro': None})
+        item['duracao'] += report.duration
+        if report.failed:
+            item['status'] = 'erro'
+            item['erro'] = item['erro'] or str(report.longreprtext).strip().splitlines()[-1][:500]
+        elif report.skipped and item['status'] == 'sucesso':
+            item['status'] = 'pulado'
+
+
+def _rodar_script(script: str) -> dict:
+    inicio = time.time()
+    status, erro = 'sucesso', None
+    try:
+        runpy.run_path(str(TESTS_DIR / script), run_name='__main__')
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            status, erro = 'erro', f"código de saída {e.code}"
+    except Exception as e:
+        status, erro = 'erro', str(e)[:500]
+    return {'unidade': script, 'status': status, 'duracao': round(time.time() - inicio, 2), 'erro': erro}
+
+
+def _rodar_pytest(ids: List[str]) -> List[dict]:
+    import pytest
+
+    coletor = _ColetorPytest()
+    pytest.main(['-q', '-s', '-p', 'no:cacheprovider', '--rootdir', str(TESTS_DIR)]
+                + [str(TESTS_DIR / i) for i in ids], plugins=[coletor])
+    resultados = []
+    for unidade in ids:
+        # Os testes da classe/módulo (e os parametrizados, "teste[param]") somam numa unidade só
+        itens = [r for nodeid, r in coletor.resultados.items()
+                 if nodeid == unidade or nodeid.startswith((unidade + '::', unidade + '['))]
+        if not itens:
+            resultados.append({'unidade': unidade, 'status': 'erro', 'duracao': 0.0, 'erro': 'teste não coletado'})
+            continue
+        status = next((s for s in ('erro', 'sucesso') if any(i['status'] == s for i in itens)), 'pulado')
+        resultados.append({'unidade': unidade, 'status': status,
+                           'duracao': round(sum(i['duracao'] for i in itens), 2),
+                           'erro': next((i['erro'] for i in itens if i['erro']), None)})
+    return resultados
+
+
+def executar_shard(unidades: List[str], indice: int, total: int, estimado: Optional[float] = None) -> dict:
+    """Roda as unidades em sequência num só pool de Chrome e grava as durações no histórico"""
+    import driver_pool
+    import page_metrics
+
+    execucao = run_store.Execucao(SUITE_HISTORICO, {'shard': f"{indice}/{total}", 'unidades': len(unidades)})
+    driver_pool.obter_pool()
+    sys.path.insert(0, str(TESTS_DIR))
+
+    resultados: List[dict] = []
+    inicio = time.time()
+    # Unidades pytest consecutivas do mesmo arquivo vão numa chamada só do pytest
+    grupos: List[List[str]] = []
+    for unidade in unidades:
+        if _eh_pytest(unidade) and grupos and _eh_pytest(grupos[-1][0]) \
+                and grupos[-1][0].split('::')[0] == unidade.split('::')[0]:
+            grupos[-1].append(unidade)
+        else:
+            grupos.append([unidade])
+
+    for grupo in grupos:
+        em_pytest = _eh_pytest(grupo[0])
+        print("\n" + "=" * 80)
+        print(f"▶️  [shard {indice}/{total}] {grupo[0].split('::')[0]}"
+              + (f" ({len(grupo)} unidade(s) pytest)" if em_pytest else ''))
+        print("=" * 80)
+        novos = _rodar_pytest(grupo) if em_pytest else [_rodar_script(grupo[0])]
+        for resultado in novos:
+            execucao.registrar_etapa(resultado['unidade'], resultado['status'],
+                                     resultado['duracao'], resultado['erro'])
+            print(f"⏱️  {resultado['unidade']}: {resultado['duracao']:.1f}s ({resultado['status']})")
+        resultados.extend(novos)
+
+    if page_metrics.finalizar():
+        resultados.append({'unidade': 'orcamento_performance', 'status': 'erro', 'duracao': 0.0,
+                           'erro': 'orçamento de performance violado'})
+    driver_pool.encerrar_pool()
+
+    duracao = round(time.time() - inicio, 2)
+    falhou = any(r['status'] == 'erro' for r in resultados)
+    execucao.finalizar('erro' if falhou else 'sucesso', duracao)
+    return {
+        'shard': indice,
+        'total': total,
+        'host': socket.gethostname(),
+        'iniciado_em': datetime.fromtimestamp(inicio).isoformat(timespec='seconds'),
+        'duracao': duracao,
+        'estimado': estimado,
+        'resultados': resultados,
+    }
+
+
+# ==============================================================================
+# EXECUÇÃO LOCAL PARALELA E RELATÓRIO
+# ==============================================================================
+
+def executar_local(plano: dict) -> List[dict]:
+    """Um processo (e um Chrome headless) por shard; logs em output/shards/shard_K.log"""
+    SHARDS_DIR.mkdir(parents=True, exist_ok=True)
+    arquivo_plano = SHARDS_DIR / 'plano.json'
+    with open(arquivo_plano, 'w', encoding='utf-8') as f:
+        json.dump(plano, f, ensure_ascii=False, indent=2)
+
+    total = len(plano['shards'])
+    ambiente = {**os.environ, 'HEADLESS': 'true', 'DRIVER_POOL_SIZE': '1', 'PYTHONUNBUFFERED': '1'}
+    processos = []
+    for shard in plano['shards']:
+        if not shard['unidades']:
+            continue
+        saida = SHARDS_DIR / f"resultado_{shard['indice']}.json"
+        log = open(SHARDS_DIR / f"shard_{shard['indice']}.log", 'w', encoding='utf-8')
+        processo = subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), 'shard', f"{shard['indice']}/{total}",
+             '--plano', str(arquivo_plano), '--saida', str(saida)],
+            cwd=str(TESTS_DIR), env=ambiente, stdout=log, stderr=subprocess.STDOUT)
+        processos.append((shard['indice'], processo, log, saida))
+        print(f"🚀 Shard {shard['indice']}/{total}: {len(shard['unidades'])} unidade(s), "
+              f"~{shard['estimado']:.0f}s (log: {log.name})")
+
+    resultados = []
+    for indice, processo, log, saida in processos:
+        codigo = processo.wait()
+        log.close()
+        if saida.exists():
+            resultados.append(ler_json(saida))
+            print(f"  ✓ Shard {indice} terminou (código {codigo})")
+        else:
+            print(f"  ❌ Shard {indice} terminou sem resultado (código {codigo}) - veja {log.name}")
+            resultados.append({'shard': indice, 'total': total, 'duracao': 0, 'resultados': [
+                {'unidade': f'shard_{indice}', 'status': 'erro', 'duracao': 0, 'erro': f"processo saiu com {codigo}"}]})
+    return resultados
+
+
+def mesclar(resultados: List[dict]) -> dict:
+    unidades = [r for shard in resultados for r in shard['resultados']]
+    soma = sum(r['duracao'] for r in unidades)
+    parede = max((s['duracao'] for s in resultados), default=0)
+    return {
+        'gerado_em': datetime.now().isoformat(timespec='seconds'),
+        'shards': [{k: v for k, v in s.items() if k != 'resultados'} for s in sorted(resultados, key=lambda s: s['shard'])],
+        'unidades': len(unidades),
+        'sucesso': sum(r['status'] == 'sucesso' for r in unidades),
+        'erro': sum(r['status'] == 'erro' for r in unidades),
+        'pulado': sum(r['status'] == 'pulado' for r in unidades),
+        'soma_duracoes': round(soma, 1),
+        'maior_shard': round(parede, 1),
+        'ganho': round(soma / parede, 2) if parede else None,
+        'falhas': [r for r in unidades if r['status'] == 'erro'],
+        'resultados': unidades,
+    }
+
+
+def imprimir_relatorio(relatorio: dict):
+    print("\n" + "=" * 80)
+    print("📊 RELATÓRIO DOS SHARDS")
+    print("=" * 80)
+    for shard in relatorio['shards']:
+        estimado = f" (estimado {shard['estimado']:.0f}s)" if shard.get('estimado') else ''
+        print(f"  Shard {shard['shard']}/{shard['total']} {shard.get('host', '')}: {shard['duracao']:.1f}s{estimado}")
+    print(f"\n  Unidades: {relatorio['unidades']} | ✓ {relatorio['sucesso']} | "
+          f"✗ {relatorio['erro']} | ⏭ {relatorio['pulado']}")
+    if relatorio['ganho']:
+        print(f"  Soma das durações {relatorio['soma_duracoes']:.0f}s | maior shard "
+              f"{relatorio['maior_shard']:.0f}s | ganho {relatorio['ganho']:.2f}x")
+    if relatorio['falhas']:
+        print("\n  ❌ Falhas:")
+        for falha in relatorio['falhas']:
+            print(f"     {falha['unidade']}: {falha['erro']}")
+    print("=" * 80)
+    print("✅ TODAS AS UNIDADES PASSARAM" if not relatorio['falhas'] else "❌ HÁ UNIDADES COM FALHA")
+
+
+def gravar_json(relatorio: dict, caminho: Optional[Path] = None) -> Path:
+    caminho = Path(caminho or SHARDS_DIR / f"relatorio_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump(relatorio, f, ensure_ascii=False, indent=2)
+    print(f"💾 Gravado em {caminho}")
+    return caminho
+
+
+# ==============================================================================
+# CLI
+# ==============================================================================
+
+def _ler_shard(texto: str) -> tuple:
+    try:
+        indice, total = (int(p) for p in texto.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError("use K/N, ex.: 2/4")
+    if not 1 <= indice <= total:
+        raise argparse.ArgumentTypeError(f"shard {indice} fora de 1..{total}")
+    return indice, total
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Divide as suítes Selenium em shards balanceados pela duração histórica',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    for nome, ajuda in (('planejar', 'Mostra (e grava) a divisão em shards'),
+                        ('executar', 'Roda todos os shards em paralelo nesta máquina')):
+        p = sub.add_parser(nome, help=ajuda)
+        p.add_argument('--shards', type=int, default=os.cpu_count() or 2, help='Número de shards')
+        p.add_argument('--suites', nargs='+', help='Suítes (padrão: todas as da análise de impacto)')
+        p.add_argument('--saida', type=Path, help='Arquivo JSON do plano / relatório')
+
+    p = sub.add_parser('shard', help='Roda um shard neste processo (uma máquina de CI)')
+    p.add_argument('shard', type=_ler_shard, help='K/N')
+    p.add_argument('--plano', type=Path, help='Plano gravado pelo "planejar" (padrão: calcula aqui)')
+    p.add_argument('--suites', nargs='+')
+    p.add_argument('--saida', type=Path, help='Resultado JSON (padrão: output/shards/resultado_K.json)')
+
+    p = sub.add_parser('mesclar', help='Junta os resultados dos shards num relatório')
+    p.add_argument('arquivos', nargs='+', type=Path)
+    p.add_argument('--saida', type=Path)
+    args = parser.parse_args(argv)
+
+    if args.comando == 'mesclar':
+        relatorio = mesclar([ler_json(a) for a in args.arquivos])
+        imprimir_relatorio(relatorio)
+        gravar_json(relatorio, args.saida)
+        return 1 if relatorio['falhas'] else 0
+
+    if args.comando == 'shard':
+        indice, total = args.shard
+        plano = ler_json(args.plano) if args.plano else gerar_plano(total, args.suites)
+        if len(plano['shards']) != total:
+            print(f"❌ O plano tem {len(plano['shards'])} shard(s), não {total}")
+            return 2
+        shard = plano['shards'][indice - 1]
+        resultado = executar_shard(shard['unidades'], indice, total, shard['estimado'])
+        saida = args.saida or SHARDS_DIR / f"resultado_{indice}.json"
+        gravar_json(resultado, saida)
+        return 1 if any(r['status'] == 'erro' for r in resultado['resultados']) else 0
+
+    if args.shards < 1:
+        parser.error('--shards precisa ser >= 1')
+    plano = gerar_plano(args.shards, args.suites)
+    imprimir_plano(plano)
+    if args.comando == 'planejar':
+        if args.saida:
+            gravar_json(plano, args.saida)
+        return 0
+
+    inicio = time.time()
+    relatorio = mesclar(executar_local(plano))
+    relatorio['parede'] = round(time.time() - inicio, 1)
+    imprimir_relatorio(relatorio)
+    print(f"⏱️  Tempo total (parede): {relatorio['parede']:.1f}s")
+    gravar_json(relatorio, args.saida)
+    return 1 if relatorio['falhas'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,403 @@
+"""
+Esperas orientadas a eventos (rede ociosa + DOM estável)
+========================================================
+
+Substitui os ``time.sleep(N)`` fixos das suítes Selenium. Em vez de pagar o
+pior caso em toda execução, as funções daqui retornam assim que a aplicação
+está de fato pronta:
+
+1. ``document.readyState == 'complete'``;
+2. nenhuma requisição XHR/fetch em andamento para o backend (``/api/v1``) ou
+   para o Supabase, acompanhando os eventos CDP ``Network.*`` do log de
+   performance (fallback: contador instrumentado em fetch/XMLHttpRequest);
+3. DOM sem mutações por ``quieto_ms`` (MutationObserver).
+
+Migração de um sleep existente (nunca fica mais lento que o sleep original,
+pois o ``timeout`` é o próprio tempo antigo):
+
+    time.sleep(3)                          # antes
+    aguardar_estavel(driver, timeout=3)    # depois
+
+Para esperas ligadas a um elemento, prefira as condições específicas:
+
+    aguardar_clicavel(driver, (By.XPATH, "//button[contains(., 'Salvar')]"))
+    aguardar_invisivel(driver, (By.CSS_SELECTOR, '.animate-spin'))
+    aguardar_quantidade(driver, (By.XPATH, "//label[contains(., 'Faixa')]"), 2)
+
+Pausas curtas (0.3-0.5s) depois de ``clear``/``send_keys``/``select`` ou de um
+``scrollIntoView`` instantâneo não esperam nada - o React atualiza o DOM no
+próprio evento. Nesses pontos não há espera; depois de um clique que adiciona ou
+remove itens, espera-se o item (``aguardar_quantidade`` / ``aguardar_removido``).
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import json
+import os
+import time
+import threading
+import weakref
+from collections import deque
+from typing import Iterable, Optional, Tuple
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+from step_trace import esperando
+
+
+# ==============================================================================
+# CONFIGURAÇÕES
+# ==============================================================================
+
+# Trechos de URL considerados "requisições da aplicação"
+PADROES_API = tuple(p for p in (
+    '/api/v1',
+    'supabase.co',
+    '/rest/v1/',
+    '/auth/v1/',
+    os.getenv('SUPABASE_URL', ''),
+) if p)
+
+TIPOS_RECURSO = ('XHR', 'Fetch')
+
+QUIETO_MS = int(os.getenv('WAIT_QUIETO_MS', '250'))      # DOM sem mutações
+OCIOSA_MS = int(os.getenv('WAIT_OCIOSA_MS', '250'))      # rede sem requisições
+INTERVALO_POLL = 0.05
+REQUISICAO_EXPIRA_S = 30  # requisições sem resposta (long polling) deixam de bloquear
+
+# Contador instrumentado em fetch/XHR (usado quando o log de performance não está habilitado)
+_JS_CONTADOR = """
+(function (padroes) {
+  if (window.__esperaRede) return;
+  var s = window.__esperaRede = {pendentes: 0, ultima: Date.now()};
+  function relevante(url) {
+    url = String(url || '');
+    for (var i = 0; i < padroes.length; i++) { if (url.indexOf(padroes[i]) !== -1) return true; }
+    return false;
+  }
+  function fim() { s.pendentes = Math.max(0, s.pendentes - 1); s.ultima = Date.now(); }
+  if (window.fetch) {
+    var f = window.fetch;
+    window.fetch = function (input) {
+      var url = (input && input.url) || input;
+      if (!relevante(url)) return f.apply(this, arguments);
+      s.pendentes++;
+      return f.apply(this, arguments).finally(fim);
+    };
+  }
+  var abrir = XMLHttpRequest.prototype.open, enviar = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.open = function (m, url) { this.__esperaUrl = url; return abrir.apply(this, arguments); };
+  XMLHttpRequest.prototype.send = function () {
+    if (relevante(this.__esperaUrl)) { s.pendentes++; this.addEventListener('loadend', fim); }
+    return enviar.apply(this, arguments);
+  };
+})(%s);
+"""
+
+_JS_DOM_QUIETO = """
+var quieto = arguments[0], limite = arguments[1], done = arguments[arguments.length - 1];
+var alvo = document.body || document.documentElement;
+if (!alvo || typeof MutationObserver === 'undefined') { done(true); return; }
+var timer, maximo;
+var obs = new MutationObserver(function () { clearTimeout(timer); timer = setTimeout(fim, quieto); });
+function fim() { obs.disconnect(); clearTimeout(maximo); done(true); }
+maximo = setTimeout(function () { obs.disconnect(); clearTimeout(timer); done(false); }, limite);
+obs.observe(alvo, {childList: true, subtree: true, attributes: true, characterData: true});
+timer = setTimeout(fim, quieto);
+"""
+
+
+# ==============================================================================
+# MONITOR DE REDE (CDP Network.* via log de performance)
+# ==============================================================================
+
+class MonitorRede:
+    """
+    Acompanha requisições em andamento de um driver.
+
+    Lê os eventos ``Network.requestWillBeSent`` / ``loadingFinished`` /
+    ``loadingFailed`` do log de performance. Como ``get_log`` consome as
+    entradas, elas ficam guardadas em ``historico`` para quem também precisa
+    delas (ver ``logs_performance``) e são repassadas aos ``ouvintes``
+    (ex.: ``network_recorder.GravadorRede``).
+    """
+
+    def __init__(self, driver, padroes: Iterable[str] = PADROES_API):
+        self.driver = driver
+        self.padroes = tuple(padroes)
+        self.em_andamento = {}  # requestId -> (url, inicio)
+        self.ultima_atividade = time.time()
+        self.historico = deque(maxlen=20000)
+        self.usa_cdp = True
+        self.ouvintes = []  # callbacks (metodo, params) para cada evento Network.* lido
+        self._contador_instalado = False
+        self._lock = threading.Lock()
+
+    def _relevante(self, url: str) -> bool:
+        return any(p in url for p in self.padroes)
+
+    def atualizar(self):
+        """Consome o log de performance e atualiza as requisições em andamento"""
+        if not self.usa_cdp:
+            return
+        try:
+            entradas = self.driver.get_log('performance')
+        except Exception:
+            # Driver sem goog:loggingPrefs: usa o contador instrumentado em JS
+            self.usa_cdp = False
+            return
+
+        with self._lock:
+            agora = time.time()
+            for entrada in entradas:
+                self.historico.append(entrada)
+                try:
+                    mensagem = json.loads(entrada['message'])['message']
+                except Exception:
+                    continue
+                metodo = mensagem.get('method', '')
+                params = mensagem.get('params', {})
+                for ouvinte in self.ouvintes:
+                    ouvinte(metodo, params)
+
+                if metodo == 'Network.requestWillBeSent':
+                    url = params.get('request', {}).get('url', '')
+                    if params.get('type') in TIPOS_RECURSO and self._relevante(url):
+                        self.em_andamento[params.get('requestId')] = (url, agora)
+                        self.ultima_atividade = agora
+                elif metodo in ('Network.loadingFinished', 'Network.loadingFailed'):
+                    if self.em_andamento.pop(params.get('requestId'), None):
+                        self.ultima_atividade = agora
+
+            # Long polling / requisições abandonadas não bloqueiam para sempre
+            for request_id, (_, inicio) in list(self.em_andamento.items()):
+                if agora - inicio > REQUISICAO_EXPIRA_S:
+                    self.em_andamento.pop(request_id, None)
+
+    def _estado_js(self) -> Tuple[int, float]:
+        """(pendentes, segundos desde a última resposta) pelo contador em JS"""
+        script = _JS_CONTADOR % json.dumps(list(self.padroes))
+        if not self._contador_instalado:
+            # Instala também nas próximas navegações, antes do app carregar
+            try:
+                self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': script})
+            except Exception:
+                pass
+            self._contador_instalado = True
+        try:
+            pendentes, ociosa_ms = self.driver.execute_script(
+                script + "return [window.__esperaRede.pendentes, Date.now() - window.__esperaRede.ultima];"
+            )
+            return int(pendentes), ociosa_ms / 1000.0
+        except Exception:
+            return 0, float('inf')
+
+    def ociosa(self, ociosa_ms: int = OCIOSA_MS) -> bool:
+        """True se não há requisições em andamento há pelo menos ``ociosa_ms``"""
+        self.atualizar()
+        if self.usa_cdp:
+            return not self.em_andamento and (time.time() - self.ultima_atividade) * 1000 >= ociosa_ms
+        pendentes, desde = self._estado_js()
+        return pendentes == 0 and desde * 1000 >= ociosa_ms
+
+    def reiniciar(self):
+        """Descarta estado e histórico (ex.: ao devolver o driver ao pool)"""
+        try:
+            self.driver.get_log('performance')
+        except Exception:
+            pass
+        with self._lock:
+            self.em_andamento.clear()
+            self.historico.clear()
+            self.ultima_atividade = time.time()
+
+
+_monitores = weakref.WeakKeyDictionary()
+_monitores_lock = threading.Lock()
+
+
+def monitor_rede(driver) -> MonitorRede:
+    """Retorna o monitor de rede associado ao driver (criado sob demanda)"""
+    with _monitores_lock:
+        monitor = _monitores.get(driver)
+        if monitor is None:
+            monitor = _monitores[driver] = MonitorRede(driver)
+        return monitor
+
+
+def reiniciar_monitor(driver):
+    """Reinicia o monitor do driver, se existir"""
+    with _monitores_lock:
+        monitor = _monitores.get(driver)
+    if monitor is not None:
+        monitor.reiniciar()
+
+
+def logs_performance(driver) -> list:
+    """
+    Entradas do log de performance do driver, incluindo as já consumidas
+    pelas esperas (``get_log`` direto perderia essas entradas).
+    """
+    monitor = monitor_rede(driver)
+    monitor.atualizar()
+    return list(monitor.historico)
+
+
+# ==============================================================================
+# ESPERAS
+# ==============================================================================
+
+def aguardar_documento(driver, timeout: float = 10) -> bool:
+    """Aguarda document.readyState == 'complete'"""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=INTERVALO_POLL).until(
+            lambda d: d.execute_script('return document.readyState') == 'complete'
+        )
+        return True
+    except Exception:
+        return False
+
+
+@esperando
+def aguardar_rede_ociosa(driver, timeout: float = 10, ociosa_ms: int = OCIOSA_MS) -> bool:
+    """Aguarda não haver XHR/fetch em andamento para a API/Supabase"""
+    monitor = monitor_rede(driver)
+    limite = time.time() + timeout
+    while True:
+        if monitor.ociosa(ociosa_ms):
+            return True
+        if time.time() >= limite:
+            return False
+        time.sleep(INTERVALO_POLL)
+
+
+def _timeout_script(driver) -> float:
+    """Timeout atual de scripts assíncronos (padrão do WebDriver: 30s se o driver não informar)"""
+    try:
+        return float(driver.timeouts.script)
+    except Exception:
+        return 30.0
+
+
+@esperando
+def aguardar_dom_estavel(driver, timeout: float = 10, quieto_ms: int = QUIETO_MS) -> bool:
+    """Aguarda o DOM ficar ``quieto_ms`` sem mutações (MutationObserver)"""
+    if timeout <= 0:
+        return False
+    limite_ms = int(timeout * 1000)
+    quieto_ms = min(quieto_ms, max(50, limite_ms // 2))
+    anterior = _timeout_script(driver)
+    try:
+        driver.set_script_timeout(timeout + 5)
+        return bool(driver.execute_async_script(_JS_DOM_QUIETO, quieto_ms, limite_ms))
+    except Exception:
+        return False
+    finally:
+        # Outras chamadas de execute_async_script da suíte seguem com o timeout delas
+        try:
+            driver.set_script_timeout(anterior)
+        except Exception:
+            pass
+
+
+@esperando
+def aguardar_estavel(driver, timeout: float = 10, quieto_ms: int = QUIETO_MS,
+                     ociosa_ms: int = OCIOSA_MS) -> bool:
+    """
+    Substituto de ``time.sleep``: documento carregado + rede ociosa + DOM estável.
+
+    Retorna assim que as três condições são atendidas ou quando ``timeout``
+    expira (nunca lança exceção; retorna False no timeout).
+    """
+    inicio = time.time()
+
+    def restante():
+        return max(0.0, timeout - (time.time() - inicio))
+
+    ociosa_ms = min(ociosa_ms, int(timeout * 500))
+    if not aguardar_documento(driver, restante()):
+        return False
+    if not aguardar_rede_ociosa(driver, restante(), ociosa_ms):
+        return False
+    if not aguardar_dom_estavel(driver, restante(), quieto_ms):
+        return False
+    # Mutações podem ter disparado novas requisições
+    return aguardar_rede_ociosa(driver, restante(), 0)
+
+
+def _aguardar_condicao(driver, condicao, timeout: float):
+    return WebDriverWait(driver, timeout, poll_frequency=INTERVALO_POLL).until(condicao)
+
+
+def aguardar_visivel(driver, locator, timeout: float = 10):
+    """Retorna o elemento assim que estiver visível"""
+    return _aguardar_condicao(driver, EC.visibility_of_element_located(locator), timeout)
+
+
+def aguardar_clicavel(driver, locator, timeout: float = 10):
+    """Retorna o elemento assim que estiver visível e habilitado"""
+    return _aguardar_condicao(driver, EC.element_to_be_clickable(locator), timeout)
+
+
+def aguardar_invisivel(driver, locator, timeout: float = 10) -> bool:
+    """Aguarda o elemento (ex.: spinner, modal) sumir"""
+    try:
+        _aguardar_condicao(driver, EC.invisibility_of_element_located(locator), timeout)
+        return True
+    except TimeoutException:
+        return False
+
+
+def aguardar_texto(driver, locator, texto: str, timeout: float = 10) -> bool:
+    """Aguarda o texto aparecer no elemento"""
+    try:
+        _aguardar_condicao(driver, EC.text_to_be_present_in_element(locator, texto), timeout)
+        return True
+    except TimeoutException:
+        return False
+
+
+def aguardar_quantidade(driver, locator, minimo: int, timeout: float = 10) -> bool:
+    """Aguarda existirem ao menos ``minimo`` elementos (ex.: linha nova após "Adicionar")"""
+    try:
+        _aguardar_condicao(driver, lambda d: len(d.find_elements(*locator)) >= minimo, timeout)
+        return True
+    except TimeoutException:
+        return False
+
+
+def aguardar_removido(driver, elemento, timeout: float = 10) -> bool:
+    """Aguarda o elemento sair do DOM (ex.: item removido e re-renderizado)"""
+    try:
+        _aguardar_condicao(driver, EC.staleness_of(elemento), timeout)
+        return True
+    except TimeoutException:
+        return False
+
+
+def aguardar_scroll(driver, elemento, timeout: float = 5) -> bool:
+    """Aguarda o fim de um ``scrollIntoView({behavior: 'smooth'})``: elemento parado na tela"""
+    posicao = {}
+
+    def parado(d):
+        atual = d.execute_script("return arguments[0].getBoundingClientRect().top;", elemento)
+        anterior, posicao['top'] = posicao.get('top'), atual
+        return anterior is not None and abs(atual - anterior) < 1
+
+    try:
+        _aguardar_condicao(driver, parado, timeout)
+        return True
+    except TimeoutException:
+        return False
+
+
+def aguardar_url(driver, trecho: str, timeout: float = 10) -> bool:
+    """Aguarda a URL atual conter ``trecho`` (navegação de rota do SPA)"""
+    try:
+        _aguardar_condicao(driver, EC.url_contains(trecho), timeout)
+        return True
+    except TimeoutException:
+        return False
@@ -0,0 +1,210 @@
+"""
+Agendador de passos com dependências e retentativa do passo que falhou
+======================================================================
+
+As suítes em cadeia (ex.: ``WorkflowEngineTestSuite``: test_01 → test_08)
+rodavam os passos numa sequência fixa. Um timeout ocasional (ex.: a navegação
+depois do ``/steps/{id}/complete``) marcava o passo como FAILED e todos os
+seguintes rodavam sobre um estado quebrado - o jeito de "resolver" era rodar
+a suíte inteira de novo.
+
+Aqui cada passo declara de quem depende e se usa o navegador:
+
+- passos de navegador rodam um de cada vez, na ordem declarada, na thread
+  principal; antes de cada um o estado do app é capturado (``capturar``);
+- se o passo falha, o estado capturado é restaurado (``restaurar``) e só ele é
+  repetido, até ``AGENDADOR_RETRIES`` vezes por passo e
+  ``AGENDADOR_ORCAMENTO`` vezes na execução inteira;
+- restaurar só volta o lado do cliente: antes de repetir, ``verificar(passo,
+  estado)`` consulta se o servidor já aplicou o efeito do passo (ex.: o
+  ``complete_step`` respondeu 200 e só a navegação seguinte deu timeout). Se
+  devolver ``'sucesso'`` ou ``'erro'``, esse é o resultado final e o passo
+  não é repetido; ``None`` (o servidor não avançou) libera a repetição;
+- passos sem navegador (checagens de API/banco) rodam em paralelo, em
+  threads, assim que as dependências deles concluem;
+- passos cuja dependência falhou ou foi pulada são marcados como pulados sem
+  rodar.
+
+Uso:
+
+    from step_scheduler import Passo, Agendador
+
+    agendador = Agendador(
+        [Passo('login', fazer_login),
+         Passo('criar', criar, depende_de=('login',)),
+         Passo('banco', validar_banco, depende_de=('criar',), navegador=False)],
+        capturar=lambda passo: capturar_navegador(driver),
+        restaurar=lambda passo, estado: restaurar_navegador(driver, estado),
+        verificar=lambda passo, estado: 'sucesso' if servidor_avancou(passo) else None,
+    )
+    for passo in agendador.executar():
+        print(passo.nome, passo.status, passo.execucoes)
+
+Cada função de passo devolve ``'sucesso'``, ``'erro'`` ou ``'pulado'``
+(exceções contam como ``'erro'``).
+
+Variáveis de ambiente:
+    AGENDADOR_RETRIES     retentativas por passo (padrão: 1)
+    AGENDADOR_ORCAMENTO   retentativas somadas na execução (padrão: 3)
+    AGENDADOR_WORKERS     threads para os passos sem navegador (padrão: 2)
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+RETRIES = int(os.getenv('AGENDADOR_RETRIES', '1'))
+ORCAMENTO = int(os.getenv('AGENDADOR_ORCAMENTO', '3'))
+WORKERS = int(os.getenv('AGENDADOR_WORKERS', '2'))
+
+STATUS_FINAIS = ('sucesso', 'erro', 'pulado')
+
+
+class Passo:
+    """Um teste da cadeia: função, dependências e se precisa do navegador compartilhado"""
+
+    def __init__(self, nome: str, funcao: Callable[[], str], depende_de: Iterable[str] = (),
+                 navegador: bool = True, retries: Optional[int] = None):
+        self.nome = nome
+        self.funcao = funcao
+        self.depende_de = tuple(depende_de)
+        self.navegador = navegador
+        self.retries = RETRIES if retries is None else retries
+        self.status = 'pendente'
+        self.erro: Optional[str] = None
+        self.execucoes = 0
+        self.duracao = 0.0
+
+
+class Agendador:
+    """Executa os passos respeitando dependências, com retentativa e restauração de estado"""
+
+    def __init__(self, passos: List[Passo], capturar: Optional[Callable] = None,
+                 restaurar: Optional[Callable] = None, orcamento: int = ORCAMENTO,
+                 workers: int = WORKERS, verificar: Optional[Callable] = None):
+        self.passos: Dict[str, Passo] = {}
+        for passo in passos:
+            if passo.nome in self.passos:
+                raise ValueError(f"Passo duplicado: {passo.nome}")
+            self.passos[passo.nome] = passo
+        for passo in passos:
+            desconhecidas = [d for d in passo.depende_de if d not in self.passos]
+            if desconhecidas:
+                raise ValueError(f"Passo {passo.nome} depende de passos inexistentes: {desconhecidas}")
+        self.capturar = capturar
+        self.restaurar = restaurar
+        self.verificar = verificar
+        self.orcamento = max(0, orcamento)
+        self.workers = max(1, workers)
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Um passo
+    # ------------------------------------------------------------------
+
+    def _reservar_retry(self, passo: Passo) -> bool:
+        with self._lock:
+            if passo.execucoes > passo.retries or self.orcamento <= 0:
+                return False
+            self.orcamento -= 1
+            return True
+
+    def _executar(self, passo: Passo):
+        estado = None
+        if passo.navegador and self.capturar and passo.retries > 0:
+            try:
+                estado = self.capturar(passo)
+            except Exception as e:
+                print(f"⚠️  {passo.nome}: estado anterior não capturado ({e}) - falha não será repetida")
+        inicio = time.time()
+        while True:
+            passo.execucoes += 1
+            passo.erro = None
+            try:
+                status = passo.funcao()
+            except Exception as e:
+                status, passo.erro = 'erro', str(e)
+            if status not in STATUS_FINAIS:
+                status = 'sucesso' if status is True else 'erro'
+            if status == 'erro' and estado is not None and self.verificar:
+                verificado = self._verificar(passo, estado)
+                if verificado in STATUS_FINAIS:
+                    status = verificado
+                    break
+            if status != 'erro' or (passo.navegador and self.capturar and estado is None) \
+                    or not self._reservar_retry(passo):
+                break
+            print(f"🔁 {passo.nome}: falhou na tentativa {passo.execucoes}; "
+                  f"repetindo só este passo (orçamento restante: {self.orcamento})")
+            if estado is not None and self.restaurar:
+                try:
+                    self.restaurar(passo, estado)
+                except Exception as e:
+                    print(f"⚠️  {passo.nome}: estado anterior não restaurado ({e})")
+                    break
+        passo.status = status
+        passo.duracao = time.time() - inicio
+
+    def _verificar(self, passo: Passo, estado) -> Optional[str]:
+        """Resultado final se o servidor já aplicou o passo; None se ele pode ser repetido"""
+        try:
+            verificado = self.verificar(passo, estado)
+        except Exception as e:
+            print(f"⚠️  {passo.nome}: estado do servidor não verificado ({e})")
+            return None
+        if verificado == 'sucesso':
+            print(f"✅ {passo.nome}: o servidor já tinha concluído o passo - não será repetido")
+            passo.erro = None
+        elif verificado in STATUS_FINAIS:
+            print(f"⛔ {passo.nome}: o servidor já avançou, repetir o passo não adianta")
+        return verificado
+
+    def _pular(self, passo: Passo, dependencia: Passo):
+        passo.status = 'pulado'
+        passo.erro = f"Dependência {dependencia.nome} terminou como '{dependencia.status}'"
+        print(f"⏭️  {passo.nome}: pulado ({passo.erro})")
+
+    # ------------------------------------------------------------------
+    # Execução
+    # ------------------------------------------------------------------
+
+    def _pronto(self, passo: Passo) -> bool:
+        return all(self.passos[d].status == 'sucesso' for d in passo.depende_de)
+
+    def _bloqueado(self, passo: Passo) -> Optional[Passo]:
+        return next((self.passos[d] for d in passo.depende_de
+                     if self.passos[d].status in ('erro', 'pulado')), None)
+
+    def executar(self) -> List[Passo]:
+        """Roda todos os passos e devolve a lista na ordem declarada"""
+        pendentes = [p for p in self.passos.values() if p.status == 'pendente']
+        em_andamento = {}
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='passo') as executor:
+            while pendentes or em_andamento:
+                for passo in list(pendentes):
+                    dependencia = self._bloqueado(passo)
+                    if dependencia is not None:
+                        self._pular(passo, dependencia)
+                        pendentes.remove(passo)
+                    elif not passo.navegador and self._pronto(passo):
+                        em_andamento[executor.submit(self._executar, passo)] = passo
+                        pendentes.remove(passo)
+
+                proximo = next((p for p in pendentes if p.navegador and self._pronto(p)), None)
+                if proximo is not None:
+                    pendentes.remove(proximo)
+                    self._executar(proximo)
+                elif em_andamento:
+                    concluidos, _ = wait(em_andamento, return_when=FIRST_COMPLETED)
+                    for futuro in concluidos:
+                        em_andamento.pop(futuro)
+                        futuro.result()
+                elif pendentes:
+                    raise RuntimeError(f"Dependência circular entre: {[p.nome for p in pendentes]}")
+        return list(self.passos.values())
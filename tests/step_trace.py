@@ -0,0 +1,482 @@
+"""
+Rastro de etapas: spans hierárquicos com tempo de WebDriver, espera e sono
+==========================================================================
+
+Os testes imprimem o progresso (``log_etapa``, "ETAPA 2: ...", "[1/7] Fazendo
+login...") mas não guardavam tempo de nada abaixo do teste inteiro. Quando a
+suíte fica lenta não dá para dizer se piorou o login, a busca de Atividades
+ou as seções da Caracterização.
+
+Este módulo registra spans aninhados por thread e divide o tempo de cada um
+em:
+
+- ``webdriver``: comandos enviados ao ChromeDriver (``driver.execute``, o
+  que inclui cliques, ``find_element``, ``execute_script`` e CDP) - só nas
+  sessões instrumentadas (``driver_pool.criar_driver`` já instrumenta);
+- ``espera``: ``WebDriverWait.until/until_not`` e as esperas do
+  ``smart_wait``;
+- ``sono``: ``time.sleep``;
+- ``python``: o restante (o próprio código do teste).
+
+As categorias são exclusivas: um comando dentro de uma espera conta como
+espera, e um ``time.sleep`` dentro do polling do ``WebDriverWait`` também.
+
+Uso:
+
+    from step_trace import span, rastrear, etapa
+
+    with span('login', usuario=cpf):            # bloco
+        ...
+
+    @rastrear()                                  # função/método
+    def test_01_criar_inscricao(self): ...
+
+    etapa('ETAPA 2: Selecionar tipo')            # marcador sequencial: fecha a
+                                                 # etapa anterior e abre a próxima
+
+Ao fim do processo o rastro é gravado em ``tests/output/traces/``:
+
+- ``etapas_<data>_<pid>.json``: árvore de spans com os tempos divididos;
+- ``etapas_<data>_<pid>.trace.json``: formato Chrome trace-event, para abrir
+  em ``chrome://tracing``, https://ui.perfetto.dev ou speedscope (flame graph).
+
+Para ver o resumo de um rastro gravado:
+
+    python tests/step_trace.py tests/output/traces/etapas_20251127_101500_4242.json --nivel 3
+
+Variáveis de ambiente:
+    TRACE_ETAPAS        true/false (padrão: true)
+    TRACE_DIR           pasta dos rastros (padrão: tests/output/traces)
+    TRACE_MAX_EVENTOS   comandos/esperas/sonos individuais no trace (padrão: 50000)
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+import argparse
+import functools
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+ATIVO = os.getenv('TRACE_ETAPAS', 'true').lower() == 'true'
+TRACE_DIR = Path(os.getenv('TRACE_DIR', Path(__file__).resolve().parent / 'output' / 'traces'))
+MAX_EVENTOS = int(os.getenv('TRACE_MAX_EVENTOS', '50000'))
+
+CATEGORIAS = ('webdriver', 'espera', 'sono')
+
+_sleep_original = time.sleep
+_t0 = time.perf_counter()
+_inicio_iso = datetime.now().isoformat(timespec='seconds')
+
+
+# ==============================================================================
+# ESTADO
+# ==============================================================================
+
+class Span:
+    """Trecho cronometrado; ``tempos`` guarda só o tempo próprio (sem os filhos)"""
+
+    __slots__ = ('nome', 'atributos', 'inicio', 'fim', 'filhos', 'tid', 'marcador',
+                 'status', 'erro', 'tempos', 'contagem')
+
+    def __init__(self, nome: str, atributos: Dict, tid: int, marcador: bool = False):
+        self.nome = nome
+        self.atributos = atributos
+        self.inicio = time.perf_counter()
+        self.fim: Optional[float] = None
+        self.filhos: List['Span'] = []
+        self.tid = tid
+        self.marcador = marcador
+        self.status = 'ok'
+        self.erro: Optional[str] = None
+        self.tempos = dict.fromkeys(CATEGORIAS, 0.0)
+        self.contagem = dict.fromkeys(CATEGORIAS, 0)
+
+    def fechar(self, erro: Optional[BaseException] = None):
+        if self.fim is None:
+            self.fim = time.perf_counter()
+        if erro is not None:
+            self.status = 'erro'
+            self.erro = f"{type(erro).__name__}: {erro}"
+
+    @property
+    def duracao(self) -> float:
+        return (self.fim if self.fim is not None else time.perf_counter()) - self.inicio
+
+    def totais(self) -> Dict[str, float]:
+        """Tempos por categoria somando os filhos"""
+        totais = dict(self.tempos)
+        for filho in self.filhos:
+            for categoria, valor in filho.totais().items():
+                totais[categoria] += valor
+        return totais
+
+    def comandos(self) -> Dict[str, int]:
+        contagem = dict(self.contagem)
+        for filho in self.filhos:
+            for categoria, valor in filho.comandos().items():
+                contagem[categoria] += valor
+        return contagem
+
+    def como_dict(self) -> Dict:
+        totais = self.totais()
+        dados = {
+            'nome': self.nome,
+            'inicio_ms': round((self.inicio - _t0) * 1000, 3),
+            'duracao_ms': round(self.duracao * 1000, 3),
+            **{f"{c}_ms": round(totais[c] * 1000, 3) for c in CATEGORIAS},
+            'python_ms': round(max(0.0, self.duracao - sum(totais.values())) * 1000, 3),
+            'chamadas': self.comandos(),
+            'thread': self.tid,
+            'status': self.status,
+        }
+        if self.atributos:
+            dados['atributos'] = self.atributos
+        if self.erro:
+            dados['erro'] = self.erro
+        dados['filhos'] = [f.como_dict() for f in self.filhos]
+        return dados
+
+
+class _Rastro:
+    """Spans e eventos de todas as threads do processo"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.raizes: List[Span] = []
+        self.eventos: List[tuple] = []        # (categoria, nome, inicio, duracao, tid)
+        self.descartados = 0
+        self.threads: Dict[int, tuple] = {}   # ident -> (tid curto, nome)
+        self.instalado = False
+        self.salvo = False
+
+
+_rastro = _Rastro()
+_local = threading.local()
+
+
+def _pilha() -> List[Span]:
+    pilha = getattr(_local, 'pilha', None)
+    if pilha is None:
+        pilha = _local.pilha = []
+        _local.categoria = None
+    return pilha
+
+
+def _tid() -> int:
+    ident = threading.get_ident()
+    registro = _rastro.threads.get(ident)
+    if registro is None:
+        with _rastro.lock:
+            registro = _rastro.threads.setdefault(
+                ident, (len(_rastro.threads) + 1, threading.current_thread().name))
+    return registro[0]
+
+
+def _abrir(nome: str, atributos: Dict, marcador: bool = False) -> Span:
+    _instalar()
+    pilha = _pilha()
+    novo = Span(str(nome), atributos, _tid(), marcador)
+    if pilha:
+        pilha[-1].filhos.append(novo)
+    else:
+        with _rastro.lock:
+            _rastro.raizes.append(novo)
+    pilha.append(novo)
+    return novo
+
+
+def _fechar_ate(alvo: Span, erro: Optional[BaseException] = None):
+    """Fecha ``alvo`` e os marcadores de etapa ainda abertos acima dele"""
+    pilha = _pilha()
+    while pilha:
+        topo = pilha.pop()
+        topo.fechar(erro)
+        if topo is alvo:
+            return
+
+
+# ==============================================================================
+# API
+# ==============================================================================
+
+@contextmanager
+def span(nome: str, **atributos):
+    """Abre um span filho do span atual da thread (ou uma raiz)"""
+    if not ATIVO:
+        yield None
+        return
+    aberto = _abrir(nome, atributos)
+    try:
+        yield aberto
+    except BaseException as e:
+        _fechar_ate(aberto, e)
+        raise
+    else:
+        _fechar_ate(aberto)
+
+
+def rastrear(nome: Optional[str] = None, **atributos):
+    """Decorator: cada chamada vira um span (padrão: nome qualificado da função)"""
+    def decorar(funcao):
+        rotulo = nome or funcao.__qualname__
+
+        @functools.wraps(funcao)
+        def envolvida(*args, **kwargs):
+            with span(rotulo, **atributos):
+                return funcao(*args, **kwargs)
+        return envolvida
+    return decorar
+
+
+def etapa(nome: str, **atributos) -> Optional[Span]:
+    """
+    Marcador sequencial (``log_etapa``, prints "ETAPA N"): fecha a etapa anterior
+    do mesmo nível e abre a próxima, que dura até a seguinte ou até o span pai
+    terminar.
+    """
+    if not ATIVO:
+        return None
+    pilha = _pilha()
+    if pilha and pilha[-1].marcador:
+        _fechar_ate(pilha[-1])
+    return _abrir(nome, atributos, marcador=True)
+
+
+@contextmanager
+def medir(categoria: str, nome: str = ''):
+    """
+    Conta o bloco como ``webdriver``, ``espera`` ou ``sono`` no span atual.
+
+    Só a categoria mais externa conta (o polling de uma espera não vira tempo
+    de WebDriver). Sem span aberto na thread, não registra nada.
+    """
+    pilha = getattr(_local, 'pilha', None)
+    if not ATIVO or not pilha or getattr(_local, 'categoria', None) is not None:
+        yield
+        return
+    dono = pilha[-1]
+    _local.categoria = categoria
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        duracao = time.perf_counter() - inicio
+        _local.categoria = None
+        dono.tempos[categoria] += duracao
+        dono.contagem[categoria] += 1
+        if len(_rastro.eventos) < MAX_EVENTOS:
+            _rastro.eventos.append((categoria, nome or categoria, inicio, duracao, dono.tid))
+        else:
+            _rastro.descartados += 1
+
+
+def esperando(funcao):
+    """Decorator para funções de espera (ex.: ``smart_wait.aguardar_estavel``)"""
+    @functools.wraps(funcao)
+    def envolvida(*args, **kwargs):
+        with medir('espera', funcao.__name__):
+            return funcao(*args, **kwargs)
+    return envolvida
+
+
+def instrumentar(driver):
+    """Mede cada comando enviado ao ChromeDriver por esta sessão (idempotente)"""
+    if not ATIVO or getattr(driver, '_step_trace', False):
+        return driver
+    execute_original = driver.execute
+
+    def execute(driver_command, params=None):
+        with medir('webdriver', driver_command):
+            return execute_original(driver_command, params)
+
+    driver.execute = execute
+    driver._step_trace = True
+    return driver
+
+
+# ==============================================================================
+# GANCHOS GLOBAIS (instalados no primeiro span)
+# ==============================================================================
+
+def _sleep(segundos):
+    if getattr(_local, 'pilha', None):
+        with medir('sono', f"sleep {segundos:g}s" if isinstance(segundos, (int, float)) else 'sleep'):
+            return _sleep_original(segundos)
+    return _sleep_original(segundos)
+
+
+def _instalar():
+    if _rastro.instalado:
+        return
+    with _rastro.lock:
+        if _rastro.instalado:
+            return
+        _rastro.instalado = True
+        time.sleep = _sleep
+        try:
+            from selenium.webdriver.support.wait import WebDriverWait
+        except ImportError:
+            WebDriverWait = None
+        if WebDriverWait is not None:
+            for metodo in ('until', 'until_not'):
+                original = getattr(WebDriverWait, metodo)
+
+                def envolvido(self, method, message='', _original=original, _metodo=metodo):
+                    with medir('espera', f"WebDriverWait.{_metodo}"):
+                        return _original(self, method, message)
+
+                setattr(WebDriverWait, metodo, functools.wraps(original)(envolvido))
+        atexit.register(salvar)
+
+
+# ==============================================================================
+# EXPORTAÇÃO
+# ==============================================================================
+
+def _us(segundos: float) -> float:
+    return round(segundos * 1_000_000, 1)
+
+
+def _eventos_chrome(spans: List[Span], pid: int) -> List[Dict]:
+    eventos = []
+    for s in spans:
+        totais = s.totais()
+        args = {f"{c}_ms": round(totais[c] * 1000, 1) for c in CATEGORIAS}
+        args['python_ms'] = round(max(0.0, s.duracao - sum(totais.values())) * 1000, 1)
+        args.update({k: str(v) for k, v in s.atributos.items()})
+        if s.erro:
+            args['erro'] = s.erro
+        eventos.append({'name': s.nome, 'cat': 'etapa' if s.marcador else 'span', 'ph': 'X',
+                        'ts': _us(s.inicio - _t0), 'dur': _us(s.duracao),
+                        'pid': pid, 'tid': s.tid, 'args': args})
+        eventos.extend(_eventos_chrome(s.filhos, pid))
+    return eventos
+
+
+def _abertos_para_fechar():
+    """Fecha (sem tirar da pilha) os spans ainda abertos, ex.: etapas finais sem pai"""
+    def fechar(spans):
+        for s in spans:
+            if s.fim is None:
+                s.fim = time.perf_counter()
+            fechar(s.filhos)
+    fechar(_rastro.raizes)
+
+
+def exportar() -> Dict:
+    """Árvore de spans (JSON) do processo até agora"""
+    with _rastro.lock:
+        raizes = list(_rastro.raizes)
+    return {
+        'inicio': _inicio_iso,
+        'pid': os.getpid(),
+        'threads': {str(tid): nome for tid, nome in _rastro.threads.values()},
+        'eventos_descartados': _rastro.descartados,
+        'spans': [s.como_dict() for s in raizes],
+    }
+
+
+def exportar_chrome() -> Dict:
+    """Rastro no formato Chrome trace-event (spans + comandos/esperas/sonos)"""
+    pid = os.getpid()
+    with _rastro.lock:
+        raizes = list(_rastro.raizes)
+        threads = list(_rastro.threads.values())
+    eventos = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': 'testes selenium'}}]
+    eventos += [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': nome}}
+                for tid, nome in threads]
+    eventos += _eventos_chrome(raizes, pid)
+    eventos += [{'name': nome, 'cat': categoria, 'ph': 'X', 'ts': _us(inicio - _t0),
+                 'dur': _us(duracao), 'pid': pid, 'tid': tid}
+                for categoria, nome, inicio, duracao, tid in list(_rastro.eventos)]
+    return {'traceEvents': eventos, 'displayTimeUnit': 'ms'}
+
+
+def salvar(pasta: Optional[Path] = None) -> Optional[Path]:
+    """Grava o JSON e o trace do Chrome; retorna o caminho do JSON (uma vez por processo)"""
+    if _rastro.salvo or not _rastro.raizes:
+        return None
+    _rastro.salvo = True
+    _abertos_para_fechar()
+    pasta = Path(pasta or TRACE_DIR)
+    try:
+        pasta.mkdir(parents=True, exist_ok=True)
+        base = pasta / f"etapas_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+        dados = exportar()
+        caminho = base.with_suffix('.json')
+        caminho.write_text(json.dumps(dados, ensure_ascii=False, indent=2), encoding='utf-8')
+        base.with_suffix('.trace.json').write_text(json.dumps(exportar_chrome()), encoding='utf-8')
+    except OSError as e:
+        print(f"⚠️  Rastro de etapas não gravado: {e}")
+        return None
+    imprimir_resumo(dados, nivel=2)
+    print(f"🧭 Rastro de etapas: {caminho} (Chrome trace: {base.with_suffix('.trace.json').name})")
+    return caminho
+
+
+# ==============================================================================
+# RESUMO
+# ==============================================================================
+
+def _linhas(spans: List[Dict], nivel: int, profundidade: int = 0):
+    for s in spans:
+        yield profundidade, s
+        if profundidade + 1 < nivel:
+            yield from _linhas(s['filhos'], nivel, profundidade + 1)
+
+
+def imprimir_resumo(dados: Dict, nivel: int = 2):
+    """Tabela dos spans até ``nivel`` níveis de profundidade"""
+    print("=" * 80)
+    print("🧭 RASTRO DE ETAPAS (segundos)")
+    print("=" * 80)
+    print(f"{'Span':<40}{'Total':>8}{'WebDrv':>8}{'Espera':>8}{'Sono':>8}{'Python':>8}")
+    print("-" * 80)
+    for profundidade, s in _linhas(dados['spans'], nivel):
+        rotulo = ('  ' * profundidade + s['nome'])[:38]
+        marca = '❌' if s['status'] == 'erro' else ''
+        print(f"{rotulo + marca:<40}{s['duracao_ms'] / 1000:>8.2f}{s['webdriver_ms'] / 1000:>8.2f}"
+              f"{s['espera_ms'] / 1000:>8.2f}{s['sono_ms'] / 1000:>8.2f}{s['python_ms'] / 1000:>8.2f}")
+    if dados.get('eventos_descartados'):
+        print(f"⚠️  {dados['eventos_descartados']} eventos individuais fora do trace (TRACE_MAX_EVENTOS)")
+    print("=" * 80)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Resumo de um rastro de etapas gravado',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument('arquivo', nargs='?', help='JSON do rastro (padrão: o mais recente em TRACE_DIR)')
+    parser.add_argument('--nivel', type=int, default=3, help='profundidade da árvore exibida (padrão: 3)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.arquivo:
+        caminho = Path(args.arquivo)
+    else:
+        rastros = sorted(p for p in TRACE_DIR.glob('etapas_*.json') if not p.name.endswith('.trace.json'))
+        if not rastros:
+            print(f"❌ Nenhum rastro em {TRACE_DIR}")
+            return 1
+        caminho = rastros[-1]
+    print(f"📄 {caminho}")
+    imprimir_resumo(json.loads(caminho.read_text(encoding='utf-8')), nivel=args.nivel)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
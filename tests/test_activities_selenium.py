@@ -5,17 +5,18 @@ Preenche apenas: código, nome, descrição
 """
 
 import os
+import sys
 import time
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
 from dotenv import load_dotenv
 
-# Criar diretório para screenshots se não existir
-os.makedirs('tests/screenshots', exist_ok=True)
+from driver_pool import obter_driver, devolver_driver
+from smart_wait import aguardar_estavel
+from auth_session import login_navegador
 
 # Carregar variáveis de ambiente
 load_dotenv()
@@ -24,191 +25,176 @@ load_dotenv()
 CPF = os.getenv('TEST_CPF', '61404694579')
 PASSWORD = os.getenv('TEST_PASSWORD', 'Senh@01!')
 BASE_URL = os.getenv('BASE_URL', 'http://localhost:5173')
-CHROMEDRIVER_PATH = r'C:\chromedriver\chromedriver.exe'
 
-print(f"👤 CPF: {CPF}")
-print(f"🔗 URL: {BASE_URL}")
-print("=" * 70)
-print("🧪 TESTE SIMPLIFICADO: Verificação de Atividades")
-print("=" * 70)
-print("ℹ️ Nota: Atividades usa formulário customizado complexo")
-print("ℹ️ Este teste apenas verifica se a tela carrega corretamente")
-print("=" * 70)
 
-# Configurar ChromeDriver
-service = Service(executable_path=CHROMEDRIVER_PATH)
-options = webdriver.ChromeOptions()
-options.add_argument('--start-maximized')
-options.add_argument('--disable-blink-features=AutomationControlled')
+def main() -> int:
+    """Verifica se a tela de Atividades carrega e o formulário abre"""
+    print(f"👤 CPF: {CPF}")
+    print(f"🔗 URL: {BASE_URL}")
+    print("=" * 70)
+    print("🧪 TESTE SIMPLIFICADO: Verificação de Atividades")
+    print("=" * 70)
+    print("ℹ️ Nota: Atividades usa formulário customizado complexo")
+    print("ℹ️ Este teste apenas verifica se a tela carrega corretamente")
+    print("=" * 70)
 
-print("\n📦 Inicializando ChromeDriver...")
-driver = webdriver.Chrome(service=service, options=options)
-wait = WebDriverWait(driver, 10)
-print("✅ ChromeDriver iniciado com sucesso")
+    # Criar diretório para screenshots se não existir
+    os.makedirs('tests/screenshots', exist_ok=True)
 
-try:
-    # 1. FAZER LOGIN
-    print(f"\n🔐 PASSO 1: Fazendo login em {BASE_URL}")
-    driver.get(BASE_URL)
-    print("  ✓ Página carregada")
-    
-    time.sleep(2)
-    
-    # Preencher CPF
-    cpf_input = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 'input[type="text"]')))
-    cpf_input.clear()
-    cpf_input.send_keys(CPF)
-    print(f"  ✓ CPF preenchido: {CPF}")
-    
-    # Preencher senha
-    password_input = driver.find_element(By.CSS_SELECTOR, 'input[type="password"]')
-    password_input.clear()
-    password_input.send_keys(PASSWORD)
-    print("  ✓ Senha preenchida")
-    
-    # Clicar em Login
-    login_button = driver.find_element(By.CSS_SELECTOR, 'button[type="submit"]')
-    login_button.click()
-    print("  ✓ Login clicado")
-    
-    time.sleep(5)
-    print(f"  ✓ URL após login: {driver.current_url}")
+    # Obter ChromeDriver do pool compartilhado (HEADLESS controlado por env var)
+    print("\n📦 Inicializando ChromeDriver...")
+    driver = obter_driver()
+    wait = WebDriverWait(driver, 10)
+    print("✅ ChromeDriver iniciado com sucesso")
+
+    try:
+        # 1. FAZER LOGIN
+        print(f"\n🔐 PASSO 1: Fazendo login em {BASE_URL}")
+        login_navegador(driver, caminho='/dashboard', cpf=CPF, senha=PASSWORD, base_url=BASE_URL)
+        print(f"  ✓ URL após login: {driver.current_url}")
     
-    # 2. NAVEGAR PARA ADMINISTRAÇÃO
-    print("\n📂 PASSO 2: Navegando para Administração")
-    driver.get(f"{BASE_URL}/dashboard")
-    time.sleep(3)
+        # 2. NAVEGAR PARA ADMINISTRAÇÃO
+        print("\n📂 PASSO 2: Navegando para Administração")
+        driver.get(f"{BASE_URL}/dashboard")
+        aguardar_estavel(driver, timeout=3)
     
-    admin_menu = wait.until(
-        EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Administração')]"))
-    )
-    admin_menu.click()
-    print("  ✅ Menu Administração aberto")
-    time.sleep(1)
+        admin_menu = wait.until(
+            EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Administração')]"))
+        )
+        admin_menu.click()
+        print("  ✅ Menu Administração aberto")
+        aguardar_estavel(driver, timeout=1)
     
-    # 3. ACESSAR ATIVIDADES
-    print("\n📋 PASSO 3: Acessando Atividades")
-    activities_button = wait.until(
-        EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Atividades')]"))
-    )
-    activities_button.click()
-    print("  ✅ Atividades selecionado")
-    time.sleep(2)
+        # 3. ACESSAR ATIVIDADES
+        print("\n📋 PASSO 3: Acessando Atividades")
+        activities_button = wait.until(
+            EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Atividades')]"))
+        )
+        activities_button.click()
+        print("  ✅ Atividades selecionado")
+        aguardar_estavel(driver, timeout=2)
     
-    # Screenshot da tela de atividades
-    driver.save_screenshot('tests/screenshots/activities_view.png')
-    print("  📸 Screenshot salvo: activities_view.png")
+        # Screenshot da tela de atividades
+        driver.save_screenshot('tests/screenshots/activities_view.png')
+        print("  📸 Screenshot salvo: activities_view.png")
     
-    # 4. VERIFICAR SE HÁ ATIVIDADES CADASTRADAS
-    print("\n🔍 PASSO 4: Verificando atividades existentes...")
-    try:
-        # Tentar encontrar a tabela
-        table = driver.find_element(By.CSS_SELECTOR, 'table')
-        print("  ✅ Tabela de atividades encontrada")
+        # 4. VERIFICAR SE HÁ ATIVIDADES CADASTRADAS
+        print("\n🔍 PASSO 4: Verificando atividades existentes...")
+        try:
+            # Tentar encontrar a tabela
+            table = driver.find_element(By.CSS_SELECTOR, 'table')
+            print("  ✅ Tabela de atividades encontrada")
         
-        # Contar linhas
-        rows = driver.find_elements(By.CSS_SELECTOR, 'tbody tr')
-        if len(rows) > 0:
-            print(f"  ✅ {len(rows)} atividade(s) encontrada(s)")
+            # Contar linhas
+            rows = driver.find_elements(By.CSS_SELECTOR, 'tbody tr')
+            if len(rows) > 0:
+                print(f"  ✅ {len(rows)} atividade(s) encontrada(s)")
             
-            # Listar primeiras 5 atividades
-            for i, row in enumerate(rows[:5]):
-                try:
-                    cells = row.find_elements(By.CSS_SELECTOR, 'td')
-                    if len(cells) >= 2:
-                        code = cells[0].text
-                        name = cells[1].text
-                        print(f"     {i+1}. Código: {code} - {name}")
-                except:
-                    pass
-        else:
-            print("  ⚠️ Nenhuma atividade cadastrada ainda")
-    except Exception as e:
-        print(f"  ⚠️ Erro ao verificar tabela: {e}")
+                # Listar primeiras 5 atividades
+                for i, row in enumerate(rows[:5]):
+                    try:
+                        cells = row.find_elements(By.CSS_SELECTOR, 'td')
+                        if len(cells) >= 2:
+                            code = cells[0].text
+                            name = cells[1].text
+                            print(f"     {i+1}. Código: {code} - {name}")
+                    except:
+                        pass
+            else:
+                print("  ⚠️ Nenhuma atividade cadastrada ainda")
+        except Exception as e:
+            print(f"  ⚠️ Erro ao verificar tabela: {e}")
     
-    # 5. CLICAR EM NOVO (para verificar se modal abre)
-    print("\n➕ PASSO 5: Testando botão 'Novo'...")
-    try:
-        new_button = driver.find_element(By.XPATH, "//button[contains(., 'Novo')]")
-        new_button.click()
-        print("  ✅ Botão 'Novo' clicado")
-        time.sleep(2)
-        
-        # Verificar se modal abriu
+        # 5. CLICAR EM NOVO (para verificar se modal abre)
+        print("\n➕ PASSO 5: Testando botão 'Novo'...")
         try:
-            modal = driver.find_element(By.CSS_SELECTOR, '[role="dialog"], .modal')
-            print("  ✅ Modal de criação aberto")
+            new_button = driver.find_element(By.XPATH, "//button[contains(., 'Novo')]")
+            new_button.click()
+            print("  ✅ Botão 'Novo' clicado")
+            aguardar_estavel(driver, timeout=2)
+        
+            # Verificar se modal abriu
+            try:
+                modal = driver.find_element(By.CSS_SELECTOR, '[role="dialog"], .modal')
+                print("  ✅ Modal de criação aberto")
             
-            # Screenshot do modal
-            driver.save_screenshot('tests/screenshots/activities_modal.png')
-            print("  📸 Screenshot do modal salvo: activities_modal.png")
+                # Screenshot do modal
+                driver.save_screenshot('tests/screenshots/activities_modal.png')
+                print("  📸 Screenshot do modal salvo: activities_modal.png")
             
-            # Verificar campos do formulário
-            print("\n  📝 Campos encontrados no formulário:")
+                # Verificar campos do formulário
+                print("\n  📝 Campos encontrados no formulário:")
             
-            # Código
-            try:
-                code_input = driver.find_element(By.CSS_SELECTOR, 'input[type="number"]')
-                print("     ✅ Campo Código (number)")
-            except:
-                print("     ⚠️ Campo Código não encontrado")
+                # Código
+                try:
+                    code_input = driver.find_element(By.CSS_SELECTOR, 'input[type="number"]')
+                    print("     ✅ Campo Código (number)")
+                except:
+                    print("     ⚠️ Campo Código não encontrado")
             
-            # Nome
-            try:
-                name_inputs = driver.find_elements(By.CSS_SELECTOR, 'input[type="text"]')
-                print(f"     ✅ {len(name_inputs)} campo(s) de texto encontrado(s)")
-            except:
-                print("     ⚠️ Campos de texto não encontrados")
+                # Nome
+                try:
+                    name_inputs = driver.find_elements(By.CSS_SELECTOR, 'input[type="text"]')
+                    print(f"     ✅ {len(name_inputs)} campo(s) de texto encontrado(s)")
+                except:
+                    print("     ⚠️ Campos de texto não encontrados")
             
-            # Selects (Porte, Potencial, etc)
-            try:
-                selects = driver.find_elements(By.CSS_SELECTOR, 'select')
-                print(f"     ✅ {len(selects)} campo(s) select encontrado(s)")
-            except:
-                print("     ⚠️ Campos select não encontrados")
+                # Selects (Porte, Potencial, etc)
+                try:
+                    selects = driver.find_elements(By.CSS_SELECTOR, 'select')
+                    print(f"     ✅ {len(selects)} campo(s) select encontrado(s)")
+                except:
+                    print("     ⚠️ Campos select não encontrados")
             
-            # Fechar modal
-            try:
-                close_button = driver.find_element(By.CSS_SELECTOR, 'button[aria-label="Fechar"], button svg.lucide-x')
-                close_button.click()
-                print("\n  ✅ Modal fechado")
-                time.sleep(1)
-            except:
-                print("\n  ⚠️ Não foi possível fechar o modal")
+                # Fechar modal
+                try:
+                    close_button = driver.find_element(By.CSS_SELECTOR, 'button[aria-label="Fechar"], button svg.lucide-x')
+                    close_button.click()
+                    print("\n  ✅ Modal fechado")
+                    aguardar_estavel(driver, timeout=1)
+                except:
+                    print("\n  ⚠️ Não foi possível fechar o modal")
                 
-        except:
-            print("  ❌ Modal não abriu")
+            except:
+                print("  ❌ Modal não abriu")
             
-    except Exception as e:
-        print(f"  ❌ Erro ao testar botão 'Novo': {e}")
+        except Exception as e:
+            print(f"  ❌ Erro ao testar botão 'Novo': {e}")
     
-    # Screenshot final
-    driver.save_screenshot('tests/screenshots/activities_final.png')
-    print("\n📸 Screenshot final salvo: activities_final.png")
+        # Screenshot final
+        driver.save_screenshot('tests/screenshots/activities_final.png')
+        print("\n📸 Screenshot final salvo: activities_final.png")
     
-    # RESULTADO FINAL
-    print("\n" + "=" * 70)
-    print("✅ TESTE DE VERIFICAÇÃO COMPLETO!")
-    print("   A tela de Atividades está funcional")
-    print("   Formulário customizado detectado corretamente")
-    print("=" * 70)
-    print("\nℹ️ NOTA IMPORTANTE:")
-    print("   O formulário de Atividades requer tabelas adicionais:")
-    print("   - enterprise_sizes (Portes)")
-    print("   - pollution_potentials (Potenciais Poluidores)")
-    print("   - activity_license_types (relacionamento)")
-    print("   - activity_documents (relacionamento)")
-    print("=" * 70)
+        # RESULTADO FINAL
+        print("\n" + "=" * 70)
+        print("✅ TESTE DE VERIFICAÇÃO COMPLETO!")
+        print("   A tela de Atividades está funcional")
+        print("   Formulário customizado detectado corretamente")
+        print("=" * 70)
+        print("\nℹ️ NOTA IMPORTANTE:")
+        print("   O formulário de Atividades requer tabelas adicionais:")
+        print("   - enterprise_sizes (Portes)")
+        print("   - pollution_potentials (Potenciais Poluidores)")
+        print("   - activity_license_types (relacionamento)")
+        print("   - activity_documents (relacionamento)")
+        print("=" * 70)
     
-    time.sleep(3)
+        aguardar_estavel(driver, timeout=3)
+
+    except Exception as e:
+        print(f"\n❌ ERRO DURANTE TESTE: {e}")
+        driver.save_screenshot('tests/screenshots/activities_exception_error.png')
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    finally:
+        print("\n🔚 Fechando navegador...")
+        devolver_driver(driver)
+        print("✅ Navegador fechado")
+
+    return 0
 
-except Exception as e:
-    print(f"\n❌ ERRO DURANTE TESTE: {e}")
-    driver.save_screenshot('tests/screenshots/activities_exception_error.png')
-    import traceback
-    traceback.print_exc()
 
-finally:
-    print("\n🔚 Fechando navegador...")
-    driver.quit()
-    print("✅ Navegador fechado")
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,9 +7,14 @@ import os
 from typing import Dict, Any
 import json
 
+from api_client import ClienteAPI
+from endpoint_resolver import resolver_api
+
 # Configurações
 BASE_URL = os.getenv('TEST_BASE_URL', 'http://localhost:5173')
-API_BASE = BASE_URL.replace('5173', '3000')  # Backend geralmente roda na 3000
+# Backend geralmente roda na 3000; API_URL e os demais hosts conhecidos entram no health check
+# (feito no setup do primeiro teste e cacheado pelo endpoint_resolver: coletar não sonda a rede)
+API_PREFERIDAS = [BASE_URL.replace('5173', '3000') + '/api/v1']
 ADMIN_EMAIL = os.getenv('TEST_ADMIN_EMAIL', 'admin@example.com')
 ADMIN_PASSWORD = os.getenv('TEST_ADMIN_PASSWORD', 'admin123')
 
@@ -19,14 +24,17 @@ class TestParametrizacaoAPI:
     @pytest.fixture(autouse=True)
     def setup(self):
         """Setup do cliente HTTP e login"""
-        self.session = requests.Session()
+        api_url = resolver_api(API_PREFERIDAS)['url']
+        self.api_base = api_url[:-len('/api/v1')] if api_url.endswith('/api/v1') else api_url
+        # Pool + keep-alive, timeout por endpoint e retry em 5xx/erro de conexão
+        self.session = ClienteAPI(api_url)
         self.token = None
         self.config_ids = {}
         
         # Fazer login
         try:
             response = self.session.post(
-                f"{API_BASE}/api/v1/auth/login",
+                f"{self.api_base}/api/v1/auth/login",
                 json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD}
             )
             
@@ -56,7 +64,7 @@ class TestParametrizacaoAPI:
         print("="*60)
         
         try:
-            response = self.session.get(f"{API_BASE}/api/v1/system-config")
+            response = self.session.get(f"{self.api_base}/api/v1/system-config")
             
             print(f"\nStatus Code: {response.status_code}")
             
@@ -81,7 +89,7 @@ class TestParametrizacaoAPI:
                 
         except requests.exceptions.ConnectionError:
             print("❌ ERRO: Não foi possível conectar ao backend")
-            print(f"   Verifique se backend está rodando em {API_BASE}")
+            print(f"   Verifique se backend está rodando em {self.api_base}")
             pytest.skip("Backend não disponível")
     
     def test_02_atualizar_config_pesquisa_obrigatoria(self):
@@ -94,7 +102,7 @@ class TestParametrizacaoAPI:
         
         try:
             response = self.session.put(
-                f"{API_BASE}/api/v1/system-config/{config_key}",
+                f"{self.api_base}/api/v1/system-config/{config_key}",
                 json={"config_value": True}
             )
             
@@ -124,7 +132,7 @@ class TestParametrizacaoAPI:
         
         try:
             response = self.session.put(
-                f"{API_BASE}/api/v1/system-config/{config_key}",
+                f"{self.api_base}/api/v1/system-config/{config_key}",
                 json={"config_value": False}
             )
             
@@ -153,7 +161,7 @@ class TestParametrizacaoAPI:
         
         try:
             response = self.session.get(
-                f"{API_BASE}/api/v1/enterprises/search",
+                f"{self.api_base}/api/v1/enterprises/search",
                 params={"query": cnpj_teste}
             )
             
@@ -192,7 +200,7 @@ class TestParametrizacaoAPI:
         
         try:
             response = self.session.get(
-                f"{API_BASE}/api/v1/enterprises/search",
+                f"{self.api_base}/api/v1/enterprises/search",
                 params={"query": nome_teste}
             )
             
@@ -228,7 +236,7 @@ class TestParametrizacaoAPI:
         
         try:
             response = self.session.get(
-                f"{API_BASE}/api/v1/system-config/{config_key}"
+                f"{self.api_base}/api/v1/system-config/{config_key}"
             )
             
             print(f"\nBuscando: {config_key}")
@@ -257,7 +265,7 @@ class TestParametrizacaoAPI:
         print("="*60)
         
         try:
-            response = self.session.get(f"{API_BASE}/api/v1/system-config")
+            response = self.session.get(f"{self.api_base}/api/v1/system-config")
             
             if response.status_code == 200:
                 configs = response.json()
@@ -304,4 +312,8 @@ def run_summary():
 
 if __name__ == "__main__":
     import sys
+    if '--async' in sys.argv:
+        # Mesmas verificações em paralelo (leituras concorrentes, escritas em ordem)
+        from api_async_runner import main
+        sys.exit(main(['--suites', 'parametrizacao'] + [a for a in sys.argv[1:] if a != '--async']))
     sys.exit(run_summary())
@@ -6,22 +6,29 @@ Verifica se o endpoint está retornando dados corretamente
 import requests
 import os
 
-API_BASE_URL = os.getenv('VITE_API_BASE_URL', 'http://localhost:8000/api/v1')
-ENDPOINT = f"{API_BASE_URL}/referencias/unidades-medida"
+from api_client import obter_cliente
+from endpoint_resolver import resolver_api, descrever
 
-print("=" * 70)
-print("🧪 TESTE: Endpoint de Unidades de Medida")
-print("=" * 70)
-print(f"📍 API URL: {API_BASE_URL}")
-print(f"📍 Endpoint: {ENDPOINT}")
-print("=" * 70)
+# A API é resolvida (sonda de rede) na execução do teste, não no import
+API_PREFERIDAS = [os.getenv('VITE_API_BASE_URL'), 'http://localhost:8000/api/v1']
 
 def test_endpoint():
     """Testa se o endpoint está funcionando"""
-    
+    resolvida = resolver_api(API_PREFERIDAS)
+    api_base_url = resolvida['url']
+    api = obter_cliente(api_base_url)
+    endpoint = f"{api_base_url}/referencias/unidades-medida"
+
+    print("=" * 70)
+    print("🧪 TESTE: Endpoint de Unidades de Medida")
+    print("=" * 70)
+    print(f"📍 API URL: {descrever(resolvida)}")
+    print(f"📍 Endpoint: {endpoint}")
+    print("=" * 70)
+
     try:
         print("\n📡 [1/2] Fazendo requisição GET com is_active=true...")
-        response = requests.get(f"{ENDPOINT}?is_active=true", timeout=10)
+        response = api.get(endpoint, params={"is_active": "true"}, timeout=10)
         
         print(f"  ✓ Status Code: {response.status_code}")
         
@@ -63,7 +70,7 @@ def test_endpoint():
             print("❌ ERRO: Endpoint não encontrado!")
             print("   • Verifique se o backend está rodando")
             print("   • Confirme a URL da API no .env")
-            print(f"   • URL tentada: {ENDPOINT}")
+            print(f"   • URL tentada: {endpoint}")
             print(f"{'='*70}")
             return False
         else:
@@ -77,7 +84,7 @@ def test_endpoint():
         print(f"\n{'='*70}")
         print("❌ ERRO: Não foi possível conectar à API!")
         print("   • Verifique se o backend está rodando")
-        print(f"   • URL: {API_BASE_URL}")
+        print(f"   • URL: {api_base_url}")
         print("   • Execute: uvicorn app.main:app --reload")
         print(f"{'='*70}")
         return False
@@ -0,0 +1,145 @@
+"""
+Benchmark de inicialização: importar os módulos de tests/ tem de ser instantâneo
+===============================================================================
+
+Vários scripts faziam o trabalho no import: subiam o Chrome
+(``test_activities_crud_selenium.py``, ``debug_motor_bpmn.py``...), sondavam a
+API (``detect_api_url`` / ``resolver_api``) ou carregavam a cadeia inteira
+(orquestrador). Com isso o ``pytest --collect-only`` abria navegadores e ia à
+rede. Hoje o trabalho fica em ``main()`` / fixtures; este teste garante que
+continue assim.
+
+Cada módulo é importado num processo Python novo (``-X importtime``) com
+sockets e subprocessos bloqueados, e o teste falha se o import:
+
+- tentar abrir conexão de rede ou iniciar processo (ChromeDriver, git...);
+- pedir entrada no terminal;
+- gastar mais de ``IMPORT_LIMITE_MS`` no corpo do próprio módulo (sem contar
+  os imports de selenium, requests etc., que o ``importtime`` separa).
+
+Módulos cujas dependências de terceiros não estão instaladas são pulados.
+
+Uso:
+
+    pytest test_import_startup.py -q
+    python test_import_startup.py            # tabela com o tempo de cada módulo
+
+Variáveis de ambiente:
+    IMPORT_LIMITE_MS   limite do corpo de cada módulo em ms (padrão: 50)
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import os
+import sys
+import json
+import subprocess
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+
+TESTS_DIR = Path(__file__).resolve().parent
+LIMITE_MS = float(os.getenv('IMPORT_LIMITE_MS', '50'))
+
+# Roda no processo filho: bloqueia rede/processos e importa o módulo de argv[1]
+SONDA = r"""
+import sys, json, time, socket, subprocess
+tentativas = []
+
+def bloquear(nome):
+    def bloqueado(*args, **kwargs):
+        tentativas.append(nome)
+        raise OSError(f"{nome} bloqueado durante o import")
+    return bloqueado
+
+socket.socket.connect = bloquear('socket.connect')
+socket.socket.connect_ex = bloquear('socket.connect')
+socket.create_connection = bloquear('socket.create_connection')
+subprocess.Popen.__init__ = bloquear('subprocess.Popen')
+
+inicio = time.perf_counter()
+resultado = {}
+try:
+    __import__(sys.argv[1])
+except ModuleNotFoundError as e:
+    resultado['faltando'] = e.name
+except BaseException as e:
+    resultado['erro'] = f"{type(e).__name__}: {e}"
+resultado['total_ms'] = (time.perf_counter() - inicio) * 1000
+resultado['tentativas'] = tentativas
+print('@@SONDA' + json.dumps(resultado))
+"""
+
+
+def listar_modulos() -> List[str]:
+    return sorted(p.stem for p in TESTS_DIR.glob('*.py') if p.stem != Path(__file__).stem)
+
+
+def medir_import(modulo: str) -> Dict:
+    """Importa ``modulo`` num processo novo e devolve tempos e efeitos colaterais"""
+    processo = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', SONDA, modulo],
+        cwd=str(TESTS_DIR), stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=60,
+        env={**os.environ, 'PYTHONPATH': str(TESTS_DIR), 'PYTHONDONTWRITEBYTECODE': '1'},
+    )
+    linha = next((l for l in processo.stdout.splitlines() if l.startswith('@@SONDA')), None)
+    if linha is None:
+        return {'erro': (processo.stderr.strip().splitlines() or ['sem saída'])[-1], 'tentativas': []}
+    resultado = json.loads(linha[len('@@SONDA'):])
+
+    # "import time: self [us] | cumulative | nome" - o self do próprio módulo é o corpo dele
+    for registro in processo.stderr.splitlines():
+        partes = registro.split('|')
+        if registro.startswith('import time:') and len(partes) == 3 and partes[2].strip() == modulo:
+            resultado['corpo_ms'] = int(partes[0].split(':')[1]) / 1000
+            resultado['cumulativo_ms'] = int(partes[1]) / 1000
+    return resultado
+
+
+def _dependencia_externa(nome: str) -> bool:
+    return not (TESTS_DIR / f"{nome.split('.')[0]}.py").exists()
+
+
+@pytest.mark.parametrize('modulo', listar_modulos())
+def test_import_sem_efeitos_colaterais(modulo):
+    resultado = medir_import(modulo)
+    if resultado.get('faltando') and _dependencia_externa(resultado['faltando']):
+        pytest.skip(f"dependência não instalada: {resultado['faltando']}")
+
+    assert not resultado.get('faltando'), f"módulo de tests/ não encontrado: {resultado['faltando']}"
+    assert not resultado['tentativas'], f"import tentou {sorted(set(resultado['tentativas']))}"
+    assert not resultado.get('erro'), f"import falhou: {resultado['erro']}"
+    assert resultado.get('corpo_ms', 0) <= LIMITE_MS, \
+        f"corpo do módulo levou {resultado['corpo_ms']:.1f} ms (limite {LIMITE_MS:g} ms)"
+
+
+def main() -> int:
+    print("=" * 80)
+    print(f"⏱️  TEMPO DE IMPORT DOS MÓDULOS DE tests/ (limite do corpo: {LIMITE_MS:g} ms)")
+    print("=" * 80)
+    print(f"{'Módulo':<48}{'Corpo ms':>10}{'Total ms':>10}  Situação")
+    print("-" * 80)
+    falhas = 0
+    for modulo in listar_modulos():
+        r = medir_import(modulo)
+        if r.get('faltando') and _dependencia_externa(r['faltando']):
+            situacao = f"⏭  falta {r['faltando']}"
+        elif r['tentativas'] or r.get('erro') or r.get('faltando') or r.get('corpo_ms', 0) > LIMITE_MS:
+            falhas += 1
+            situacao = '❌ ' + (', '.join(sorted(set(r['tentativas']))) or r.get('erro') or
+                               (f"falta {r['faltando']}" if r.get('faltando') else 'lento'))
+        else:
+            situacao = '✅'
+        corpo = f"{r['corpo_ms']:.1f}" if 'corpo_ms' in r else '-'
+        total = f"{r['cumulativo_ms']:.1f}" if 'cumulativo_ms' in r else '-'
+        print(f"{modulo[:47]:<48}{corpo:>10}{total:>10}  {situacao[:60]}")
+    print("=" * 80)
+    print("✅ Nenhum import com efeito colateral" if not falhas else f"❌ {falhas} módulo(s) com problema")
+    return 1 if falhas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
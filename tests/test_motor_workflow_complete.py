@@ -15,9 +15,11 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import TimeoutException
 
+from driver_pool import obter_driver, devolver_driver
+from smart_wait import aguardar_estavel
+
 # Configuração
 CHROME_DRIVER_PATH = "C:\\chromedriver\\chromedriver.exe"
 BASE_URL = "http://localhost:5173"
@@ -32,12 +34,8 @@ def main():
     print(f"  - Modo: VISÍVEL (não headless)")
     print("\n" + "=" * 60)
     
-    # Configurar Chrome
-    service = Service(CHROME_DRIVER_PATH)
-    options = webdriver.ChromeOptions()
-    options.add_argument('--start-maximized')
-    
-    driver = webdriver.Chrome(service=service, options=options)
+    # Obter ChromeDriver do pool compartilhado (HEADLESS controlado por env var)
+    driver = obter_driver()
     wait = WebDriverWait(driver, 20)
     
     try:
@@ -49,7 +47,7 @@ def main():
         
         driver.get(f"{BASE_URL}/login")
         print("1. Navegando para login...")
-        time.sleep(2)
+        aguardar_estavel(driver, timeout=2)
         
         print("2. Fazendo login...")
         # CPF
@@ -69,7 +67,7 @@ def main():
         submit_btn.click()
         
         print("3. Aguardando dashboard...")
-        time.sleep(3)
+        aguardar_estavel(driver, timeout=3)
         
         print(f"✅ Login OK - URL: {driver.current_url}")
         
@@ -81,7 +79,7 @@ def main():
         
         print("1. Navegando para Dashboard...")
         driver.get(f"{BASE_URL}/dashboard")
-        time.sleep(2)
+        aguardar_estavel(driver, timeout=2)
         
         print("2. Procurando item de menu 'Processos Motor'...")
         # Menu lateral esquerdo - mesmo padrão dos outros testes
@@ -95,7 +93,7 @@ def main():
         
         print("3. Clicando em 'Processos Motor'...")
         processos_motor_btn.click()
-        time.sleep(2)
+        aguardar_estavel(driver, timeout=2)
         print("   ✅ Navegou para Processos Motor")
         
         # =================================================================
@@ -118,24 +116,24 @@ def main():
         print("2. Clicando UMA VEZ em 'Novo Processo Motor'... (cria processo novo)")
         driver.execute_script("arguments[0].click();", novo_processo_btn)
         print("   ✅ Botão clicado! Aguardando workflow inicializar...")
-        time.sleep(5)  # Aguarda mais tempo para garantir inicialização completa
+        aguardar_estavel(driver, timeout=5)  # Aguarda mais tempo para garantir inicialização completa
         
         print("3. Verificando se wizard inline abriu...")
         # Wizard abre INLINE (não em modal) quando vem da aba Processos Motor
         try:
             # Espera o loading sumir E o wizard aparecer
             print("   Aguardando 'Inicializando processo com Motor BPMN...' aparecer...")
-            time.sleep(2)
+            aguardar_estavel(driver, timeout=2)
             
             print("   Aguardando wizard finalizar carregamento...")
             wizard_title = wait.until(
                 EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'Novo Processo de Licenciamento')]"))
             )
             print(f"   ✅ Wizard aberto: {wizard_title.text}")
-            time.sleep(2)  # Aguarda renderização completa
+            aguardar_estavel(driver, timeout=2)  # Aguarda renderização completa
         except TimeoutException:
             print("   ⚠️  Timeout aguardando wizard, verificando estado...")
-            time.sleep(3)
+            aguardar_estavel(driver, timeout=3)
         
         # Verificar se está na página Participantes
         print("4. Verificando se chegou em Participantes...")
@@ -145,7 +143,7 @@ def main():
         if len(participantes_elementos) > 0:
             print("   ✅ Página Participantes carregada!")
         
-        time.sleep(2)  # Pausa para visualização
+        aguardar_estavel(driver, timeout=2)  # Pausa para visualização
         
         # =================================================================
         # ETAPA 4: ADICIONAR PARTICIPANTE (REQUERENTE)
@@ -162,7 +160,7 @@ def main():
             
             print("2. Clicando em 'Adicionar Participante'...")
             add_btn.click()
-            time.sleep(2)
+            aguardar_estavel(driver, timeout=2)
             print("   ✅ Modal de adicionar participante aberto")
             
             # Preencher CPF (só os 3 primeiros dígitos para buscar)
@@ -172,12 +170,12 @@ def main():
             )
             cpf_input.clear()
             cpf_input.send_keys("333")
-            time.sleep(2)  # Aguarda lista de sugestões aparecer
+            aguardar_estavel(driver, timeout=2)  # Aguarda lista de sugestões aparecer
             print("   ✅ CPF digitado")
             
             # Aguardar tabela de resultados aparecer
             print("4. Aguardando tabela de pessoas cadastradas...")
-            time.sleep(2)
+            aguardar_estavel(driver, timeout=2)
             
             # Procurar todas as linhas da tabela (tr dentro de tbody)
             print("5. Procurando linhas da tabela...")
@@ -199,14 +197,14 @@ def main():
                 # Clicar no botão Selecionar usando JavaScript
                 print("   Clicando no botão 'Selecionar'...")
                 driver.execute_script("arguments[0].click();", botao_selecionar)
-                time.sleep(2)
+                aguardar_estavel(driver, timeout=2)
                 print("   ✅ Botão 'Selecionar' clicado na última pessoa!")
             else:
                 print("   ⚠️  Nenhum item encontrado na lista, tentando adicionar manualmente...")
             
             # Aguardar pessoa ser selecionada e aparecer seção "Pessoa Selecionada"
             print("6. Aguardando pessoa ser selecionada...")
-            time.sleep(1)
+            aguardar_estavel(driver, timeout=1)
             
             # Procurar botão verde "+ Adicionar" no rodapé do modal
             print("7. Procurando botão verde '+ Adicionar' no rodapé do modal...")
@@ -219,7 +217,7 @@ def main():
             
             print("8. Clicando no botão '+ Adicionar' para finalizar...")
             driver.execute_script("arguments[0].click();", add_final_btn)
-            time.sleep(3)
+            aguardar_estavel(driver, timeout=3)
             print("   ✅ Participante adicionado e modal fechado!")
             
             print("✅ Participante adicionado com sucesso!")
@@ -228,7 +226,7 @@ def main():
             print(f"⚠️  Erro ao adicionar participante: {str(e)}")
             print("   Continuando mesmo assim...")
         
-        time.sleep(2)  # Pausa para visualização
+        aguardar_estavel(driver, timeout=2)  # Pausa para visualização
         
         # =================================================================
         # ETAPA 5: AVANÇAR PARA IMÓVEL
@@ -237,7 +235,7 @@ def main():
         print("-" * 60)
         
         print("1. Aguardando modal fechar e botão 'Próximo' aparecer...")
-        time.sleep(3)  # Aguarda modal fechar completamente
+        aguardar_estavel(driver, timeout=3)  # Aguarda modal fechar completamente
         
         print("2. Procurando botão 'Próximo' ou 'Avançar'...")
         try:
@@ -251,7 +249,7 @@ def main():
             
             print("3. Clicando em 'Próximo'...")
             driver.execute_script("arguments[0].click();", next_btn)
-            time.sleep(3)
+            aguardar_estavel(driver, timeout=3)
             
             print("4. Verificando se avançou para Imóvel...")
             imovel_elementos = driver.find_elements(By.XPATH, "//*[contains(text(), 'Imóvel') or contains(text(), 'Propriedade')]")
@@ -263,7 +261,7 @@ def main():
         except TimeoutException:
             print("⚠️  Botão 'Próximo' não encontrado")
         
-        time.sleep(2)  # Pausa para visualização
+        aguardar_estavel(driver, timeout=2)  # Pausa para visualização
         
         # =================================================================
         # ETAPA 6: AVANÇAR PARA EMPREENDIMENTO
@@ -280,7 +278,7 @@ def main():
             
             print("2. Clicando...")
             next_btn.click()
-            time.sleep(3)
+            aguardar_estavel(driver, timeout=3)
             
             print("3. Verificando se avançou para Empreendimento...")
             emp_elementos = driver.find_elements(By.XPATH, "//*[contains(text(), 'Empreendimento')]")
@@ -292,7 +290,7 @@ def main():
         except TimeoutException:
             print("⚠️  Botão não encontrado")
         
-        time.sleep(2)  # Pausa para visualização
+        aguardar_estavel(driver, timeout=2)  # Pausa para visualização
         
         # =================================================================
         # ETAPA 7: AVANÇAR PARA FORMULÁRIO
@@ -309,7 +307,7 @@ def main():
             
             print("2. Clicando...")
             next_btn.click()
-            time.sleep(3)
+            aguardar_estavel(driver, timeout=3)
             
             print("3. Verificando se avançou para Formulário...")
             form_elementos = driver.find_elements(By.XPATH, "//*[contains(text(), 'Formulário') or contains(text(), 'Questionário')]")
@@ -321,7 +319,7 @@ def main():
         except TimeoutException:
             print("⚠️  Botão não encontrado")
         
-        time.sleep(2)  # Pausa para visualização
+        aguardar_estavel(driver, timeout=2)  # Pausa para visualização
         
         # =================================================================
         # ETAPA 8: AVANÇAR PARA DOCUMENTAÇÃO
@@ -336,7 +334,7 @@ def main():
         if len(doc_elementos) > 0:
             print(f"   Elementos encontrados: {len(doc_elementos)}")
         
-        time.sleep(2)  # Pausa para visualização
+        aguardar_estavel(driver, timeout=2)  # Pausa para visualização
         
         # =================================================================
         # ETAPA 9: FINALIZAR WORKFLOW (REVISÃO)
@@ -366,18 +364,18 @@ def main():
         print("   8. Revisão (componente não criado)")
         
         print("\n🏁 Teste finalizado! Aguardando 10 segundos antes de fechar...")
-        time.sleep(10)  # Pausa final para visualização
+        aguardar_estavel(driver, timeout=10)  # Pausa final para visualização
         
     except Exception as e:
         print(f"\n❌ ERRO: {str(e)}")
         import traceback
         traceback.print_exc()
         print("\n⚠️  Erro encontrado. Aguardando 10 segundos antes de fechar...")
-        time.sleep(10)
+        aguardar_estavel(driver, timeout=10)
     
     finally:
         print("\nFechando navegador...")
-        driver.quit()
+        devolver_driver(driver)
         print("✅ Navegador fechado")
 
 if __name__ == "__main__":
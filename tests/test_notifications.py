@@ -3,19 +3,23 @@ Script para testar o sistema de notificações
 Cria notificações de teste usando a API backend
 """
 
-import requests
 import json
 from datetime import datetime
 
-# Configuração
-API_BASE_URL = "https://fastapi-sandbox-ee3p.onrender.com/api/v1"
+from api_client import obter_cliente
+from endpoint_resolver import resolver_api
+
+# Configuração (a API é resolvida no primeiro uso: o import não sonda a rede)
+API_PREFERIDAS = ['https://fastapi-sandbox-ee3p.onrender.com/api/v1']
 # Substitua pelo ID do usuário que você está testando
 USER_ID = "264671"  # ✅ ID do usuário logado
 
+def obter_api():
+    """Cliente keep-alive da API resolvida (cacheado pelo endpoint_resolver/api_client)"""
+    return obter_cliente(resolver_api(API_PREFERIDAS)['url'])
+
 def create_test_notification(notification_type: str, title: str, message: str, severity: str, action_url: str = None):
     """Cria uma notificação de teste"""
-    url = f"{API_BASE_URL}/notifications"
-    
     payload = {
         "user_id": USER_ID,
         "type": notification_type,
@@ -28,7 +32,7 @@ def create_test_notification(notification_type: str, title: str, message: str, s
     }
     
     try:
-        response = requests.post(url, json=payload)
+        response = obter_api().post("/notifications", json=payload)
         response.raise_for_status()
         print(f"✅ Notificação criada: {title}")
         return response.json()
@@ -38,11 +42,10 @@ def create_test_notification(notification_type: str, title: str, message: str, s
 
 def get_user_notifications():
     """Lista todas as notificações do usuário"""
-    url = f"{API_BASE_URL}/notifications"
     params = {"user_id": USER_ID, "skip": 0, "limit": 20}
     
     try:
-        response = requests.get(url, params=params)
+        response = obter_api().get("/notifications", params=params)
         response.raise_for_status()
         data = response.json()
         print(f"\n📊 Total de notificações: {data['total']}")
@@ -56,11 +59,10 @@ def get_user_notifications():
 
 def get_stats():
     """Obtém estatísticas das notificações"""
-    url = f"{API_BASE_URL}/notifications/stats"
     params = {"user_id": USER_ID}
     
     try:
-        response = requests.get(url, params=params)
+        response = obter_api().get("/notifications/stats", params=params)
         response.raise_for_status()
         stats = response.json()
         print(f"\n📈 Estatísticas:")
@@ -138,6 +140,8 @@ def main():
     # Obter estatísticas
     get_stats()
     
+    obter_api().imprimir_resumo()
+    
     print("\n" + "=" * 60)
     print("✅ TESTE CONCLUÍDO!")
     print("=" * 60)
@@ -4,18 +4,19 @@ Inclui criação via API, verificação do sino, listagem e leitura de notifica
 """
 
 import os
+import sys
 import time
-import requests
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
 from dotenv import load_dotenv
 
-# Criar diretório para screenshots se não existir
-os.makedirs('tests/screenshots', exist_ok=True)
+from driver_pool import obter_driver, devolver_driver
+from smart_wait import aguardar_estavel
+from endpoint_resolver import candidatos, resolver_api, descrever
+from api_client import obter_cliente
 
 # Carregar variáveis de ambiente
 load_dotenv()
@@ -24,14 +25,11 @@ load_dotenv()
 CPF = os.getenv('TEST_CPF', '61404694579')
 PASSWORD = os.getenv('TEST_PASSWORD', 'Senh@01!')
 BASE_URL = os.getenv('BASE_URL', 'http://localhost:5173')
-# Testa API local primeiro, fallback para Render
-API_BASE_URLS = [
-    'http://localhost:8000/api/v1',
-    'https://fastapi-sandbox-ee3p.onrender.com/api/v1'
-]
+# Testa API local primeiro (ou API_URL, ex.: backend_local.py), fallback para Render
+API_BASE_URLS = candidatos(['http://localhost:8000/api/v1', 'https://fastapi-sandbox-ee3p.onrender.com/api/v1'])
 API_BASE_URL = None  # Será detectado automaticamente
+API_LATENCIA_MS = None  # Latência do /health da API escolhida
 USER_ID = os.getenv('TEST_USER_ID', '264671')
-CHROMEDRIVER_PATH = r'C:\chromedriver\chromedriver.exe'
 
 # Dados para notificações de teste
 TIMESTAMP = datetime.now().strftime("%H:%M:%S")
@@ -60,40 +58,25 @@ TEST_NOTIFICATIONS = [
 ]
 
 def detect_api_url():
-    """Detecta qual API está disponível (local ou Render)"""
-    global API_BASE_URL
+    """Detecta qual API está disponível (health check em paralelo, ver endpoint_resolver)"""
+    global API_BASE_URL, API_LATENCIA_MS
     
     print("\n🔍 Detectando API disponível...")
-    for url in API_BASE_URLS:
-        try:
-            response = requests.get(f"{url}/health", timeout=5)
-            if response.status_code == 200:
-                API_BASE_URL = url
-                print(f"  ✅ API detectada: {url}")
-                return url
-        except:
-            print(f"  ❌ API não disponível: {url}")
-            continue
-    
-    # Se nenhuma API respondeu, usa a primeira como fallback
-    API_BASE_URL = API_BASE_URLS[0]
-    print(f"  ⚠️ Nenhuma API respondeu ao health check. Usando: {API_BASE_URL}")
+    api = resolver_api(API_BASE_URLS)
+    API_BASE_URL = api['url']
+    API_LATENCIA_MS = api['latencia_ms']
+    if api['saudavel']:
+        print(f"  ✅ API detectada: {descrever(api)}")
+    else:
+        print(f"  ⚠️ Nenhuma API respondeu ao health check. Usando: {API_BASE_URL}")
     return API_BASE_URL
 
-# Detectar API disponível
-detect_api_url()
-
-print(f"\n👤 CPF: {CPF}")
-print(f"🔗 URL: {BASE_URL}")
-print(f"🔔 API: {API_BASE_URL}")
-print(f"👤 User ID: {USER_ID}")
-print("=" * 70)
-print("🧪 TESTE COMPLETO: Sistema de Notificações")
-print("=" * 70)
+def obter_api():
+    """Cliente keep-alive da API (detectada no primeiro uso, não no import)"""
+    return obter_cliente(API_BASE_URL or detect_api_url())
 
 def create_notification_via_api(notification_data):
     """Cria uma notificação via API"""
-    url = f"{API_BASE_URL}/notifications"
     payload = {
         "user_id": USER_ID,
         "type": notification_data['type'],
@@ -106,7 +89,7 @@ def create_notification_via_api(notification_data):
     }
     
     try:
-        response = requests.post(url, json=payload)
+        response = obter_api().post("/notifications", json=payload)
         response.raise_for_status()
         return response.json()
     except Exception as e:
@@ -115,11 +98,10 @@ def create_notification_via_api(notification_data):
 
 def get_notifications_count_via_api():
     """Obtém contagem de notificações não lidas via API"""
-    url = f"{API_BASE_URL}/notifications/stats"
     params = {"user_id": USER_ID}
     
     try:
-        response = requests.get(url, params=params)
+        response = obter_api().get("/notifications/stats", params=params)
         response.raise_for_status()
         stats = response.json()
         return stats.get('unread_count', 0), stats.get('total_count', 0)
@@ -127,343 +109,363 @@ def get_notifications_count_via_api():
         print(f"  ⚠️ Erro ao obter stats via API: {e}")
         return 0, 0
 
-# Configurar ChromeDriver
-service = Service(executable_path=CHROMEDRIVER_PATH)
-options = webdriver.ChromeOptions()
-options.add_argument('--start-maximized')
-options.add_argument('--disable-blink-features=AutomationControlled')
-options.add_argument('--auto-open-devtools-for-tabs')
 
-print("\n📦 Inicializando ChromeDriver...")
-driver = webdriver.Chrome(service=service, options=options)
-wait = WebDriverWait(driver, 10)
-print("✅ ChromeDriver iniciado com sucesso (DevTools aberto)")
+def main() -> int:
+    """Detecta a API, abre o navegador e percorre o sino, o dropdown e a página de notificações"""
+    # Detectar API disponível
+    detect_api_url()
+
+    print(f"\n👤 CPF: {CPF}")
+    print(f"🔗 URL: {BASE_URL}")
+    print(f"🔔 API: {API_BASE_URL}" + (f" ({API_LATENCIA_MS:.0f} ms)" if API_LATENCIA_MS else ""))
+    print(f"👤 User ID: {USER_ID}")
+    print("=" * 70)
+    print("🧪 TESTE COMPLETO: Sistema de Notificações")
+    print("=" * 70)
+
+    # Criar diretório para screenshots se não existir
+    os.makedirs('tests/screenshots', exist_ok=True)
+
+    # Obter ChromeDriver do pool compartilhado (HEADLESS controlado por env var)
+    print("\n📦 Inicializando ChromeDriver...")
+    driver = obter_driver()
+    wait = WebDriverWait(driver, 10)
+    print("✅ ChromeDriver iniciado com sucesso")
 
-try:
-    # 1. VERIFICAR NOTIFICAÇÕES EXISTENTES VIA API
-    print(f"\n🔔 [1/7] Verificando notificações existentes via API...")
-    
     try:
-        unread_api, total_api = get_notifications_count_via_api()
-        print(f"  ℹ️ API Stats - Não lidas: {unread_api}, Total: {total_api}")
+        # 1. VERIFICAR NOTIFICAÇÕES EXISTENTES VIA API
+        print(f"\n🔔 [1/7] Verificando notificações existentes via API...")
+    
+        try:
+            unread_api, total_api = get_notifications_count_via_api()
+            print(f"  ℹ️ API Stats - Não lidas: {unread_api}, Total: {total_api}")
         
-        if total_api > 0:
-            print(f"✅ Sistema tem {total_api} notificações (testando com dados existentes)")
-        else:
-            print("  ⚠️ Nenhuma notificação existente")
-            print("  ℹ️ Teste continuará para validar interface mesmo sem dados")
-    except Exception as e:
-        print(f"  ⚠️ Não foi possível verificar stats via API: {e}")
-        print("  ℹ️ Teste continuará para validar interface")
+            if total_api > 0:
+                print(f"✅ Sistema tem {total_api} notificações (testando com dados existentes)")
+            else:
+                print("  ⚠️ Nenhuma notificação existente")
+                print("  ℹ️ Teste continuará para validar interface mesmo sem dados")
+        except Exception as e:
+            print(f"  ⚠️ Não foi possível verificar stats via API: {e}")
+            print("  ℹ️ Teste continuará para validar interface")
     
-    # 2. FAZER LOGIN
-    print(f"\n🔐 [2/7] Fazendo login...")
-    driver.get(BASE_URL)
-    time.sleep(2)
+        # 2. FAZER LOGIN
+        print(f"\n🔐 [2/7] Fazendo login...")
+        driver.get(BASE_URL)
+        aguardar_estavel(driver, timeout=2)
     
-    cpf_input = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 'input[type="text"]')))
-    cpf_input.clear()
-    cpf_input.send_keys(CPF)
-    print(f"  ✓ CPF: {CPF}")
+        cpf_input = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 'input[type="text"]')))
+        cpf_input.clear()
+        cpf_input.send_keys(CPF)
+        print(f"  ✓ CPF: {CPF}")
     
-    password_input = driver.find_element(By.CSS_SELECTOR, 'input[type="password"]')
-    password_input.clear()
-    password_input.send_keys(PASSWORD)
-    print("  ✓ Senha preenchida")
+        password_input = driver.find_element(By.CSS_SELECTOR, 'input[type="password"]')
+        password_input.clear()
+        password_input.send_keys(PASSWORD)
+        print("  ✓ Senha preenchida")
     
-    login_button = driver.find_element(By.CSS_SELECTOR, 'button[type="submit"]')
-    login_button.click()
-    time.sleep(5)
-    print("✅ Login realizado")
+        login_button = driver.find_element(By.CSS_SELECTOR, 'button[type="submit"]')
+        login_button.click()
+        aguardar_estavel(driver, timeout=5)
+        print("✅ Login realizado")
     
-    # Navegar para uma página que tem o NotificationBell (InscricaoLayout)
-    print("  ↗️ Navegando para página com notificações...")
-    driver.get(f"{BASE_URL}/inscricao/participantes")
-    time.sleep(3)
-    print("  ✓ Página de inscrição carregada")
+        # Navegar para uma página que tem o NotificationBell (InscricaoLayout)
+        print("  ↗️ Navegando para página com notificações...")
+        driver.get(f"{BASE_URL}/inscricao/participantes")
+        aguardar_estavel(driver, timeout=3)
+        print("  ✓ Página de inscrição carregada")
     
-    # 3. VERIFICAR SINO DE NOTIFICAÇÕES NO HEADER
-    print("\n🔔 [3/7] Verificando sino de notificações...")
+        # 3. VERIFICAR SINO DE NOTIFICAÇÕES NO HEADER
+        print("\n🔔 [3/7] Verificando sino de notificações...")
     
-    # Procurar pelo botão do sino (pode ter badge com contador)
-    try:
-        # Tentar diferentes seletores possíveis
-        notification_bell = None
-        selectors = [
-            'button[aria-label*="notifica"]',
-            'button[aria-label*="Notifica"]',
-            'button svg[class*="Bell"]',
-            'button:has(svg.lucide-bell)',
-            '[data-testid="notification-bell"]'
-        ]
-        
-        for selector in selectors:
-            try:
-                notification_bell = wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
-                print(f"  ✓ Sino encontrado com seletor: {selector}")
-                break
-            except:
-                continue
+        # Procurar pelo botão do sino (pode ter badge com contador)
+        try:
+            # Tentar diferentes seletores possíveis
+            notification_bell = None
+            selectors = [
+                'button[aria-label*="notifica"]',
+                'button[aria-label*="Notifica"]',
+                'button svg[class*="Bell"]',
+                'button:has(svg.lucide-bell)',
+                '[data-testid="notification-bell"]'
+            ]
         
-        if not notification_bell:
-            # Fallback: procurar por qualquer button com SVG que pareça sino
-            buttons = driver.find_elements(By.TAG_NAME, 'button')
-            for btn in buttons:
+            for selector in selectors:
                 try:
-                    svg = btn.find_element(By.TAG_NAME, 'svg')
-                    if 'bell' in svg.get_attribute('class').lower() or 'bell' in btn.get_attribute('aria-label').lower():
-                        notification_bell = btn
-                        print("  ✓ Sino encontrado via fallback")
-                        break
+                    notification_bell = wait.until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+                    )
+                    print(f"  ✓ Sino encontrado com seletor: {selector}")
+                    break
                 except:
                     continue
         
-        if notification_bell:
-            # Verificar se tem badge com número
-            try:
-                badge = notification_bell.find_element(By.CSS_SELECTOR, '[class*="badge"], span[class*="count"]')
-                badge_text = badge.text
-                print(f"  ✓ Badge encontrado: {badge_text} notificações não lidas")
-            except:
-                print("  ℹ️ Badge não encontrado (pode não ter notificações não lidas)")
+            if not notification_bell:
+                # Fallback: procurar por qualquer button com SVG que pareça sino
+                buttons = driver.find_elements(By.TAG_NAME, 'button')
+                for btn in buttons:
+                    try:
+                        svg = btn.find_element(By.TAG_NAME, 'svg')
+                        if 'bell' in svg.get_attribute('class').lower() or 'bell' in btn.get_attribute('aria-label').lower():
+                            notification_bell = btn
+                            print("  ✓ Sino encontrado via fallback")
+                            break
+                    except:
+                        continue
+        
+            if notification_bell:
+                # Verificar se tem badge com número
+                try:
+                    badge = notification_bell.find_element(By.CSS_SELECTOR, '[class*="badge"], span[class*="count"]')
+                    badge_text = badge.text
+                    print(f"  ✓ Badge encontrado: {badge_text} notificações não lidas")
+                except:
+                    print("  ℹ️ Badge não encontrado (pode não ter notificações não lidas)")
             
-            # Screenshot do sino
-            driver.save_screenshot('tests/screenshots/notifications_bell.png')
-            print("  📸 Screenshot: notifications_bell.png")
-            print("✅ Sino de notificações verificado")
-        else:
-            print("  ⚠️ Sino de notificações não encontrado - pode não estar implementado no header")
-            driver.save_screenshot('tests/screenshots/notifications_bell_not_found.png')
+                # Screenshot do sino
+                driver.save_screenshot('tests/screenshots/notifications_bell.png')
+                print("  📸 Screenshot: notifications_bell.png")
+                print("✅ Sino de notificações verificado")
+            else:
+                print("  ⚠️ Sino de notificações não encontrado - pode não estar implementado no header")
+                driver.save_screenshot('tests/screenshots/notifications_bell_not_found.png')
     
-    except Exception as e:
-        print(f"  ⚠️ Erro ao verificar sino: {e}")
-        driver.save_screenshot('tests/screenshots/notifications_bell_error.png')
+        except Exception as e:
+            print(f"  ⚠️ Erro ao verificar sino: {e}")
+            driver.save_screenshot('tests/screenshots/notifications_bell_error.png')
     
-    # 4. CLICAR NO SINO E VERIFICAR DROPDOWN
-    print("\n📋 [4/7] Tentando abrir dropdown de notificações...")
-    dropdown_opened = False
+        # 4. CLICAR NO SINO E VERIFICAR DROPDOWN
+        print("\n📋 [4/7] Tentando abrir dropdown de notificações...")
+        dropdown_opened = False
     
-    try:
-        if notification_bell:
-            # Tentar clicar no sino
-            try:
-                notification_bell.click()
-                time.sleep(1.5)
+        try:
+            if notification_bell:
+                # Tentar clicar no sino
+                try:
+                    notification_bell.click()
+                    aguardar_estavel(driver, timeout=1.5)
                 
-                # Procurar dropdown/popover de notificações
-                dropdown = driver.find_element(
-                    By.CSS_SELECTOR, 
-                    '[role="menu"], [class*="dropdown"], [class*="popover"], [class*="notification-list"], .notifications-dropdown'
-                )
-                dropdown_opened = True
-                print("  ✓ Dropdown aberto com sucesso")
+                    # Procurar dropdown/popover de notificações
+                    dropdown = driver.find_element(
+                        By.CSS_SELECTOR, 
+                        '[role="menu"], [class*="dropdown"], [class*="popover"], [class*="notification-list"], .notifications-dropdown'
+                    )
+                    dropdown_opened = True
+                    print("  ✓ Dropdown aberto com sucesso")
                 
-                # Contar itens de notificação no dropdown
-                notification_items = dropdown.find_elements(
-                    By.CSS_SELECTOR, 
-                    '[role="menuitem"], [class*="notification-item"], li, div[class*="item"]'
-                )
-                if notification_items:
-                    print(f"  ✓ {len(notification_items)} item(ns) encontrado(s) no dropdown")
-                else:
-                    print("  ℹ️ Dropdown aberto mas sem itens visíveis")
+                    # Contar itens de notificação no dropdown
+                    notification_items = dropdown.find_elements(
+                        By.CSS_SELECTOR, 
+                        '[role="menuitem"], [class*="notification-item"], li, div[class*="item"]'
+                    )
+                    if notification_items:
+                        print(f"  ✓ {len(notification_items)} item(ns) encontrado(s) no dropdown")
+                    else:
+                        print("  ℹ️ Dropdown aberto mas sem itens visíveis")
                 
-                # Screenshot do dropdown
-                driver.save_screenshot('tests/screenshots/notifications_dropdown.png')
-                print("  📸 Screenshot: notifications_dropdown.png")
+                    # Screenshot do dropdown
+                    driver.save_screenshot('tests/screenshots/notifications_dropdown.png')
+                    print("  📸 Screenshot: notifications_dropdown.png")
                 
-            except Exception as e:
-                print(f"  ℹ️ Dropdown não abriu ou não foi encontrado: {str(e)[:100]}")
-                print("  ↪️ Continuando teste direto na página /notificacoes")
+                except Exception as e:
+                    print(f"  ℹ️ Dropdown não abriu ou não foi encontrado: {str(e)[:100]}")
+                    print("  ↪️ Continuando teste direto na página /notificacoes")
                 
-    except Exception as e:
-        print(f"  ℹ️ Pulando teste de dropdown: {str(e)[:100]}")
+        except Exception as e:
+            print(f"  ℹ️ Pulando teste de dropdown: {str(e)[:100]}")
     
-    # 5. NAVEGAR PARA PÁGINA DE NOTIFICAÇÕES
-    print("\n📄 [5/7] Navegando para página de notificações...")
+        # 5. NAVEGAR PARA PÁGINA DE NOTIFICAÇÕES
+        print("\n📄 [5/7] Navegando para página de notificações...")
     
-    try:
-        # Se dropdown abriu, tentar clicar no "Ver todas"
-        if dropdown_opened:
-            try:
-                ver_todas_link = driver.find_element(
-                    By.XPATH, 
-                    "//a[contains(text(), 'Ver todas')] | //a[contains(text(), 'todas as notificações')] | //button[contains(text(), 'Ver todas')]"
-            )
-                ver_todas_link.click()
-                time.sleep(2)
-                print("  ✓ Clicou em 'Ver todas as notificações'")
-            except:
-                # Dropdown abriu mas sem link "Ver todas" - ir direto pela URL
+        try:
+            # Se dropdown abriu, tentar clicar no "Ver todas"
+            if dropdown_opened:
+                try:
+                    ver_todas_link = driver.find_element(
+                        By.XPATH, 
+                        "//a[contains(text(), 'Ver todas')] | //a[contains(text(), 'todas as notificações')] | //button[contains(text(), 'Ver todas')]"
+                )
+                    ver_todas_link.click()
+                    aguardar_estavel(driver, timeout=2)
+                    print("  ✓ Clicou em 'Ver todas as notificações'")
+                except:
+                    # Dropdown abriu mas sem link "Ver todas" - ir direto pela URL
+                    driver.get(f"{BASE_URL}/notificacoes")
+                    aguardar_estavel(driver, timeout=2)
+                    print("  ✓ Navegou direto para /notificacoes")
+            else:
+                # Dropdown não abriu - ir direto pela URL
                 driver.get(f"{BASE_URL}/notificacoes")
-                time.sleep(2)
+                aguardar_estavel(driver, timeout=2)
                 print("  ✓ Navegou direto para /notificacoes")
-        else:
-            # Dropdown não abriu - ir direto pela URL
-            driver.get(f"{BASE_URL}/notificacoes")
-            time.sleep(2)
-            print("  ✓ Navegou direto para /notificacoes")
         
-        # Verificar se está na página correta
-        current_url = driver.current_url
-        if 'notificacoes' in current_url.lower():
-            print(f"  ✓ URL atual: {current_url}")
-            print("✅ Página de notificações carregada")
-        else:
-            print(f"  ⚠️ URL inesperada: {current_url}")
-            # Tentar ir direto
-            driver.get(f"{BASE_URL}/notificacoes")
-            time.sleep(2)
+            # Verificar se está na página correta
+            current_url = driver.current_url
+            if 'notificacoes' in current_url.lower():
+                print(f"  ✓ URL atual: {current_url}")
+                print("✅ Página de notificações carregada")
+            else:
+                print(f"  ⚠️ URL inesperada: {current_url}")
+                # Tentar ir direto
+                driver.get(f"{BASE_URL}/notificacoes")
+                aguardar_estavel(driver, timeout=2)
     
-    except Exception as e:
-        print(f"  ⚠️ Erro ao navegar: {e}")
-        driver.get(f"{BASE_URL}/notificacoes")
-        time.sleep(2)
+        except Exception as e:
+            print(f"  ⚠️ Erro ao navegar: {e}")
+            driver.get(f"{BASE_URL}/notificacoes")
+            aguardar_estavel(driver, timeout=2)
     
-    # 6. VERIFICAR LISTA DE NOTIFICAÇÕES
-    print("\n📊 [6/7] Verificando lista de notificações...")
+        # 6. VERIFICAR LISTA DE NOTIFICAÇÕES
+        print("\n📊 [6/7] Verificando lista de notificações...")
     
-    try:
-        # Aguardar lista carregar
-        time.sleep(3)
-        
-        # Verificar se a lista está carregando (spinner)
         try:
-            spinner = driver.find_element(By.CSS_SELECTOR, '.animate-spin')
-            print("  ⏳ Aguardando carregamento...")
-            time.sleep(2)
-        except:
-            pass
+            # Aguardar lista carregar
+            aguardar_estavel(driver, timeout=3)
+        
+            # Verificar se a lista está carregando (spinner)
+            try:
+                spinner = driver.find_element(By.CSS_SELECTOR, '.animate-spin')
+                print("  ⏳ Aguardando carregamento...")
+                aguardar_estavel(driver, timeout=2)
+            except:
+                pass
         
-        # Procurar por NotificationItem components (usam div com botões de ação)
-        # Baseado no código: NotificationCenter renderiza NotificationItem para cada notificação
-        notification_items = driver.find_elements(By.CSS_SELECTOR, '.space-y-3 > div')
+            # Procurar por NotificationItem components (usam div com botões de ação)
+            # Baseado no código: NotificationCenter renderiza NotificationItem para cada notificação
+            notification_items = driver.find_elements(By.CSS_SELECTOR, '.space-y-3 > div')
         
-        if len(notification_items) > 0:
-            print(f"  ✓ {len(notification_items)} notificação(ões) encontrada(s) na lista")
+            if len(notification_items) > 0:
+                print(f"  ✓ {len(notification_items)} notificação(ões) encontrada(s) na lista")
             
-            # Mostrar detalhes das primeiras notificações
-            for i, item in enumerate(notification_items[:5], 1):
-                try:
-                    # Cada NotificationItem tem título e mensagem
-                    text_content = item.text.strip()
-                    # Pegar primeira linha significativa como título (pula emojis sozinhos)
-                    lines = [line.strip() for line in text_content.split('\n') if line.strip() and len(line.strip()) > 2]
-                    if lines:
-                        # Mostrar primeira linha que tenha mais de 2 caracteres
-                        title = lines[0] if len(lines[0]) > 2 else (lines[1] if len(lines) > 1 else lines[0])
-                        print(f"  {i}. {title[:70]}")
-                    else:
-                        print(f"  {i}. [Notificação vazia]")
-                except Exception as e:
-                    print(f"  {i}. [Erro ao ler: {str(e)[:30]}]")
+                # Mostrar detalhes das primeiras notificações
+                for i, item in enumerate(notification_items[:5], 1):
+                    try:
+                        # Cada NotificationItem tem título e mensagem
+                        text_content = item.text.strip()
+                        # Pegar primeira linha significativa como título (pula emojis sozinhos)
+                        lines = [line.strip() for line in text_content.split('\n') if line.strip() and len(line.strip()) > 2]
+                        if lines:
+                            # Mostrar primeira linha que tenha mais de 2 caracteres
+                            title = lines[0] if len(lines[0]) > 2 else (lines[1] if len(lines) > 1 else lines[0])
+                            print(f"  {i}. {title[:70]}")
+                        else:
+                            print(f"  {i}. [Notificação vazia]")
+                    except Exception as e:
+                        print(f"  {i}. [Erro ao ler: {str(e)[:30]}]")
             
-            # Screenshot da lista
-            driver.save_screenshot('tests/screenshots/notifications_list.png')
-            print("  📸 Screenshot: notifications_list.png")
-            print("✅ Lista de notificações validada")
+                # Screenshot da lista
+                driver.save_screenshot('tests/screenshots/notifications_list.png')
+                print("  📸 Screenshot: notifications_list.png")
+                print("✅ Lista de notificações validada")
             
-        else:
-            # Verificar se tem mensagem de lista vazia
-            print("  ℹ️ Verificando mensagem de lista vazia...")
-            try:
-                empty_state = driver.find_element(By.XPATH, "//*[contains(text(), 'Nenhuma notificação')]")
-                print(f"  ✓ Mensagem encontrada: {empty_state.text[:80]}")
-                print("✅ Página mostra corretamente que não há notificações")
-            except:
-                print("  ⚠️ Nenhuma notificação encontrada e sem mensagem de lista vazia")
-                print("  ℹ️ A API retornou 1 notificação mas a página não está mostrando")
-                print("  ℹ️ Pode haver problema no filtro ou no carregamento")
+            else:
+                # Verificar se tem mensagem de lista vazia
+                print("  ℹ️ Verificando mensagem de lista vazia...")
+                try:
+                    empty_state = driver.find_element(By.XPATH, "//*[contains(text(), 'Nenhuma notificação')]")
+                    print(f"  ✓ Mensagem encontrada: {empty_state.text[:80]}")
+                    print("✅ Página mostra corretamente que não há notificações")
+                except:
+                    print("  ⚠️ Nenhuma notificação encontrada e sem mensagem de lista vazia")
+                    print("  ℹ️ A API retornou 1 notificação mas a página não está mostrando")
+                    print("  ℹ️ Pode haver problema no filtro ou no carregamento")
             
-            driver.save_screenshot('tests/screenshots/notifications_list_empty.png')
+                driver.save_screenshot('tests/screenshots/notifications_list_empty.png')
     
-    except Exception as e:
-        print(f"  ⚠️ Erro ao verificar lista: {e}")
-        driver.save_screenshot('tests/screenshots/notifications_list_error.png')
+        except Exception as e:
+            print(f"  ⚠️ Erro ao verificar lista: {e}")
+            driver.save_screenshot('tests/screenshots/notifications_list_error.png')
     
-    # 7. MARCAR UMA NOTIFICAÇÃO COMO LIDA
-    print("\n✉️ [7/7] Testando marcar notificação como lida...")
+        # 7. MARCAR UMA NOTIFICAÇÃO COMO LIDA
+        print("\n✉️ [7/7] Testando marcar notificação como lida...")
     
-    try:
-        # Procurar primeira notificação não lida
-        unread_notifications = driver.find_elements(
-            By.CSS_SELECTOR,
-            '[class*="unread"], [data-read="false"], [class*="new"]'
-        )
+        try:
+            # Procurar primeira notificação não lida
+            unread_notifications = driver.find_elements(
+                By.CSS_SELECTOR,
+                '[class*="unread"], [data-read="false"], [class*="new"]'
+            )
         
-        if len(unread_notifications) > 0:
-            first_unread = unread_notifications[0]
-            print(f"  ✓ Notificação não lida encontrada")
+            if len(unread_notifications) > 0:
+                first_unread = unread_notifications[0]
+                print(f"  ✓ Notificação não lida encontrada")
             
-            # Tentar clicar na notificação
-            first_unread.click()
-            time.sleep(2)
+                # Tentar clicar na notificação
+                first_unread.click()
+                aguardar_estavel(driver, timeout=2)
             
-            print("  ✓ Clicou na notificação")
+                print("  ✓ Clicou na notificação")
             
-            # Verificar se mudou o estado visual
-            # (a notificação pode ter sido marcada como lida automaticamente)
-            driver.save_screenshot('tests/screenshots/notifications_read.png')
-            print("  📸 Screenshot: notifications_read.png")
-            print("✅ Interação com notificação realizada")
+                # Verificar se mudou o estado visual
+                # (a notificação pode ter sido marcada como lida automaticamente)
+                driver.save_screenshot('tests/screenshots/notifications_read.png')
+                print("  📸 Screenshot: notifications_read.png")
+                print("✅ Interação com notificação realizada")
             
-        else:
-            print("  ℹ️ Nenhuma notificação não lida encontrada para testar")
+            else:
+                print("  ℹ️ Nenhuma notificação não lida encontrada para testar")
     
-    except Exception as e:
-        print(f"  ⚠️ Erro ao marcar como lida: {e}")
+        except Exception as e:
+            print(f"  ⚠️ Erro ao marcar como lida: {e}")
     
-    # VERIFICAR LOGS DO CONSOLE
-    print("\n📋 Capturando logs do console...")
-    try:
-        logs = driver.get_log('browser')
-        if logs:
-            print(f"\n📋 Últimos logs do console ({len(logs)} mensagens):")
-            # Mostrar apenas logs relevantes a notificações
-            notification_logs = [log for log in logs if 'notification' in log['message'].lower()]
-            for log in notification_logs[-10:]:  # Últimas 10
-                level = log['level']
-                message = log['message']
-                print(f"  [{level}] {message[:100]}...")
-        else:
-            print("  ℹ️ Nenhum log relevante encontrado")
-    except Exception as e:
-        print(f"  ⚠️ Erro ao capturar logs: {e}")
+        # VERIFICAR LOGS DO CONSOLE
+        print("\n📋 Capturando logs do console...")
+        try:
+            logs = driver.get_log('browser')
+            if logs:
+                print(f"\n📋 Últimos logs do console ({len(logs)} mensagens):")
+                # Mostrar apenas logs relevantes a notificações
+                notification_logs = [log for log in logs if 'notification' in log['message'].lower()]
+                for log in notification_logs[-10:]:  # Últimas 10
+                    level = log['level']
+                    message = log['message']
+                    print(f"  [{level}] {message[:100]}...")
+            else:
+                print("  ℹ️ Nenhum log relevante encontrado")
+        except Exception as e:
+            print(f"  ⚠️ Erro ao capturar logs: {e}")
     
-    # Screenshot final
-    driver.save_screenshot('tests/screenshots/notifications_final.png')
-    print("  📸 Screenshot final: notifications_final.png")
+        # Screenshot final
+        driver.save_screenshot('tests/screenshots/notifications_final.png')
+        print("  📸 Screenshot final: notifications_final.png")
     
-    print("\n" + "=" * 70)
-    print("🎉 TESTE DE NOTIFICAÇÕES CONCLUÍDO!")
-    print("=" * 70)
-    print(f"\n✅ Resumo:")
-    print(f"  • Verificou API de notificações")
-    print(f"  • Sino de notificações verificado")
-    print(f"  • Dropdown de notificações testado")
-    print(f"  • Página /notificacoes acessada")
-    print(f"  • Lista de notificações validada")
-    print(f"  • Interação com notificações testada")
-    print("\n📝 Observações:")
-    print("  • Teste validou interface mesmo sem criar notificações")
-    print("  • Para testar com dados, use o backend para criar notificações")
-    print("=" * 70)
+        print("\n" + "=" * 70)
+        print("🎉 TESTE DE NOTIFICAÇÕES CONCLUÍDO!")
+        print("=" * 70)
+        print(f"\n✅ Resumo:")
+        print(f"  • Verificou API de notificações")
+        print(f"  • Sino de notificações verificado")
+        print(f"  • Dropdown de notificações testado")
+        print(f"  • Página /notificacoes acessada")
+        print(f"  • Lista de notificações validada")
+        print(f"  • Interação com notificações testada")
+        print("\n📝 Observações:")
+        print("  • Teste validou interface mesmo sem criar notificações")
+        print("  • Para testar com dados, use o backend para criar notificações")
+        print("=" * 70)
 
-except Exception as e:
-    print(f"\n❌ ERRO DURANTE TESTE: {e}")
-    driver.save_screenshot('tests/screenshots/notifications_error.png')
-    print("  📸 Screenshot do erro: notifications_error.png")
-    import traceback
-    traceback.print_exc()
+    except Exception as e:
+        print(f"\n❌ ERRO DURANTE TESTE: {e}")
+        driver.save_screenshot('tests/screenshots/notifications_error.png')
+        print("  📸 Screenshot do erro: notifications_error.png")
+        import traceback
+        traceback.print_exc()
+        return 1
 
-finally:
-    print("\n⏸️  TESTE FINALIZADO - Navegador permanecerá aberto para análise")
-    print("    Verifique o console do navegador (DevTools) para erros")
-    print("    Pressione ENTER para fechar o navegador e finalizar...")
-    input()
+    finally:
+        obter_api().imprimir_resumo()
     
-    print("\n🔚 Fechando navegador...")
-    driver.quit()
-    print("✅ Navegador fechado")
+        print("\n⏸️  TESTE FINALIZADO - Navegador permanecerá aberto para análise")
+        print("    Verifique o console do navegador (DevTools) para erros")
+        print("    Pressione ENTER para fechar o navegador e finalizar...")
+        input()
+    
+        print("\n🔚 Fechando navegador...")
+        devolver_driver(driver)
+        print("✅ Navegador fechado")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,7 +5,7 @@ Teste Automatizado 01 - Menu e Navegação
 Testa a navegação até o formulário de Novo Empreendimento.
 
 Fluxo:
-1. Faz login no sistema
+1. Faz login no sistema (sessão via API injetada no navegador)
 2. Navega para Dashboard
 3. Clica no menu "Empreendimento"
 4. Clica no botão "Novo Empreendimento"
@@ -29,6 +29,11 @@ from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 
+from smart_wait import aguardar_estavel
+from auth_session import autenticar, injetar_sessao
+from artifacts import capturar_falha
+from step_trace import etapa, instrumentar
+
 # Configuração
 CHROME_DRIVER_PATH = "C:\\chromedriver\\chromedriver.exe"
 BASE_URL = "http://localhost:5173"
@@ -78,6 +83,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
             service = Service(CHROME_DRIVER_PATH)
             driver = webdriver.Chrome(service=service, options=options)
         
+        instrumentar(driver)
         wait = WebDriverWait(driver, TIMEOUT)
     
     contexto = {
@@ -93,15 +99,25 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         # ETAPA 1: AUTO-LOGIN VIA TOKEN
         # =================================================================
         print("📝 ETAPA 1: AUTO-LOGIN VIA TOKEN")
+        etapa("ETAPA 1: AUTO-LOGIN VIA TOKEN", teste="teste_01")
         print("-" * 80)
         
-        print(f"✓ Acessando URL com auto-login...")
-        driver.get(AUTO_LOGIN_URL)
-        print("✓ URL carregada com token de autenticação")
+        # Sessão obtida uma vez via API (cacheada) e injetada antes da navegação;
+        # a URL de auto-login fica como fallback se a API não responder
+        try:
+            sessao = autenticar()
+            injetar_sessao(driver, sessao, BASE_URL)
+            print("✓ Sessão obtida via API e injetada no navegador")
+            driver.get(BASE_URL)
+        except Exception as e:
+            print(f"⚠️ Login via API indisponível ({e})")
+            print(f"✓ Acessando URL com auto-login...")
+            driver.get(AUTO_LOGIN_URL)
+            print("✓ URL carregada com token de autenticação")
         
         # Aguardar processamento do token e redirecionamento
         print("✓ Aguardando processamento do auto-login...")
-        time.sleep(3)
+        aguardar_estavel(driver, timeout=3)
         
         # Aguardar que a URL não contenha mais 'login' (se redirecionar de /login)
         try:
@@ -121,12 +137,13 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         contexto['login_ok'] = True
         
         # Aguardar carregamento completo da aplicação
-        time.sleep(2)
+        aguardar_estavel(driver, timeout=2)
         
         # =================================================================
         # ETAPA 2: NAVEGAR PARA EMPREENDIMENTO
         # =================================================================
         print("\n📂 ETAPA 2: NAVEGAR PARA MENU EMPREENDIMENTO")
+        etapa("ETAPA 2: NAVEGAR PARA MENU EMPREENDIMENTO", teste="teste_01")
         print("-" * 80)
         
         print("✓ Procurando botão 'Empreendimento' no menu...")
@@ -152,7 +169,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         
         print("✓ Clicando em 'Empreendimento'...")
         empreendimento_btn.click()
-        time.sleep(2)
+        aguardar_estavel(driver, timeout=2)
         
         # Validar navegação
         if 'empreendimento' not in driver.current_url.lower():
@@ -176,6 +193,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         # ETAPA 3: CLICAR EM "NOVO EMPREENDIMENTO" (NA LISTA)
         # =================================================================
         print("\n➕ ETAPA 3: CLICAR EM 'NOVO EMPREENDIMENTO' NA LISTA")
+        etapa("ETAPA 3: CLICAR EM 'NOVO EMPREENDIMENTO' NA LISTA", teste="teste_01")
         print("-" * 80)
         
         print("✓ Procurando botão 'Novo Empreendimento' na lista...")
@@ -205,7 +223,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         
         print("✓ Clicando em 'Novo Empreendimento'...")
         novo_btn.click()
-        time.sleep(3)
+        aguardar_estavel(driver, timeout=3)
         
         contexto['botao_novo_ok'] = True
         
@@ -213,6 +231,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         # ETAPA 4: VALIDAR WIZARD ABERTO E SELECIONAR ETAPA IMÓVEL
         # =================================================================
         print("\n🎯 ETAPA 4: VALIDAR WIZARD E SELECIONAR ETAPA IMÓVEL")
+        etapa("ETAPA 4: VALIDAR WIZARD E SELECIONAR ETAPA IMÓVEL", teste="teste_01")
         print("-" * 80)
         
         print("✓ Verificando se wizard foi aberto...")
@@ -230,7 +249,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
             raise Exception("❌ Título 'Novo Empreendimento' não encontrado")
         
         # Aguardar um pouco para o wizard carregar completamente
-        time.sleep(2)
+        aguardar_estavel(driver, timeout=2)
         
         # Procurar e clicar na etapa "Imóvel" no stepper
         print("✓ Procurando etapa 'Imóvel' no stepper...")
@@ -267,7 +286,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
             # Clicar na etapa Imóvel
             print("✓ Clicando na etapa Imóvel...")
             step_imovel.click()
-            time.sleep(2)
+            aguardar_estavel(driver, timeout=2)
             
             print("✅ Etapa Imóvel selecionada com sucesso")
             
@@ -309,6 +328,12 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         print(f"  ✓ Etapa 'Imóvel' selecionada e pronta para cadastro")
         print("\n" + "=" * 80)
         
+        # Preservar dados do cenário (ex: tipo_imovel no modo paralelo do orquestrador)
+        if contexto_anterior:
+            for key, value in contexto_anterior.items():
+                if key not in contexto and key != 'driver':
+                    contexto[key] = value
+        
         contexto['status'] = 'sucesso'
         return contexto
         
@@ -323,13 +348,10 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         contexto['status'] = 'erro'
         contexto['erro'] = str(e)
         
-        # Tirar screenshot do erro
-        try:
-            screenshot_path = f"tests/screenshots/erro_teste_01_{int(time.time())}.png"
-            driver.save_screenshot(screenshot_path)
-            print(f"\n📸 Screenshot salvo: {screenshot_path}")
-        except:
-            pass
+        # Screenshot + DOM do erro (gravados em segundo plano)
+        pasta = capturar_falha(driver, "teste_01", "erro")
+        if pasta:
+            print(f"\n📸 Artefatos da falha em: {pasta}")
         
         return contexto
 
@@ -7,7 +7,7 @@ Testa o cadastro de imóvel na etapa Imóvel do fluxo Novo Empreendimento.
 Fluxo:
 1. Recebe contexto do teste anterior (wizard já aberto na etapa Imóvel)
 2. Verifica se modal "Cadastrar Novo Imóvel" está aberto (ou clica no botão)
-3. Seleciona tipo de imóvel no select (RURAL, URBANO ou LINEAR - aleatório)
+3. Seleciona tipo de imóvel no select (RURAL, URBANO ou LINEAR - do cenário ou aleatório)
 4. Aguarda formulário específico do tipo aparecer
 5. Preenche todos os campos obrigatórios com dados fictícios
 6. Clica em "Cadastrar Imóvel" (salva e fecha modal)
@@ -32,6 +32,11 @@ from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.support.ui import Select
 
+from smart_wait import aguardar_estavel
+from run_store import salvar_payload
+from artifacts import capturar_falha
+from step_trace import etapa
+
 # Configuração
 CHROME_DRIVER_PATH = "C:\\chromedriver\\chromedriver.exe"
 BASE_URL = "http://localhost:5173"
@@ -101,9 +106,9 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
     driver = driver_existente
     wait = WebDriverWait(driver, TIMEOUT)
     
-    # Escolher tipo de imóvel aleatoriamente
+    # Escolher tipo de imóvel: definido pelo cenário (orquestrador paralelo) ou aleatório
     tipos_imovel = ['RURAL', 'URBANO', 'LINEAR']
-    tipo_escolhido = random.choice(tipos_imovel)
+    tipo_escolhido = (contexto_anterior or {}).get('tipo_imovel') or random.choice(tipos_imovel)
     
     contexto = {
         'teste': '02_imovel',
@@ -120,6 +125,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         # ETAPA 1: VALIDAR ETAPA IMÓVEL E AGUARDAR MODAL
         # =================================================================
         print("🏠 ETAPA 1: VALIDAR ETAPA IMÓVEL")
+        etapa("ETAPA 1: VALIDAR ETAPA IMÓVEL", teste="teste_02")
         print("-" * 80)
         
         print("✓ Verificando se estamos na etapa Imóvel...")
@@ -127,7 +133,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         print(f"  URL atual: {current_url}")
         
         # Aguardar página carregar
-        time.sleep(3)
+        aguardar_estavel(driver, timeout=3)
         
         # Verificar se modal "Cadastrar Novo Imóvel" já está aberto
         print("✓ Verificando se modal 'Cadastrar Novo Imóvel' está aberto...")
@@ -152,7 +158,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
                 )
                 print(f"✓ Botão encontrado: {cadastrar_btn.text}")
                 cadastrar_btn.click()
-                time.sleep(2)
+                aguardar_estavel(driver, timeout=2)
                 print("✓ Modal aberto")
                 contexto['modal_aberto'] = True
             except:
@@ -164,12 +170,13 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         # ETAPA 2: SELECIONAR TIPO DE IMÓVEL NO SELECT
         # =================================================================
         print(f"\n📋 ETAPA 2: SELECIONAR TIPO DE IMÓVEL ({tipo_escolhido})")
+        etapa("ETAPA 2: SELECIONAR TIPO DE IMÓVEL", teste="teste_02")
         print("-" * 80)
         
         print(f"✓ Tipo escolhido: {tipo_escolhido}")
         
         # Aguardar select de tipo estar disponível
-        time.sleep(1)
+        aguardar_estavel(driver, timeout=1)
         
         # Procurar o select de tipo de imóvel
         print("✓ Procurando select 'Tipo de Imóvel'...")
@@ -188,7 +195,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         print(f"✓ Selecionando tipo: {tipo_escolhido}...")
         try:
             Select(tipo_select).select_by_value(tipo_escolhido)
-            time.sleep(2)  # Aguardar formulário específico aparecer
+            aguardar_estavel(driver, timeout=2)  # Aguardar formulário específico aparecer
             print(f"✓ Tipo {tipo_escolhido} selecionado")
         except Exception as e:
             raise Exception(f"❌ Erro ao selecionar tipo: {e}")
@@ -199,6 +206,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         # ETAPA 3: CLICAR NO BOTÃO "PREENCHER DADOS"
         # =================================================================
         print(f"\n📝 ETAPA 3: PREENCHER DADOS AUTOMATICAMENTE")
+        etapa("ETAPA 3: PREENCHER DADOS AUTOMATICAMENTE", teste="teste_02")
         print("-" * 80)
         
         try:
@@ -211,7 +219,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
             )
             print(f"✓ Botão encontrado: {preencher_btn.text}")
             preencher_btn.click()
-            time.sleep(3)  # Aguardar preenchimento automático
+            aguardar_estavel(driver, timeout=3)  # Aguardar preenchimento automático
             print("✓ Dados preenchidos automaticamente")
         except Exception as e:
             print(f"⚠️ Botão 'Preencher Dados' não encontrado: {e}")
@@ -221,11 +229,12 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         # ETAPA 4: VALIDAR/COMPLEMENTAR CAMPOS OBRIGATÓRIOS
         # =================================================================
         print(f"\n📝 ETAPA 4: VALIDAR CAMPOS OBRIGATÓRIOS DO IMÓVEL {tipo_escolhido}")
+        etapa("ETAPA 4: VALIDAR CAMPOS OBRIGATÓRIOS DO IMÓVEL", teste="teste_02")
         print("-" * 80)
         
         # Validar se campos obrigatórios foram preenchidos
         print("✓ Validando campos obrigatórios...")
-        time.sleep(1)
+        aguardar_estavel(driver, timeout=1)
         
         if tipo_escolhido == 'RURAL':
             dados = DADOS_RURAL
@@ -247,7 +256,6 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
                 print(f"✓ Selecionando Situação CAR: Ativo")
                 situacao_select = driver.find_element(By.XPATH, "//select[.//option[contains(text(), 'Ativo')]]")
                 Select(situacao_select).select_by_visible_text('Ativo')
-                time.sleep(0.3)
             except Exception as e:
                 print(f"⚠️ Erro ao selecionar Situação CAR: {e}")
             
@@ -256,7 +264,6 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
                 print(f"✓ Selecionando UF: {dados['uf']}")
                 uf_select = driver.find_element(By.XPATH, "//select[.//option[@value='SC']]")
                 Select(uf_select).select_by_value(dados['uf'])
-                time.sleep(0.3)
             except Exception as e:
                 print(f"⚠️ Erro ao selecionar UF: {e}")
             
@@ -265,7 +272,6 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
                 print(f"✓ Selecionando Sistema de Referência: SIRGAS 2000")
                 sistema_select = driver.find_element(By.XPATH, "//select[.//option[contains(text(), 'SIRGAS')]]")
                 Select(sistema_select).select_by_visible_text('SIRGAS 2000')
-                time.sleep(0.3)
             except Exception as e:
                 print(f"⚠️ Erro ao selecionar Sistema: {e}")
         
@@ -285,13 +291,14 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         # ETAPA 5: SALVAR/CONFIRMAR IMÓVEL NO MODAL
         # =================================================================
         print(f"\n💾 ETAPA 5: SALVAR NOVO IMÓVEL")
+        etapa("ETAPA 5: SALVAR NOVO IMÓVEL", teste="teste_02")
         print("-" * 80)
         
         print("✓ Procurando botão 'Salvar Imóvel' no modal...")
         
         try:
             # Aguardar um pouco para garantir que o formulário está pronto
-            time.sleep(1)
+            aguardar_estavel(driver, timeout=1)
             
             # Procurar especificamente o botão verde "Salvar Imóvel" com ícone Plus
             # Evita pegar "Salvar Rascunho" ou "Reiniciar"
@@ -310,7 +317,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
                 setTimeout(() => botao.click(), 500);
             """, salvar_btn)
             
-            time.sleep(3)
+            aguardar_estavel(driver, timeout=3)
             print("✓ Imóvel salvo, modal deve estar fechado")
         except Exception as e:
             print(f"❌ Erro ao salvar: {e}")
@@ -321,7 +328,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
                 for btn in botoes:
                     if 'Imóvel' in btn.text and 'bg-green' in btn.get_attribute('class'):
                         driver.execute_script("arguments[0].click();", btn)
-                        time.sleep(3)
+                        aguardar_estavel(driver, timeout=3)
                         print("✓ Clicou via método alternativo")
                         break
                 else:
@@ -338,11 +345,11 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
                     "//div[contains(., 'Cadastrar Novo Imóvel')]"
                 ))
             )
-            time.sleep(2)
+            aguardar_estavel(driver, timeout=2)
             print("✓ Modal fechado confirmado")
         except:
             print("⚠️ Não conseguiu confirmar fechamento do modal, mas continuando...")
-            time.sleep(2)
+            aguardar_estavel(driver, timeout=2)
         
         contexto['imovel_salvo'] = True
         
@@ -350,13 +357,14 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         # ETAPA 6: CLICAR EM "PRÓXIMO" PARA IR PARA DADOS GERAIS
         # =================================================================
         print(f"\n➡️ ETAPA 6: AVANÇAR PARA DADOS GERAIS")
+        etapa("ETAPA 6: AVANÇAR PARA DADOS GERAIS", teste="teste_02")
         print("-" * 80)
         
         print("✓ Procurando botão 'Próximo'...")
         
         try:
             # Aguardar um pouco mais e tentar múltiplos seletores
-            time.sleep(2)
+            aguardar_estavel(driver, timeout=2)
             
             # Tentativa 1: Botão com texto "Próximo"
             try:
@@ -366,9 +374,8 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
                 )
                 print(f"✓ Botão encontrado (método 1): {proximo_btn.text}")
                 driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", proximo_btn)
-                time.sleep(0.5)
                 proximo_btn.click()
-                time.sleep(3)
+                aguardar_estavel(driver, timeout=3)
                 print("✓ Clicou em Próximo")
             except:
                 # Tentativa 2: Qualquer botão verde na parte inferior
@@ -379,7 +386,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
                     if 'próximo' in texto or 'avançar' in texto or 'continuar' in texto:
                         print(f"✓ Botão encontrado (método 2): {btn.text}")
                         driver.execute_script("arguments[0].click();", btn)
-                        time.sleep(3)
+                        aguardar_estavel(driver, timeout=3)
                         print("✓ Clicou em Próximo via método alternativo")
                         break
                 else:
@@ -403,6 +410,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         # ETAPA 7: VALIDAR NAVEGAÇÃO PARA DADOS GERAIS
         # =================================================================
         print(f"\n✅ ETAPA 7: VALIDAR ETAPA 'DADOS GERAIS'")
+        etapa("ETAPA 7: VALIDAR ETAPA 'DADOS GERAIS'", teste="teste_02")
         print("-" * 80)
         
         print("✓ Verificando se avançou para Dados Gerais...")
@@ -492,17 +500,12 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
                 'sistemaReferencia': 'SIRGAS 2000'
             }
         
-        # Salvar JSON parcial
-        output_dir = os.path.join(os.path.dirname(__file__), "output")
-        os.makedirs(output_dir, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"imovel_json_{timestamp}.json"
-        filepath = os.path.join(output_dir, filename)
-        
+        # Salvar JSON parcial no histórico de execuções (run_store)
+        referencia_json = None
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(json_parcial, f, indent=2, ensure_ascii=False)
-            print(f"\n📦 JSON parcial salvo: {filepath}")
+            referencia_json = salvar_payload('imovel', json_parcial,
+                                             cadeia=(contexto_anterior or {}).get('cadeia', ''))
+            print(f"\n📦 JSON parcial salvo no histórico: {referencia_json[:12]}")
         except Exception as e:
             print(f"\n⚠️ Erro ao salvar JSON parcial: {e}")
         
@@ -519,7 +522,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         print(f"  ✓ Formulário específico preenchido")
         print(f"  ✓ Imóvel salvo no sistema")
         print(f"  ✓ Avançou para Dados Gerais")
-        print(f"  ✓ JSON parcial gerado: {filename}")
+        print(f"  ✓ JSON parcial gerado: {referencia_json or 'não salvo'}")
         print("\n" + "=" * 80)
         
         contexto['status'] = 'sucesso'
@@ -536,13 +539,10 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         contexto['status'] = 'erro'
         contexto['erro'] = str(e)
         
-        # Tirar screenshot do erro
-        try:
-            screenshot_path = f"tests/screenshots/erro_teste_02_{int(time.time())}.png"
-            driver.save_screenshot(screenshot_path)
-            print(f"\n📸 Screenshot salvo: {screenshot_path}")
-        except:
-            pass
+        # Screenshot + DOM do erro (gravados em segundo plano)
+        pasta = capturar_falha(driver, "teste_02", "erro")
+        if pasta:
+            print(f"\n📸 Artefatos da falha em: {pasta}")
         
         return contexto
 
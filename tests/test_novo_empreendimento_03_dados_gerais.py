@@ -28,6 +28,11 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+from smart_wait import aguardar_estavel
+from run_store import salvar_payload
+from artifacts import capturar_falha
+from step_trace import etapa
+
 # Configuração
 TIMEOUT = 20
 
@@ -81,6 +86,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         # ETAPA 1: VALIDAR QUE ESTAMOS NA PÁGINA DE DADOS GERAIS
         # =================================================================
         print("📋 ETAPA 1: VALIDAR PÁGINA DE DADOS GERAIS")
+        etapa("ETAPA 1: VALIDAR PÁGINA DE DADOS GERAIS", teste="teste_03")
         print("-" * 80)
         
         print("✓ Verificando se estamos na etapa Dados Gerais...")
@@ -106,6 +112,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         # ETAPA 2: CLICAR NO BOTÃO "PREENCHER DADOS"
         # =================================================================
         print(f"\n🪄 ETAPA 2: USAR BOTÃO 'PREENCHER DADOS' (AUTO-FILL)")
+        etapa("ETAPA 2: USAR BOTÃO 'PREENCHER DADOS' (AUTO-FILL)", teste="teste_03")
         print("-" * 80)
         
         print("✓ Procurando botão 'Preencher Dados'...")
@@ -147,7 +154,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         # IMPORTANTE: Aguardar mais tempo para os campos serem preenchidos
         # O botão "Preencher Dados" pode demorar a preencher todos os campos
         print("✓ Aguardando campos serem preenchidos...")
-        time.sleep(3)
+        aguardar_estavel(driver, timeout=3)
         
         print("✅ Botão 'Preencher Dados' clicado")
         contexto['preencher_dados_ok'] = True
@@ -156,6 +163,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         # ETAPA 3: VALIDAR CAMPOS PREENCHIDOS
         # =================================================================
         print(f"\n✅ ETAPA 3: VALIDAR CAMPOS PREENCHIDOS")
+        etapa("ETAPA 3: VALIDAR CAMPOS PREENCHIDOS", teste="teste_03")
         print("-" * 80)
         
         print("✓ Verificando se campos foram preenchidos...")
@@ -177,7 +185,6 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
                 # Preencher manualmente pois o campo é obrigatório
                 nome_input.clear()
                 nome_input.send_keys("Empreendimento Teste Automatizado")
-                time.sleep(0.5)
                 nome_valor = nome_input.get_attribute('value')
                 print(f"  ✅ Nome preenchido manualmente: {nome_valor}")
                 contexto['nome_preenchido'] = nome_valor
@@ -202,7 +209,6 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
                 # Pular a opção vazia e selecionar a primeira válida
                 if len(select.options) > 1:
                     select.select_by_index(1)
-                    time.sleep(0.5)
                     situacao_valor = situacao_select.get_attribute('value')
                     print(f"  ✅ Situação preenchida manualmente: {situacao_valor}")
                     contexto['situacao_preenchida'] = situacao_valor
@@ -231,7 +237,6 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
                 opcoes = [opt for opt in select.options if opt.get_attribute('value')]
                 if opcoes:
                     select.select_by_value(opcoes[0].get_attribute('value'))
-                    time.sleep(0.5)
                     situacao_valor = situacao_select.get_attribute('value')
                     print(f"  ✅ Situação preenchida manualmente: {situacao_valor}")
                     contexto['situacao_preenchida'] = situacao_valor
@@ -277,6 +282,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         # ETAPA 4: VALIDAR PARTÍCIPE ADICIONADO
         # =================================================================
         print(f"\n👥 ETAPA 4: VALIDAR PARTÍCIPE ADICIONADO")
+        etapa("ETAPA 4: VALIDAR PARTÍCIPE ADICIONADO", teste="teste_03")
         print("-" * 80)
         
         print("✓ Verificando se partícipe foi adicionado...")
@@ -311,6 +317,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         # ETAPA 5: CLICAR EM "PRÓXIMO"
         # =================================================================
         print(f"\n➡️ ETAPA 5: AVANÇAR PARA PRÓXIMA ETAPA")
+        etapa("ETAPA 5: AVANÇAR PARA PRÓXIMA ETAPA", teste="teste_03")
         print("-" * 80)
         
         print("✓ Procurando botão 'Próximo'...")
@@ -329,7 +336,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
             # IMPORTANTE: Aguardar mais tempo para transição entre páginas
             # O React pode demorar para renderizar a próxima etapa
             print("✓ Aguardando transição para próxima página...")
-            time.sleep(5)
+            aguardar_estavel(driver, timeout=5)
         except Exception as e:
             print(f"❌ Erro ao clicar em Próximo: {e}")
             raise Exception("Botão 'Próximo' não encontrado ou não clicável")
@@ -340,6 +347,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         # ETAPA 6: VALIDAR NAVEGAÇÃO PARA ATIVIDADES
         # =================================================================
         print(f"\n✅ ETAPA 6: VALIDAR ETAPA 'ATIVIDADES'")
+        etapa("ETAPA 6: VALIDAR ETAPA 'ATIVIDADES'", teste="teste_03")
         print("-" * 80)
         
         print("✓ Verificando se avançou para Atividades...")
@@ -405,17 +413,12 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
             }
         }
         
-        # Salvar JSON parcial
-        output_dir = os.path.join(os.path.dirname(__file__), "output")
-        os.makedirs(output_dir, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"dados_gerais_json_{timestamp}.json"
-        filepath = os.path.join(output_dir, filename)
-        
+        # Salvar JSON parcial no histórico de execuções (run_store)
+        referencia_json = None
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(json_parcial, f, indent=2, ensure_ascii=False)
-            print(f"\n📦 JSON parcial salvo: {filepath}")
+            referencia_json = salvar_payload('dados_gerais', json_parcial,
+                                             cadeia=(contexto_anterior or {}).get('cadeia', ''))
+            print(f"\n📦 JSON parcial salvo no histórico: {referencia_json[:12]}")
         except Exception as e:
             print(f"\n⚠️ Erro ao salvar JSON parcial: {e}")
         
@@ -435,7 +438,7 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
             print(f"    - Empregados: {contexto['empregados_preenchido']}")
         print(f"  ✓ Partícipe adicionado")
         print(f"  ✓ Avançou para Atividades")
-        print(f"  ✓ JSON parcial gerado: {filename}")
+        print(f"  ✓ JSON parcial gerado: {referencia_json or 'não salvo'}")
         print("\n" + "=" * 80)
         
         # Preservar dados de testes anteriores
@@ -458,13 +461,10 @@ def executar_teste(driver_existente=None, contexto_anterior=None):
         contexto['status'] = 'erro'
         contexto['erro'] = str(e)
         
-        # Tirar screenshot do erro
-        try:
-            screenshot_path = f"tests/screenshots/erro_teste_03_{int(time.time())}.png"
-            driver.save_screenshot(screenshot_path)
-            print(f"\n📸 Screenshot salvo: {screenshot_path}")
-        except:
-            pass
+        # Screenshot + DOM do erro (gravados em segundo plano)
+        pasta = capturar_falha(driver, "teste_03", "erro")
+        if pasta:
+            print(f"\n📸 Artefatos da falha em: {pasta}")
         
         return contexto
 
@@ -22,6 +22,11 @@ from selenium.webdriver.common.keys import Keys
 import time
 from datetime import datetime
 
+from smart_wait import aguardar_estavel, aguardar_scroll
+from run_store import salvar_payload
+from artifacts import registrar_passo, capturar_falha
+import step_trace
+
 # ===================================================================
 # CONFIGURAÇÃO
 # ===================================================================
@@ -40,10 +45,12 @@ DADOS_ATIVIDADE = {
 # FUNÇÕES AUXILIARES
 # ===================================================================
 
-def log_etapa(etapa: str, emoji: str = "📝"):
-    """Log formatado para cada etapa do teste"""
+def log_etapa(etapa: str, emoji: str = "📝", driver: webdriver.Chrome = None):
+    """Log formatado para cada etapa do teste (abre o span da etapa; com driver, guarda o passo para contexto de falha)"""
     print(f"\n{emoji} {etapa.upper()}")
     print("-" * 71)
+    step_trace.etapa(etapa, teste="teste_04")
+    registrar_passo(driver, "teste_04", etapa)
 
 
 def log_sucesso(mensagem: str):
@@ -57,17 +64,14 @@ def log_erro(mensagem: str):
 
 
 def salvar_screenshot_erro(driver: webdriver.Chrome, descricao: str):
-    """Salva screenshot quando ocorre erro"""
-    timestamp = int(time.time())
-    filename = f"erro_teste_04_{timestamp}.png"
-    driver.save_screenshot(filename)
-    log_erro(f"Screenshot salvo: {filename}")
+    """Agenda screenshot + DOM da falha (gravados em segundo plano, sem duplicatas)"""
+    pasta = capturar_falha(driver, "teste_04", descricao)
+    log_erro(f"Artefatos da falha em: {pasta}")
 
 
 def scroll_to_top(driver: webdriver.Chrome):
     """Scroll para o topo da página"""
     driver.execute_script("window.scrollTo(0, 0);")
-    time.sleep(0.5)
 
 
 def scroll_to_element(driver: webdriver.Chrome, element):
@@ -78,7 +82,7 @@ def scroll_to_element(driver: webdriver.Chrome, element):
             block: 'center'
         });
     """, element)
-    time.sleep(0.5)
+    aguardar_scroll(driver, element)
 
 
 # ===================================================================
@@ -124,7 +128,7 @@ def executar_teste_atividades(
         # ===============================================================
         # ETAPA 1: VALIDAR PÁGINA DE ATIVIDADES
         # ===============================================================
-        log_etapa("ETAPA 1: VALIDAR PÁGINA DE ATIVIDADES", "📋")
+        log_etapa("ETAPA 1: VALIDAR PÁGINA DE ATIVIDADES", "📋", driver)
         
         log_sucesso("Verificando se estamos na etapa Atividades...")
         print(f"  URL atual: {driver.current_url}")
@@ -161,7 +165,7 @@ def executar_teste_atividades(
         # ===============================================================
         # ETAPA 2: USAR BOTÃO 'PREENCHER DADOS'
         # ===============================================================
-        log_etapa("ETAPA 2: USAR BOTÃO 'PREENCHER DADOS'", "✨")
+        log_etapa("ETAPA 2: USAR BOTÃO 'PREENCHER DADOS'", "✨", driver)
         
         log_sucesso("Procurando botão 'Preencher Dados'...")
         
@@ -178,7 +182,7 @@ def executar_teste_atividades(
             # Clicar no botão
             log_sucesso("Clicando em 'Preencher Dados'...")
             btn_preencher.click()
-            time.sleep(2)  # Aguardar preenchimento automático
+            aguardar_estavel(driver, timeout=2)  # Aguardar preenchimento automático
             
             log_sucesso("✅ Dados preenchidos automaticamente")
             
@@ -192,16 +196,16 @@ def executar_teste_atividades(
             )))
             log_sucesso(f"Botão encontrado: {btn_adicionar.text}")
             btn_adicionar.click()
-            time.sleep(1)
+            aguardar_estavel(driver, timeout=1)
             log_sucesso("✅ Botão Adicionar Atividade clicado (fallback)")
         
         # ===============================================================
         # ETAPA 3: VALIDAR PREENCHIMENTO AUTOMÁTICO
         # ===============================================================
-        log_etapa("ETAPA 3: VALIDAR PREENCHIMENTO AUTOMÁTICO", "✅")
+        log_etapa("ETAPA 3: VALIDAR PREENCHIMENTO AUTOMÁTICO", "✅", driver)
         
         log_sucesso("Verificando se atividade foi adicionada...")
-        time.sleep(1)
+        aguardar_estavel(driver, timeout=1)
         
         # Procurar seção "Atividades Selecionadas"
         try:
@@ -237,11 +241,10 @@ def executar_teste_atividades(
         # ===============================================================
         # ETAPA 4: AVANÇAR PARA PRÓXIMA ETAPA
         # ===============================================================
-        log_etapa("ETAPA 4: AVANÇAR PARA CARACTERIZAÇÃO", "➡️")
+        log_etapa("ETAPA 4: AVANÇAR PARA CARACTERIZAÇÃO", "➡️", driver)
         
         # Scroll para o final da página onde está o botão Próximo
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(0.5)
         
         log_sucesso("Procurando botão 'Próximo'...")
         btn_proximo = wait.until(EC.element_to_be_clickable((
@@ -252,12 +255,12 @@ def executar_teste_atividades(
         
         log_sucesso("Clicou em Próximo")
         btn_proximo.click()
-        time.sleep(2)
+        aguardar_estavel(driver, timeout=2)
         
         # ===============================================================
         # ETAPA 8: VALIDAR ETAPA 'CARACTERIZAÇÃO'
         # ===============================================================
-        log_etapa("✅ ETAPA 8: VALIDAR ETAPA 'CARACTERIZAÇÃO'", "✅")
+        log_etapa("✅ ETAPA 8: VALIDAR ETAPA 'CARACTERIZAÇÃO'", "✅", driver)
         
         log_sucesso("Verificando se avançou para Caracterização...")
         try:
@@ -304,17 +307,12 @@ def executar_teste_atividades(
             }
         }
         
-        # Salvar JSON parcial
-        output_dir = os.path.join(os.path.dirname(__file__), "output")
-        os.makedirs(output_dir, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"atividades_json_{timestamp}.json"
-        filepath = os.path.join(output_dir, filename)
-        
+        # Salvar JSON parcial no histórico de execuções (run_store)
+        referencia_json = None
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(json_parcial, f, indent=2, ensure_ascii=False)
-            print(f"\n📦 JSON parcial salvo: {filepath}")
+            referencia_json = salvar_payload('atividades', json_parcial,
+                                             cadeia=(contexto_anterior or {}).get('cadeia', ''))
+            print(f"\n📦 JSON parcial salvo no histórico: {referencia_json[:12]}")
         except Exception as e:
             print(f"\n⚠️ Erro ao salvar JSON parcial: {e}")
         
@@ -333,7 +331,7 @@ def executar_teste_atividades(
         print(f"  ✓ Quantidade: {DADOS_ATIVIDADE['quantidade']} (unidade: 2)")
         print(f"  ✓ Área Ocupada: {DADOS_ATIVIDADE['area_ocupada']} m²")
         print(f"  ✓ Porte: Grande | Potencial Poluidor: Alto")
-        print(f"  ✓ JSON parcial gerado com estrutura completa: {filename}")
+        print(f"  ✓ JSON parcial gerado com estrutura completa: {referencia_json or 'não salvo'}")
         print(f"  ✓ Avançou para Caracterização")
         print("\n" + "=" * 71 + "\n")
         
@@ -345,6 +343,7 @@ def executar_teste_atividades(
             'atividade_busca': DADOS_ATIVIDADE['busca'],
             'quantidade': DADOS_ATIVIDADE['quantidade'],
             'area_ocupada': DADOS_ATIVIDADE['area_ocupada'],
+            'json_atividades': referencia_json,
             'timestamp': datetime.now().isoformat()
         }
         
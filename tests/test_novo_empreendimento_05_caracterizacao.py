@@ -26,6 +26,11 @@ from selenium.webdriver.support.ui import Select
 import time
 from datetime import datetime
 
+from smart_wait import aguardar_estavel, aguardar_scroll
+from run_store import salvar_payload
+from artifacts import registrar_passo, capturar_falha
+import step_trace
+
 # ===================================================================
 # CONFIGURAÇÃO
 # ===================================================================
@@ -64,10 +69,12 @@ DADOS_CARACTERIZACAO = {
 # FUNÇÕES AUXILIARES
 # ===================================================================
 
-def log_etapa(etapa: str, emoji: str = "📝"):
-    """Log formatado para cada etapa do teste"""
+def log_etapa(etapa: str, emoji: str = "📝", driver: webdriver.Chrome = None):
+    """Log formatado para cada etapa do teste (abre o span da etapa; com driver, guarda o passo para contexto de falha)"""
     print(f"\n{emoji} {etapa.upper()}")
     print("-" * 71)
+    step_trace.etapa(etapa, teste="teste_05")
+    registrar_passo(driver, "teste_05", etapa)
 
 
 def log_sucesso(mensagem: str):
@@ -81,17 +88,14 @@ def log_erro(mensagem: str):
 
 
 def salvar_screenshot_erro(driver: webdriver.Chrome, descricao: str):
-    """Salva screenshot quando ocorre erro"""
-    timestamp = int(time.time())
-    filename = f"erro_teste_05_{timestamp}.png"
-    driver.save_screenshot(filename)
-    log_erro(f"Screenshot salvo: {filename}")
+    """Agenda screenshot + DOM da falha (gravados em segundo plano, sem duplicatas)"""
+    pasta = capturar_falha(driver, "teste_05", descricao)
+    log_erro(f"Artefatos da falha em: {pasta}")
 
 
 def scroll_to_top(driver: webdriver.Chrome):
     """Scroll para o topo da página"""
     driver.execute_script("window.scrollTo(0, 0);")
-    time.sleep(0.5)
 
 
 def scroll_to_element(driver: webdriver.Chrome, element):
@@ -102,7 +106,7 @@ def scroll_to_element(driver: webdriver.Chrome, element):
             block: 'center'
         });
     """, element)
-    time.sleep(0.5)
+    aguardar_scroll(driver, element)
 
 
 def expandir_secao(driver, titulo_secao):
@@ -117,7 +121,8 @@ def expandir_secao(driver, titulo_secao):
             botao_secao.find_element(By.XPATH, ".//svg[contains(@class, 'lucide-chevron-down')]")
             log_sucesso(f"Seção '{titulo_secao}' estava fechada, expandindo...")
             botao_secao.click()
-            time.sleep(0.5)
+            WebDriverWait(driver, 5).until(lambda d: not botao_secao.find_elements(
+                By.XPATH, ".//svg[contains(@class, 'lucide-chevron-down')]"))
         except:
             log_sucesso(f"Seção '{titulo_secao}' já estava aberta")
             
@@ -168,7 +173,7 @@ def executar_teste_caracterizacao(
         # ===============================================================
         # ETAPA 1: VALIDAR PÁGINA DE CARACTERIZAÇÃO
         # ===============================================================
-        log_etapa("ETAPA 1: VALIDAR PÁGINA DE CARACTERIZAÇÃO", "📋")
+        log_etapa("ETAPA 1: VALIDAR PÁGINA DE CARACTERIZAÇÃO", "📋", driver)
         
         log_sucesso("Verificando se estamos na etapa Caracterização...")
         print(f"  URL atual: {driver.current_url}")
@@ -189,11 +194,11 @@ def executar_teste_caracterizacao(
         # ===============================================================
         # ETAPA 2: CLICAR NO BOTÃO "PREENCHER DADOS"
         # ===============================================================
-        log_etapa("ETAPA 2: CLICAR NO BOTÃO 'PREENCHER DADOS'", "✨")
+        log_etapa("ETAPA 2: CLICAR NO BOTÃO 'PREENCHER DADOS'", "✨", driver)
         
         # Scroll para o topo onde está o botão
         scroll_to_top(driver)
-        time.sleep(1)
+        aguardar_estavel(driver, timeout=1)
         
         # Procurar e clicar no botão "Preencher Dados"
         log_sucesso("Procurando botão 'Preencher Dados'...")
@@ -204,7 +209,7 @@ def executar_teste_caracterizacao(
             )))
             log_sucesso(f"Botão encontrado: {btn_preencher.text}")
             btn_preencher.click()
-            time.sleep(2)  # Aguardar preenchimento
+            aguardar_estavel(driver, timeout=2)  # Aguardar preenchimento
             log_sucesso("✅ Botão 'Preencher Dados' clicado - todos os dados preenchidos automaticamente!")
         except Exception as e:
             log_erro(f"Erro ao clicar no botão 'Preencher Dados': {str(e)}")
@@ -214,11 +219,11 @@ def executar_teste_caracterizacao(
         # ===============================================================
         # ETAPA 3: VALIDAR PREENCHIMENTO
         # ===============================================================
-        log_etapa("ETAPA 3: VALIDAR PREENCHIMENTO AUTOMÁTICO", "✓")
+        log_etapa("ETAPA 3: VALIDAR PREENCHIMENTO AUTOMÁTICO", "✓", driver)
         
         # Validar que os dados foram preenchidos
         log_sucesso("Validando dados preenchidos automaticamente...")
-        time.sleep(2)
+        aguardar_estavel(driver, timeout=2)
         
         # Contar quantas perguntas foram respondidas (verificar botões selecionados)
         try:
@@ -234,11 +239,11 @@ def executar_teste_caracterizacao(
         # ===============================================================
         # ETAPA 4: FINALIZAR
         # ===============================================================
-        log_etapa("ETAPA 4: FINALIZAR CADASTRO", "✅")
+        log_etapa("ETAPA 4: FINALIZAR CADASTRO", "✅", driver)
         
         # Scroll para o final da página
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(1)
+        aguardar_estavel(driver, timeout=1)
         
         log_sucesso("Procurando botão 'Finalizar'...")
         btn_finalizar = wait.until(EC.element_to_be_clickable((
@@ -249,7 +254,7 @@ def executar_teste_caracterizacao(
         
         log_sucesso("Clicando em 'Finalizar'...")
         btn_finalizar.click()
-        time.sleep(2)
+        aguardar_estavel(driver, timeout=2)
         
         log_sucesso("✅ Cadastro finalizado!")
         
@@ -259,13 +264,6 @@ def executar_teste_caracterizacao(
         
         # Gerar JSON Parcial da Etapa
         # ===============================================================
-        import json
-        import os
-        
-        timestamp_json = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_dir = os.path.join(os.path.dirname(__file__), 'output')
-        os.makedirs(output_dir, exist_ok=True)
-        
         json_parcial = {
             'metadados': {
                 'timestamp': datetime.now().isoformat(),
@@ -343,11 +341,10 @@ def executar_teste_caracterizacao(
             }
         }
         
-        arquivo_json = os.path.join(output_dir, f'caracterizacao_json_{timestamp_json}.json')
-        with open(arquivo_json, 'w', encoding='utf-8') as f:
-            json.dump(json_parcial, f, indent=2, ensure_ascii=False)
+        referencia_json = salvar_payload('caracterizacao', json_parcial,
+                                         cadeia=(contexto_anterior or {}).get('cadeia', ''))
         
-        print(f"\n💾 JSON Parcial salvo em: {arquivo_json}")
+        print(f"\n💾 JSON Parcial salvo no histórico: {referencia_json[:12]}")
         
         print("\n" + "=" * 71)
         print("✅ TESTE 05 CONCLUÍDO COM SUCESSO!")
@@ -372,6 +369,7 @@ def executar_teste_caracterizacao(
             'driver': driver,
             'caracterizacao_completa': True,
             'perguntas_respondidas': perguntas_respondidas,
+            'json_caracterizacao': referencia_json,
             'timestamp': datetime.now().isoformat()
         }
         
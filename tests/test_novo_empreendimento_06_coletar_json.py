@@ -12,7 +12,7 @@ Fluxo:
 1. Acessa o console do navegador
 2. Executa script para extrair todo o store do empreendimento
 3. Formata e exibe o JSON de forma legível
-4. Salva JSON em arquivo para referência
+4. Salva JSON no histórico de execuções (run_store.py) para referência
 
 Autor: GitHub Copilot
 Data: 2025-11-26
@@ -27,6 +27,9 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from run_store import salvar_payload, carregar_payload, ultimo_payload
+from step_trace import etapa
+
 
 def executar_teste_coletar_json(driver_existente=None, contexto_anterior=None):
     """
@@ -56,6 +59,7 @@ def executar_teste_coletar_json(driver_existente=None, contexto_anterior=None):
         # ETAPA 1: EXTRAIR JSON DO STORE VIA CONSOLE
         # =================================================================
         print(f"📊 ETAPA 1: EXTRAIR DADOS DO STORE")
+        etapa("ETAPA 1: EXTRAIR DADOS DO STORE", teste="teste_06")
         print("-" * 80)
         
         print("✓ Executando script JavaScript para acessar store...")
@@ -192,37 +196,16 @@ def executar_teste_coletar_json(driver_existente=None, contexto_anterior=None):
                 }]
             }
             
-            # Extrair dados de atividades do JSON parcial gerado pelo teste 04
-            import os
-            import glob
-            
-            # Procurar JSON mais recente de atividades
-            output_dir = os.path.join(os.path.dirname(__file__), "output")
-            atividades_files = glob.glob(os.path.join(output_dir, "atividades_json_*.json"))
+            # Extrair dados de atividades/caracterização dos JSONs parciais dos testes 04 e 05:
+            # o gerado por esta cadeia (hash no contexto) ou o mais recente do histórico
+            # (com cadeias paralelas, o mais recente pode ser de outra)
+            cadeia = contexto_anterior.get('cadeia')
+            atividades_data = (carregar_payload(contexto_anterior.get('json_atividades'))
+                               or ultimo_payload('atividades', cadeia))
             
-            if atividades_files:
-                # Pegar o mais recente
-                latest_atividades = max(atividades_files, key=os.path.getmtime)
-                print(f"✓ Carregando JSON de atividades: {os.path.basename(latest_atividades)}")
-                
-                try:
-                    with open(latest_atividades, 'r', encoding='utf-8') as f:
-                        atividades_data = json.load(f)
-                        empreendimento_completo['etapa_04_atividades'] = atividades_data.get('etapa_04_atividades', {})
-                except Exception as e:
-                    print(f"⚠️ Erro ao carregar JSON de atividades: {e}")
-                    # Fallback para estrutura básica
-                    empreendimento_completo['etapa_04_atividades'] = {
-                        'atividades': [{
-                            'codigo': 110101,
-                            'nome': 'Extração de Minérios',
-                            'quantidade': float(contexto_anterior.get('quantidade', 0)),
-                            'unidade': 'ton/mês',
-                            'areaOcupada': float(contexto_anterior.get('area_ocupada', 0)),
-                            'porteEmpreendimento': 'Grande',
-                            'isPrincipal': True
-                        }]
-                    }
+            if atividades_data:
+                print(f"✓ JSON de atividades carregado do histórico")
+                empreendimento_completo['etapa_04_atividades'] = atividades_data.get('etapa_04_atividades', {})
             else:
                 print("⚠️ JSON parcial de atividades não encontrado")
                 empreendimento_completo['etapa_04_atividades'] = {
@@ -237,26 +220,12 @@ def executar_teste_coletar_json(driver_existente=None, contexto_anterior=None):
                     }]
                 }
             
-            # Extrair dados de caracterização do JSON parcial gerado pelo teste 05
-            caracterizacao_files = glob.glob(os.path.join(output_dir, "caracterizacao_json_*.json"))
+            caracterizacao_data = (carregar_payload(contexto_anterior.get('json_caracterizacao'))
+                                   or ultimo_payload('caracterizacao', cadeia))
             
-            if caracterizacao_files:
-                # Pegar o mais recente
-                latest_caracterizacao = max(caracterizacao_files, key=os.path.getmtime)
-                print(f"✓ Carregando JSON de caracterização: {os.path.basename(latest_caracterizacao)}")
-                
-                try:
-                    with open(latest_caracterizacao, 'r', encoding='utf-8') as f:
-                        caracterizacao_data = json.load(f)
-                        empreendimento_completo['etapa_05_caracterizacao'] = caracterizacao_data.get('etapa_05_caracterizacao', {})
-                except Exception as e:
-                    print(f"⚠️ Erro ao carregar JSON de caracterização: {e}")
-                    # Fallback para estrutura básica
-                    empreendimento_completo['etapa_05_caracterizacao'] = {
-                        'caracterizacao_completa': contexto_anterior.get('caracterizacao_completa', False),
-                        'perguntas_respondidas': contexto_anterior.get('perguntas_respondidas', 0),
-                        'timestamp_finalizacao': contexto_anterior.get('timestamp', '')
-                    }
+            if caracterizacao_data:
+                print(f"✓ JSON de caracterização carregado do histórico")
+                empreendimento_completo['etapa_05_caracterizacao'] = caracterizacao_data.get('etapa_05_caracterizacao', {})
             else:
                 print("⚠️ JSON parcial de caracterização não encontrado")
                 empreendimento_completo['etapa_05_caracterizacao'] = {
@@ -272,6 +241,7 @@ def executar_teste_coletar_json(driver_existente=None, contexto_anterior=None):
         # ETAPA 2: FORMATAR E EXIBIR JSON
         # =================================================================
         print(f"\n📝 ETAPA 2: FORMATAR JSON COLETADO")
+        etapa("ETAPA 2: FORMATAR JSON COLETADO", teste="teste_06")
         print("-" * 80)
         
         json_formatado = json.dumps(store_data, indent=2, ensure_ascii=False)
@@ -283,35 +253,27 @@ def executar_teste_coletar_json(driver_existente=None, contexto_anterior=None):
         print("=" * 80 + "\n")
         
         # =================================================================
-        # ETAPA 3: SALVAR JSON EM ARQUIVO
+        # ETAPA 3: SALVAR JSON NO HISTÓRICO
         # =================================================================
-        print(f"\n💾 ETAPA 3: SALVAR JSON EM ARQUIVO")
+        print(f"\n💾 ETAPA 3: SALVAR JSON NO HISTÓRICO")
+        etapa("ETAPA 3: SALVAR JSON NO HISTÓRICO", teste="teste_06")
         print("-" * 80)
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"empreendimento_json_{timestamp}.json"
-        
-        # Caminho relativo ao diretório do script (tests/)
-        import os
-        output_dir = os.path.join(os.path.dirname(__file__), "output")
-        filepath = os.path.join(output_dir, filename)
-        
         try:
-            # Garantir que diretório existe
-            os.makedirs(output_dir, exist_ok=True)
-            
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(json_formatado)
-            print(f"✓ JSON salvo em: {filepath}")
-            contexto['json_arquivo'] = filepath
+            referencia_json = salvar_payload('empreendimento', store_data,
+                                             cadeia=(contexto_anterior or {}).get('cadeia', ''))
+            print(f"✓ JSON salvo no histórico: {referencia_json}")
+            print(f"  (exportar: python run_store.py payload {referencia_json[:12]} --saida empreendimento.json)")
+            contexto['json_payload'] = referencia_json
         except Exception as e:
-            print(f"⚠️ Erro ao salvar arquivo: {e}")
-            contexto['json_arquivo'] = None
+            print(f"⚠️ Erro ao salvar JSON: {e}")
+            contexto['json_payload'] = None
         
         # =================================================================
         # ETAPA 4: ESTATÍSTICAS DO JSON
         # =================================================================
         print(f"\n📈 ETAPA 4: ESTATÍSTICAS DOS DADOS")
+        etapa("ETAPA 4: ESTATÍSTICAS DOS DADOS", teste="teste_06")
         print("-" * 80)
         
         json_size = len(json_formatado)
@@ -328,7 +290,7 @@ def executar_teste_coletar_json(driver_existente=None, contexto_anterior=None):
         print("\n📊 Resumo:")
         print("  ✓ JSON extraído do store")
         print("  ✓ JSON formatado e exibido")
-        print(f"  ✓ JSON salvo em arquivo: {filename}")
+        print(f"  ✓ JSON salvo no histórico: {(contexto['json_payload'] or 'não salvo')[:12]}")
         print("  ✓ Estatísticas calculadas")
         print("\n" + "=" * 80 + "\n")
         
@@ -46,6 +46,8 @@ Data: 23/11/2025
 import os
 import sys
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
 from supabase import create_client, Client
@@ -63,6 +65,19 @@ SUPABASE_KEY = os.getenv('SUPABASE_KEY', '')
 # Cliente Supabase (será inicializado na função)
 supabase: Client = None
 
+# Consulta única com selects embutidos (PostgREST segue as FKs):
+# imóvel -> empreendimentos -> atividades / caracterização / recursos energéticos
+SELECT_EMBUTIDO = (
+    '*, enterprises(*, '
+    'enterprise_activities(*, activities(name)), '
+    'enterprise_characterization(*), '
+    'enterprise_energy_resources(count))'
+)
+
+# Idas ao banco na execução atual (para o resumo)
+_idas_banco = 0
+_idas_lock = threading.Lock()
+
 
 # ===================================================================
 # FUNÇÕES AUXILIARES
@@ -90,31 +105,50 @@ def log_validacao(campo: str, status: str, detalhes: str = ""):
     print(msg)
 
 
+def _executar(query):
+    """Executa uma query PostgREST contabilizando a ida ao banco"""
+    global _idas_banco
+    with _idas_lock:
+        _idas_banco += 1
+    return query.execute()
+
+
+def _aplicar_filtros(query, filtros: dict = None):
+    """Aplica filtros eq (valor simples) ou in.() (lista/tupla de valores)"""
+    for campo, valor in (filtros or {}).items():
+        if isinstance(valor, (list, tuple, set)):
+            query = query.in_(campo, list(valor))
+        else:
+            query = query.eq(campo, valor)
+    return query
+
+
 def contar_registros(tabela: str, filtros: dict = None) -> int:
     """Conta registros em uma tabela com filtros opcionais"""
     try:
-        query = supabase.table(tabela).select('id', count='exact')
-        
-        if filtros:
-            for campo, valor in filtros.items():
-                query = query.eq(campo, valor)
-        
-        response = query.execute()
-        return response.count if hasattr(response, 'count') else len(response.data)
+        query = _aplicar_filtros(supabase.table(tabela).select('id', count='exact'), filtros)
+        response = _executar(query)
+        return response.count if getattr(response, 'count', None) is not None else len(response.data)
     except Exception as e:
         print(f"⚠️ Erro ao contar registros em {tabela}: {e}")
         return -1
 
 
+def buscar_registros(tabela: str, filtros: dict, campos: str = '*'):
+    """Busca todos os registros que atendem aos filtros (None em caso de erro)"""
+    try:
+        response = _executar(_aplicar_filtros(supabase.table(tabela).select(campos), filtros))
+        return response.data or []
+    except Exception as e:
+        print(f"⚠️ Erro ao buscar registros em {tabela}: {e}")
+        return None
+
+
 def buscar_registro(tabela: str, filtros: dict, campos: str = '*'):
     """Busca um registro específico"""
     try:
-        query = supabase.table(tabela).select(campos)
-        
-        for campo, valor in filtros.items():
-            query = query.eq(campo, valor)
-        
-        response = query.limit(1).execute()
+        query = _aplicar_filtros(supabase.table(tabela).select(campos), filtros)
+        response = _executar(query.limit(1))
         return response.data[0] if response.data else None
     except Exception as e:
         print(f"⚠️ Erro ao buscar registro em {tabela}: {e}")
@@ -124,18 +158,141 @@ def buscar_registro(tabela: str, filtros: dict, campos: str = '*'):
 def buscar_ultimo_registro(tabela: str, campo_ordem: str = 'created_at'):
     """Busca o último registro inserido em uma tabela"""
     try:
-        response = supabase.table(tabela).select('*').order(campo_ordem, desc=True).limit(1).execute()
+        response = _executar(supabase.table(tabela).select('*').order(campo_ordem, desc=True).limit(1))
         return response.data[0] if response.data else None
     except Exception as e:
         print(f"⚠️ Erro ao buscar último registro em {tabela}: {e}")
         return None
 
 
+# ===================================================================
+# COLETA DOS DADOS (CONSULTAS EM LOTE)
+# ===================================================================
+
+def _dados_do_empreendimento(dados: dict, empreendimento: dict) -> dict:
+    """Separa os filhos embutidos do registro do empreendimento"""
+    empreendimento = dict(empreendimento)
+    atividades = empreendimento.pop('enterprise_activities', None)
+    caracterizacao = empreendimento.pop('enterprise_characterization', None)
+    recursos = empreendimento.pop('enterprise_energy_resources', None)
+
+    if isinstance(caracterizacao, list):
+        caracterizacao = caracterizacao[0] if caracterizacao else None
+    total_recursos = recursos[0].get('count', 0) if recursos else 0
+
+    dados.update({
+        'empreendimento': empreendimento,
+        'atividades': atividades or [],
+        'caracterizacao': caracterizacao,
+        'total_recursos': total_recursos,
+    })
+    return dados
+
+
+def _coletar_embutido(contexto: dict) -> dict:
+    """
+    Uma única ida ao banco: último imóvel (ou o do contexto) com
+    empreendimento, atividades, caracterização e contagem de recursos embutidos.
+
+    Lança exceção se o PostgREST não conseguir resolver os relacionamentos.
+    """
+    query = supabase.table('properties').select(SELECT_EMBUTIDO)
+    if contexto.get('property_id'):
+        query = query.eq('id', contexto['property_id'])
+    else:
+        query = query.order('created_at', desc=True)
+    response = _executar(query.limit(1))
+
+    dados = {'imovel': None, 'empreendimento': None, 'atividades': [],
+             'caracterizacao': None, 'total_recursos': 0}
+    if not response.data:
+        return dados
+
+    imovel = dict(response.data[0])
+    empreendimentos = imovel.pop('enterprises', None) or []
+    dados['imovel'] = imovel
+
+    if contexto.get('enterprise_id'):
+        empreendimentos = [e for e in empreendimentos if e.get('id') == contexto['enterprise_id']]
+    if empreendimentos:
+        _dados_do_empreendimento(dados, empreendimentos[0])
+    return dados
+
+
+def _coletar_em_lotes(contexto: dict) -> dict:
+    """
+    Fallback sem selects embutidos: imóvel e empreendimento em sequência
+    (um depende do outro) e as tabelas filhas em paralelo.
+    """
+    dados = {'imovel': None, 'empreendimento': None, 'atividades': [],
+             'caracterizacao': None, 'total_recursos': 0}
+
+    if contexto.get('property_id'):
+        dados['imovel'] = buscar_registro('properties', {'id': contexto['property_id']})
+    else:
+        dados['imovel'] = buscar_ultimo_registro('properties')
+    if not dados['imovel']:
+        return dados
+
+    filtros = {'property_id': dados['imovel']['id']}
+    if contexto.get('enterprise_id'):
+        filtros['id'] = contexto['enterprise_id']
+    dados['empreendimento'] = buscar_registro('enterprises', filtros)
+    if not dados['empreendimento']:
+        return dados
+
+    filtro_emp = {'enterprise_id': dados['empreendimento']['id']}
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        f_atividades = executor.submit(buscar_registros, 'enterprise_activities', filtro_emp)
+        f_caracterizacao = executor.submit(buscar_registro, 'enterprise_characterization', filtro_emp)
+        f_recursos = executor.submit(contar_registros, 'enterprise_energy_resources', filtro_emp)
+        atividades = f_atividades.result()
+        dados['caracterizacao'] = f_caracterizacao.result()
+        dados['total_recursos'] = f_recursos.result()
+
+    # Nomes das atividades em uma só consulta: activities?id=in.(...)
+    if atividades:
+        ids = sorted({a['activity_id'] for a in atividades if a.get('activity_id')})
+        nomes = {}
+        if ids:
+            nomes = {a['id']: a for a in (buscar_registros('activities', {'id': ids}, 'id, name') or [])}
+        for atividade in atividades:
+            atividade['activities'] = nomes.get(atividade.get('activity_id'), {})
+    dados['atividades'] = atividades
+    return dados
+
+
+def coletar_dados(contexto: dict) -> dict:
+    """
+    Busca, de uma vez, tudo o que as validações das abas precisam.
+
+    Tenta a consulta única com selects embutidos; se o schema não expuser os
+    relacionamentos, usa consultas em lote com as tabelas filhas em paralelo.
+    As validações por aba apenas conferem o resultado, sem ir ao banco.
+    """
+    global _idas_banco
+    _idas_banco = 0
+    inicio = time.time()
+
+    try:
+        dados = _coletar_embutido(contexto)
+        modo = 'select embutido'
+    except Exception as e:
+        print(f"⚠️ Select embutido indisponível ({e}); usando consultas em lote")
+        dados = _coletar_em_lotes(contexto)
+        modo = 'consultas em lote'
+
+    dados['consultas'] = _idas_banco
+    dados['tempo_ms'] = round((time.time() - inicio) * 1000, 1)
+    print(f"⏱️ Dados coletados via {modo}: {dados['consultas']} ida(s) ao banco em {dados['tempo_ms']} ms")
+    return dados
+
+
 # ===================================================================
 # VALIDAÇÕES POR ABA
 # ===================================================================
 
-def validar_aba_imovel(contexto: dict) -> dict:
+def validar_aba_imovel(contexto: dict, dados: dict) -> dict:
     """
     Valida se os dados da aba Imóvel foram salvos.
     Tabela: properties
@@ -149,8 +306,7 @@ def validar_aba_imovel(contexto: dict) -> dict:
         'sucesso': True
     }
     
-    # Buscar último imóvel cadastrado
-    imovel = buscar_ultimo_registro('properties')
+    imovel = dados.get('imovel')
     
     if not imovel:
         log_validacao("Registro", "ERRO", "Nenhum imóvel encontrado no banco")
@@ -210,7 +366,7 @@ def validar_aba_imovel(contexto: dict) -> dict:
     return resultado
 
 
-def validar_aba_dados_gerais(contexto: dict) -> dict:
+def validar_aba_dados_gerais(contexto: dict, dados: dict) -> dict:
     """
     Valida se os dados da aba Dados Gerais foram salvos.
     Tabela: enterprises
@@ -230,8 +386,8 @@ def validar_aba_dados_gerais(contexto: dict) -> dict:
         resultado['sucesso'] = False
         return resultado
     
-    # Buscar empreendimento relacionado ao imóvel
-    empreendimento = buscar_registro('enterprises', {'property_id': property_id})
+    # Empreendimento relacionado ao imóvel
+    empreendimento = dados.get('empreendimento')
     
     if not empreendimento:
         log_validacao("Registro", "ERRO", "Nenhum empreendimento encontrado para este imóvel")
@@ -275,7 +431,7 @@ def validar_aba_dados_gerais(contexto: dict) -> dict:
     return resultado
 
 
-def validar_aba_atividades(contexto: dict) -> dict:
+def validar_aba_atividades(contexto: dict, dados: dict) -> dict:
     """
     Valida se as atividades foram salvas.
     Tabela: enterprise_activities
@@ -295,8 +451,9 @@ def validar_aba_atividades(contexto: dict) -> dict:
         resultado['sucesso'] = False
         return resultado
     
-    # Contar atividades vinculadas ao empreendimento
-    total_atividades = contar_registros('enterprise_activities', {'enterprise_id': enterprise_id})
+    # Atividades vinculadas ao empreendimento (já com o nome embutido)
+    atividades = dados.get('atividades') or []
+    total_atividades = len(atividades)
     
     if total_atividades > 0:
         log_validacao("Total de Atividades", "OK", f"{total_atividades} atividade(s)")
@@ -306,30 +463,20 @@ def validar_aba_atividades(contexto: dict) -> dict:
             'valor': total_atividades
         })
         
-        # Buscar detalhes das atividades
-        try:
-            response = supabase.table('enterprise_activities')\
-                .select('*, activities(name)')\
-                .eq('enterprise_id', enterprise_id)\
-                .execute()
+        for idx, atividade in enumerate(atividades, 1):
+            activity_name = (atividade.get('activities') or {}).get('name', 'Sem nome')
+            log_validacao(f"Atividade {idx}", "OK", activity_name)
+            resultado['validacoes'].append({
+                'campo': f'Atividade {idx}',
+                'status': 'OK',
+                'valor': activity_name
+            })
             
-            for idx, atividade in enumerate(response.data, 1):
-                activity_name = atividade.get('activities', {}).get('name', 'Sem nome')
-                log_validacao(f"Atividade {idx}", "OK", activity_name)
-                resultado['validacoes'].append({
-                    'campo': f'Atividade {idx}',
-                    'status': 'OK',
-                    'valor': activity_name
-                })
-                
-                # Validar dados quantitativos
-                if atividade.get('quantity'):
-                    log_validacao(f"  └─ Quantidade", "OK", f"{atividade['quantity']} {atividade.get('unit', '')}")
-                else:
-                    log_validacao(f"  └─ Quantidade", "AVISO", "Não preenchida")
-        
-        except Exception as e:
-            log_validacao("Detalhes", "ERRO", str(e))
+            # Validar dados quantitativos
+            if atividade.get('quantity'):
+                log_validacao(f"  └─ Quantidade", "OK", f"{atividade['quantity']} {atividade.get('unit', '')}")
+            else:
+                log_validacao(f"  └─ Quantidade", "AVISO", "Não preenchida")
     else:
         log_validacao("Total de Atividades", "ERRO", "Nenhuma atividade encontrada")
         resultado['sucesso'] = False
@@ -342,7 +489,7 @@ def validar_aba_atividades(contexto: dict) -> dict:
     return resultado
 
 
-def validar_aba_caracterizacao(contexto: dict) -> dict:
+def validar_aba_caracterizacao(contexto: dict, dados: dict) -> dict:
     """
     Valida se os dados de caracterização foram salvos.
     Tabelas: enterprise_characterization, enterprise_energy_resources, etc.
@@ -363,7 +510,7 @@ def validar_aba_caracterizacao(contexto: dict) -> dict:
         return resultado
     
     # Validar tabela principal de caracterização
-    caracterizacao = buscar_registro('enterprise_characterization', {'enterprise_id': enterprise_id})
+    caracterizacao = dados.get('caracterizacao')
     
     if caracterizacao:
         log_validacao("Caracterização Ambiental", "OK", "Registro encontrado")
@@ -396,7 +543,7 @@ def validar_aba_caracterizacao(contexto: dict) -> dict:
         })
     
     # Validar recursos energéticos
-    total_recursos = contar_registros('enterprise_energy_resources', {'enterprise_id': enterprise_id})
+    total_recursos = dados.get('total_recursos', -1)
     log_validacao("Recursos Energéticos", "OK" if total_recursos >= 0 else "ERRO", 
                   f"{total_recursos} registro(s)" if total_recursos >= 0 else "Erro ao consultar")
     
@@ -452,20 +599,23 @@ def executar_validacao_completa(contexto: dict = None):
     resultados = []
     
     try:
+        # Todas as consultas de uma vez; as abas só conferem os dados
+        dados = coletar_dados(contexto)
+        
         # 1. Validar Imóvel
-        resultado_imovel = validar_aba_imovel(contexto)
+        resultado_imovel = validar_aba_imovel(contexto, dados)
         resultados.append(resultado_imovel)
         
         # 2. Validar Dados Gerais
-        resultado_dados = validar_aba_dados_gerais(contexto)
+        resultado_dados = validar_aba_dados_gerais(contexto, dados)
         resultados.append(resultado_dados)
         
         # 3. Validar Atividades
-        resultado_atividades = validar_aba_atividades(contexto)
+        resultado_atividades = validar_aba_atividades(contexto, dados)
         resultados.append(resultado_atividades)
         
         # 4. Validar Caracterização
-        resultado_caracterizacao = validar_aba_caracterizacao(contexto)
+        resultado_caracterizacao = validar_aba_caracterizacao(contexto, dados)
         resultados.append(resultado_caracterizacao)
         
     except Exception as e:
@@ -488,6 +638,7 @@ def executar_validacao_completa(contexto: dict = None):
     print(f"   • Abas validadas com sucesso: {abas_ok} ✓")
     print(f"   • Abas com erro: {abas_erro} ✗")
     print(f"   • Taxa de sucesso: {(abas_ok/total_abas*100):.1f}%")
+    print(f"   • Consultas ao banco: {dados['consultas']} ({dados['tempo_ms']} ms)")
     
     print(f"\n📋 DETALHAMENTO POR ABA:")
     for resultado in resultados:
@@ -517,6 +668,8 @@ def executar_validacao_completa(contexto: dict = None):
         'abas_ok': abas_ok,
         'abas_erro': abas_erro,
         'resultados': resultados,
+        'consultas': dados['consultas'],
+        'tempo_consultas_ms': dados['tempo_ms'],
         'contexto': contexto
     }
 
@@ -1,19 +1,20 @@
 # Testes Automatizados - Parametrização de Empreendimento
-# Requerimentos: selenium, pytest, webdriver-manager
+# Requerimentos: selenium, pytest, webdriver-manager (via driver_pool)
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
 import time
 import pytest
 from typing import Dict, Any
 import os
 
+from driver_pool import obter_driver, devolver_driver
+from smart_wait import aguardar_estavel
+from artifacts import capturar_falha
+
 # Configurações
 BASE_URL = os.getenv('TEST_BASE_URL', 'http://localhost:5173')
 ADMIN_EMAIL = os.getenv('TEST_ADMIN_EMAIL', 'admin@example.com')
@@ -26,29 +27,15 @@ class TestParametrizacaoEmpreendimento:
     @pytest.fixture(autouse=True)
     def setup(self):
         """Setup do navegador antes de cada teste"""
-        chrome_options = Options()
-        # chrome_options.add_argument('--headless')  # Descomente para modo headless
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--start-maximized')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--disable-software-rasterizer')
-        
-        # Download e configuração automática do ChromeDriver
-        driver_path = ChromeDriverManager().install()
-        service = Service(executable_path=driver_path)
-        
-        self.driver = webdriver.Chrome(
-            service=service,
-            options=chrome_options
-        )
+        # Sessão emprestada do pool compartilhado (reaproveitada entre os testes)
+        self.driver = obter_driver()
         self.driver.implicitly_wait(5)
         self.wait = WebDriverWait(self.driver, TIMEOUT)
         
         yield
         
-        # Teardown
-        self.driver.quit()
+        # Teardown: devolve a sessão ao pool (estado é resetado entre testes)
+        devolver_driver(self.driver)
 
     def login_admin(self):
         """Realiza login como administrador"""
@@ -74,11 +61,11 @@ class TestParametrizacaoEmpreendimento:
             # Aguarda redirecionamento para dashboard
             self.wait.until(EC.url_contains('/dashboard'))
             print("✅ Login realizado com sucesso")
-            time.sleep(2)  # Aguarda carregamento completo
+            aguardar_estavel(self.driver, timeout=2)  # Aguarda carregamento completo
             
         except TimeoutException:
             print("❌ Timeout ao fazer login")
-            self.driver.save_screenshot('login_error.png')
+            capturar_falha(self.driver, 'parametrizacao_empreendimento', 'login')
             raise
 
     def configurar_sistema(self, pesquisa_obrigatoria: bool, permitir_novo: bool):
@@ -94,21 +81,21 @@ class TestParametrizacaoEmpreendimento:
         try:
             # Navegar para configurações do sistema
             self.driver.get(f"{BASE_URL}/dashboard")
-            time.sleep(2)
+            aguardar_estavel(self.driver, timeout=2)
             
             # Clicar em Administração no menu lateral
             admin_menu = self.wait.until(
                 EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Administração')]"))
             )
             admin_menu.click()
-            time.sleep(1)
+            aguardar_estavel(self.driver, timeout=1)
             
             # Clicar em Configurações do Sistema
             config_menu = self.wait.until(
                 EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Configurações do Sistema')]"))
             )
             config_menu.click()
-            time.sleep(2)
+            aguardar_estavel(self.driver, timeout=2)
             
             # Aguarda toggles carregarem
             toggles = self.wait.until(
@@ -124,7 +111,7 @@ class TestParametrizacaoEmpreendimento:
             
             if is_active != pesquisa_obrigatoria:
                 toggle_pesquisa.click()
-                time.sleep(1)
+                aguardar_estavel(self.driver, timeout=1)
                 # Aguarda toast de confirmação
                 self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, 'Toastify')))
                 print(f"  ✓ Toggle 'Pesquisa Obrigatória' ajustado para: {pesquisa_obrigatoria}")
@@ -135,16 +122,16 @@ class TestParametrizacaoEmpreendimento:
             
             if is_active != permitir_novo:
                 toggle_novo.click()
-                time.sleep(1)
+                aguardar_estavel(self.driver, timeout=1)
                 self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, 'Toastify')))
                 print(f"  ✓ Toggle 'Permitir Novo' ajustado para: {permitir_novo}")
             
             print("✅ Configurações aplicadas com sucesso")
-            time.sleep(2)
+            aguardar_estavel(self.driver, timeout=2)
             
         except Exception as e:
             print(f"❌ Erro ao configurar sistema: {str(e)}")
-            self.driver.save_screenshot('config_error.png')
+            capturar_falha(self.driver, 'parametrizacao_empreendimento', 'config')
             raise
 
     def iniciar_nova_solicitacao(self):
@@ -154,14 +141,14 @@ class TestParametrizacaoEmpreendimento:
         try:
             # Ir para dashboard
             self.driver.get(f"{BASE_URL}/dashboard")
-            time.sleep(2)
+            aguardar_estavel(self.driver, timeout=2)
             
             # Clicar em "Nova Solicitação" ou "Solicitação de Processo"
             nova_solicitacao = self.wait.until(
                 EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Nova Solicitação') or contains(., 'Solicitação')]"))
             )
             nova_solicitacao.click()
-            time.sleep(3)
+            aguardar_estavel(self.driver, timeout=3)
             
             # Aguarda wizard carregar
             self.wait.until(EC.presence_of_element_located((By.XPATH, "//h1[contains(., 'Nova Inscrição')]")))
@@ -174,7 +161,7 @@ class TestParametrizacaoEmpreendimento:
             # Avançar para Etapa 2
             proximo_btn = self.driver.find_element(By.XPATH, "//button[contains(., 'Próximo') or contains(., 'Avançar')]")
             proximo_btn.click()
-            time.sleep(2)
+            aguardar_estavel(self.driver, timeout=2)
             
             # Preencher Etapa 2 (Imóvel) - simplificado
             print("  → Etapa 2: Imóvel")
@@ -184,7 +171,7 @@ class TestParametrizacaoEmpreendimento:
                 EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Próximo') or contains(., 'Avançar')]"))
             )
             proximo_btn.click()
-            time.sleep(2)
+            aguardar_estavel(self.driver, timeout=2)
             
             # Aguarda etapa 3 carregar
             self.wait.until(EC.presence_of_element_located((By.XPATH, "//h2[contains(., 'Empreendimento')]")))
@@ -192,7 +179,7 @@ class TestParametrizacaoEmpreendimento:
             
         except Exception as e:
             print(f"❌ Erro ao iniciar solicitação: {str(e)}")
-            self.driver.save_screenshot('iniciar_solicitacao_error.png')
+            capturar_falha(self.driver, 'parametrizacao_empreendimento', 'iniciar_solicitacao')
             raise
 
     def pesquisar_empreendimento(self, query: str) -> bool:
@@ -221,7 +208,7 @@ class TestParametrizacaoEmpreendimento:
             buscar_btn.click()
             
             # Aguarda loading terminar
-            time.sleep(2)
+            aguardar_estavel(self.driver, timeout=2)
             
             # Verificar se há resultados
             try:
@@ -240,7 +227,7 @@ class TestParametrizacaoEmpreendimento:
                 
         except Exception as e:
             print(f"❌ Erro ao pesquisar: {str(e)}")
-            self.driver.save_screenshot('pesquisa_error.png')
+            capturar_falha(self.driver, 'parametrizacao_empreendimento', 'pesquisa')
             raise
 
     def verificar_botao_cadastrar_novo_visivel(self) -> bool:
@@ -260,7 +247,7 @@ class TestParametrizacaoEmpreendimento:
                 EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Cadastrar Novo Empreendimento')]"))
             )
             botao.click()
-            time.sleep(2)
+            aguardar_estavel(self.driver, timeout=2)
             
             # Verificar se card verde apareceu
             card_novo = self.wait.until(
@@ -270,7 +257,7 @@ class TestParametrizacaoEmpreendimento:
             
         except Exception as e:
             print(f"❌ Erro ao clicar em cadastrar novo: {str(e)}")
-            self.driver.save_screenshot('cadastrar_novo_error.png')
+            capturar_falha(self.driver, 'parametrizacao_empreendimento', 'cadastrar_novo')
             raise
 
     def tentar_avancar(self) -> bool:
@@ -289,7 +276,7 @@ class TestParametrizacaoEmpreendimento:
             # Clicar em Próximo
             proximo_btn = self.driver.find_element(By.XPATH, "//button[contains(., 'Próximo') or contains(., 'Avançar')]")
             proximo_btn.click()
-            time.sleep(2)
+            aguardar_estavel(self.driver, timeout=2)
             
             # Verificar se URL mudou (avançou)
             url_depois = self.driver.current_url
@@ -382,7 +369,7 @@ class TestParametrizacaoEmpreendimento:
         
         # Pesquisar sem resultados
         self.pesquisar_empreendimento("88888888888888")
-        time.sleep(1)
+        aguardar_estavel(self.driver, timeout=1)
         
         # Clicar em Cadastrar Novo
         self.clicar_cadastrar_novo()
@@ -501,7 +488,7 @@ class TestParametrizacaoEmpreendimento:
                 EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Selecionar')]"))
             )
             selecionar_btn.click()
-            time.sleep(2)
+            aguardar_estavel(self.driver, timeout=2)
             
             # Verificar card verde de confirmação
             card_selecionado = self.driver.find_element(
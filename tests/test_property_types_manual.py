@@ -4,14 +4,17 @@
 import os
 from datetime import datetime
 
-print("="*70)
-print("🧪 DIAGNÓSTICO: Cadastro de Tipos de Imóvel")
-print("="*70)
-
-# Instruções para teste manual
-print("\n📋 INSTRUÇÕES PARA TESTE MANUAL:")
-print("-" * 70)
-print("""
+
+def main():
+    """Imprime o roteiro do diagnóstico manual"""
+    print("="*70)
+    print("🧪 DIAGNÓSTICO: Cadastro de Tipos de Imóvel")
+    print("="*70)
+
+    # Instruções para teste manual
+    print("\n📋 INSTRUÇÕES PARA TESTE MANUAL:")
+    print("-" * 70)
+    print("""
 1. Abra o navegador em: http://localhost:5174
 2. Faça login com suas credenciais
 3. Vá em: Administração → Tipos de Imóvel
@@ -42,11 +45,11 @@ print("""
    
 11. COPIE E COLE AQUI os logs que aparecerem!
 """)
-print("-" * 70)
+    print("-" * 70)
 
-print("\n🔍 POSSÍVEIS CAUSAS DE ERRO:")
-print("-" * 70)
-print("""
+    print("\n🔍 POSSÍVEIS CAUSAS DE ERRO:")
+    print("-" * 70)
+    print("""
 A. ERRO: "new row violates row-level security policy"
    → Problema: RLS (Row Level Security) do Supabase bloqueando
    → Solução: Verificar policies na tabela property_types
@@ -71,11 +74,11 @@ F. Nenhum log aparece
    → Problema: Formulário não está sendo submetido
    → Solução: Verificar se botão Salvar tem type="submit"
 """)
-print("-" * 70)
+    print("-" * 70)
 
-print("\n💡 PARA TESTAR CONEXÃO SUPABASE:")
-print("-" * 70)
-print("""
+    print("\n💡 PARA TESTAR CONEXÃO SUPABASE:")
+    print("-" * 70)
+    print("""
 No Console do navegador, execute:
 
 // Teste 1: Listar tipos existentes
@@ -92,16 +95,20 @@ const { data: newData, error: newError } = await window.supabase
   .single();
 console.log('Inserção:', newData, newError);
 """)
-print("-" * 70)
+    print("-" * 70)
 
-print("\n📝 APÓS TESTAR, ME INFORME:")
-print("""
+    print("\n📝 APÓS TESTAR, ME INFORME:")
+    print("""
 1. Os logs que apareceram no console
 2. Se deu erro, qual foi a mensagem exata
 3. Se salvou, mas não apareceu na lista
 4. Resultado dos testes do Supabase (se fez)
 """)
 
-print("\n" + "="*70)
-print("⏳ Aguardando você fazer o teste manual...")
-print("="*70)
+    print("\n" + "="*70)
+    print("⏳ Aguardando você fazer o teste manual...")
+    print("="*70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Cache de páginas do read_pdf_requirements.py: páginas diferentes, hashes diferentes
+===================================================================================
+
+O cache de texto é indexado pelo hash do conteúdo de cada página. Com o
+PyPDF2 3.x, ``get_contents()`` devolve um ``ArrayObject`` quando o ``/Contents``
+é um array de streams; o hash caía num valor constante e todas as páginas
+viravam o texto da primeira. Estes testes montam um PDF em memória com
+páginas de stream único e de array de streams e conferem os hashes.
+
+Uso:
+
+    pytest test_read_pdf_requirements.py -q
+
+Autor: GitHub Copilot
+Data: 2025-11-27
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+
+def _modulos():
+    """(read_pdf_requirements, biblioteca de PDF); pula se nem PyPDF2 nem pypdf estiverem instalados"""
+    try:
+        import PyPDF2 as pdf_lib
+    except ImportError:
+        pdf_lib = pytest.importorskip('pypdf')
+    if str(RAIZ) not in sys.path:
+        sys.path.insert(0, str(RAIZ))
+    import read_pdf_requirements
+    return read_pdf_requirements, pdf_lib
+
+
+def _pdf(pdf_lib, paginas) -> list:
+    """PDF em memória; cada página é uma lista de content streams (mais de um = /Contents em array)"""
+    from importlib import import_module
+    generic = import_module(f"{pdf_lib.__name__}.generic")
+
+    escritor = pdf_lib.PdfWriter()
+    for streams in paginas:
+        pagina = pdf_lib.PageObject.create_blank_page(width=200, height=200)
+        referencias = []
+        for dados in streams:
+            stream = generic.DecodedStreamObject()
+            stream.set_data(dados)
+            referencias.append(escritor._add_object(stream))
+        pagina[generic.NameObject('/Contents')] = (
+            generic.ArrayObject(referencias) if len(referencias) > 1 else referencias[0])
+        escritor.add_page(pagina)
+    saida = io.BytesIO()
+    escritor.write(saida)
+    saida.seek(0)
+    return pdf_lib.PdfReader(saida).pages
+
+
+def test_paginas_diferentes_tem_hashes_diferentes():
+    modulo, pdf_lib = _modulos()
+    paginas = _pdf(pdf_lib, [
+        [b'BT (RF01) Tj ET'],
+        [b'BT (RF02) Tj ET'],
+        [b'BT (RF03) Tj ET', b'BT (parte 2) Tj ET'],
+        [b'BT (RF04) Tj ET', b'BT (parte 2) Tj ET'],
+    ])
+    hashes = [modulo.hash_pagina(p) for p in paginas]
+    assert len(set(hashes)) == len(hashes)
+
+
+def test_paginas_iguais_tem_o_mesmo_hash():
+    modulo, pdf_lib = _modulos()
+    paginas = _pdf(pdf_lib, [
+        [b'BT (RF05) Tj ET', b'BT (fim) Tj ET'],
+        [b'BT (RF05) Tj ET', b'BT (fim) Tj ET'],
+    ])
+    assert modulo.hash_pagina(paginas[0]) == modulo.hash_pagina(paginas[1])
+
+
+def test_erro_de_leitura_nao_vira_hash_constante():
+    modulo, _ = _modulos()
+
+    class PaginaQuebrada(dict):
+        def get_contents(self):
+            raise ValueError('stream corrompido')
+
+        def extract_text(self):
+            raise ValueError('sem texto')
+
+    assert modulo.hash_pagina(PaginaQuebrada()) != modulo.hash_pagina(PaginaQuebrada())
@@ -9,59 +9,48 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
+
+from driver_pool import obter_driver, devolver_driver
+from smart_wait import aguardar_estavel
+from auth_session import login_navegador
+from endpoint_resolver import resolver_api, descrever
 
 # Configurações
 CPF = os.getenv('TEST_CPF', '61404694579')
 PASSWORD = os.getenv('TEST_PASSWORD', 'Senh@01!')
 BASE_URL = 'http://localhost:5173'
-API_BASE_URL = 'http://localhost:8000/api/v1'
-CHROMEDRIVER_PATH = r'C:\chromedriver\chromedriver.exe'
-
-# Criar diretório para screenshots
-os.makedirs('tests/screenshots', exist_ok=True)
-
-print("=" * 70)
-print("🧪 TESTE: Unidades de Referência no Cadastro de Atividades")
-print("=" * 70)
-print(f"📍 URL Frontend: {BASE_URL}")
-print(f"📍 URL API: {API_BASE_URL}")
-print("=" * 70)
+# A API é resolvida (sonda de rede) na execução do teste, não no import
+API_PREFERIDAS = ['http://localhost:8000/api/v1']
 
 def test_reference_units_in_activity_form():
     """Testa se Unidades de Referência alimentam o select de Unidade de Medida"""
-    
-    # Inicializar WebDriver
-    print("\n📦 Inicializando ChromeDriver...")
-    service = Service(CHROMEDRIVER_PATH)
-    driver = webdriver.Chrome(service=service)
-    driver.maximize_window()
+    api = resolver_api(API_PREFERIDAS)
+
+    # Criar diretório para screenshots
+    os.makedirs('tests/screenshots', exist_ok=True)
+
+    print("=" * 70)
+    print("🧪 TESTE: Unidades de Referência no Cadastro de Atividades")
+    print("=" * 70)
+    print(f"📍 URL Frontend: {BASE_URL}")
+    print(f"📍 URL API: {descrever(api)}")
+    print("=" * 70)
+
+    # Obter WebDriver do pool compartilhado
+    print("\n📦 Obtendo ChromeDriver do pool...")
+    driver = obter_driver()
     wait = WebDriverWait(driver, 20)
     
     try:
         # 1. FAZER LOGIN
         print("\n🔐 [1/5] Fazendo login...")
-        driver.get(f"{BASE_URL}/login")
-        time.sleep(2)
-        
-        cpf_input = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 'input[type="text"]')))
-        cpf_input.send_keys(CPF)
         print(f"  ✓ CPF: {CPF}")
-        
-        password_input = driver.find_element(By.CSS_SELECTOR, 'input[type="password"]')
-        password_input.send_keys(PASSWORD)
-        print("  ✓ Senha preenchida")
-        
-        login_button = driver.find_element(By.XPATH, "//button[contains(., 'Entrar')]")
-        login_button.click()
-        
-        time.sleep(3)
+        login_navegador(driver, caminho='/admin', cpf=CPF, senha=PASSWORD,
+                        base_url=BASE_URL, api_url=api['url'])
         print("✅ Login realizado")
         
-        # 2. NAVEGAR PARA ADMIN
+        # 2. NAVEGAR PARA ADMIN (já aberto pelo login)
         print("\n⚙️ [2/5] Navegando para Administração...")
-        driver.get(f"{BASE_URL}/admin")
-        time.sleep(2)
         
         wait.until(EC.presence_of_element_located((By.XPATH, "//h1[contains(., 'Administração')]")))
         print("✅ Página de Administração carregada")
@@ -72,7 +61,7 @@ def test_reference_units_in_activity_form():
             EC.element_to_be_clickable((By.XPATH, "//h2[contains(text(), 'Atividades')]"))
         )
         activities_card.click()
-        time.sleep(2)
+        aguardar_estavel(driver, timeout=2)
         print("✅ Card de Atividades aberto")
         
         # 4. ABRIR MODAL DE NOVA ATIVIDADE
@@ -81,7 +70,7 @@ def test_reference_units_in_activity_form():
             EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Nova Atividade') or contains(., 'Adicionar')]"))
         )
         add_button.click()
-        time.sleep(2)
+        aguardar_estavel(driver, timeout=2)
         
         # Aguardar modal aparecer
         modal = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '[role="dialog"], .modal, [class*="Modal"]')))
@@ -153,8 +142,8 @@ def test_reference_units_in_activity_form():
         raise
         
     finally:
-        print("\n🔚 Fechando navegador...")
-        driver.quit()
+        print("\n🔚 Devolvendo navegador ao pool...")
+        devolver_driver(driver)
         print("✅ Teste finalizado")
 
 if __name__ == "__main__":
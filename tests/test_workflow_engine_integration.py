@@ -17,24 +17,45 @@ Banco de dados esperado:
 - workflow.process_instance com status='FINISHED'
 - workflow.process_instance_step com 6 registros (um para cada step)
 
+Os testes rodam pelo step_scheduler.py: cada um declara de quem depende
+(PASSOS_WORKFLOW); se um passo falha, o estado do app capturado antes dele é
+restaurado e só ele é repetido (AGENDADOR_RETRIES / AGENDADOR_ORCAMENTO). Antes
+de repetir, a suíte confere se o servidor já aplicou o passo (resposta do
+workflow_start/complete_step gravada pelo GravadorRede ou, sem ela, o
+current-step da API): se sim, o passo conta como concluído e só a navegação
+seguinte é retomada, em vez de repetir um complete_step já aceito. Passos
+seguintes a um que falhou de vez são pulados, e a checagem do banco (test_08)
+roda em paralelo, sem navegador, assim que o test_07 conclui.
+
 Branch: sp4-task3276-implementacao-motor-bmpn
 Data: 2025-11-11
 """
 
 import os
 import sys
+import copy
 import time
 import json
+import threading
 from datetime import datetime
 from typing import Optional, Dict, Any
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+
+from driver_pool import obter_driver, devolver_driver
+from smart_wait import aguardar_estavel, logs_performance
+from auth_session import login_navegador
+from network_recorder import GravadorRede
+from endpoint_resolver import resolver_api, descrever
+from api_client import obter_cliente
+from auth_api import cabecalhos_auth
+from run_store import iniciar_execucao
+from step_trace import span, rastrear
+from step_scheduler import Passo, Agendador
+from checkpoint import capturar_navegador, restaurar_navegador, hidratar_store
 
 # Cores para output
 class Colors:
@@ -48,9 +69,37 @@ class Colors:
 
 # Configurações
 BASE_URL = os.getenv('APP_URL', 'http://localhost:5173')
-API_BASE_URL = os.getenv('API_URL', 'http://localhost:3000/api/v1')
+API_PREFERIDAS = ['http://localhost:3000/api/v1']  # API_URL tem prioridade; health check em paralelo
 TEST_TIMEOUT = 30
 
+# (teste, dependências, usa o navegador) - ordem de execução dos passos de navegador
+PASSOS_WORKFLOW = (
+    ('test_01_criar_nova_inscricao_chama_workflow_start', (), True),
+    ('test_02_preencher_participantes_chama_complete_step', ('test_01_criar_nova_inscricao_chama_workflow_start',), True),
+    ('test_03_preencher_imovel_chama_complete_step', ('test_02_preencher_participantes_chama_complete_step',), True),
+    ('test_04_preencher_empreendimento_chama_complete_step', ('test_03_preencher_imovel_chama_complete_step',), True),
+    ('test_05_completar_formulario_chama_complete_step', ('test_04_preencher_empreendimento_chama_complete_step',), True),
+    ('test_06_completar_documentacao_chama_complete_step', ('test_05_completar_formulario_chama_complete_step',), True),
+    ('test_07_finalizar_revisao_status_finished', ('test_06_completar_documentacao_chama_complete_step',), True),
+    ('test_08_validar_banco_dados_workflow_finished', ('test_07_finalizar_revisao_status_finished',), False),
+)
+STATUS_PASSO = {'PASSED': 'sucesso', 'FAILED': 'erro', 'SKIPPED': 'pulado'}
+
+# Efeito de cada passo no servidor: (padrão do GravadorRede, página do passo, página seguinte)
+EFEITO_PASSO = {
+    'test_01_criar_nova_inscricao_chama_workflow_start': ('workflow_start', None, '/inscricao/participantes'),
+    'test_02_preencher_participantes_chama_complete_step': ('complete_step', '/inscricao/participantes', '/inscricao/imovel'),
+    'test_03_preencher_imovel_chama_complete_step': ('complete_step', '/inscricao/imovel', '/inscricao/empreendimento'),
+    'test_04_preencher_empreendimento_chama_complete_step': ('complete_step', '/inscricao/empreendimento', '/inscricao/formulario'),
+    'test_05_completar_formulario_chama_complete_step': ('complete_step', '/inscricao/formulario', '/inscricao/documentacao'),
+    'test_06_completar_documentacao_chama_complete_step': ('complete_step', '/inscricao/documentacao', '/inscricao/revisao'),
+    'test_07_finalizar_revisao_status_finished': ('complete_step', '/inscricao/revisao', None),
+}
+
+def api_resolvida() -> Dict[str, Any]:
+    """API escolhida pelo endpoint_resolver no primeiro uso (cacheada; o import não sonda a rede)"""
+    return resolver_api(API_PREFERIDAS)
+
 class WorkflowEngineTestSuite:
     """Suite de testes para Workflow Engine Integration"""
     
@@ -61,40 +110,20 @@ class WorkflowEngineTestSuite:
         self.workflow_instance_id = None
         self.process_id = None
         self.step_history = []
+        self.rede: Optional[GravadorRede] = None
+        self._resultado_passo: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
         
     def setup(self):
         """Configura o driver do Selenium"""
         print(f"\n{Colors.CYAN}🔧 Configurando WebDriver...{Colors.END}")
         
-        chrome_options = Options()
-        
-        # Modo headless (pode ser controlado pela env var HEADLESS)
-        headless = os.getenv('HEADLESS', 'true').lower() == 'true'
-        if headless:
-            chrome_options.add_argument('--headless')
+        # Sessão emprestada do pool compartilhado (HEADLESS controlado por env var)
+        self.driver = obter_driver()
         
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        
-        # Tentar usar chromedriver manual primeiro, depois webdriver_manager
-        try:
-            manual_chromedriver = r'C:\chromedriver\chromedriver.exe'
-            if os.path.exists(manual_chromedriver):
-                print(f"{Colors.CYAN}   Usando ChromeDriver manual: {manual_chromedriver}{Colors.END}")
-                self.driver = webdriver.Chrome(
-                    service=Service(manual_chromedriver),
-                    options=chrome_options
-                )
-            else:
-                raise FileNotFoundError("ChromeDriver manual não encontrado")
-        except Exception as e:
-            print(f"{Colors.YELLOW}   Tentando webdriver_manager...{Colors.END}")
-            self.driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
-                options=chrome_options
-            )
+        # Gravação de rede em streaming (CDP) desde o início da sessão
+        self.rede = GravadorRede(self.driver).iniciar()
+        print(f"{Colors.CYAN}   Gravador de rede: modo {self.rede.modo}{Colors.END}")
         
         self.wait = WebDriverWait(self.driver, TEST_TIMEOUT)
         
@@ -102,141 +131,56 @@ class WorkflowEngineTestSuite:
     
     def teardown(self):
         """Encerra o driver"""
+        if self.rede:
+            self.rede.parar()
         if self.driver:
-            self.driver.quit()
-            print(f"{Colors.CYAN}🔧 WebDriver encerrado{Colors.END}")
+            devolver_driver(self.driver)
+            self.driver = None
+            print(f"{Colors.CYAN}🔧 WebDriver devolvido ao pool{Colors.END}")
     
     def intercept_network_requests(self) -> Dict[str, Any]:
         """
-        Captura requisições de rede usando Chrome DevTools Protocol
-        Retorna um dicionário com as requisições interceptadas
+        Retorna as requisições do motor de workflow gravadas pelo GravadorRede
+        (timestamps reais do navegador, status HTTP e tempo de resposta)
         """
-        # Habilitar CDP (Chrome DevTools Protocol)
-        self.driver.execute_cdp_cmd('Network.enable', {})
-        
-        # Capturar requisições
-        logs = self.driver.get_log('performance')
-        
-        requests = {
-            'workflow_start': None,
-            'complete_steps': [],
-            'all_requests': []
+        return {
+            'workflow_start': self.rede.ultima('workflow_start'),
+            'complete_steps': self.rede.todas('complete_step'),
+            'all_requests': list(self.rede.ordem)
         }
-        
-        for log in logs:
-            try:
-                message = json.loads(log['message'])
-                method = message.get('message', {}).get('method', '')
-                
-                if method == 'Network.requestWillBeSent':
-                    request = message['message']['params']['request']
-                    url = request.get('url', '')
-                    
-                    requests['all_requests'].append({
-                        'url': url,
-                        'method': request.get('method', ''),
-                        'timestamp': datetime.now().isoformat()
-                    })
-                    
-                    # Captura /workflow/instances/start
-                    if '/workflow/instances/start' in url:
-                        requests['workflow_start'] = {
-                            'url': url,
-                            'method': request.get('method'),
-                            'timestamp': datetime.now().isoformat()
-                        }
-                    
-                    # Captura /workflow/instances/{id}/steps/{stepId}/complete
-                    if '/workflow/instances/' in url and '/steps/' in url and '/complete' in url:
-                        requests['complete_steps'].append({
-                            'url': url,
-                            'method': request.get('method'),
-                            'timestamp': datetime.now().isoformat()
-                        })
-            except:
-                pass
-        
-        return requests
     
+    def _latencia_api(self, padrao: str, apos: int = 0, timeout: float = 10) -> str:
+        """Aguarda a chamada da API gravada e retorna um resumo para a mensagem do teste"""
+        req = self.rede.aguardar(padrao, timeout=timeout, apos=apos)
+        if not req:
+            print(f"  {Colors.YELLOW}⚠️  Chamada '{padrao}' não capturada pelo gravador de rede{Colors.END}")
+            return ''
+        print(f"  {Colors.CYAN}→ {req['method']} {padrao}: HTTP {req['status']} em {req['duracao_ms']} ms{Colors.END}")
+        return f" (HTTP {req['status']}, {req['duracao_ms']} ms)"
+    
+    @rastrear('login')
     def login(self) -> bool:
-        """Realiza login na aplicação (se necessário)"""
+        """Realiza login na aplicação (token via API injetado no navegador; formulário como fallback)"""
         print(f"\n{Colors.BLUE}🔐 Verificando autenticação...{Colors.END}")
         
         try:
-            # Vai direto para a página de login
-            self.driver.get(f"{BASE_URL}/login")
-            time.sleep(2)
-            
-            # Verifica se já está logado (redireciona para dashboard)
-            if '/dashboard' in self.driver.current_url or '/inscricao' in self.driver.current_url:
-                print(f"{Colors.GREEN}✅ Já autenticado{Colors.END}")
-                return True
-            
-            # Se não estiver logado, faz o login
-            print(f"{Colors.YELLOW}⚠️  Não autenticado, fazendo login...{Colors.END}")
-            
-            # Aguarda página de login carregar
-            print(f"  {Colors.CYAN}→ Aguardando formulário de login...{Colors.END}")
-            time.sleep(2)
-            
-            # Seleciona Pessoa Física (PF) - garante que está selecionado
-            try:
-                tipo_select = self.driver.find_element(By.CSS_SELECTOR, 'select')
-                tipo_select.send_keys('PF')  # Seleciona Pessoa Física
-                print(f"  {Colors.CYAN}→ Tipo de pessoa: PF (CPF){Colors.END}")
-                time.sleep(1)
-            except:
-                print(f"  {Colors.CYAN}→ Já está PF por default{Colors.END}")
-                pass
-            
-            # Procura campo de identificação (CPF)
-            print(f"  {Colors.CYAN}→ Procurando campo de identificação...{Colors.END}")
-            identificacao_input = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'input[type="text"], input[placeholder*="CPF" i], input[placeholder*="identificação" i]'))
-            )
-            
-            # Procura campo de senha
-            password_input = self.driver.find_element(By.CSS_SELECTOR, 'input[type="password"]')
-            
             # Credenciais de teste
             test_cpf = os.getenv('TEST_USER_EMAIL', '61404694579')
             test_password = os.getenv('TEST_USER_PASSWORD', 'Senh@01!')
             
-            print(f"  {Colors.CYAN}→ Preenchendo CPF: {test_cpf}{Colors.END}")
-            identificacao_input.clear()
-            identificacao_input.send_keys(test_cpf)
-            time.sleep(0.5)
-            
-            print(f"  {Colors.CYAN}→ Preenchendo senha{Colors.END}")
-            password_input.clear()
-            password_input.send_keys(test_password)
-            time.sleep(0.5)
-            
-            # Procura e clica no botão de submit
-            print(f"  {Colors.CYAN}→ Procurando botão Entrar...{Colors.END}")
-            submit_button = self.driver.find_element(By.CSS_SELECTOR, 'button[type="submit"]')
-            print(f"  {Colors.CYAN}→ Clicando em Entrar...{Colors.END}")
-            submit_button.click()
+            login_navegador(
+                self.driver,
+                caminho='/dashboard',
+                cpf=test_cpf,
+                senha=test_password,
+                base_url=BASE_URL,
+                api_url=api_resolvida()['url']
+            )
             
-            print(f"  {Colors.CYAN}→ Aguardando redirecionamento para dashboard (timeout: 30s)...{Colors.END}")
+            if '/login' in self.driver.current_url:
+                raise Exception(f"Redirecionado para login: {self.driver.current_url}")
             
-            # Aguarda redirecionamento para dashboard ou home
-            try:
-                WebDriverWait(self.driver, 30).until(
-                    lambda driver: '/dashboard' in driver.current_url or driver.current_url == f"{BASE_URL}/" or driver.current_url == BASE_URL
-                )
-            except:
-                # Se não redirecionou, verifica se houve erro
-                print(f"  {Colors.RED}→ URL atual após submit: {self.driver.current_url}{Colors.END}")
-                try:
-                    error_text = self.driver.find_element(By.CSS_SELECTOR, '.bg-red-50').text
-                    print(f"  {Colors.RED}→ Erro na página: {error_text}{Colors.END}")
-                except:
-                    pass
-                raise
             print(f"{Colors.GREEN}✅ Login realizado com sucesso{Colors.END}")
-            time.sleep(2)  # Aguarda carregamento completo
-            
             return True
             
         except Exception as e:
@@ -260,12 +204,11 @@ class WorkflowEngineTestSuite:
         print(f"\n{Colors.BOLD}{Colors.BLUE}TEST 1: {test_name}{Colors.END}")
         
         try:
-            # Habilitar captura de rede
-            self.driver.execute_cdp_cmd('Network.enable', {})
+            inicios_antes = self.rede.contar('workflow_start')
             
             # Navegar para dashboard
             self.driver.get(BASE_URL)
-            time.sleep(2)
+            aguardar_estavel(self.driver, timeout=2)
             
             # Clicar no botão "Motor BPMN" (Workflow Engine)
             print(f"  {Colors.CYAN}→ Procurando botão 'Motor BPMN'...{Colors.END}")
@@ -278,7 +221,7 @@ class WorkflowEngineTestSuite:
             
             print(f"  {Colors.CYAN}→ Clicando em Motor BPMN...{Colors.END}")
             motor_btn.click()
-            time.sleep(5)  # Aguarda inicialização do workflow (cria processo + inicia motor)
+            aguardar_estavel(self.driver, timeout=5)  # Aguarda inicialização do workflow (cria processo + inicia motor)
             
             # O wizard do motor ABRE EM MODAL (asModal=true)
             # Verificar se o modal do wizard apareceu
@@ -294,7 +237,7 @@ class WorkflowEngineTestSuite:
             
             # Aguarda inicialização completar e página Participantes aparecer
             print(f"  {Colors.CYAN}→ Aguardando wizard inicializar...{Colors.END}")
-            time.sleep(3)
+            aguardar_estavel(self.driver, timeout=3)
             
             # Verifica se chegou na página Participantes
             participantes_title = self.wait.until(
@@ -306,16 +249,27 @@ class WorkflowEngineTestSuite:
             
             print(f"  {Colors.CYAN}→ Wizard Participantes carregado{Colors.END}")
             
-            # TODO: Capturar requisição /workflow/instances/start via CDP
-            # Por enquanto, verificamos se chegou na página correta
-            # Em produção, você pode usar um proxy ou mock do backend para validar a chamada
+            # Requisição /workflow/instances/start capturada via CDP
+            detalhe = ''
+            start_req = self.rede.aguardar('workflow_start', timeout=10, apos=inicios_antes)
+            if start_req:
+                if start_req['status'] and start_req['status'] >= 400:
+                    raise AssertionError(f"/workflow/instances/start retornou HTTP {start_req['status']}")
+                corpo = self.rede.corpo_resposta(start_req) or {}
+                self.workflow_instance_id = corpo.get('instanceId') or corpo.get('instance_id') or corpo.get('id') or self.workflow_instance_id
+                detalhe = f" (HTTP {start_req['status']}, {start_req['duracao_ms']} ms)"
+                print(f"  {Colors.CYAN}→ POST workflow/instances/start{detalhe}{Colors.END}")
+            elif self.rede.ativo:
+                raise AssertionError("POST /workflow/instances/start não foi chamado")
+            else:
+                print(f"  {Colors.YELLOW}⚠️  Gravador de rede inativo - chamada ao start não verificada{Colors.END}")
             
             print(f"  {Colors.GREEN}✅ Workflow iniciado e redirecionado para Participantes{Colors.END}")
             
             self.test_results.append({
                 'test': test_name,
                 'status': 'PASSED',
-                'message': 'Workflow start chamado e redirecionamento OK'
+                'message': 'Workflow start chamado e redirecionamento OK' + detalhe
             })
             return True
             
@@ -346,7 +300,7 @@ class WorkflowEngineTestSuite:
             # Verificar se está na página Participantes
             if '/inscricao/participantes' not in self.driver.current_url:
                 self.driver.get(f"{BASE_URL}/inscricao/participantes")
-                time.sleep(2)
+                aguardar_estavel(self.driver, timeout=2)
             
             # Adicionar participante REQUERENTE
             print(f"  {Colors.CYAN}→ Adicionando participante REQUERENTE...{Colors.END}")
@@ -358,7 +312,7 @@ class WorkflowEngineTestSuite:
                 ))
             )
             add_button.click()
-            time.sleep(1)
+            aguardar_estavel(self.driver, timeout=1)
             
             # Selecionar tipo: Pessoa Física
             tipo_select = self.wait.until(
@@ -369,7 +323,7 @@ class WorkflowEngineTestSuite:
             # Selecionar "Pessoa Física" ou "PF"
             pf_option = self.driver.find_element(By.XPATH, "//option[contains(text(), 'Pessoa Física') or contains(text(), 'PF')]")
             pf_option.click()
-            time.sleep(1)
+            aguardar_estavel(self.driver, timeout=1)
             
             # Preencher campos (ajustar seletores conforme seu formulário)
             # Simplificado - você pode expandir conforme necessário
@@ -383,7 +337,7 @@ class WorkflowEngineTestSuite:
             # Salvar participante
             save_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Salvar') or contains(text(), 'Adicionar')]")
             save_button.click()
-            time.sleep(1)
+            aguardar_estavel(self.driver, timeout=1)
             
             print(f"  {Colors.GREEN}✅ Participante adicionado{Colors.END}")
             
@@ -396,8 +350,9 @@ class WorkflowEngineTestSuite:
                     "//button[contains(text(), 'Próximo') or contains(text(), 'Avançar')]"
                 ))
             )
+            chamadas_antes = self.rede.contar('complete_step')
             proximo_button.click()
-            time.sleep(3)  # Aguarda completeStep e navegação
+            aguardar_estavel(self.driver, timeout=3)  # Aguarda completeStep e navegação
             
             # Verificar se redirecionou para /inscricao/imovel
             current_url = self.driver.current_url
@@ -419,7 +374,7 @@ class WorkflowEngineTestSuite:
             self.test_results.append({
                 'test': test_name,
                 'status': 'PASSED',
-                'message': 'completeStep → nextStep.path OK'
+                'message': 'completeStep → nextStep.path OK' + self._latencia_api('complete_step', chamadas_antes)
             })
             return True
             
@@ -453,7 +408,7 @@ class WorkflowEngineTestSuite:
             
             # Permitir continuar sem imóvel (validação flexível)
             # ou selecionar um imóvel se houver opção
-            time.sleep(1)
+            aguardar_estavel(self.driver, timeout=1)
             
             # Clicar em Próximo
             print(f"  {Colors.CYAN}→ Clicando em Próximo...{Colors.END}")
@@ -464,8 +419,9 @@ class WorkflowEngineTestSuite:
                     "//button[contains(text(), 'Próximo') or contains(text(), 'Avançar')]"
                 ))
             )
+            chamadas_antes = self.rede.contar('complete_step')
             proximo_button.click()
-            time.sleep(3)
+            aguardar_estavel(self.driver, timeout=3)
             
             # Verificar redirecionamento
             current_url = self.driver.current_url
@@ -479,7 +435,7 @@ class WorkflowEngineTestSuite:
             self.test_results.append({
                 'test': test_name,
                 'status': 'PASSED',
-                'message': 'Navegação para Empreendimento OK'
+                'message': 'Navegação para Empreendimento OK' + self._latencia_api('complete_step', chamadas_antes)
             })
             return True
             
@@ -512,7 +468,7 @@ class WorkflowEngineTestSuite:
             print(f"  {Colors.CYAN}→ Preenchendo dados mínimos...{Colors.END}")
             
             # Permitir continuar (validação flexível)
-            time.sleep(1)
+            aguardar_estavel(self.driver, timeout=1)
             
             # Clicar em Próximo
             print(f"  {Colors.CYAN}→ Clicando em Próximo...{Colors.END}")
@@ -523,8 +479,9 @@ class WorkflowEngineTestSuite:
                     "//button[contains(text(), 'Próximo') or contains(text(), 'Avançar')]"
                 ))
             )
+            chamadas_antes = self.rede.contar('complete_step')
             proximo_button.click()
-            time.sleep(3)
+            aguardar_estavel(self.driver, timeout=3)
             
             # Verificar redirecionamento
             current_url = self.driver.current_url
@@ -538,7 +495,7 @@ class WorkflowEngineTestSuite:
             self.test_results.append({
                 'test': test_name,
                 'status': 'PASSED',
-                'message': 'Navegação para Formulário OK'
+                'message': 'Navegação para Formulário OK' + self._latencia_api('complete_step', chamadas_antes)
             })
             return True
             
@@ -572,7 +529,7 @@ class WorkflowEngineTestSuite:
                 return False
             
             print(f"  {Colors.CYAN}→ Aguardando FormWizard carregar...{Colors.END}")
-            time.sleep(2)
+            aguardar_estavel(self.driver, timeout=2)
             
             # FormWizard interno tem múltiplos steps
             # Por simplicidade, vamos clicar em "Finalizar" ou "Concluir"
@@ -591,13 +548,13 @@ class WorkflowEngineTestSuite:
                         ))
                     )
                     next_or_finish.click()
-                    time.sleep(2)
+                    aguardar_estavel(self.driver, timeout=2)
                     
                 except TimeoutException:
                     break  # Último step
             
             # Após completar FormWizard, deve navegar para Documentação
-            time.sleep(2)
+            aguardar_estavel(self.driver, timeout=2)
             current_url = self.driver.current_url
             print(f"  {Colors.CYAN}→ URL atual: {current_url}{Colors.END}")
             
@@ -640,7 +597,7 @@ class WorkflowEngineTestSuite:
                 return False
             
             print(f"  {Colors.CYAN}→ Clicando em Próximo na Documentação...{Colors.END}")
-            time.sleep(1)
+            aguardar_estavel(self.driver, timeout=1)
             
             proximo_button = self.wait.until(
                 EC.element_to_be_clickable((
@@ -648,8 +605,9 @@ class WorkflowEngineTestSuite:
                     "//button[contains(text(), 'Próximo') or contains(text(), 'Avançar')]"
                 ))
             )
+            chamadas_antes = self.rede.contar('complete_step')
             proximo_button.click()
-            time.sleep(3)
+            aguardar_estavel(self.driver, timeout=3)
             
             current_url = self.driver.current_url
             print(f"  {Colors.CYAN}→ URL atual: {current_url}{Colors.END}")
@@ -662,7 +620,7 @@ class WorkflowEngineTestSuite:
             self.test_results.append({
                 'test': test_name,
                 'status': 'PASSED',
-                'message': 'Navegação para Revisão OK'
+                'message': 'Navegação para Revisão OK' + self._latencia_api('complete_step', chamadas_antes)
             })
             return True
             
@@ -698,7 +656,7 @@ class WorkflowEngineTestSuite:
                 return False
             
             print(f"  {Colors.CYAN}→ Finalizando processo...{Colors.END}")
-            time.sleep(1)
+            aguardar_estavel(self.driver, timeout=1)
             
             finalizar_button = self.wait.until(
                 EC.element_to_be_clickable((
@@ -706,8 +664,9 @@ class WorkflowEngineTestSuite:
                     "//button[contains(text(), 'Finalizar') or contains(text(), 'Concluir') or contains(text(), 'Enviar')]"
                 ))
             )
+            chamadas_antes = self.rede.contar('complete_step')
             finalizar_button.click()
-            time.sleep(3)
+            aguardar_estavel(self.driver, timeout=3)
             
             # Verificar se mostra mensagem de sucesso ou redireciona
             # Pode redirecionar para dashboard ou mostrar confirmação
@@ -720,7 +679,7 @@ class WorkflowEngineTestSuite:
             self.test_results.append({
                 'test': test_name,
                 'status': 'PASSED',
-                'message': 'Processo finalizado com sucesso'
+                'message': 'Processo finalizado com sucesso' + self._latencia_api('complete_step', chamadas_antes)
             })
             return True
             
@@ -832,6 +791,170 @@ class WorkflowEngineTestSuite:
             })
             return False
     
+    def executar_teste(self, teste) -> bool:
+        """Executa um test_NN num span do rastro de etapas e anota a duração no resultado que ele registrou"""
+        registrados = len(self.test_results)
+        inicio = time.time()
+        try:
+            with span(teste.__name__, suite='workflow_engine') as trecho:
+                passou = teste()
+                if trecho is not None and not passou:
+                    trecho.status = 'erro'
+                return passou
+        finally:
+            if len(self.test_results) > registrados:
+                self.test_results[-1]['duracao'] = time.time() - inicio
+    
+    def executar_passo(self, nome: str, isolado: bool = False) -> str:
+        """
+        Executa o test_NN ``nome`` para o agendador e devolve 'sucesso', 'erro' ou 'pulado'.
+
+        Numa retentativa o resultado da tentativa anterior sai do resumo. Com
+        ``isolado`` o teste roda numa cópia da suíte com resultados próprios
+        (checagens sem navegador em paralelo aos passos do navegador).
+        """
+        alvo = self
+        if isolado:
+            alvo = copy.copy(self)
+            alvo.test_results = []
+        registrados = len(alvo.test_results)
+        alvo.executar_teste(getattr(alvo, nome))
+        novos = alvo.test_results[registrados:]
+        if not novos:
+            return 'erro'
+        resultado = novos[-1]
+        resultado['passo'] = nome
+        with self._lock:
+            anterior = self._resultado_passo.get(nome)
+            if anterior is not None:
+                self.test_results.remove(anterior)
+                resultado['tentativas'] = anterior.get('tentativas', 1) + 1
+            if isolado:
+                self.test_results.append(resultado)
+            self._resultado_passo[nome] = resultado
+        return STATUS_PASSO.get(resultado['status'], 'erro')
+    
+    def capturar_estado(self, passo=None) -> Dict[str, Any]:
+        """Estado do app antes de um passo: URL/storage/store do navegador (checkpoint.py) e IDs do workflow"""
+        navegador = capturar_navegador(self.driver)
+        return {
+            'navegador': navegador,
+            'store': navegador.pop('store', None),
+            'suite': {
+                'workflow_instance_id': self.workflow_instance_id,
+                'process_id': self.process_id,
+                'step_history': list(self.step_history),
+            },
+            'rede': {padrao: self.rede.contar(padrao) for padrao in ('workflow_start', 'complete_step')},
+        }
+    
+    def restaurar_estado(self, passo, estado: Dict[str, Any]):
+        """Volta o navegador e a suíte ao estado capturado antes do passo (para repeti-lo)"""
+        print(f"  {Colors.CYAN}→ Restaurando estado anterior a {passo.nome}...{Colors.END}")
+        restaurar_navegador(self.driver, estado)
+        hidratar_store(self.driver, estado)
+        self.workflow_instance_id = estado['suite']['workflow_instance_id']
+        self.process_id = estado['suite']['process_id']
+        self.step_history = list(estado['suite']['step_history'])
+    
+    def _servidor_avancou(self, nome: str, estado: Dict[str, Any]) -> Optional[str]:
+        """
+        Descrição da evidência de que o servidor já aplicou o passo ``nome``
+        depois do estado capturado; None se não aplicou (ou não dá para saber).
+        """
+        padrao, pagina, _ = EFEITO_PASSO[nome]
+        antes = estado.get('rede', {}).get(padrao, 0)
+        # A resposta pode chegar logo depois do timeout da navegação
+        if self.rede.aguardar(padrao, timeout=5, apos=antes):
+            aceitas = [r for r in self.rede.todas(padrao)[antes:] if r['status'] and r['status'] < 400]
+            if aceitas:
+                if padrao == 'workflow_start':
+                    corpo = self.rede.corpo_resposta(aceitas[-1]) or {}
+                    self.workflow_instance_id = corpo.get('instanceId') or corpo.get('instance_id') \
+                        or corpo.get('id') or self.workflow_instance_id
+                return f"{padrao} HTTP {aceitas[-1]['status']}"
+            return None
+
+        # Sem resposta gravada: pergunta ao motor em que step a instância está
+        if pagina is None or not self.workflow_instance_id:
+            return None
+        resposta = obter_cliente(api_resolvida()['url']).get(
+            f"/workflow/instances/{self.workflow_instance_id}/current-step", headers=cabecalhos_auth())
+        if resposta.status_code != 200:
+            return None
+        corpo = resposta.json() or {}
+        atual = corpo.get('step') or corpo.get('currentStep') or {}
+        if corpo.get('status') == 'FINISHED':
+            return 'current-step FINISHED'
+        if atual.get('path') and atual['path'] != pagina:
+            return f"current-step {atual.get('key') or atual['path']}"
+        return None
+
+    def verificar_servidor(self, passo, estado: Dict[str, Any]) -> Optional[str]:
+        """
+        Antes de repetir um passo que falhou: se o servidor já o aplicou, não
+        repete (um segundo complete_step avançaria o workflow de novo ou seria
+        recusado) - retoma a navegação para a página seguinte e devolve
+        'sucesso', ou 'erro' se ela não abrir. None libera a repetição.
+        """
+        if passo.nome not in EFEITO_PASSO:
+            return None
+        evidencia = self._servidor_avancou(passo.nome, estado)
+        if evidencia is None:
+            return None
+        seguinte = EFEITO_PASSO[passo.nome][2]
+        print(f"  {Colors.CYAN}→ {passo.nome}: servidor já avançou ({evidencia}){Colors.END}")
+        if seguinte and seguinte not in self.driver.current_url:
+            print(f"  {Colors.CYAN}→ Retomando a navegação para {seguinte}...{Colors.END}")
+            self.driver.get(f"{BASE_URL}{seguinte}")
+            aguardar_estavel(self.driver, timeout=3)
+
+        resultado = self._resultado_passo.get(passo.nome)
+        if seguinte and seguinte not in self.driver.current_url:
+            if resultado is not None:
+                resultado['message'] = (f"Servidor avançou ({evidencia}), mas a navegação para {seguinte} "
+                                        f"não abriu: {self.driver.current_url}")
+            return 'erro'
+        if resultado is not None:
+            resultado['status'] = 'PASSED'
+            resultado['message'] = f"Concluído no servidor ({evidencia}); navegação retomada após: {resultado['message']}"
+        return 'sucesso'
+    
+    def executar_passos(self):
+        """Roda PASSOS_WORKFLOW pelo agendador (dependências, retentativa e checagens em paralelo)"""
+        passos = [
+            Passo(nome, lambda nome=nome, navegador=navegador: self.executar_passo(nome, isolado=not navegador),
+                  depende_de=dependencias, navegador=navegador)
+            for nome, dependencias, navegador in PASSOS_WORKFLOW
+        ]
+        Agendador(passos, capturar=self.capturar_estado, restaurar=self.restaurar_estado,
+                  verificar=self.verificar_servidor).executar()
+        
+        for passo in passos:
+            if passo.execucoes == 0 and passo.status == 'pulado':
+                self.test_results.append({
+                    'test': getattr(self, passo.nome).__doc__.strip().splitlines()[0],
+                    'status': 'SKIPPED',
+                    'message': passo.erro,
+                    'passo': passo.nome,
+                })
+        self.test_results.sort(key=lambda r: r.get('passo', ''))
+    
+    def salvar_historico(self, inicio: float):
+        """Grava resultado e duração de cada teste no histórico de execuções (run_store)"""
+        status_etapa = {'PASSED': 'sucesso', 'FAILED': 'erro', 'SKIPPED': 'pulado'}
+        try:
+            execucao = iniciar_execucao('workflow_engine', {'base_url': BASE_URL, 'api': api_resolvida()['url']})
+            for ordem, resultado in enumerate(self.test_results, 1):
+                execucao.registrar_etapa(resultado['test'], status_etapa.get(resultado['status'], resultado['status']),
+                                         resultado.get('duracao'), resultado['message'] if resultado['status'] == 'FAILED' else None,
+                                         ordem=ordem)
+            falhou = not self.test_results or any(r['status'] == 'FAILED' for r in self.test_results)
+            execucao.finalizar('erro' if falhou else 'sucesso', duracao=time.time() - inicio)
+            print(f"{Colors.CYAN}🗄️  Execução #{execucao.id} gravada no histórico (run_store.py){Colors.END}")
+        except Exception as e:
+            print(f"{Colors.YELLOW}⚠️  Histórico não gravado: {e}{Colors.END}")
+    
     def print_summary(self):
         """Imprime resumo dos testes"""
         print(f"\n{Colors.BOLD}{'='*60}{Colors.END}")
@@ -852,7 +975,10 @@ class WorkflowEngineTestSuite:
                          '❌' if result['status'] == 'FAILED' else \
                          '⚠️ '
             
-            print(f"{status_icon} {status_color}{result['status']:<8}{Colors.END} | {result['test']}")
+            duracao = f" ({result['duracao']:.2f}s)" if 'duracao' in result else ""
+            if result.get('tentativas'):
+                duracao += f" [{result['tentativas']} tentativas]"
+            print(f"{status_icon} {status_color}{result['status']:<8}{Colors.END} | {result['test']}{duracao}")
             if result['message']:
                 print(f"   └─ {result['message']}")
         
@@ -861,6 +987,13 @@ class WorkflowEngineTestSuite:
         print(f"{Colors.RED}Failed:{Colors.END} {failed}")
         print(f"{Colors.YELLOW}Skipped:{Colors.END} {skipped}")
         
+        latencias = self.rede.latencias() if self.rede else {}
+        if latencias:
+            print(f"\n{Colors.BOLD}Latência da API (gravador de rede):{Colors.END}")
+            for padrao, dados in latencias.items():
+                print(f"   {padrao:<16} {dados['quantidade']:>3}x | média {dados['media_ms']:>8.1f} ms | "
+                      f"min {dados['min_ms']:>8.1f} | max {dados['max_ms']:>8.1f}")
+        
         if failed == 0 and passed > 0:
             print(f"\n{Colors.GREEN}{Colors.BOLD}🎉 TODOS OS TESTES PASSARAM!{Colors.END}")
             print(f"{Colors.GREEN}Workflow Engine está funcionando corretamente.{Colors.END}")
@@ -879,8 +1012,10 @@ def main():
     print(f"\n{Colors.CYAN}Branch:{Colors.END} sp4-task3276-implementacao-motor-bmpn")
     print(f"{Colors.CYAN}Data:{Colors.END} 2025-11-11")
     print(f"{Colors.CYAN}URL:{Colors.END} {BASE_URL}")
+    print(f"{Colors.CYAN}API:{Colors.END} {descrever(api_resolvida())}")
     
     suite = WorkflowEngineTestSuite()
+    inicio = time.time()
     
     try:
         suite.setup()
@@ -890,15 +1025,8 @@ def main():
             print(f"\n{Colors.RED}❌ Falha no login. Abortando testes.{Colors.END}")
             return
         
-        # Executar testes em sequência
-        suite.test_01_criar_nova_inscricao_chama_workflow_start()
-        suite.test_02_preencher_participantes_chama_complete_step()
-        suite.test_03_preencher_imovel_chama_complete_step()
-        suite.test_04_preencher_empreendimento_chama_complete_step()
-        suite.test_05_completar_formulario_chama_complete_step()
-        suite.test_06_completar_documentacao_chama_complete_step()
-        suite.test_07_finalizar_revisao_status_finished()
-        suite.test_08_validar_banco_dados_workflow_finished()
+        # Executar testes pelo agendador (dependências + retentativa do passo que falhou)
+        suite.executar_passos()
         
     except KeyboardInterrupt:
         print(f"\n{Colors.YELLOW}⚠️  Testes interrompidos pelo usuário{Colors.END}")
@@ -907,6 +1035,7 @@ def main():
     finally:
         suite.teardown()
         suite.print_summary()
+        suite.salvar_historico(inicio)
 
 if __name__ == '__main__':
     main()